@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+import tracemalloc
+
+import numpy as np
+import pytest
+from SciDataTool import Data1D
+
+from pyleecan.Classes.MagFEMM import MagFEMM
+from pyleecan.Classes.MeshSolution import MeshSolution
+from pyleecan.Classes.PostMethod import PostMethod
+from pyleecan.Classes.Simu1 import Simu1
+from Tests.Methods.Mesh.square_mesh import get_square_mesh
+
+
+def get_FEMM_meshsol(N, Nt):
+    """MeshSolution with the B, H and mu solutions of MagFEMM on a mesh of
+    2*N*N triangles and Nt time steps
+    """
+    mesh = get_square_mesh(N)
+    nb_cell = mesh.cell["triangle"].nb_cell
+    rng = np.random.RandomState(0)
+    B = rng.rand(Nt, nb_cell, 3)
+    B[:, :, 2] = 0
+    H = rng.rand(Nt, nb_cell, 3)
+    H[:, :, 2] = 0
+    mu = rng.rand(Nt, nb_cell)
+    Time = Data1D(name="time", unit="s", values=np.linspace(0, 1, Nt))
+    groups = [{"stator core": mesh.cell["triangle"].indice[: nb_cell // 2]}]
+
+    return MagFEMM(is_sliding_band=True).build_meshsolution(
+        Nt, [mesh], Time, B, H, mu, groups
+    )
+
+
+@pytest.mark.MeshSol
+def test_copy():
+    """Check that the copy does not share any ndarray with the original object
+    (unless requested) and that as_dict is still json serializable"""
+    meshsol = get_FEMM_meshsol(4, 3)
+    mesh = meshsol.get_mesh()
+    Bx = meshsol.solution[0].field.components["comp_x"]
+
+    meshsol_copy = meshsol.copy()
+    assert meshsol_copy == meshsol
+    mesh_copy = meshsol_copy.get_mesh()
+    Bx_copy = meshsol_copy.solution[0].field.components["comp_x"]
+    assert isinstance(mesh_copy.point.coordinate, np.ndarray)
+    assert not np.shares_memory(mesh_copy.point.coordinate, mesh.point.coordinate)
+    assert not np.shares_memory(Bx_copy.values, Bx.values)
+    assert Bx_copy.axes[0] is not Bx.axes[0]
+    # The axes of the components are not shared (as with as_dict)
+    By_copy = meshsol_copy.solution[0].field.components["comp_y"]
+    assert Bx_copy.axes is not By_copy.axes
+
+    Bx_copy.values[0, 0] = -1
+    assert Bx.values[0, 0] != -1
+
+    # Shared ndarrays
+    meshsol_share = meshsol.copy(share_ndarray=True)
+    assert meshsol_share == meshsol
+    assert meshsol_share.get_mesh().point.coordinate is mesh.point.coordinate
+    assert meshsol_share.group["stator core"] is meshsol.group["stator core"]
+
+    # Default as_dict: json serializable
+    meshsol_dict = meshsol.as_dict()
+    assert isinstance(meshsol_dict["mesh"][0]["point"]["coordinate"], list)
+    assert isinstance(meshsol_dict["group"]["stator core"], list)
+    assert MeshSolution(init_dict=meshsol_dict) == meshsol
+    with pytest.raises(Exception):
+        meshsol.as_dict(type_handle_ndarray=3)
+
+
+class OldPostMethod(PostMethod):
+    """PostMethod with an as_dict overridden with the former signature"""
+
+    def as_dict(self):
+        PostMethod_dict = super(OldPostMethod, self).as_dict()
+        PostMethod_dict["__class__"] = "PostMethod"
+        return PostMethod_dict
+
+
+def test_as_dict_override():
+    """Check as_dict, copy and save of an object containing an object whose
+    as_dict is overridden without the type_handle_ndarray argument"""
+    simu = Simu1(name="test_as_dict_override", postproc_list=[OldPostMethod()])
+    simu_dict = simu.as_dict()
+    assert simu_dict["postproc_list"][0]["__class__"] == "PostMethod"
+    assert simu.copy() == Simu1(init_dict=simu_dict)
+    assert simu.copy(share_ndarray=True).postproc_list[0] == PostMethod()
+
+
+@pytest.mark.long
+@pytest.mark.MeshSol
+def test_copy_benchmark():
+    """Copy of a FEMM MeshSolution (10^5 triangles, 8 time steps) compared to
+    the former copy through a json serializable dict
+    """
+    meshsol = get_FEMM_meshsol(224, 8)
+
+    result = dict()
+    for name, copy_fct in [
+        ("list", lambda: MeshSolution(init_dict=meshsol.as_dict())),
+        ("copy", meshsol.copy),
+        ("share", lambda: meshsol.copy(share_ndarray=True)),
+    ]:
+        tracemalloc.start()
+        t0 = perf_counter()
+        meshsol_copy = copy_fct()
+        time = perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert meshsol_copy == meshsol
+        result[name] = (time, peak / 2 ** 20)
+        del meshsol_copy
+
+    print()
+    for name, (time, peak) in result.items():
+        print("%s: %.3f s, peak memory %.1f MiB" % (name, time, peak))
+    # The copy only allocates the new arrays (no python float objects)
+    assert result["copy"][0] < result["list"][0]
+    assert result["copy"][1] < result["list"][1] / 2
+    assert result["share"][1] < 1
+
+
+if __name__ == "__main__":
+    test_copy()
+    test_as_dict_override()
+    test_copy_benchmark()
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+from os import listdir
+from os.path import join
+from time import perf_counter
+from threading import Event, Thread
+
+import pytest
+from numpy import pi
+
+from pyleecan.Classes._check import CheckTypeError, is_check_var, skip_check_var
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.MagPMMF import MagPMMF
+from pyleecan.Classes.Magnet import Magnet
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.XOutput import XOutput
+from pyleecan.Functions.load import convert_init_dict, load, load_init_dict
+from pyleecan.Functions.Load.import_class import import_class
+from pyleecan.definitions import DATA_DIR
+
+MACHINE_DIR = join(DATA_DIR, "Machine")
+
+
+def test_from_dict_trusted():
+    """Check the initialisation without check of the property values"""
+    IPMSM_A = load(join(MACHINE_DIR, "IPMSM_A.json"))
+    machine = type(IPMSM_A).from_dict_trusted(IPMSM_A.as_dict())
+    assert machine == IPMSM_A
+    assert machine.rotor.parent is machine
+    assert machine.copy() == IPMSM_A
+    assert load(join(MACHINE_DIR, "IPMSM_A.json"), is_trusted=True) == IPMSM_A
+
+    # The values are not checked, the conversions are still done
+    with pytest.raises(CheckTypeError):
+        Magnet(init_dict={"Lmag": "wrong"})
+    magnet = Magnet.from_dict_trusted(
+        {"Lmag": "wrong", "mat_type": {"__class__": "Material"}}
+    )
+    assert magnet.Lmag == "wrong"
+    assert magnet.mat_type.parent is magnet
+    # The check is enabled again (even after an error or nested calls)
+    assert is_check_var()
+    with pytest.raises(ValueError):
+        with skip_check_var():
+            with skip_check_var():
+                pass
+            assert not is_check_var()
+            raise ValueError()
+    assert is_check_var()
+    with pytest.raises(CheckTypeError):
+        magnet.Lmag = "wrong"
+
+
+def test_skip_check_var_thread():
+    """Check that skip_check_var only affects the current thread"""
+    is_started, is_done = Event(), Event()
+    result = dict()
+
+    def trusted_init():
+        with skip_check_var():
+            is_started.set()
+            is_done.wait(10)
+            result["Lmag"] = Magnet(init_dict={"Lmag": "wrong"}).Lmag
+        result["is_check_var"] = is_check_var()
+
+    thread = Thread(target=trusted_init)
+    thread.start()
+    assert is_started.wait(10)
+    # The other thread is in skip_check_var: the values are still checked here
+    assert is_check_var()
+    with pytest.raises(CheckTypeError):
+        Magnet(init_dict={"Lmag": "wrong"})
+    is_done.set()
+    thread.join(10)
+    assert result == {"Lmag": "wrong", "is_check_var": True}
+    assert is_check_var()
+
+
+def get_machine_dict_list():
+    """init_dict of all the reference machines"""
+    init_dict_list = list()
+    for file_name in sorted(listdir(MACHINE_DIR)):
+        if file_name.endswith(".json"):
+            init_dict = load_init_dict(join(MACHINE_DIR, file_name))[1]
+            convert_init_dict(init_dict)
+            init_dict_list.append(init_dict)
+    return init_dict_list
+
+
+def get_xoutput(nb_simu):
+    """XOutput of nb_simu simulations of the SPMSM_003"""
+    SPMSM_003 = load(join(MACHINE_DIR, "SPMSM_003.json"))
+    simu = Simu1(name="test_from_dict_trusted", machine=SPMSM_003)
+    simu.input = InputCurrent(N0=2000, Nt_tot=8, Na_tot=256)
+    simu.input.set_Id_Iq(I0=100, Phi0=pi / 2)
+    simu.mag = MagPMMF(is_periodicity_a=True)
+    simu.elec = None
+    simu.force = None
+    simu.struct = None
+    out = Output(simu=simu)
+    simu.run()
+    return XOutput(
+        simu=simu.copy(),
+        nb_simu=nb_simu,
+        output_list=[out.copy() for _ in range(nb_simu)],
+    )
+
+
+@pytest.mark.long
+def test_from_dict_trusted_benchmark():
+    """Initialisation of the reference machines and of a 100 simulations
+    XOutput with and without the check of the property values
+    """
+    machine_list = list()
+    for init_dict in get_machine_dict_list():
+        class_obj = import_class("pyleecan.Classes", init_dict["__class__"])
+        machine_list.append(class_obj(init_dict=init_dict))
+    xoutput = get_xoutput(100)
+
+    def init_time(obj_list, is_trusted):
+        """Time of the initialisation of the objects from their dict"""
+        # The init_dict are modified by the initialisation: new dicts each time
+        dict_list = [obj.as_dict() for obj in obj_list]
+        t0 = perf_counter()
+        for obj, obj_dict in zip(obj_list, dict_list):
+            if is_trusted:
+                type(obj).from_dict_trusted(obj_dict)
+            else:
+                type(obj)(init_dict=obj_dict)
+        return perf_counter() - t0
+
+    result = dict()
+    for is_trusted in [False, True]:
+        time_machine = min(init_time(machine_list, is_trusted) for _ in range(10))
+        time_xoutput = min(init_time([xoutput], is_trusted) for _ in range(5))
+        result[is_trusted] = (time_machine, time_xoutput)
+
+    print()
+    for is_trusted, (time_machine, time_xoutput) in result.items():
+        print(
+            "%s: %d machines %.1f ms, 100 simulations XOutput %.1f ms"
+            % (
+                "trusted" if is_trusted else "checked",
+                len(machine_list),
+                time_machine * 1e3,
+                time_xoutput * 1e3,
+            )
+        )
+    # The trusted path is not slower
+    assert result[True][0] <= result[False][0]
+    assert result[True][1] <= result[False][1]
+    for machine in machine_list:
+        assert type(machine).from_dict_trusted(machine.as_dict()) == machine
+    assert XOutput.from_dict_trusted(xoutput.as_dict()) == xoutput
+
+
+if __name__ == "__main__":
+    test_from_dict_trusted()
+    test_skip_check_var_thread()
+    test_from_dict_trusted_benchmark()
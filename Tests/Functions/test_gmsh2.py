@@ -1,6 +1,7 @@
 import pytest
 import sys
 import json
+from time import perf_counter
 
 from os import makedirs
 from os.path import join, isdir
@@ -8,6 +9,7 @@ from pyleecan.Functions.load import load
 from pyleecan.Classes.Simu1 import Simu1
 from pyleecan.Classes.Output import Output
 from pyleecan.Classes.SlotM10 import SlotM10
+from pyleecan.Classes.NotchEvenDist import NotchEvenDist
 from pyleecan.definitions import DATA_DIR
 from Tests import save_plot_path
 from pyleecan.Methods.Simulation.MagElmer import (
@@ -123,6 +125,58 @@ def test_gmsh_spm():
     return gmsh_dict
 
 
+@pytest.mark.long
+@pytest.mark.GMSH
+def test_gmsh_72_slots():
+    """Check the time to build the full GMSH model of a 72 slots machine with
+    notches (no duplicated points)"""
+    if isinstance(draw_GMSH, ImportError):
+        raise ImportError("Fail to import draw_GMSH (gmsh package missing)")
+
+    IPMSM_A = load(join(DATA_DIR, "Machine", "IPMSM_A.json"))
+    IPMSM_A.stator.slot.Zs = 72
+    IPMSM_A.stator.notch = [
+        NotchEvenDist(
+            notch_shape=SlotM10(Zs=72, W0=2e-3, H0=1e-3, Wmag=2e-3, Hmag=1e-3),
+            alpha=0,
+        )
+    ]
+    save_path = join(save_plot_path, "GMSH")
+    if not isdir(save_path):
+        makedirs(save_path)
+
+    mySimu = Simu1(name="test_gmsh_72_slots", machine=IPMSM_A)
+    myResults = Output(simu=mySimu)
+
+    start = perf_counter()
+    gmsh_dict = draw_GMSH(
+        output=myResults,
+        sym=1,
+        boundary_prop=boundary_prop,
+        boundary_list=boundary_list,
+        surface_label=surface_label,
+        is_sliding_band=True,
+        is_airbox=True,
+        path_save=join(save_path, "GSMH_model_72_slots.geo"),
+    )
+    duration = perf_counter() - start
+    print("\nGMSH model of the 72 slots machine built in %.2f s" % duration)
+
+    # Each point has a single tag
+    point_dict = dict()
+    for s_data in gmsh_dict.values():
+        for lvalues in s_data.values():
+            if type(lvalues) is not dict:
+                continue
+            for pvalues in lvalues.values():
+                if type(pvalues) is dict and pvalues["tag"] is not None:
+                    coord = pvalues["coord"]
+                    key = (round(coord.real, 5), round(coord.imag, 5))
+                    assert point_dict.setdefault(key, pvalues["tag"]) == pvalues["tag"]
+    assert len(point_dict) > 72 * 10
+    assert duration < 30
+
+
 def encode_complex(z):
     if isinstance(z, complex):
         return (z.real, z.imag)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+from json import dump
+from os import listdir, makedirs, remove, utime
+from os.path import isdir, isfile, join
+from shutil import copyfile, rmtree
+
+import pytest
+
+from pyleecan.Functions.Load import matlib_index
+from pyleecan.Functions.Load.matlib_index import INDEX_FILE_NAME, MatLibIndex
+from pyleecan.Functions.load import load, load_matlib, load_matlib_index
+from pyleecan.definitions import DATA_DIR
+from Tests import save_path
+
+
+def get_matlib_path():
+    """Copy of the reference materials with a subfolder and non material files"""
+    mat_path = join(save_path, "test_matlib_index")
+    if isdir(mat_path):
+        rmtree(mat_path)
+    makedirs(join(mat_path, "Magnet"))
+    for file_name in listdir(join(DATA_DIR, "Material")):
+        if file_name.endswith(".json"):
+            sub_folder = "Magnet" if file_name.startswith("Magnet") else ""
+            copyfile(
+                join(DATA_DIR, "Material", file_name),
+                join(mat_path, sub_folder, file_name),
+            )
+    with open(join(mat_path, "not_a_material.json"), "w") as json_file:
+        dump({"__class__": "MatMagnetics", "mur_lin": 2}, json_file)
+    with open(join(mat_path, "broken.json"), "w") as json_file:
+        json_file.write("{")
+    return mat_path
+
+
+def test_matlib_index(monkeypatch):
+    """Check the listing, refresh, search and on demand loading of a material
+    library"""
+    mat_path = get_matlib_path()
+    matlib = load_matlib(mat_path)
+
+    # Listing: same materials as load_matlib without loading them
+    nb_read = [0]
+    read_entry = matlib_index._read_entry
+
+    def count_read(file_path):
+        nb_read[0] += 1
+        return read_entry(file_path)
+
+    monkeypatch.setattr(matlib_index, "_read_entry", count_read)
+    monkeypatch.setattr(matlib_index, "_load_material", None)
+    index = load_matlib_index(mat_path)
+    assert sorted(index.get_name_list()) == sorted([mat.name for mat in matlib])
+    assert len(index) == len(matlib)
+    # Non material files and Magnet1 (unknown MatMagnet class) are indexed too
+    assert nb_read[0] == len(matlib) + 3
+    assert isfile(join(mat_path, INDEX_FILE_NAME))
+
+    # The index file is used: no file read
+    index = MatLibIndex(mat_path)
+    assert nb_read[0] == len(matlib) + 3
+    assert index.refresh() == 0
+    assert sorted(index.get_name_list()) == sorted([mat.name for mat in matlib])
+
+    # Only the modified, new and removed files are updated
+    M400 = load(join(mat_path, "M400-50A.json"))
+    M400.mag.mur_lin = 1234
+    M400.save(join(mat_path, "M400-50A.json"))
+    utime(join(mat_path, "M400-50A.json"), ns=(1, 1))
+    M400.save(join(mat_path, "Magnet", "M400_copy.json"))
+    remove(join(mat_path, "Copper1.json"))
+    assert index.refresh() == 2
+    assert "M400_copy" in index.get_name_list()
+    assert "Copper1" not in index.get_name_list()
+    assert MatLibIndex(mat_path).refresh() == 0
+
+    # Search by property
+    entry_list = index.search({"mag.mur_lin": 1234})
+    assert sorted(entry["path"] for entry in entry_list) == [
+        "M400-50A.json",
+        "Magnet/M400_copy.json",
+    ]
+    entry_list = index.search({"mag.Brm20": lambda Brm20: Brm20 > 0.5})
+    assert sorted(entry["name"] for entry in entry_list) == [
+        "Magnet3",
+        "Magnet5",
+        "MagnetPrius",
+        "N42UH",
+    ]
+    with pytest.raises(KeyError):
+        index.search({"mag.BH_curve": None})
+
+    # On demand loading
+    monkeypatch.undo()
+    mat = index.get_material("M400_copy")
+    assert mat.name == "M400_copy"
+    assert mat.mag.mur_lin == 1234
+    assert mat.mag.BH_curve == M400.mag.BH_curve
+    mat = index.get_material("Magnet/Magnet3.json")
+    assert mat.name == "Magnet3"
+    assert mat.path == join(mat_path, "Magnet/Magnet3.json")
+    with pytest.raises(KeyError):
+        index.get_material("Magnet1")
+    assert len(index.get_material_list()) == len(index)
+
+    # Index file of another format: not used
+    assert len(MatLibIndex(mat_path, is_refresh=False)) == len(index)
+    monkeypatch.setattr(matlib_index, "INDEX_VERSION", 0)
+    assert MatLibIndex(mat_path, is_refresh=False).entry_dict == dict()
+
+
+if __name__ == "__main__":
+    test_matlib_index(pytest.MonkeyPatch())
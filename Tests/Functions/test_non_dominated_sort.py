@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Classes.OptiObjective import OptiObjective
+from pyleecan.Classes.XOutput import XOutput
+from pyleecan.Functions.Optimization.non_dominated_sort import (
+    crowding_distance,
+    non_dominated_sort,
+)
+from pyleecan.Functions.Optimization.selNSGA2 import selNSGA2
+
+
+def get_front_ref(fitness):
+    """Front index by removing the non dominated individuals front by front"""
+    rank = -np.ones(fitness.shape[0], dtype=int)
+    remaining = np.arange(fitness.shape[0])
+    front = 0
+    while remaining.size > 0:
+        fit = fitness[remaining]
+        is_dom = np.array(
+            [
+                np.any(np.all(fit <= value, axis=1) & np.any(fit < value, axis=1))
+                for value in fit
+            ]
+        )
+        rank[remaining[~is_dom]] = front
+        remaining = remaining[is_dom]
+        front += 1
+    return rank
+
+
+@pytest.mark.parametrize("nb_obj", [1, 2, 3, 4, 5])
+def test_non_dominated_sort(nb_obj):
+    """Check the fronts with continuous and discrete (equal individuals)
+    fitness values"""
+    rng = np.random.RandomState(0)
+    for _ in range(10):
+        fitness = rng.rand(100, nb_obj)
+        assert np.array_equal(non_dominated_sort(fitness), get_front_ref(fitness))
+        fitness = rng.randint(0, 4, (100, nb_obj))
+        assert np.array_equal(non_dominated_sort(fitness), get_front_ref(fitness))
+    assert non_dominated_sort(np.zeros((0, nb_obj))).size == 0
+
+
+def test_crowding_distance():
+    """Check the crowding distance against DEAP assignCrowdingDist"""
+    tools = pytest.importorskip("deap.tools")
+    rng = np.random.RandomState(1)
+    fitness = rng.rand(60, 3)
+    fitness[:5, 0] = 0.5  # Same value in a front
+    rank = non_dominated_sort(fitness)
+    distance = crowding_distance(fitness, rank)
+
+    class Fitness(object):
+        def __init__(self, values):
+            self.values = tuple(values)
+
+    class Individual(object):
+        def __init__(self, values):
+            self.fitness = Fitness(values)
+
+    pop = [Individual(values) for values in fitness]
+    for front in range(rank.max() + 1):
+        tools.emo.assignCrowdingDist([pop[ii] for ii in np.flatnonzero(rank == front)])
+    distance_ref = np.array([indiv.fitness.crowding_dist for indiv in pop])
+    assert np.allclose(distance, distance_ref)
+
+
+def test_selNSGA2():
+    """Check the selection against DEAP selNSGA2: same fronts and same crowding
+    distances in the last front (the ties may be broken differently). No equal
+    objective values: their crowding distances depend on the order."""
+    base = pytest.importorskip("deap.base")
+    tools = pytest.importorskip("deap.tools")
+
+    class FitnessMin(base.Fitness):
+        weights = (-1.0, -1.0, -1.0)
+
+    class Individual(object):
+        def __init__(self, ii, values):
+            self.ii = ii
+            self.fitness = FitnessMin(values)
+
+    rng = np.random.RandomState(2)
+    for _ in range(20):
+        fitness = rng.rand(40, 3)
+        size = rng.randint(1, 40)
+        pop = [Individual(ii, values) for ii, values in enumerate(fitness)]
+        selection = [indiv.ii for indiv in selNSGA2(pop, size)]
+        pop_ref = [Individual(ii, values) for ii, values in enumerate(fitness)]
+        selection_ref = [indiv.ii for indiv in tools.selNSGA2(pop_ref, size)]
+
+        assert len(selection) == len(selection_ref) == size
+        rank = non_dominated_sort(fitness)
+        distance = crowding_distance(fitness, rank)
+        # Sorted by front then by decreasing crowding distance
+        key = list(zip(rank[selection], -distance[selection]))
+        assert key == sorted(key)
+        # Same individuals in the full fronts, same distances in the last one
+        last = rank[selection].max()
+        sel, sel_ref = np.array(selection), np.array(selection_ref)
+        assert set(sel[rank[sel] < last]) == set(sel_ref[rank[sel_ref] < last])
+        assert np.array_equal(
+            np.sort(distance[sel[rank[sel] == last]]),
+            np.sort(distance[sel_ref[rank[sel_ref] == last]]),
+        )
+
+
+def test_get_pareto_index():
+    """Check the pareto front of an XOutput with non valid individuals"""
+    fitness = np.array([[1, 4], [2, 2], [0, 0], [4, 1], [3, 3], [2, 2], [5, 0]])
+    xoutput = XOutput()
+    xoutput.xoutput_dict["is_valid"] = DataKeeper(
+        symbol="is_valid", result=[True, True, False, True, True, True, True]
+    )
+    for ii in range(2):
+        xoutput.xoutput_dict["obj" + str(ii)] = OptiObjective(
+            symbol="obj" + str(ii), result=fitness[:, ii].tolist()
+        )
+
+    assert xoutput.get_pareto_index() == [0, 1, 3, 5, 6]
+    rank, crowding_dist = xoutput.get_pareto_rank()
+    assert rank.tolist() == [0, 0, -1, 0, 1, 0, 0]
+    assert np.isnan(crowding_dist[2])
+    assert crowding_dist[0] == np.inf and crowding_dist[6] == np.inf
+
+
+@pytest.mark.long
+@pytest.mark.parametrize("nb_obj", [2, 3, 4])
+def test_non_dominated_sort_benchmark(nb_obj):
+    """Non dominated sort of 10^4 and 10^5 individuals compared to the
+    previous pareto front computation (10^4 individuals)"""
+    rng = np.random.RandomState(0)
+    fitness = rng.rand(100000, nb_obj)
+
+    result = list()
+    for nb_indiv in [10000, 100000]:
+        t0 = perf_counter()
+        rank = non_dominated_sort(fitness[:nb_indiv])
+        crowding_distance(fitness[:nb_indiv], rank)
+        result.append(perf_counter() - t0)
+
+    # Previous implementation (pareto front only)
+    pareto = fitness[:10000]
+    t0 = perf_counter()
+    idx_non_dom = list(range(len(pareto)))
+    for i in range(len(pareto)):
+        for j in idx_non_dom:
+            if all(pareto[j] <= pareto[i]) and any(pareto[j] < pareto[i]):
+                idx_non_dom.remove(i)
+                break
+    t_ref = perf_counter() - t0
+    assert np.flatnonzero(non_dominated_sort(pareto) == 0).tolist() == idx_non_dom
+
+    print(
+        "\n%d objectives: 10^4 individuals %.3f s (previous pareto front %.1f s), 10^5 individuals %.2f s (%d fronts)"
+        % (nb_obj, result[0], t_ref, result[1], rank.max() + 1)
+    )
+    assert result[0] < t_ref
+    assert result[1] < 30
+
+
+if __name__ == "__main__":
+    for nb_obj in [1, 2, 3, 4, 5]:
+        test_non_dominated_sort(nb_obj)
+    test_crowding_distance()
+    test_selNSGA2()
+    test_get_pareto_index()
+    for nb_obj in [2, 3, 4]:
+        test_non_dominated_sort_benchmark(nb_obj)
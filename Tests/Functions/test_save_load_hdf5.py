@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+from os.path import getsize, join
+from time import perf_counter
+
+import numpy as np
+import pytest
+from h5py import File
+
+from pyleecan.Classes._check import CheckTypeError
+
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Load.lazy_array import LazyArray
+from pyleecan.Functions.Save.save_hdf5 import save_hdf5
+from Tests import save_load_path as save_path
+from Tests.Functions.test_copy import get_FEMM_meshsol
+
+
+@pytest.mark.MeshSol
+def test_save_load_hdf5():
+    """Check the array native h5 format, the previous format and the lazy
+    loading"""
+    meshsol = get_FEMM_meshsol(4, 3)
+    mesh = meshsol.get_mesh()
+
+    file_path = join(save_path, "test_save_load_hdf5.h5")
+    meshsol.save(file_path)
+    with File(file_path, "r") as file:
+        dataset = file["mesh/list_0/point/coordinate"]
+        assert dataset.attrs["ndarray"]
+        assert dataset.attrs["is_lazy"]
+        # ndarrays of SciDataTool objects are never loaded lazily
+        values = file["solution/list_0/field/components/comp_x/values"]
+        assert values.attrs["ndarray"]
+        assert "is_lazy" not in values.attrs.keys()
+    meshsol_load = load(file_path)
+    assert meshsol_load == meshsol
+    assert isinstance(meshsol_load.group["stator core"], np.ndarray)
+    assert meshsol_load.get_mesh().point.coordinate.dtype == mesh.point.coordinate.dtype
+
+    # Previous format (ndarrays converted to lists)
+    file_path_list = join(save_path, "test_save_load_hdf5_list.h5")
+    save_hdf5(meshsol, file_path_list, is_ndarray=False)
+    assert load(file_path_list) == meshsol
+
+    # Lazy loading of the large ndarray properties
+    meshsol = get_FEMM_meshsol(250, 1)
+    meshsol.save(file_path)
+    meshsol_load = load(file_path, is_lazy=True)
+    point = meshsol_load.get_mesh().point
+    assert isinstance(point._coordinate, LazyArray)
+    assert point._coordinate.shape == meshsol.get_mesh().point.coordinate.shape
+    assert isinstance(point.coordinate, np.ndarray)
+    assert not isinstance(point._coordinate, LazyArray)
+    assert meshsol_load == meshsol
+
+    # Save a lazily loaded object in its own file
+    meshsol_load = load(file_path, is_lazy=True)
+    assert isinstance(meshsol_load.get_mesh().point._coordinate, LazyArray)
+    meshsol_load.save(file_path)
+    assert meshsol_load == meshsol
+    assert load(file_path, is_lazy=True) == meshsol
+
+    # The lazy arrays are checked when they are loaded
+    point = load(file_path, is_lazy=True).get_mesh().point
+    point._coordinate.load = lambda: "wrong"
+    with pytest.raises(CheckTypeError):
+        point.coordinate
+
+
+@pytest.mark.long
+@pytest.mark.MeshSol
+def test_save_load_hdf5_benchmark():
+    """Size and time of the h5 files of a FEMM MeshSolution (10^5 triangles,
+    16 time steps) compared to the previous format"""
+    meshsol = get_FEMM_meshsol(224, 16)
+    # FEMM like smooth fields
+    mesh = meshsol.get_mesh()
+    center = np.mean(mesh.point.coordinate[mesh.cell["triangle"].connectivity], axis=1)
+    time = np.linspace(0, 1, 16)[:, None]
+    for sol in meshsol.solution:
+        field = sol.field
+        for data in getattr(field, "components", {"": field}).values():
+            data.values = np.sin(2 * np.pi * (7 * center[:, 0] + time)) + 0.01 * (
+                data.values
+            )
+
+    result = dict()
+    for name, is_ndarray, is_lazy in [
+        ("list", False, False),
+        ("ndarray", True, False),
+        ("lazy", True, True),
+    ]:
+        file_path = join(save_path, "test_save_load_hdf5_" + name + ".h5")
+        t0 = perf_counter()
+        save_hdf5(meshsol, file_path, is_ndarray=is_ndarray)
+        t_save = perf_counter() - t0
+        t0 = perf_counter()
+        meshsol_load = load(file_path, is_lazy=is_lazy)
+        t_load = perf_counter() - t0
+        assert meshsol_load == meshsol
+        result[name] = (getsize(file_path) / 2 ** 20, t_save, t_load)
+
+    print()
+    for name, (size, t_save, t_load) in result.items():
+        print("%s: %.1f MiB, save %.2f s, load %.2f s" % (name, size, t_save, t_load))
+    assert result["ndarray"][0] < result["list"][0]
+    assert result["ndarray"][1] < result["list"][1]
+    assert result["ndarray"][2] < result["list"][2]
+
+
+if __name__ == "__main__":
+    test_save_load_hdf5()
+    test_save_load_hdf5_benchmark()
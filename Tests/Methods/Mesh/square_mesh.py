@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.Interpolation import Interpolation
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.PointMat import PointMat
+from pyleecan.Classes.RefTriangle3 import RefTriangle3
+
+
+def get_square_mesh(N):
+    """Mesh of the unit square with 2*N*N triangles"""
+    x, y = np.meshgrid(np.linspace(0, 1, N + 1), np.linspace(0, 1, N + 1))
+    ind = np.arange((N + 1) ** 2).reshape((N + 1, N + 1))
+    p0, p1 = ind[:-1, :-1].ravel(), ind[:-1, 1:].ravel()
+    p2, p3 = ind[1:, 1:].ravel(), ind[1:, :-1].ravel()
+    connect = np.vstack((np.column_stack((p0, p1, p2)), np.column_stack((p0, p2, p3))))
+
+    mesh = MeshMat(dimension=2)
+    mesh.point = PointMat(
+        coordinate=np.column_stack((x.ravel(), y.ravel())),
+        nb_pt=(N + 1) ** 2,
+        indice=np.arange((N + 1) ** 2),
+    )
+    mesh.cell["triangle"] = CellMat(
+        connectivity=connect,
+        nb_cell=connect.shape[0],
+        nb_pt_per_cell=3,
+        indice=np.arange(connect.shape[0]),
+        interpolation=Interpolation(ref_cell=RefTriangle3(epsilon=1e-10)),
+    )
+    return mesh
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.PointMat import PointMat
+from Tests.Methods.Mesh.square_mesh import get_square_mesh
+
+
+@pytest.mark.MeshSol
+@pytest.mark.METHODS
+def test_add_points():
+    """Check the bulk point creation with duplicated points"""
+    point = PointMat()
+    point.add_point(np.array([1, 2]))
+
+    indice = point.add_points(
+        np.array([[0, 0], [1, 0], [1, 2], [0, 0], [1 + 1e-12, 0], [2, 3]])
+    )
+    assert indice.tolist() == [1, 2, 0, 1, 2, 3]
+    assert point.nb_pt == 4
+    assert point.indice.tolist() == [0, 1, 2, 3]
+    assert point.coordinate.tolist() == [[1, 2], [0, 0], [1, 0], [2, 3]]
+
+    # Point by point creation uses the same hash table
+    assert point.add_point(np.array([2, 3])) is None
+    assert point.add_point(np.array([3, 3])) == 4
+    assert point.add_points(np.zeros((0, 2))).size == 0
+
+    # The arrays are views on buffers with free space (no copy of the
+    # existing points at each call)
+    buffer = point.coordinate.base
+    point.add_point(np.array([4, 3]))
+    assert point.coordinate.base is buffer
+    assert point.coordinate.shape == (6, 2)
+
+    # The hash table is rebuilt if the coordinates are modified
+    point.coordinate = point.coordinate * 2
+    assert point.add_points(np.array([[8, 6], [4, 6]])).tolist() == [5, 3]
+
+    # -0.0 and 0.0 are the same key (between calls and in the rebuilt table)
+    point = PointMat()
+    assert point.add_points(np.array([[0, 1], [1, 0]])).tolist() == [0, 1]
+    assert point.add_points(np.array([[-1e-12, 1], [1, -0.0]])).tolist() == [0, 1]
+    assert point.add_point(np.array([-0.0, 1])) is None
+    point.coordinate = point.coordinate * 1
+    assert point.add_points(np.array([[-1e-12, 1], [1, -1e-12]])).tolist() == [0, 1]
+    assert point.nb_pt == 2
+
+
+@pytest.mark.MeshSol
+@pytest.mark.METHODS
+def test_add_cells():
+    """Check the bulk cell creation with duplicated and wrong cells"""
+    mesh = MeshMat()
+    mesh.cell["triangle"] = CellMat(nb_pt_per_cell=3)
+    mesh.cell["segment"] = CellMat(nb_pt_per_cell=2)
+    mesh.add_cell(np.array([0, 1]), "segment")
+
+    indice = mesh.add_cells(
+        np.array([[0, 1, 2], [1, 2, 3], [2, 1, 0], [4, 4, 3], [3, 4, 2]]), "triangle"
+    )
+    assert indice.tolist() == [1, 2, 1, -1, 3]
+    cells = mesh.cell["triangle"]
+    assert cells.nb_cell == 3
+    assert cells.indice.tolist() == [1, 2, 3]
+    assert cells.connectivity.tolist() == [[0, 1, 2], [1, 2, 3], [3, 4, 2]]
+
+    assert mesh.add_cell(np.array([3, 2, 1]), "triangle") is None
+    assert mesh.add_cell(np.array([3, 2, 5]), "triangle") is not None
+    assert cells.is_exist([5, 2, 3])
+    assert cells.nb_cell == 4
+    new_ind = cells.indice[-1] + 1
+    indice = mesh.add_cells(np.array([[1, 0], [1, 2]]), "segment")
+    assert indice.tolist() == [0, new_ind]
+
+
+@pytest.mark.long
+@pytest.mark.MeshSol
+@pytest.mark.parametrize("N", [224, 708])
+def test_add_points_benchmark(N):
+    """Build a mesh of 10^5 and 10^6 triangles from a mesh file like data
+    (each triangle has its own points, the shared points are merged)
+    """
+    ref_mesh = get_square_mesh(N)
+    connect = ref_mesh.cell["triangle"].connectivity
+    coord = ref_mesh.point.coordinate[connect.ravel()]
+
+    t0 = perf_counter()
+    mesh = MeshMat()
+    mesh.cell["triangle"] = CellMat(nb_pt_per_cell=3)
+    pt_indice = mesh.point.add_points(coord)
+    mesh.add_cells(pt_indice.reshape((-1, 3)), "triangle")
+    t_bulk = perf_counter() - t0
+
+    assert mesh.point.nb_pt == ref_mesh.point.nb_pt
+    assert mesh.cell["triangle"].nb_cell == connect.shape[0]
+    assert np.array_equal(
+        mesh.point.coordinate[mesh.cell["triangle"].connectivity],
+        ref_mesh.point.coordinate[connect],
+    )
+
+    # Incremental creation of the last 1000 cells
+    mesh = MeshMat()
+    mesh.cell["triangle"] = CellMat(nb_pt_per_cell=3)
+    mesh.add_cells(connect[:-1000], "triangle")
+    t0 = perf_counter()
+    for cell in connect[-1000:]:
+        mesh.add_cell(cell, "triangle")
+    t_incr = perf_counter() - t0
+    assert mesh.cell["triangle"].nb_cell == connect.shape[0]
+
+    print(
+        "\n%d cells: bulk creation %.2f s, add_cell %.1f us"
+        % (connect.shape[0], t_bulk, t_incr / 1000 * 1e6)
+    )
+    # No copy of the connectivity nor duplicate search on all the cells
+    assert t_incr / 1000 < 1e-3
+
+
+if __name__ == "__main__":
+    test_add_points()
+    test_add_cells()
+    for N in [224, 708]:
+        test_add_points_benchmark(N)
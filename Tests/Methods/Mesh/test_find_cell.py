@@ -9,6 +9,7 @@ from pyleecan.Classes.MeshSolution import MeshSolution
 from pyleecan.Classes.PointMat import PointMat
 from pyleecan.Classes.RefSegmentP1 import RefSegmentP1
 from pyleecan.Classes.RefTriangle3 import RefTriangle3
+from Tests.Methods.Mesh.square_mesh import get_square_mesh
 
 
 @pytest.mark.MeshSol
@@ -112,7 +113,59 @@ def test_triangle3():
     assert testA is True
 
 
+@pytest.mark.MeshSol
+def test_find_cell_batch():
+    """Check the batch point location against the reference coordinates"""
+    N = 20
+    mesh = get_square_mesh(N)
+    points = np.random.RandomState(0).uniform(-0.1, 1.1, (1000, 2))
+
+    cell_ind, point_ref = mesh.find_cell_batch(points)
+
+    is_out = np.any((points < 0) | (points > 1), axis=1)
+    assert np.all(cell_ind[is_out] == -1)
+    assert np.all(np.isnan(point_ref[is_out]))
+    assert np.all(cell_ind[~is_out] >= 0)
+
+    # The reference coordinates give back the points
+    connect = mesh.cell["triangle"].connectivity
+    vert = mesh.point.coordinate[connect[cell_ind[~is_out]]]
+    s, t = point_ref[~is_out, 0], point_ref[~is_out, 1]
+    assert np.all((s > -1e-10) & (t > -1e-10) & (1 - s - t > -1e-10))
+    point_calc = (
+        vert[:, 0] * (1 - s - t)[:, None]
+        + vert[:, 1] * s[:, None]
+        + vert[:, 2] * t[:, None]
+    )
+    assert point_calc == pytest.approx(points[~is_out], abs=1e-12)
+
+    # Same result as the cell by cell search
+    ref_cell = mesh.cell["triangle"].interpolation.ref_cell
+    for ii, pt in enumerate(points[~is_out][:50]):
+        assert ref_cell.is_inside(vert[ii], pt)[0]
+
+    # The spatial index is rebuilt when the mesh is modified
+    tree = mesh.get_search_tree("triangle")
+    assert mesh.get_search_tree("triangle") is tree
+    mesh.point.coordinate = mesh.point.coordinate + 2
+    assert mesh.get_search_tree("triangle") is not tree
+    cell_ind_2 = mesh.find_cell_batch(points + 2)[0]
+    assert np.all(cell_ind_2 == cell_ind)
+
+    # Point indices that are not the rows of the coordinates
+    mesh.point.coordinate = mesh.point.coordinate - 2
+    perm = np.random.RandomState(1).permutation(mesh.point.nb_pt)
+    mesh.point.coordinate = mesh.point.coordinate[perm]
+    mesh.point.indice = 10 + perm
+    mesh.cell["triangle"].connectivity = 10 + connect
+    assert np.array_equal(mesh.point.get_row(10 + perm), np.arange(perm.size))
+    cell_ind_3, point_ref_3 = mesh.find_cell_batch(points)
+    assert np.all(cell_ind_3 == cell_ind)
+    assert point_ref_3[~is_out] == pytest.approx(point_ref[~is_out], abs=1e-12)
+
+
 if __name__ == "__main__":
 
     test_line()
     test_triangle3()
+    test_find_cell_batch()
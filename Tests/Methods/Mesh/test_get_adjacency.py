@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.PointMat import PointMat
+from Tests.Methods.Mesh.square_mesh import get_square_mesh
+
+
+@pytest.mark.MeshSol
+@pytest.mark.METHODS
+def test_get_adjacency():
+    """Check the point to cell and cell to cell adjacency"""
+    mesh = MeshMat()
+    mesh.cell["triangle"] = CellMat(nb_pt_per_cell=3)
+    mesh.point = PointMat()
+    for coord in [[0, 0], [1, 0], [1, 2], [2, 3], [3, 3], [5, 5]]:
+        mesh.point.add_point(np.array(coord))
+    mesh.add_cell(np.array([0, 1, 2]), "triangle")
+    mesh.add_cell(np.array([1, 2, 3]), "triangle")
+    mesh.add_cell(np.array([4, 2, 3]), "triangle")
+
+    point2cell = mesh.get_adjacency("triangle")
+    assert point2cell.shape == (5, 3)
+    assert point2cell.indices[point2cell.indptr[2] : point2cell.indptr[3]].tolist() == [
+        0,
+        1,
+        2,
+    ]
+    assert mesh.get_point2cell(1).tolist() == [0, 1]
+    assert mesh.get_point2cell(5).tolist() == []
+
+    cell2cell = mesh.get_adjacency("triangle", "cell2cell")
+    assert cell2cell.indices[cell2cell.indptr[0] : cell2cell.indptr[1]].tolist() == [
+        1,
+        2,
+    ]
+    # Number of common points
+    assert cell2cell[1, 2] == 2
+    assert cell2cell[0, 2] == 1
+
+    # Cached until the connectivity is modified
+    assert mesh.get_adjacency("triangle") is point2cell
+    assert mesh.cell["triangle"].is_exist([3, 1, 2])
+    assert not mesh.cell["triangle"].is_exist([3, 4, 5])
+    mesh.add_cell(np.array([3, 4, 5]), "triangle")
+    assert mesh.get_adjacency("triangle") is not point2cell
+    assert mesh.cell["triangle"].is_exist([3, 4, 5])
+    assert mesh.get_point2cell(5).tolist() == [3]
+
+    with pytest.raises(ValueError):
+        mesh.get_adjacency("triangle", "point2point")
+
+
+@pytest.mark.long
+@pytest.mark.MeshSol
+@pytest.mark.parametrize("N", [224, 500, 708])
+def test_get_adjacency_benchmark(N):
+    """Adjacency of 10^5 to 10^6 triangles: the build time is linear
+    and the queries do not depend on the mesh size
+    """
+    mesh = get_square_mesh(N)
+    cells = mesh.cell["triangle"]
+    nb_cell = cells.nb_cell
+
+    t0 = perf_counter()
+    mesh.get_adjacency("triangle")
+    t_point2cell = perf_counter() - t0
+
+    t0 = perf_counter()
+    mesh.get_adjacency("triangle", "cell2cell")
+    t_cell2cell = perf_counter() - t0
+
+    nb_query = 1000
+    pt_list = np.random.RandomState(0).randint(0, mesh.point.nb_pt, nb_query)
+    t0 = perf_counter()
+    for pt in pt_list:
+        mesh.get_point2cell(pt)
+    t_query = (perf_counter() - t0) / nb_query
+
+    t0 = perf_counter()
+    for ii in range(nb_query):
+        assert cells.is_exist(cells.connectivity[ii][::-1])
+    t_exist = (perf_counter() - t0) / nb_query
+
+    print(
+        "\n%d cells: point2cell %.3f s, cell2cell %.3f s, "
+        "get_point2cell %.1f us, is_exist %.1f us"
+        % (nb_cell, t_point2cell, t_cell2cell, t_query * 1e6, t_exist * 1e6)
+    )
+    # Each query only reads a row of the adjacency
+    assert t_query < 1e-3
+    assert t_exist < 1e-3
+
+
+if __name__ == "__main__":
+    test_get_adjacency()
+    for N in [224, 500, 708]:
+        test_get_adjacency_benchmark(N)
@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
+import gc
+import weakref
+
 import pytest
 
 from pyleecan.Classes.MeshMat import MeshMat
 from pyleecan.Classes.CellMat import CellMat
 from pyleecan.Classes.MeshSolution import MeshSolution
 from pyleecan.Classes.PointMat import PointMat
+from pyleecan.Classes.SolutionMat import SolutionMat
 import numpy as np
 
 
@@ -54,5 +58,72 @@ def test_MeshMat_1group():
     assert testA == pytest.approx(0, rel=DELTA), msg
 
 
+@pytest.mark.METHODS
+@pytest.mark.MeshSol
+def test_get_group_cache():
+    """Check that the group extraction is cached until the MeshSolution is
+    modified"""
+
+    mesh = MeshMat()
+    mesh.cell["triangle"] = CellMat(nb_pt_per_cell=3)
+    mesh.point.add_points(np.array([[0, 0], [1, 0], [1, 2], [2, 3], [3, 3]]))
+    mesh.add_cells(np.array([[0, 1, 2], [1, 2, 3], [4, 2, 3]]), "triangle")
+
+    meshsol = MeshSolution(mesh=[mesh])
+    meshsol.group = {"stator": np.array([0, 1]), "rotor": np.array([2])}
+    meshsol.solution = [
+        SolutionMat(
+            label="B",
+            type_cell="triangle",
+            field=np.array([[1.0, 2.0, 3.0]]),
+            indice=mesh.cell["triangle"].indice,
+            axis_name=["time", "indice"],
+            axis_size=[1, 3],
+        )
+    ]
+
+    MS_grp = meshsol.get_group("stator")
+    assert MS_grp.solution[0].field.tolist() == [[1, 2]]
+
+    # Same arrays, new MeshSolution, mesh and solutions (can be modified)
+    MS_grp_2 = meshsol.get_group("stator")
+    assert MS_grp_2 is not MS_grp
+    assert MS_grp_2.get_mesh() is not MS_grp.get_mesh()
+    connect = MS_grp.get_mesh().cell["triangle"].connectivity
+    assert MS_grp_2.get_mesh().cell["triangle"].connectivity is connect
+    assert MS_grp_2.solution[0].field is MS_grp.solution[0].field
+    MS_grp_2.solution = list()
+    assert len(meshsol.get_group("stator").solution) == 1
+    MS_grp_2 = meshsol.get_group(["stator"])
+    assert MS_grp_2.get_mesh().cell["triangle"].connectivity is not connect
+
+    # Modifications of the groups, the solutions or the mesh
+    meshsol.group["stator"] = np.array([1, 2])
+    MS_grp_2 = meshsol.get_group("stator")
+    assert MS_grp_2.solution[0].field.tolist() == [[2, 3]]
+
+    meshsol.solution[0].field = np.array([[4.0, 5.0, 6.0]])
+    MS_grp_3 = meshsol.get_group("stator")
+    assert MS_grp_3.solution[0].field.tolist() == [[5, 6]]
+    connect = MS_grp_3.get_mesh().cell["triangle"].connectivity
+    assert connect is not MS_grp_2.get_mesh().cell["triangle"].connectivity
+    assert meshsol.get_group("stator").get_mesh().cell["triangle"].connectivity is (
+        connect
+    )
+
+    mesh.add_cell(np.array([0, 1, 3]), "triangle")
+    MS_grp_4 = meshsol.get_group("stator")
+    assert MS_grp_4.get_mesh().cell["triangle"].connectivity is not connect
+
+    # The cache does not keep the MeshSolution (nor the group ones) alive
+    meshsol_ref = weakref.ref(meshsol)
+    MS_grp_ref = weakref.ref(MS_grp_3)
+    del meshsol, mesh, MS_grp, MS_grp_2, MS_grp_3, MS_grp_4
+    gc.collect()
+    assert meshsol_ref() is None
+    assert MS_grp_ref() is None
+
+
 if __name__ == "__main__":
     Xout = test_MeshMat_1group()
+    test_get_group_cache()
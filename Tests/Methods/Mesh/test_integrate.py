@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.Interpolation import Interpolation
+from pyleecan.Classes.RefSegmentP1 import RefSegmentP1
+from Tests.Methods.Mesh.square_mesh import get_square_mesh
+
+
+@pytest.mark.MeshSol
+def test_integrate():
+    """Check the geometric factors and the integration on a mesh of the unit
+    square"""
+    N = 8
+    Nt = 3
+    mesh = get_square_mesh(N)
+    coord = mesh.point.coordinate
+    nb_cell = mesh.cell["triangle"].nb_cell
+
+    geometry = mesh.get_cell_geometry("triangle")
+    assert geometry["area"] == pytest.approx(np.full(nb_cell, 0.5 / N ** 2))
+    assert mesh.get_cell_area() == pytest.approx(geometry["area"])
+    assert mesh.get_cell_area(indices=[3, 1]) == pytest.approx([0.5 / N ** 2] * 2)
+    jacob = geometry["jacob"]
+    assert np.einsum("cgij,cgjk->cgik", jacob, geometry["inv_jacob"]) == (
+        pytest.approx(np.broadcast_to(np.eye(2), jacob.shape))
+    )
+    # Exact gradient of a linear field
+    u = 2 * coord[:, 0] - 3 * coord[:, 1]
+    connect = mesh.cell["triangle"].connectivity
+    grad = np.einsum("cgbn,cn->cgb", geometry["grad_shape"], u[connect])
+    assert grad[..., 0] == pytest.approx(2)
+    assert grad[..., 1] == pytest.approx(-3)
+    # Cached until the mesh is modified
+    assert mesh.get_cell_geometry() is geometry
+    mesh.point.coordinate = coord * 2
+    assert mesh.get_cell_area().sum() == pytest.approx(4)
+    mesh.point.coordinate = coord
+
+    # Field on the points (linear: exact) and on the cells, on all the steps
+    coeff = np.arange(1, Nt + 1)
+    field = coeff[:, None] * (coord[:, 0] + 2 * coord[:, 1])[None, :]
+    assert mesh.integrate(field, is_point=True) == pytest.approx(1.5 * coeff)
+    field = coeff[:, None] * np.ones(nb_cell)[None, :]
+    assert mesh.integrate(field) == pytest.approx(coeff)
+    # Group of cells (field on all the cells or on the group only)
+    group = np.arange(nb_cell // 2)
+    assert mesh.integrate(field, group=group) == pytest.approx(coeff / 2)
+    assert mesh.integrate(field[:, group], group=group) == pytest.approx(coeff / 2)
+
+    # Segments: length
+    mesh.cell["line"] = CellMat(
+        connectivity=np.array([[0, 1], [1, 2]]),
+        nb_cell=2,
+        nb_pt_per_cell=2,
+        indice=np.array([10, 11]),
+        interpolation=Interpolation(ref_cell=RefSegmentP1()),
+    )
+    assert mesh.get_cell_geometry("line")["area"] == pytest.approx([1 / N] * 2)
+    assert mesh.integrate(
+        coord[:, 0] ** 0, group=[11], key="line", is_point=True
+    ) == pytest.approx(1 / N)
+
+
+if __name__ == "__main__":
+    test_integrate()
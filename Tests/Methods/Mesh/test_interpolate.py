@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.MeshSolution import MeshSolution
+from pyleecan.Classes.SolutionMat import SolutionMat
+from Tests.Methods.Mesh.square_mesh import get_square_mesh
+
+
+@pytest.mark.MeshSol
+def test_interpolate(monkeypatch):
+    """Check the interpolation of nodal and cell solutions at arbitrary points"""
+    N = 10
+    Nt = 3
+    mesh = get_square_mesh(N)
+    coord = mesh.point.coordinate
+    nb_cell = mesh.cell["triangle"].nb_cell
+    # Linear nodal field (exact interpolation) and constant field on the cells
+    coeff = np.arange(1, Nt + 1)
+    field_pt = np.zeros((Nt, coord.shape[0], 2))
+    field_pt[:, :, 0] = coeff[:, None] * (2 * coord[:, 0] - coord[:, 1])
+    field_pt[:, :, 1] = coeff[:, None] * 3
+    field_cell = np.arange(nb_cell)[None, :] * coeff[:, None]
+
+    meshsol = MeshSolution(mesh=[mesh], dimension=2)
+    meshsol.solution = [
+        SolutionMat(
+            field=field_pt,
+            type_cell="point",
+            label="U",
+            axis_name=["time", "indice", "component"],
+            axis_size=[Nt, coord.shape[0], 2],
+        ),
+        SolutionMat(
+            field=field_cell,
+            type_cell="triangle",
+            label="mu",
+            axis_name=["time", "indice"],
+            axis_size=[Nt, nb_cell],
+        ),
+    ]
+
+    points = np.random.RandomState(0).uniform(-0.1, 1.1, (500, 2))
+    is_out = np.any((points < 0) | (points > 1), axis=1)
+
+    values = meshsol.interpolate(points, label="U")
+    assert values.shape == (Nt, 500, 2)
+    assert np.all(np.isnan(values[:, is_out]))
+    x, y = points[~is_out, 0], points[~is_out, 1]
+    assert values[:, ~is_out, 0] == pytest.approx(
+        coeff[:, None] * (2 * x - y)[None, :], abs=1e-12
+    )
+    assert values[:, ~is_out, 1] == pytest.approx(3 * coeff[:, None] + 0 * x)
+
+    # The interpolation matrix is cached for the same points
+    nb_call = [0]
+    find_cell_batch = MeshMat.find_cell_batch
+
+    def count_call(*args, **kwargs):
+        nb_call[0] += 1
+        return find_cell_batch(*args, **kwargs)
+
+    monkeypatch.setattr(MeshMat, "find_cell_batch", count_call)
+    values_2 = meshsol.interpolate(points, label="U")
+    assert nb_call[0] == 0
+    assert np.array_equal(values_2, values, equal_nan=True)
+    # Until the mesh is modified
+    mesh.point.coordinate = coord * 2
+    values_2 = meshsol.interpolate(points * 2, label="U")
+    assert nb_call[0] == 1
+    assert np.array_equal(values_2, values, equal_nan=True)
+    mesh.point.coordinate = coord
+    # Several point sets are cached (same values in a new array: no location)
+    points_2 = points[::-1]
+    values_2 = meshsol.interpolate(points_2, label="U")
+    assert np.array_equal(values_2, values[:, ::-1], equal_nan=True)
+    nb_call[0] = 0
+    for _ in range(2):
+        assert np.array_equal(
+            meshsol.interpolate(points.copy(), label="U"), values, equal_nan=True
+        )
+        assert np.array_equal(
+            meshsol.interpolate(points_2, label="U"), values_2, equal_nan=True
+        )
+    assert nb_call[0] == 1
+    monkeypatch.undo()
+
+    # Cell solution: value of the cell containing each point
+    values = meshsol.interpolate(points, label="mu")
+    assert values.shape == (Nt, 500)
+    assert np.all(np.isnan(values[:, is_out]))
+    cell_ind, _ = mesh.find_cell_batch(points[~is_out])
+    assert values[:, ~is_out] == pytest.approx(cell_ind[None, :] * coeff[:, None])
+
+    # Point indices that are not the rows of the coordinates (the nodal field
+    # is ordered as the coordinates)
+    values = meshsol.interpolate(points, label="U")
+    perm = np.random.RandomState(1).permutation(coord.shape[0])
+    mesh.point.coordinate = coord[perm]
+    mesh.point.indice = 10 + perm
+    mesh.cell["triangle"].connectivity = 10 + mesh.cell["triangle"].connectivity
+    meshsol.solution[0].field = field_pt[:, perm]
+    assert np.allclose(meshsol.interpolate(points, label="U"), values, equal_nan=True)
+
+
+if __name__ == "__main__":
+    test_interpolate(pytest.MonkeyPatch())
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from pyleecan.Classes.CellMat import CellMat
+from pyleecan.Classes.MeshMat import MeshMat
+from pyleecan.Classes.MeshSolution import MeshSolution
+from pyleecan.Classes.PointMat import PointMat
+from pyleecan.Classes.SolutionMat import SolutionMat
+from Tests.Methods.Mesh.square_mesh import get_square_mesh
+
+
+@pytest.mark.MeshSol
+@pytest.mark.METHODS
+def test_renum():
+    """Check that renum removes the unused points and keeps the cells"""
+    mesh = MeshMat()
+    mesh.cell["triangle"] = CellMat(nb_pt_per_cell=3)
+    mesh.cell["segment"] = CellMat(nb_pt_per_cell=2)
+    mesh.point = PointMat()
+    mesh.point.add_points(np.array([[0, 0], [1, 0], [1, 2], [2, 3], [3, 3], [4, 4]]))
+    mesh.add_cell(np.array([4, 2, 3]), "triangle")
+    mesh.add_cell(np.array([5, 3]), "segment")
+    vertice = mesh.point.coordinate[mesh.cell["triangle"].connectivity]
+
+    mesh.renum()
+
+    assert mesh.point.nb_pt == 4
+    assert mesh.point.indice.tolist() == [0, 1, 2, 3]
+    assert mesh.point.coordinate.tolist() == [[1, 2], [2, 3], [3, 3], [4, 4]]
+    assert mesh.cell["triangle"].connectivity.tolist() == [[2, 0, 1]]
+    assert mesh.cell["segment"].connectivity.tolist() == [[3, 1]]
+    assert mesh.cell["triangle"].indice.tolist() == [0]
+    assert mesh.cell["segment"].indice.tolist() == [1]
+    assert np.array_equal(
+        mesh.point.coordinate[mesh.cell["triangle"].connectivity], vertice
+    )
+
+
+def get_meshsol(N):
+    """MeshSolution on the square mesh with a "left" and a "right" group,
+    a cell solution (cell indice) and a point solution (x coordinate)
+    """
+    mesh = get_square_mesh(N)
+    cells = mesh.cell["triangle"]
+    center = np.mean(mesh.point.coordinate[cells.connectivity], axis=1)
+
+    meshsol = MeshSolution(mesh=[mesh])
+    meshsol.group = {
+        "left": cells.indice[center[:, 0] < 0.5],
+        "right": cells.indice[center[:, 0] >= 0.5],
+    }
+    nb_time = 3
+    meshsol.solution = [
+        SolutionMat(
+            label="cell_ind",
+            type_cell="triangle",
+            field=np.tile(cells.indice, (nb_time, 1)),
+            indice=cells.indice,
+            axis_name=["time", "indice"],
+            axis_size=[nb_time, cells.nb_cell],
+        ),
+        SolutionMat(
+            label="x",
+            type_cell="point",
+            field=np.tile(mesh.point.coordinate[:, 0], (nb_time, 1)),
+            indice=mesh.point.indice,
+            axis_name=["time", "indice"],
+            axis_size=[nb_time, mesh.point.nb_pt],
+        ),
+    ]
+    return meshsol
+
+
+def check_group(meshsol, meshsol_grp, group_name):
+    """Check the mesh and the solutions of a group"""
+    mesh = meshsol.get_mesh()
+    mesh_grp = meshsol_grp.get_mesh()
+    group = meshsol.group[group_name]
+    cells_grp = mesh_grp.cell["triangle"]
+
+    assert cells_grp.indice.tolist() == group.tolist()
+    connect = mesh.cell["triangle"].connectivity[group]
+    assert np.array_equal(
+        mesh_grp.point.coordinate[cells_grp.connectivity],
+        mesh.point.coordinate[mesh.point.get_row(connect)],
+    )
+    # Only the points of the group are kept
+    assert mesh_grp.point.nb_pt == np.unique(cells_grp.connectivity).size
+
+    sol_cell, sol_point = meshsol_grp.solution
+    assert np.array_equal(sol_cell.field[0], group)
+    assert np.array_equal(sol_point.field[0], mesh_grp.point.coordinate[:, 0])
+
+
+@pytest.mark.MeshSol
+@pytest.mark.METHODS
+def test_get_group_renum():
+    """Check the group extraction (mesh and solutions)"""
+    meshsol = get_meshsol(10)
+    for group_name in ["left", "right"]:
+        check_group(meshsol, meshsol.get_group(group_name), group_name)
+
+    # Point indices that are not the rows of the coordinates
+    mesh = meshsol.get_mesh()
+    perm = np.random.RandomState(0).permutation(mesh.point.nb_pt)
+    mesh.point.coordinate = mesh.point.coordinate[perm]
+    mesh.point.indice = 10 + perm
+    mesh.cell["triangle"].connectivity = 10 + mesh.cell["triangle"].connectivity
+    sol_point = meshsol.solution[1]
+    sol_point.field = sol_point.field[:, perm]
+    sol_point.indice = mesh.point.indice
+    for group_name in ["left", "right"]:
+        check_group(meshsol, meshsol.get_group(group_name), group_name)
+
+
+@pytest.mark.long
+@pytest.mark.MeshSol
+def test_get_group_benchmark():
+    """Group extraction on a FEMM-sized mesh (10^5 triangles, half of them
+    in the group)
+    """
+    meshsol = get_meshsol(224)
+
+    t0 = perf_counter()
+    meshsol_grp = meshsol.get_group("left")
+    t_group = perf_counter() - t0
+
+    # Second call (e.g. one call per loss model): cached group
+    t0 = perf_counter()
+    meshsol.get_group("left")
+    t_cached = perf_counter() - t0
+
+    t0 = perf_counter()
+    meshsol_grp.get_mesh().renum()
+    t_renum = perf_counter() - t0
+
+    check_group(meshsol, meshsol_grp, "left")
+    print(
+        "\n%d cells: get_group %.3f s (cached %.1f ms), renum %.3f s"
+        % (
+            meshsol.get_mesh().cell["triangle"].nb_cell,
+            t_group,
+            t_cached * 1e3,
+            t_renum,
+        )
+    )
+    # Previous implementation: several minutes (loop on the points)
+    assert t_group < 10
+    assert t_renum < 1
+    assert t_cached < 0.01
+
+
+if __name__ == "__main__":
+    test_renum()
+    test_get_group_renum()
+    test_get_group_benchmark()
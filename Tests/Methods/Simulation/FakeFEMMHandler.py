@@ -0,0 +1,97 @@
+import re
+from os.path import join
+
+from numpy import arctan2, cos, sin, pi
+
+
+class FakeFEMMHandler(object):
+    """Stand-in for _FEMMHandler (FEMM is not needed) to test and benchmark
+    the FEMM post-processing on any platform.
+    The airgap flux density is analytical and every FEMM call is counted.
+    """
+
+    def __init__(self, p=4, Bm=1.2, Bt_ratio=0.1):
+        object.__init__(self)
+        self.p = p  # Number of pole pairs of the analytical field
+        self.Bm = Bm  # Amplitude of the radial flux density
+        self.Bt_ratio = Bt_ratio  # Amplitude ratio tangential / radial
+        self.nb_call = 0  # Number of calls to FEMM
+        self.call_list = list()  # Name of the called FEMM commands
+        self.HandleToFEMM = None
+        self.document = None  # Path to the opened document
+
+    def openfemm(self, *arg):
+        self._count("openfemm")
+        if self.HandleToFEMM is not None:
+            raise Exception("An instance FEMM is already open")
+        self.HandleToFEMM = "FakeFEMM"
+
+    def closefemm(self):
+        self.HandleToFEMM = None
+        self.document = None
+
+    def opendocument(self, path):
+        self._count("opendocument")
+        self.document = path
+
+    def comp_B(self, angle):
+        """Analytical airgap flux density (Br, Bt) at angle [rad]"""
+        Br = self.Bm * cos(self.p * angle)
+        Bt = self.Bt_ratio * self.Bm * sin(self.p * angle)
+        return Br, Bt
+
+    def _count(self, name):
+        self.nb_call += 1
+        self.call_list.append(name)
+
+    def mo_getgapb(self, bc_name, angle):
+        self._count("mo_getgapb")
+        return list(self.comp_B(angle * pi / 180))
+
+    def mo_getb(self, x, y):
+        self._count("mo_getb")
+        angle = arctan2(y, x)
+        Br, Bt = self.comp_B(angle)
+        return [Br * cos(angle) - Bt * sin(angle), Br * sin(angle) + Bt * cos(angle)]
+
+    def callfemm(self, myString):
+        self._count(myString.split("(")[0])
+        if myString.startswith("dofile("):
+            self._dofile(myString[8:-2])
+
+    def _dofile(self, path_lua):
+        """Execute the airgap flux LUA script (parsed instead of interpreted)"""
+        with open(path_lua, "r") as file_lua:
+            text_lua = file_lua.read()
+        path_txt = re.search(r'path_txt = "(.*)"', text_lua).group(1)
+        idworker = re.search(r"idworker = (\d+)", text_lua).group(1)
+        is_sliding_band = re.search(r"is_sliding_band = (\d)", text_lua).group(1)
+        p1 = [float(p) for p in re.search(r"p1 = {(.*)}", text_lua).group(1).split(",")]
+        if is_sliding_band == "1":
+            B_list = [self.comp_B(p * pi / 180) for p in p1]
+        else:
+            p2 = re.search(r"p2 = {(.*)}", text_lua).group(1).split(",")
+            B_list = list()
+            for x, y in zip(p1, p2):
+                angle = arctan2(float(y), x)
+                Br, Bt = self.comp_B(angle)
+                B_list.append(
+                    (
+                        Br * cos(angle) - Bt * sin(angle),
+                        Br * sin(angle) + Bt * cos(angle),
+                    )
+                )
+        with open(join(path_txt, "airgap_B" + idworker + ".txt"), "w") as file_txt:
+            for b1, b2 in B_list:
+                file_txt.write(repr(float(b1)) + " " + repr(float(b2)) + "\n")
+
+    def __getattr__(self, name):
+        """Any other FEMM command is counted and returns 0"""
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def femm_cmd(*arg):
+            self._count(name)
+            return 0
+
+        return femm_cmd
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from SciDataTool import Data1D, DataTime, VectorField
+
+from pyleecan.Classes.ForceMT import ForceMT
+from pyleecan.Classes.OutForce import OutForce
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+
+
+def get_output(Rag=0.0465):
+    """Output with an analytical AGSF (3 harmonics) at the radius Rag"""
+    time = np.linspace(0, 1 / 50, 16, endpoint=False)
+    angle = np.linspace(0, 2 * np.pi, 64, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    t, a = np.meshgrid(time, angle, indexing="ij")
+    w = 2 * np.pi * 50
+    AGSF_r = 1e5 + 2e4 * np.cos(2 * w * t - 8 * a) + 5e3 * np.cos(4 * w * t - 16 * a)
+    AGSF_t = 1e4 * np.sin(2 * w * t - 8 * a) + 1e3 * np.cos(6 * a)
+
+    AGSF = VectorField(name="Air gap Surface Force", symbol="AGSF")
+    AGSF.components["radial"] = DataTime(
+        name="Radial AGSF", symbol="AGSF_r", axes=[Time, Angle], values=AGSF_r
+    )
+    AGSF.components["tangential"] = DataTime(
+        name="Tangential AGSF", symbol="AGSF_t", axes=[Time, Angle], values=AGSF_t
+    )
+    output = Output(simu=Simu1(force=ForceMT()))
+    output.force = OutForce(AGSF=AGSF, Rag=Rag)
+    return output
+
+
+@pytest.mark.parametrize("rnoise", [None, 10])
+def test_AGSF_transfer_batch(rnoise):
+    """Check the batched transfer against the transfer to each radius"""
+    Rsbo = np.array([0.047, 0.048, 0.05])
+    output = get_output()
+    force = output.simu.force
+
+    AGSF_transfer = force.comp_AGSF_transfer_batch(output, Rsbo, rnoise)
+    AGSF_fact = force.comp_AGSF_transfer_batch(output, Rsbo, rnoise, is_factorized=True)
+    assert AGSF_transfer.Prad_TR.shape == (3,) + AGSF_transfer.Prad.shape
+    assert AGSF_fact.Prad_TR is None and AGSF_fact.Sn.shape == (3, 64)
+
+    for ii, R in enumerate(Rsbo):
+        out_ref = get_output()
+        force.Rsbo_enforced_transfer = R
+        force.comp_AGSF_transfer(out_ref, rnoise)
+        result = out_ref.force.AGSF.get_rphiz_along("freqs", "wavenumber")
+        for Prad, Ptan in [
+            (AGSF_transfer.Prad_TR[ii], AGSF_transfer.Ptan_TR[ii]),
+            AGSF_fact.get_spectrum(ii),
+        ]:
+            assert np.allclose(Prad, result["radial"])
+            assert np.allclose(Ptan, result["tangential"])
+
+        # Same VectorField as the single radius transfer
+        AGSF = AGSF_fact.get_AGSF(ii)
+        result_ii = AGSF.get_rphiz_along("freqs", "wavenumber")
+        assert np.allclose(result_ii["radial"], result["radial"])
+
+    # All the radii with a radius axis
+    AGSF = AGSF_fact.get_AGSF()
+    assert AGSF.components["radial"].values.shape == AGSF_transfer.Prad_TR.shape
+    assert np.allclose(AGSF.components["tangential"].values, AGSF_transfer.Ptan_TR)
+    assert np.allclose(
+        AGSF_fact.get_spectrum(slice(1, 3))[0], AGSF_transfer.Prad_TR[1:3]
+    )
+
+
+if __name__ == "__main__":
+    test_AGSF_transfer_batch(None)
+    test_AGSF_transfer_batch(10)
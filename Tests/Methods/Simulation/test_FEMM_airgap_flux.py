@@ -0,0 +1,60 @@
+from os import listdir, makedirs
+from os.path import join, isdir
+
+import pytest
+from numpy import linspace, pi, cos, sin
+from numpy.testing import assert_allclose
+
+from pyleecan.Functions.FEMM.comp_FEMM_airgap_flux import (
+    comp_FEMM_airgap_flux,
+    write_FEMM_airgap_lua,
+)
+from Tests import save_path
+from Tests.Methods.Simulation.FakeFEMMHandler import FakeFEMMHandler
+
+Na = 2048
+Nt = 16
+
+
+@pytest.mark.parametrize("is_sliding_band", [True, False])
+def test_FEMM_airgap_flux(is_sliding_band):
+    """Check that the LUA batch sampling gives the same airgap flux density
+    than the per angle FEMM calls with a single FEMM call per time step
+    """
+    res_path = join(save_path, "FEMM_airgap_flux")
+    if not isdir(res_path):
+        makedirs(res_path)
+    angle = linspace(0, 2 * pi, Na, endpoint=False)
+    Rag = 0.05
+
+    # One FEMM call per angle
+    femm_ref = FakeFEMMHandler()
+    for ii in range(Nt):
+        Br_ref, Bt_ref = comp_FEMM_airgap_flux(
+            femm_ref, angle, Rag, is_sliding_band=is_sliding_band
+        )
+    assert femm_ref.nb_call == Na * Nt
+
+    # Single FEMM call per time step (the LUA script is created once)
+    femm = FakeFEMMHandler()
+    path_lua = write_FEMM_airgap_lua(
+        res_path, angle, Rag, is_sliding_band=is_sliding_band, id_worker=3
+    )
+    for ii in range(Nt):
+        Br, Bt = comp_FEMM_airgap_flux(
+            femm, angle, Rag, is_sliding_band=is_sliding_band, path_lua=path_lua
+        )
+    assert femm.nb_call == Nt
+    assert femm.call_list == ["dofile"] * Nt
+    # The result file is removed after reading
+    assert listdir(res_path) == ["airgap_B3.lua"]
+
+    assert_allclose(Br, Br_ref, rtol=0, atol=1e-12)
+    assert_allclose(Bt, Bt_ref, rtol=0, atol=1e-12)
+    assert_allclose(Br, 1.2 * cos(4 * angle), rtol=0, atol=1e-12)
+    assert_allclose(Bt, 0.12 * sin(4 * angle), rtol=0, atol=1e-12)
+
+
+if __name__ == "__main__":
+    test_FEMM_airgap_flux(True)
+    test_FEMM_airgap_flux(False)
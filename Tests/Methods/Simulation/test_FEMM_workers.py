@@ -0,0 +1,162 @@
+from os import listdir, makedirs, remove
+from os.path import basename, join, isdir, isfile
+from time import sleep
+
+import pytest
+from numpy import linspace, pi, zeros
+from numpy.testing import assert_array_equal
+
+from pyleecan.Classes.MagFEMM import MagFEMM
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.Functions.FEMM.run_FEMM_workers import (
+    FEMM_WORKERS,
+    get_FEMM_workers,
+    load_FEMM_worker,
+    run_FEMM_workers,
+    close_FEMM_workers,
+)
+from pyleecan.definitions import DATA_DIR
+from Tests import save_path
+from Tests.Methods.Simulation.FakeFEMMHandler import FakeFEMMHandler
+
+
+def test_FEMM_workers():
+    """Check the dynamic scheduling and the reuse of the FEMM workers"""
+    res_path = join(save_path, "FEMM_workers")
+    if not isdir(res_path):
+        makedirs(res_path)
+    fem_file = join(res_path, "model.fem")
+    with open(fem_file, "w") as file:
+        file.write("model")
+
+    Nt = 24
+    nb_worker = 4
+
+    def solve_task(worker, ii):
+        load_FEMM_worker(worker)
+        # First time step is slower (as a nonlinear step converging slowly)
+        sleep(0.02 if ii == 0 else 0.001)
+        return (ii, worker["femm"].document)
+
+    worker_list = get_FEMM_workers(fem_file, nb_worker, FakeFEMMHandler)
+    assert len(worker_list) == nb_worker
+    for worker in worker_list:
+        assert isfile(worker["file"])
+    result_dict, stat_list = run_FEMM_workers(worker_list, list(range(Nt)), solve_task)
+
+    # Every time step is solved once on a worker file
+    assert sorted(result_dict.keys()) == list(range(Nt))
+    file_list = [worker["file"] for worker in worker_list]
+    for ii in range(Nt):
+        assert result_dict[ii][0] == ii
+        assert result_dict[ii][1] in file_list
+    assert sum([stat["nb_task"] for stat in stat_list]) == Nt
+    for stat in stat_list:
+        assert 0 < stat["usage"] <= 1
+
+    # Second simulation on the same file: FEMM instances and files reused
+    worker_list_2 = get_FEMM_workers(fem_file, nb_worker, FakeFEMMHandler)
+    assert [w["femm"] for w in worker_list_2] == [w["femm"] for w in worker_list]
+    run_FEMM_workers(worker_list_2, list(range(Nt)), solve_task)
+    for worker in worker_list_2:
+        # FEMM is started once, the file is loaded for each simulation
+        assert worker["femm"].call_list.count("openfemm") == 1
+        assert worker["femm"].call_list.count("opendocument") == 2
+
+    # Modified file: new workers
+    with open(fem_file, "w") as file:
+        file.write("new model")
+    worker_list_3 = get_FEMM_workers(fem_file, nb_worker, FakeFEMMHandler)
+    assert worker_list_3[0]["femm"] is not worker_list[0]["femm"]
+    assert worker_list[0]["femm"].HandleToFEMM is None  # closed
+
+    close_FEMM_workers(fem_file)
+    assert fem_file not in FEMM_WORKERS
+    for worker in worker_list_3:
+        assert not isfile(worker["file"])
+
+
+def test_FEMM_workers_error():
+    """Check that an error in a worker stops the scheduling and is raised"""
+    res_path = join(save_path, "FEMM_workers")
+    if not isdir(res_path):
+        makedirs(res_path)
+    fem_file = join(res_path, "model_error.fem")
+    with open(fem_file, "w") as file:
+        file.write("model")
+
+    def solve_task(worker, ii):
+        if ii == 3:
+            raise ValueError("Time step 3 failed")
+        return ii
+
+    worker_list = get_FEMM_workers(fem_file, 2, FakeFEMMHandler)
+    with pytest.raises(ValueError):
+        run_FEMM_workers(worker_list, list(range(10)), solve_task)
+    close_FEMM_workers()
+    assert len(FEMM_WORKERS) == 0
+
+
+def test_solve_FEMM_parallel(monkeypatch):
+    """Check that the parallel resolution gives the same airgap flux density
+    as the sequential one (stator shift applied once, one LUA script per worker)
+    """
+    pytest.importorskip("win32com")  # Import of the FEMM handler
+    from pyleecan.Classes.OutMagFEMM import OutMagFEMM
+
+    monkeypatch.setattr(
+        "pyleecan.Methods.Simulation.MagFEMM.solve_FEMM_parallel._FEMMHandler",
+        FakeFEMMHandler,
+    )
+    SPMSM_003 = load(join(DATA_DIR, "Machine", "SPMSM_003.json"))
+    simu = Simu1(name="test_solve_FEMM_parallel", machine=SPMSM_003)
+    output = Output(simu=simu)
+    output.mag.internal = OutMagFEMM()
+
+    Nt, Na = 12, 256
+    angle = linspace(0, 2 * pi, Na, endpoint=False)
+    FEMM_dict = {"circuits": [], "groups": {}}
+    for key in ["GROUP_RC", "GROUP_RH", "GROUP_RW", "GROUP_RM"]:
+        FEMM_dict["groups"][key] = 0
+    param = dict(
+        FEMM_dict=FEMM_dict,
+        sym=1,
+        Nt=Nt,
+        angle=angle,
+        Is=None,
+        Ir=None,
+        angle_rotor=linspace(0, pi / 4, Nt),
+    )
+
+    out_list = list()
+    for nb_worker in [1, 3]:
+        mag = MagFEMM(nb_worker=nb_worker, angle_stator_shift=pi / 8)
+        simu.mag = mag
+        out_dict = {"Br": zeros((Nt, Na)), "Bt": zeros((Nt, Na)), "Tem": zeros(Nt)}
+        if nb_worker == 1:
+            femm = FakeFEMMHandler()
+            mag.solve_FEMM(femm, output, out_dict, is_close_femm=False, **param)
+        else:
+            fem_file = mag.get_path_save_fem(output)
+            for file_name in listdir(mag.get_path_save(output)):  # Previous run
+                remove(join(mag.get_path_save(output), file_name))
+            with open(fem_file, "w") as file:
+                file.write("model")
+            mag.solve_FEMM_parallel(None, output, out_dict, **param)
+            # The workers are closed and the LUA scripts removed
+            assert fem_file not in FEMM_WORKERS
+            assert listdir(mag.get_path_save(output)) == [basename(fem_file)]
+            stat_list = output.mag.internal.worker_stat
+            assert sum([stat["nb_task"] for stat in stat_list]) == Nt
+        out_list.append(out_dict)
+
+    for key in ["Br", "Bt", "Tem", "Rag"]:
+        assert_array_equal(out_list[1][key], out_list[0][key])
+
+
+if __name__ == "__main__":
+    test_FEMM_workers()
+    test_FEMM_workers_error()
+    test_solve_FEMM_parallel(pytest.MonkeyPatch())
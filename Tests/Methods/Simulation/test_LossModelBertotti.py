@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+import gc
+import weakref
+from os.path import join
+
+import numpy as np
+import pytest
+from SciDataTool import Data1D, DataTime, VectorField
+
+from pyleecan.Classes.ImportMatrixVal import ImportMatrixVal
+from pyleecan.Classes.Loss import Loss
+from pyleecan.Classes.LossModelBertotti import LossModelBertotti
+from pyleecan.Classes.MagFEMM import MagFEMM
+from pyleecan.Classes.MeshSolution import MeshSolution
+from pyleecan.Classes.OutElec import OutElec
+from pyleecan.Classes.OutMag import OutMag
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.SolutionVector import SolutionVector
+from pyleecan.Functions.load import load
+from pyleecan.Methods.Simulation.LossModelBertotti import comp_coeff_Bertotti
+from pyleecan.definitions import DATA_DIR
+from Tests.Methods.Mesh.square_mesh import get_square_mesh
+
+N0 = 3000
+Nt = 16
+COEFF = [2.0, 2.0, 0.5, 2.0, 0.1, 1.5]  # k_hy, alpha_hy, k_ed, ...
+
+
+def get_output():
+    """Output with a synthetic flux density on a square mesh split in a stator
+    and a rotor core groups (shuffled cells) and two Bertotti loss models"""
+    mesh = get_square_mesh(10)
+    nb_cell = mesh.cell["triangle"].nb_cell
+    rng = np.random.RandomState(0)
+    cells = rng.permutation(nb_cell)
+
+    time = np.linspace(0, 60 / N0, Nt, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time)
+    Indice = Data1D(
+        name="indice", values=np.arange(nb_cell).tolist(), is_components=True
+    )
+    phase = rng.rand(nb_cell) * 2 * np.pi
+    f = N0 / 60
+    Bx = 1.5 * np.cos(2 * np.pi * f * time[:, None] + phase) + 0.2 * np.cos(
+        6 * np.pi * f * time[:, None]
+    )
+    By = rng.rand(nb_cell) * np.sin(2 * np.pi * f * time[:, None] + phase)
+    components = dict()
+    for name, values in [("comp_x", Bx), ("comp_y", By)]:
+        components[name] = DataTime(
+            name="Flux density",
+            unit="T",
+            symbol="B",
+            axes=[Time, Indice],
+            values=values,
+        )
+    field = VectorField(name="Flux density", symbol="B", components=components)
+
+    meshsol = MeshSolution(
+        mesh=[mesh],
+        solution=[SolutionVector(field=field, type_cell="triangle", label="B")],
+        group={
+            "stator core": cells[: nb_cell // 2],
+            "rotor core": cells[nb_cell // 2 + 10 :],
+            "airgap": cells[nb_cell // 2 : nb_cell // 2 + 10],
+        },
+    )
+
+    machine = load(join(DATA_DIR, "Machine", "SPMSM_020.json"))
+    simu = Simu1(name="test_LossModelBertotti", machine=machine)
+    simu.mag = MagFEMM(is_periodicity_a=False)
+    simu.loss = Loss()
+    for part_label in ["Stator", "Rotor"]:
+        model = LossModelBertotti(
+            name=part_label + " Iron Losses",
+            k_hy=COEFF[0],
+            alpha_hy=COEFF[1],
+            k_ed=COEFF[2],
+            alpha_ed=COEFF[3],
+            k_ex=COEFF[4],
+            alpha_ex=COEFF[5],
+            group="core",
+            get_meshsolution=True,
+            N0=[N0, 2 * N0],
+        )
+        simu.loss.add_model(model=model, part_label=part_label)
+
+    output = Output(simu=simu)
+    output.elec = OutElec(N0=N0, Time=Time)
+    output.mag = OutMag(meshsolution=meshsol)
+    return output
+
+
+def get_loss_ref(output, model, group):
+    """Losses computed component by component on the group only"""
+    meshsol = output.mag.meshsolution
+    cells = meshsol.group[group]
+    F_REF, B_REF = model.F_REF, model.B_REF
+    C = [model.k_hy, model.alpha_hy, model.k_ed, model.alpha_ed]
+    C += [model.k_ex, model.alpha_ex]
+
+    comps = np.zeros(3)
+    for component in meshsol.solution[0].field.components.values():
+        comp = DataTime(
+            name=component.name,
+            unit=component.unit,
+            symbol=component.symbol,
+            axes=[
+                component.axes[0],
+                Data1D(name="indice", values=cells.tolist(), is_components=True),
+            ],
+            values=component.values[:, cells],
+        )
+        mag_dict = comp.get_magnitude_along("freqs", "indice")
+        f_norm = np.abs(mag_dict["freqs"][:, None] / F_REF)
+        B_norm = mag_dict["B"] / B_REF
+        HY = (C[0] * f_norm * B_norm ** C[1]).sum(axis=0)
+        ED = (C[2] * (f_norm * B_norm) ** C[3]).sum(axis=0)
+        EX = (C[4] * (f_norm * B_norm) ** C[5]).sum(axis=0)
+        comps += np.array([HY.sum(), ED.sum(), EX.sum()])
+
+    lam = output.simu.machine.get_lam_by_label(
+        "Stator" if "stator" in group else "Rotor"
+    )
+    area = 1 / (10 * 10 * 2)  # Same area for all the cells
+    loss = list()
+    for k in [1, 2]:
+        loss.append(
+            (comps * k ** np.array([1, C[3], C[5]])).sum()
+            * area
+            * lam.L1
+            * lam.mat_type.struct.rho
+        )
+    return np.array(loss)
+
+
+@pytest.mark.METHODS
+def test_LossModelBertotti():
+    """Check the vectorized Bertotti losses against a component by component
+    computation and that the flux density spectrum is computed once"""
+    output = get_output()
+    nb_fft = [0]
+    get_magnitude_along = DataTime.get_magnitude_along
+
+    def count_fft(self, *args, **kwargs):
+        nb_fft[0] += 1
+        return get_magnitude_along(self, *args, **kwargs)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(DataTime, "get_magnitude_along", count_fft)
+        output.simu.loss.run()
+    assert nb_fft[0] == 1  # Both groups and components at once
+
+    for ii, (part_label, group) in enumerate(
+        [("Stator", "stator core"), ("Rotor", "rotor core")]
+    ):
+        model = output.simu.loss.model_list[ii]
+        loss = output.loss.get_loss(part_label=part_label, index=0)
+        loss_ref = get_loss_ref(output, model, group)
+        assert loss.values.shape == (Nt, 2)
+        assert np.allclose(loss.values[0], loss_ref, rtol=1e-10)
+        assert np.allclose(loss.values[-1], loss_ref, rtol=1e-10)
+
+        # Loss density of the group cells
+        mshsol = output.loss.get_loss_dist(part_label=part_label, index=0)
+        LossDens = mshsol.get_solution(label="LossDens").field
+        indice = LossDens.axes[1].get_values()
+        assert list(indice) == output.mag.meshsolution.group[group].tolist()
+        LossDensComps = mshsol.get_solution(label="LossDensComps").field
+        assert np.allclose(LossDensComps.values.sum(axis=-1), LossDens.values)
+
+
+@pytest.mark.METHODS
+def test_comp_coeff_Bertotti(monkeypatch):
+    """Check that the loss coefficients are fitted once per material"""
+    output = get_output()
+    mat = output.simu.machine.stator.mat_type
+    output.simu.machine.rotor.mat_type = mat
+
+    # Loss data of the reference coefficients
+    model = output.simu.loss.model_list[0]
+    B, f = np.meshgrid([0.5, 1.0, 1.5], [50, 100, 200, 400])
+    B, f = B.ravel(), f.ravel()
+    f_norm, B_norm = f / model.F_REF, B / model.B_REF
+    Loss = (
+        COEFF[0] * f_norm * B_norm ** COEFF[1]
+        + COEFF[2] * (f_norm * B_norm) ** COEFF[3]
+        + COEFF[4] * (f_norm * B_norm) ** COEFF[5]
+    )
+    mat.mag.LossData = ImportMatrixVal(value=np.column_stack((B, f, Loss)))
+    for model in output.simu.loss.model_list:
+        model.k_hy, model.k_ed = None, None
+
+    nb_fit = [0]
+    least_squares = comp_coeff_Bertotti.optimize.least_squares
+
+    def count_fit(*args, **kwargs):
+        nb_fit[0] += 1
+        return least_squares(*args, **kwargs)
+
+    monkeypatch.setattr(comp_coeff_Bertotti.optimize, "least_squares", count_fit)
+    output.simu.loss.run()
+    assert nb_fit[0] == 1
+    for model in output.simu.loss.model_list:
+        assert model.k_hy == pytest.approx(COEFF[0])
+        assert model.k_ed == pytest.approx(COEFF[2])
+
+    # New loss data: new fit
+    mat.mag.LossData = ImportMatrixVal(value=np.column_stack((B, f, 2 * Loss)))
+    for model in output.simu.loss.model_list:
+        model.k_hy, model.k_ed = None, None
+    output.simu.loss.run()
+    assert nb_fit[0] == 2
+    assert output.simu.loss.model_list[1].k_hy > 1.5 * COEFF[0]
+
+    # The cache does not keep the material alive
+    mat_ref = weakref.ref(mat)
+    del output, mat, model
+    gc.collect()
+    assert mat_ref() is None
+
+
+# To run it without pytest
+if __name__ == "__main__":
+    test_LossModelBertotti()
+    test_comp_coeff_Bertotti(pytest.MonkeyPatch())
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+import pytest
+from numpy import abs as np_abs, array, linspace, pi, sqrt
+from numpy.fft import rfft
+from numpy.testing import assert_allclose
+from scipy.io import loadmat
+
+from pyleecan.Classes.ImportGenVectLin import ImportGenVectLin
+from pyleecan.Classes.ImportMatrixVal import ImportMatrixVal
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.MagFE import MagFE
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.Functions.MagFE.mag_fe_model import MagFEModel
+from pyleecan.definitions import DATA_DIR
+from Tests import TEST_DATA_DIR
+
+
+def get_simu(type_BH):
+    """Simulation of the SPMSM_003 on 4 time steps (as test_EM_SPMSM_FL_001)"""
+    SPMSM_003 = load(join(DATA_DIR, "Machine", "SPMSM_003.json"))
+    simu = Simu1(name="test_MagFE", machine=SPMSM_003)
+    Is = ImportMatrixVal(
+        value=array(
+            [
+                [6.97244193e-06, 2.25353053e02, -2.25353060e02],
+                [-2.60215295e02, 1.30107654e02, 1.30107642e02],
+                [-6.97244208e-06, -2.25353053e02, 2.25353060e02],
+                [2.60215295e02, -1.30107654e02, -1.30107642e02],
+            ]
+        )
+    )
+    simu.input = InputCurrent(
+        Is=Is,
+        Ir=None,  # No winding on the rotor
+        N0=3000,
+        angle_rotor=None,  # Will be computed
+        time=ImportGenVectLin(start=0, stop=0.015, num=4, endpoint=True),
+        Na_tot=1024,
+        angle_rotor_initial=0.5216 + pi,
+    )
+    simu.mag = MagFE(
+        type_BH_stator=type_BH,
+        type_BH_rotor=type_BH,
+        is_periodicity_a=True,
+        is_get_mesh=True,
+    )
+    simu.force = None
+    simu.struct = None
+    return simu
+
+
+def test_MagFE_SPMSM():
+    """Check the airgap flux density of a SPMSM with infinite permeability
+    against the subdomain model of MANATEE"""
+    simu = get_simu(type_BH=2)
+    out = Output(simu=simu)
+    simu.run()
+
+    Br = out.mag.B.components["radial"].get_along("time", "angle")["B_r"]
+    Bt = out.mag.B.components["tangential"].get_along("time", "angle")["B_t"]
+    assert Br.shape == (4, 1024)
+    # Anti-periodicity in space and in time (half a revolution)
+    assert_allclose(Br[:, 512:], -Br[:, :512], atol=1e-9)
+    assert_allclose(Br[2], -Br[0], atol=1e-9)
+    assert_allclose(out.mag.Tem.values[2], out.mag.Tem.values[0], rtol=1e-9)
+
+    # Amplitudes of the main harmonics
+    mat = loadmat(join(TEST_DATA_DIR, "EM_SPMSM_FL_001_MANATEE_SDM.mat"))
+    for B, B_ref in [(Br, mat["XBr"]), (Bt, mat["XBt"])]:
+        amp = np_abs(rfft(B, axis=1))[:, [1, 3, 5, 7, 11, 13]] / 512
+        amp_ref = np_abs(rfft(B_ref, axis=1))[:, [1, 3, 5, 7, 11, 13]] / 512
+        assert_allclose(amp, amp_ref, atol=0.02)
+
+    # Winding flux and mesh solution
+    assert out.mag.Phi_wind_stator.values.shape == (4, 3)
+    meshsol = out.mag.meshsolution
+    assert sorted(meshsol.group.keys()) == sorted(
+        ["airgap", "stator core", "stator winding", "rotor core", "rotor magnets"]
+    )
+    B_elem = meshsol.get_field(label="B")
+    assert B_elem.shape == (4, meshsol.mesh[0].cell["triangle"].nb_cell, 2)
+
+
+@pytest.mark.parametrize("type_BH", [1, 0])
+def test_MagFE_torque(type_BH):
+    """Check the torque (Maxwell stress tensor in the moving band) against the
+    derivative of the co-energy and the Newton iterations"""
+    SPMSM_003 = load(join(DATA_DIR, "Machine", "SPMSM_003.json"))
+    model = MagFEModel(
+        SPMSM_003,
+        sym=2,
+        is_antiper=True,
+        type_BH_stator=type_BH,
+        type_BH_rotor=type_BH,
+    )
+    assert model.is_linear == (type_BH != 0)
+    f = model.f_mag + model.F_I["Stator_0"].dot(array([200, -100, -100]))
+    delta = model.U / model.Nb  # Rotation step of the band nodes
+
+    a_list, coenergy = list(), list()
+    for alpha in [9 * delta, 10 * delta, 11 * delta]:
+        a, nb_iter = model.solve(alpha, f, a0=a_list[-1] if a_list else None)
+        if model.is_linear:
+            assert nb_iter == 1
+        else:
+            assert nb_iter > 1
+            # Converged nonlinear problem
+            r, _ = model.comp_residual(
+                a, model.get_band_matrix(model.get_band(alpha)), f
+            )
+            assert sqrt((r ** 2).sum()) < 1e-6 * sqrt((f ** 2).sum())
+        a_list.append(a)
+        if model.is_linear:
+            coenergy.append(0.5 * a.dot(f))
+
+    A1, A2, shift = model.get_ring_value(a_list[1], 10 * delta)
+    Tem = model.comp_torque(A1[None, :], A2[None, :], array([shift]))
+    assert Tem.shape == (1,)
+    if model.is_linear:
+        Tem_ref = model.sym * model.L * (coenergy[2] - coenergy[0]) / (2 * delta)
+        assert_allclose(Tem[0], Tem_ref, rtol=0.02)
+
+    # Flux density on any radius of the band: same torque
+    R_list = linspace(model.R1, model.R2, 3)
+    angle = linspace(0, model.U, 2048, endpoint=False)
+    for R in R_list:
+        Br, Bt = model.comp_airgap_flux(
+            A1[None, :], A2[None, :], array([shift]), angle, R
+        )
+        T_R = 2 * pi * model.L * R ** 2 * (Br * Bt).mean() / (4e-7 * pi)
+        assert_allclose(T_R, Tem[0], rtol=1e-6)
+
+
+@pytest.mark.long
+@pytest.mark.validation
+def test_MagFE_IPMSM():
+    """Validation of the average torque of the Prius machine (nonlinear) with
+    the FEMM result of test_EEC_FEMM_IPMSM"""
+    IPMSM_A = load(join(DATA_DIR, "Machine", "IPMSM_A.json"))
+    simu = Simu1(name="test_MagFE_IPMSM", machine=IPMSM_A)
+    simu.input = InputCurrent(N0=2000, Nt_tot=10, Na_tot=2048)
+    simu.input.set_Id_Iq(I0=250 / sqrt(2), Phi0=60 * pi / 180)
+    simu.mag = MagFE(type_BH_stator=0, type_BH_rotor=0, is_periodicity_a=True)
+    simu.elec = None
+    simu.force = None
+    simu.struct = None
+
+    out = Output(simu=simu)
+    simu.run()
+    assert_allclose(out.mag.Tem_av, 81.70, rtol=0.02)
+
+
+if __name__ == "__main__":
+    test_MagFE_SPMSM()
+    test_MagFE_torque(0)
+    test_MagFE_IPMSM()
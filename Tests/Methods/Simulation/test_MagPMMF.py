@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+import pytest
+from numpy import abs as np_abs, pi
+from numpy.fft import rfft
+from numpy.testing import assert_allclose
+from scipy.io import loadmat
+
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.MagFE import MagFE
+from pyleecan.Classes.MagPMMF import MagPMMF
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+from Tests import TEST_DATA_DIR
+from Tests.Methods.Simulation.test_MagFE import get_simu
+
+
+def test_MagPMMF_SPMSM():
+    """Check the airgap flux density of a SPMSM with infinite permeability
+    against the subdomain model of MANATEE"""
+    simu = get_simu(type_BH=2)
+    simu.mag = MagPMMF(is_periodicity_a=True)
+    out = Output(simu=simu)
+    simu.run()
+
+    Br = out.mag.B.components["radial"].get_along("time", "angle")["B_r"]
+    assert Br.shape == (4, 1024)
+    # Anti-periodicity in space and in time (half a revolution)
+    assert_allclose(Br[:, 512:], -Br[:, :512], atol=1e-9)
+    assert_allclose(Br[2], -Br[0], atol=1e-9)
+    assert out.mag.Tem.values.shape == (4,)
+    assert out.mag.Phi_wind_stator.values.shape == (4, 3)
+
+    # Amplitudes of the main harmonics
+    mat = loadmat(join(TEST_DATA_DIR, "EM_SPMSM_FL_001_MANATEE_SDM.mat"))
+    amp = np_abs(rfft(Br, axis=1))[:, [1, 3, 5, 7]] / 512
+    amp_ref = np_abs(rfft(mat["XBr"], axis=1))[:, [1, 3, 5, 7]] / 512
+    assert_allclose(amp, amp_ref, atol=0.03)
+
+
+@pytest.mark.parametrize("Phi0", [0, 90])
+def test_MagPMMF_MagFE(Phi0):
+    """Compare the torque and the winding flux of a SPMSM with the finite
+    element model (infinite permeability)"""
+    SPMSM_003 = load(join(DATA_DIR, "Machine", "SPMSM_003.json"))
+    result = list()
+    for mag in [
+        MagFE(type_BH_stator=2, type_BH_rotor=2, is_periodicity_a=True),
+        MagPMMF(type_BH_stator=2, type_BH_rotor=2, is_periodicity_a=True),
+    ]:
+        simu = Simu1(name="test_MagPMMF", machine=SPMSM_003)
+        simu.input = InputCurrent(N0=2000, Nt_tot=4, Na_tot=2048)
+        simu.input.set_Id_Iq(I0=100, Phi0=Phi0 * pi / 180)
+        simu.mag = mag
+        simu.elec = None
+        simu.force = None
+        simu.struct = None
+        out = Output(simu=simu)
+        simu.run()
+        result.append(out.mag)
+
+    mag_FE, mag_PMMF = result
+    assert_allclose(
+        mag_PMMF.Phi_wind_stator.values, mag_FE.Phi_wind_stator.values, atol=0.05
+    )
+    assert_allclose(mag_PMMF.Tem_av, mag_FE.Tem_av, rtol=0.1, atol=5)
+
+
+if __name__ == "__main__":
+    test_MagPMMF_SPMSM()
+    test_MagPMMF_MagFE(90)
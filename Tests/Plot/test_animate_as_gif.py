@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+from os import remove
+from os.path import join
+from time import perf_counter
+
+import imageio
+import numpy as np
+import pytest
+from SciDataTool import Data1D, DataTime
+
+from pyleecan.Functions.Plot.animate_as_gif import animate_as_gif
+from Tests import save_plot_path as save_path
+
+
+def get_B(Nt=200, Na=1024):
+    """Airgap flux density with a rotating fundamental and a slot harmonic"""
+    time = np.linspace(0, 0.02, Nt, endpoint=False)
+    angle = np.linspace(0, 2 * np.pi, Na, endpoint=False)
+    Time = Data1D(name="time", unit="s", values=time)
+    Angle = Data1D(name="angle", unit="rad", values=angle)
+    values = np.cos(4 * angle - 2 * np.pi * 200 * time[:, None]) + 0.2 * np.cos(
+        48 * angle - 2 * np.pi * 200 * time[:, None]
+    )
+    return DataTime(
+        name="Airgap flux density",
+        unit="T",
+        symbol="B",
+        axes=[Time, Angle],
+        values=values,
+    )
+
+
+def plot_B(data, t_index=0, **kwargs):
+    """Plot the flux density over angle at a time step"""
+    data.plot_2D_Data(
+        "angle{°}", "time[" + str(t_index) + "]", y_min=-1.5, y_max=1.5, **kwargs
+    )
+
+
+@pytest.mark.PLOT
+def test_animate_as_gif():
+    """Check the number of frames and that the parallel rendering gives the
+    same frames"""
+    B = get_B(Nt=10)
+    animate_as_gif(plot_B, B, save_path=save_path, file_name="B.gif", index_max=10)
+    frames = imageio.mimread(join(save_path, "B.gif"))
+    assert len(frames) == 10
+
+    # Several data and index step
+    animate_as_gif(
+        plot_B,
+        [B, B],
+        save_path=save_path,
+        file_name="B_par.gif",
+        index_max=10,
+        index_step=2,
+        nb_proc=2,
+    )
+    frames_par = imageio.mimread(join(save_path, "B_par.gif"))
+    assert len(frames_par) == 10
+    for ii in range(5):
+        assert np.array_equal(frames_par[ii], frames[2 * ii])
+        assert np.array_equal(frames_par[5 + ii], frames[2 * ii])
+
+
+@pytest.mark.long
+@pytest.mark.PLOT
+def test_animate_as_gif_benchmark():
+    """Animation of 200 frames compared to the previous rendering through
+    temporary png files"""
+    B = get_B()
+
+    t0 = perf_counter()
+    with imageio.get_writer(join(save_path, "B_ref.gif"), mode="I") as writer:
+        for j in range(200):
+            save_path_temp = join(save_path, "temp_" + str(j) + ".png")
+            plot_B(B, t_index=j, save_path=save_path_temp, is_show_fig=False)
+            writer.append_data(imageio.imread(save_path_temp))
+            remove(save_path_temp)
+    t_ref = perf_counter() - t0
+
+    result = list()
+    for nb_proc in [1, 0]:
+        t0 = perf_counter()
+        animate_as_gif(
+            plot_B,
+            B,
+            save_path=save_path,
+            file_name="B_bench.gif",
+            index_max=200,
+            nb_proc=nb_proc,
+        )
+        result.append(perf_counter() - t0)
+
+    print(
+        "\n200 frames: temporary png files %.1f s, in memory %.1f s, all the cpu %.1f s"
+        % (t_ref, result[0], result[1])
+    )
+    assert result[0] < t_ref
+
+
+if __name__ == "__main__":
+    test_animate_as_gif()
+    test_animate_as_gif_benchmark()
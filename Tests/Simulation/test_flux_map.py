@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+import numpy as np
+import pytest
+
+from pyleecan.Classes.EEC_PMSM import EEC_PMSM
+from pyleecan.Classes.Electrical import Electrical
+from pyleecan.Classes.FluxMapDQ import FluxMapDQ
+from pyleecan.Classes.IndMag import IndMag
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+
+
+def comp_phid(Id, Iq):
+    """Analytical d-axis flux linkage (bilinear: exactly interpolated)"""
+    return 0.1 + 1e-3 * Id + 1e-6 * Id * Iq
+
+
+def comp_phiq(Id, Iq):
+    """Analytical q-axis flux linkage"""
+    return 2e-3 * Iq - 2e-6 * Id * Iq
+
+
+def comp_inductance(self, output):
+    """Analytical inductance model (instead of FEMM)"""
+    return comp_phid(output.elec.Id_ref, output.elec.Iq_ref), comp_phiq(
+        output.elec.Id_ref, output.elec.Iq_ref
+    )
+
+
+def run_simu(machine, Id_ref, Iq_ref):
+    """Electrical simulation of an operating point with the analytical model"""
+    simu = Simu1(name="test_flux_map", machine=machine)
+    simu.input = InputCurrent(
+        N0=3000, Id_ref=Id_ref, Iq_ref=Iq_ref, Nt_tot=16, Na_tot=256
+    )
+    simu.elec = Electrical(eec=EEC_PMSM(indmag=IndMag(), parameters={"R20": 0.03}))
+    simu.mag = None
+    simu.force = None
+    output = Output(simu=simu)
+    simu.run()
+    return output
+
+
+def test_flux_map_interpolate():
+    """Check the interpolation of an analytical map"""
+    Id = np.array([-200, -100, -50, 0])
+    Iq = np.array([0, 100, 150, 300, 400])
+    Id_grid, Iq_grid = np.meshgrid(Id, Iq, indexing="ij")
+    flux_map = FluxMapDQ(
+        Id=Id, Iq=Iq, Phid=comp_phid(Id_grid, Iq_grid), Phiq=comp_phiq(Id_grid, Iq_grid)
+    )
+
+    # Single points (inside and outside the grid)
+    for Id_ref, Iq_ref in [(-75, 120), (-200, 0), (0, 400), (-250, 450), (10, -20)]:
+        phid, phiq = flux_map.interpolate(Id_ref, Iq_ref)
+        assert phid == pytest.approx(comp_phid(Id_ref, Iq_ref))
+        assert phiq == pytest.approx(comp_phiq(Id_ref, Iq_ref))
+
+    # Arrays of operating points
+    Id_ref = np.linspace(-220, 10, 7)
+    Iq_ref = np.linspace(-10, 420, 7)
+    phid, phiq = flux_map.interpolate(Id_ref, Iq_ref)
+    assert np.allclose(phid, comp_phid(Id_ref, Iq_ref))
+    assert np.allclose(phiq, comp_phiq(Id_ref, Iq_ref))
+
+    # The interpolation data are updated with the map
+    flux_map.Phid = 2 * flux_map.Phid
+    assert flux_map.interpolate(-75, 120)[0] == pytest.approx(2 * comp_phid(-75, 120))
+
+
+@pytest.mark.parametrize("nb_proc", [1, 2])
+def test_flux_map_EEC(monkeypatch, nb_proc):
+    """Check that the map is computed once with the inductance model, saved with
+    the machine and interpolated by EEC_PMSM"""
+    nb_call = [0]
+
+    def count_inductance(self, output):
+        nb_call[0] += 1
+        return comp_inductance(self, output)
+
+    monkeypatch.setattr(IndMag, "comp_inductance", count_inductance, raising=False)
+
+    machine = load(join(DATA_DIR, "Machine", "IPMSM_A.json"))
+    machine.flux_map = FluxMapDQ(
+        Id=np.linspace(-200, 0, 5), Iq=np.linspace(0, 300, 4), nb_proc=nb_proc
+    )
+    output = run_simu(machine, -100, 200)
+    flux_map = output.simu.machine.flux_map
+    assert flux_map.Phid.shape == (5, 4)
+    if nb_proc == 1:
+        assert nb_call[0] == 20
+    PAR = output.simu.elec.eec.parameters
+    assert PAR["phi"] == pytest.approx(0.1)
+    assert PAR["Phid"] == pytest.approx(comp_phid(-100, 200))
+    assert PAR["Ld"] == pytest.approx((comp_phid(-100, 200) - 0.1) / -100)
+    assert PAR["Lq"] == pytest.approx(comp_phiq(-100, 200) / 200)
+
+    # The map is saved with the machine: no more inductance computation
+    nb_call[0] = 0
+    machine = output.simu.machine.copy()
+    assert np.array_equal(machine.flux_map.Phiq, flux_map.Phiq)
+    output = run_simu(machine, -150, 250)
+    assert nb_call[0] == 0
+    PAR = output.simu.elec.eec.parameters
+    assert PAR["Phiq"] == pytest.approx(comp_phiq(-150, 250))
+    assert output.elec.Uq_ref == pytest.approx(
+        0.03 * 250 + 2 * np.pi * output.elec.felec * comp_phid(-150, 250)
+    )
+
+
+if __name__ == "__main__":
+    test_flux_map_interpolate()
+    test_flux_map_EEC(pytest.MonkeyPatch(), 1)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from os import listdir
+from os.path import join
+
+import pytest
+
+from pyleecan.Classes.EEC_PMSM import EEC_PMSM
+from pyleecan.Classes.Electrical import Electrical
+from pyleecan.Classes.InputCurrent import InputCurrent
+from pyleecan.Classes.Output import Output
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Simulation import result_cache
+from pyleecan.Functions.Simulation.result_cache import clear_result_cache
+from pyleecan.definitions import DATA_DIR
+from Tests import save_path
+
+
+def get_simu(cache_dir, Iq_ref=200):
+    """Electrical simulation of IPMSM_A with known EEC parameters"""
+    IPMSM_A = load(join(DATA_DIR, "Machine", "IPMSM_A.json"))
+    simu = Simu1(name="test_result_cache", machine=IPMSM_A)
+    simu.input = InputCurrent(
+        N0=3000, Id_ref=-100, Iq_ref=Iq_ref, Nt_tot=16, Na_tot=256
+    )
+    simu.elec = Electrical(
+        eec=EEC_PMSM(
+            parameters={
+                "R20": 0.03,
+                "phi": 0.1,
+                "Id": -100,
+                "Iq": Iq_ref,
+                "Ld": 1e-3,
+                "Lq": 2e-3,
+                "Phid": 0.0,
+                "Phiq": 0.4,
+            }
+        )
+    )
+    simu.mag = None
+    simu.force = None
+    simu.result_cache_dir = cache_dir
+    return simu
+
+
+def run_simu(simu):
+    """Run a copy of the simulation and return its Output"""
+    simu = simu.copy()
+    output = Output(simu=simu)
+    simu.run()
+    return output
+
+
+def test_result_cache(monkeypatch):
+    """Check that the Electrical module reuses the result of an identical
+    problem and the cache invalidation (size and version)"""
+    cache_dir = join(save_path, "test_result_cache")
+    clear_result_cache(cache_dir)
+
+    nb_solve = [0]
+    solve_EEC = EEC_PMSM.solve_EEC
+
+    def count_solve(self, output):
+        nb_solve[0] += 1
+        return solve_EEC(self, output)
+
+    monkeypatch.setattr(EEC_PMSM, "solve_EEC", count_solve)
+
+    simu = get_simu(cache_dir)
+    out_ref = run_simu(simu)
+    assert nb_solve[0] == 1
+    out = run_simu(simu)
+    assert nb_solve[0] == 1  # Loaded from the cache
+    assert out.elec.parent is out
+    assert out.elec.Tem_av_ref == out_ref.elec.Tem_av_ref
+    assert out.elec.Ud_ref == out_ref.elec.Ud_ref
+
+    # Different input: new result
+    run_simu(get_simu(cache_dir, Iq_ref=100))
+    assert nb_solve[0] == 2
+    assert len([name for name in listdir(cache_dir) if name.endswith(".pkl")]) == 2
+
+    # Size based eviction: only the last result is kept
+    run_simu(get_simu(cache_dir, Iq_ref=150))
+    assert nb_solve[0] == 3
+    simu_small = get_simu(cache_dir, Iq_ref=50)
+    simu_small.result_cache_size = 0
+    run_simu(simu_small)
+    assert len([name for name in listdir(cache_dir) if name.endswith(".pkl")]) == 1
+
+    # A new version of pyleecan clears the cache
+    run_simu(simu_small)
+    assert nb_solve[0] == 4
+    monkeypatch.setattr(result_cache, "__version__", "0.0.0")
+    run_simu(simu_small)
+    assert nb_solve[0] == 5
+
+    # Disabled cache
+    simu.result_cache_dir = None
+    run_simu(simu)
+    run_simu(simu)
+    assert nb_solve[0] == 7
+
+
+if __name__ == "__main__":
+    test_result_cache(pytest.MonkeyPatch())
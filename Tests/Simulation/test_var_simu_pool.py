@@ -0,0 +1,145 @@
+import pytest
+from os import getpid, listdir, makedirs
+from os.path import join, isdir
+
+from numpy import sqrt, isnan
+from pyleecan.Functions.load import load
+from pyleecan.definitions import DATA_DIR
+from pyleecan.Classes.PostFunction import PostFunction
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Classes.InputElec import InputElec
+from pyleecan.Classes.VarParam import VarParam
+from pyleecan.Classes.ParamExplorerSet import ParamExplorerSet
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Functions.FEMM.run_FEMM_workers import get_FEMM_workers
+from Tests import save_path
+from Tests.Methods.Simulation.FakeFEMMHandler import FakeFEMMHandler
+
+FEMM_PATH = join(save_path, "test_var_simu_pool")
+
+
+def get_simu(nb_proc, chunk_size=1):
+    """Create a VarParam multi-simulation on the stator slot width
+    (the 3rd simulation fails)
+    """
+    IPMSM_A = load(join(DATA_DIR, "Machine", "IPMSM_A.json"))
+
+    simu = Simu1(name="test_var_simu_pool", machine=IPMSM_A)
+    simu.input = InputElec(
+        N0=2000, Id_ref=-100, Iq_ref=200, Nt_tot=10, Na_tot=2048, rot_dir=1
+    )
+    # Make the simulation with W0=3 fail
+    simu.postproc_list = [
+        PostFunction(run="lambda output: 1 / (output.simu.machine.stator.slot.W0 != 3)")
+    ]
+
+    simu.var_simu = VarParam(
+        ref_simu_index=0,
+        paramexplorer_list=[
+            ParamExplorerSet(
+                value=[1, 2, 3, 4, 5],
+                setter="simu.machine.stator.slot.W0",
+                name="Stator slot width",
+                unit="m",
+                symbol="S_s_w",
+            )
+        ],
+        datakeeper_list=[
+            DataKeeper(
+                name="Stator slot width",
+                unit="m",
+                symbol="D_S_s_w",
+                keeper="lambda output: np.sqrt(output.simu.machine.stator.slot.W0)",
+                error_keeper="lambda simu: np.nan",
+            ),
+            DataKeeper(
+                name="Simulation index",
+                unit="-",
+                symbol="idx",
+                keeper="lambda output: output.simu.index",
+            ),
+        ],
+        stop_if_error=False,
+        is_keep_all_output=True,
+        nb_proc=nb_proc,
+        chunk_size=chunk_size,
+    )
+    return simu
+
+
+@pytest.mark.parametrize("nb_proc, chunk_size", [(1, 1), (2, 1), (2, 3)])
+def test_var_simu_pool(nb_proc, chunk_size):
+    """Check that the process pool gives the same results as the serial run"""
+    xoutput = get_simu(nb_proc, chunk_size).run()
+
+    result = xoutput["D_S_s_w"].result
+    assert result[:2] == [1, sqrt(2)]
+    assert isnan(result[2])  # error_keeper
+    assert result[3:] == [2, sqrt(5)]
+    assert xoutput["idx"].result == [0, 1, None, 3, 4]
+    # Outputs are stored in the simulation order
+    assert len(xoutput.output_list) == 5
+    assert xoutput.output_list[2] is None
+    assert [out.simu.machine.stator.slot.W0 for out in xoutput.output_list if out] == [
+        1,
+        2,
+        4,
+        5,
+    ]
+
+
+def test_var_simu_pool_stop_if_error():
+    """Check that stop_if_error raises the error of a worker"""
+    simu = get_simu(nb_proc=2)
+    simu.var_simu.stop_if_error = True
+    with pytest.raises(ZeroDivisionError):
+        simu.run()
+
+
+class MarkerFEMMHandler(FakeFEMMHandler):
+    """Fake FEMM handler writing a file when it is closed"""
+
+    def closefemm(self):
+        FakeFEMMHandler.closefemm(self)
+        open(join(FEMM_PATH, "closed_" + str(getpid())), "w").close()
+
+
+def keep_FEMM_worker(output):
+    """Post-processing opening FEMM workers kept between the simulations"""
+    get_FEMM_workers(join(FEMM_PATH, "model.fem"), 1, MarkerFEMMHandler)
+
+
+def test_var_simu_pool_close_FEMM():
+    """Check that the FEMM workers kept open in the processes of the pool are
+    closed when the processes exit"""
+    if not isdir(FEMM_PATH):
+        makedirs(FEMM_PATH)
+    with open(join(FEMM_PATH, "model.fem"), "w") as file:
+        file.write("model")
+
+    simu = get_simu(nb_proc=2)
+    # lambda str since the simulations are copied (as_dict)
+    simu.postproc_list = [
+        PostFunction(
+            run="lambda output: __import__("
+            + "'Tests.Simulation.test_var_simu_pool', fromlist=['']"
+            + ").keep_FEMM_worker(output)"
+        )
+    ]
+    simu.var_simu.ref_simu_index = None
+    simu.var_simu.is_keep_all_output = False
+    simu.run()
+
+    closed_list = [name for name in listdir(FEMM_PATH) if name.startswith("closed")]
+    # Reference simulation in the main process (closed by VarSimu.run) and
+    # other simulations in the 2 processes of the pool
+    assert len(closed_list) == 3
+    assert "closed_" + str(getpid()) in closed_list
+    # The worker files are removed
+    assert sorted(listdir(FEMM_PATH)) == sorted(closed_list + ["model.fem"])
+
+
+if __name__ == "__main__":
+    test_var_simu_pool(2, 1)
+    test_var_simu_pool_stop_if_error()
+    test_var_simu_pool_close_FEMM()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+from os import remove
+from os.path import isfile, join
+import random
+
+import pytest
+
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Classes.OptiDesignVar import OptiDesignVar
+from pyleecan.Classes.OptiGenAlgNsga2Deap import OptiGenAlgNsga2Deap
+from pyleecan.Classes.OptiObjective import OptiObjective
+from pyleecan.Classes.OptiProblem import OptiProblem
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Optimization.fitness_cache import get_problem_signature
+from pyleecan.definitions import DATA_DIR
+from Tests import save_validation_path as save_path
+
+
+def get_solver(eval_list, **kwargs):
+    """Binh and Korn problem on discrete slot heights of SCIM_001 (the
+    evaluated designs are appended to eval_list)"""
+    SCIM_001 = load(join(DATA_DIR, "Machine", "SCIM_001.json"))
+    simu = Simu1(name="test_opti_cache", machine=SCIM_001)
+
+    my_vars = [
+        OptiDesignVar(
+            name="Rotor slot height",
+            symbol="RH0",
+            type_var="set",
+            space=[0, 1, 2, 3, 4, 5],
+            get_value="lambda space: random.choice(space)",
+            setter="simu.machine.rotor.slot.H0",
+        ),
+        OptiDesignVar(
+            name="Stator slot height",
+            symbol="SH0",
+            type_var="set",
+            space=[0, 1, 2, 3],
+            get_value="lambda space: random.choice(space)",
+            setter="simu.machine.stator.slot.H0",
+        ),
+    ]
+    objs = [
+        OptiObjective(
+            name="Binh and Korn 1",
+            symbol="obj1",
+            keeper="lambda output: output.mag.Tem_av",
+        ),
+        OptiObjective(
+            name="Binh and Korn 2",
+            symbol="obj2",
+            keeper="lambda output: output.mag.Tem_rip_norm",
+        ),
+    ]
+    datakeeper_list = [
+        DataKeeper(
+            name="Stator slot height",
+            symbol="SH0_bis",
+            keeper="lambda output: output.simu.machine.stator.slot.H0",
+        )
+    ]
+
+    def evaluate(output):
+        x = output.simu.machine.rotor.slot.H0
+        y = output.simu.machine.stator.slot.H0
+        eval_list.append((x, y))
+        output.mag.Tem_av = 4 * x ** 2 + 4 * y ** 2
+        output.mag.Tem_rip_norm = (x - 5) ** 2 + (y - 5) ** 2
+
+    my_prob = OptiProblem(
+        simu=simu,
+        design_var=my_vars,
+        obj_func=objs,
+        datakeeper_list=datakeeper_list,
+        eval_func=evaluate,
+    )
+    return OptiGenAlgNsga2Deap(
+        problem=my_prob, size_pop=12, nb_gen=6, p_mutate=0.5, **kwargs
+    )
+
+
+@pytest.mark.DEAP
+def test_opti_cache():
+    """Check that the cached evaluations give the same results as the
+    evaluation of every individual and that a resumed optimization does not
+    evaluate anything"""
+    cache_path = join(save_path, "test_opti_cache.pkl")
+    if isfile(cache_path):
+        remove(cache_path)
+
+    ref_list = list()
+    random.seed(0)
+    ref = get_solver(ref_list).solve()
+
+    eval_list = list()
+    random.seed(0)
+    solver = get_solver(eval_list, cache_size=None, cache_path=cache_path)
+    res = solver.solve()
+    for symbol in ["obj1", "obj2", "SH0_bis", "is_valid", "ngen"]:
+        assert res[symbol].result == ref[symbol].result, symbol
+    # Each design is evaluated once
+    assert len(eval_list) == len(set(eval_list))
+    assert len(eval_list) < len(ref_list)
+    assert isfile(cache_path)
+    solver_signature = get_problem_signature(get_solver(list()).problem)
+    assert get_problem_signature(get_solver(list()).problem) == solver_signature
+
+    # Resumed optimization: everything is in the saved cache
+    resume_list = list()
+    random.seed(0)
+    res = get_solver(resume_list, cache_size=None, cache_path=cache_path).solve()
+    assert resume_list == []
+    for symbol in ["obj1", "obj2", "SH0_bis"]:
+        assert res[symbol].result == ref[symbol].result, symbol
+
+    # Same symbols, different problem: the saved cache is not used
+    other_list = list()
+    random.seed(0)
+    solver = get_solver(other_list, cache_size=None, cache_path=cache_path)
+    solver.problem.simu.machine.stator.slot.W0 *= 1.1
+    solver.solve()
+    assert len(other_list) == len(eval_list)
+    for change in [
+        lambda prob: setattr(prob.design_var[0], "space", [0, 1, 2]),
+        lambda prob: setattr(prob.obj_func[0], "keeper", "lambda output: 0"),
+        lambda prob: setattr(prob, "eval_func", lambda output: None),
+    ]:
+        problem = get_solver(list()).problem
+        change(problem)
+        assert get_problem_signature(problem) != solver_signature
+
+    # Limited cache: some designs are evaluated again
+    small_list = list()
+    random.seed(0)
+    res = get_solver(small_list, cache_size=2).solve()
+    assert res["obj1"].result == ref["obj1"].result
+    assert len(eval_list) <= len(small_list) <= len(ref_list)
+
+
+if __name__ == "__main__":
+    test_opti_cache()
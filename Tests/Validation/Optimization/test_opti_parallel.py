@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+import random
+
+import pytest
+
+from pyleecan.Classes.DataKeeper import DataKeeper
+from pyleecan.Classes.OptiConstraint import OptiConstraint
+from pyleecan.Classes.OptiDesignVar import OptiDesignVar
+from pyleecan.Classes.OptiGenAlgNsga2Deap import OptiGenAlgNsga2Deap
+from pyleecan.Classes.OptiObjective import OptiObjective
+from pyleecan.Classes.OptiProblem import OptiProblem
+from pyleecan.Classes.Simu1 import Simu1
+from pyleecan.Functions.load import load
+from pyleecan.Functions.Optimization.evaluate_pop import evaluate_queue
+from pyleecan.definitions import DATA_DIR
+
+
+def get_solver(nb_proc, evaluator=None, is_keep_all_output=False):
+    """Binh and Korn problem on the slot heights of SCIM_001 (the evaluation
+    fails for the individuals with a rotor slot height above 4.5)
+    """
+    SCIM_001 = load(join(DATA_DIR, "Machine", "SCIM_001.json"))
+    simu = Simu1(name="test_opti_parallel", machine=SCIM_001)
+
+    my_vars = [
+        OptiDesignVar(
+            name="Rotor slot height",
+            symbol="RH0",
+            type_var="interval",
+            space=[0, 5],
+            get_value="lambda space: random.uniform(*space)",
+            setter="simu.machine.rotor.slot.H0",
+        ),
+        OptiDesignVar(
+            name="Stator slot height",
+            symbol="SH0",
+            type_var="interval",
+            space=[0, 3],
+            get_value="lambda space: random.uniform(*space)",
+            setter="simu.machine.stator.slot.H0",
+        ),
+    ]
+    objs = [
+        OptiObjective(
+            name="Binh and Korn 1",
+            symbol="obj1",
+            keeper="lambda output: output.mag.Tem_av",
+        ),
+        OptiObjective(
+            name="Binh and Korn 2",
+            symbol="obj2",
+            keeper="lambda output: output.mag.Tem_rip_norm",
+        ),
+    ]
+    cstrs = [
+        OptiConstraint(
+            name="first",
+            get_variable="lambda output: (output.simu.machine.rotor.slot.H0 - 5) ** 2 + output.simu.machine.stator.slot.H0 ** 2",
+            type_const="<=",
+            value=25,
+        )
+    ]
+    datakeeper_list = [
+        DataKeeper(
+            name="Rotor slot height",
+            symbol="RH0_bis",
+            keeper="lambda output: output.simu.machine.rotor.slot.H0",
+            error_keeper="lambda simu: -1",
+        )
+    ]
+
+    def evaluate(output):
+        x = output.simu.machine.rotor.slot.H0
+        y = output.simu.machine.stator.slot.H0
+        if x > 4.5:
+            raise Exception("Evaluation failure")
+        output.mag.Tem_av = 4 * x ** 2 + 4 * y ** 2
+        output.mag.Tem_rip_norm = (x - 5) ** 2 + (y - 5) ** 2
+
+    my_prob = OptiProblem(
+        simu=simu,
+        design_var=my_vars,
+        obj_func=objs,
+        constraint=cstrs,
+        datakeeper_list=datakeeper_list,
+        eval_func=evaluate,
+    )
+    return OptiGenAlgNsga2Deap(
+        problem=my_prob,
+        size_pop=8,
+        nb_gen=3,
+        p_mutate=0.5,
+        nb_proc=nb_proc,
+        evaluator=evaluator,
+        is_keep_all_output=is_keep_all_output,
+    )
+
+
+@pytest.mark.DEAP
+@pytest.mark.parametrize(
+    "nb_proc, evaluator, is_keep_all_output",
+    [(2, None, False), (2, evaluate_queue, True)],
+)
+def test_opti_parallel(nb_proc, evaluator, is_keep_all_output):
+    """Check that the parallel evaluators give the same results as the serial
+    evaluation (same random seed)"""
+    random.seed(0)
+    ref = get_solver(1, is_keep_all_output=is_keep_all_output).solve()
+    random.seed(0)
+    res = get_solver(nb_proc, evaluator, is_keep_all_output).solve()
+
+    assert res.nb_simu == ref.nb_simu
+    for symbol in ["obj1", "obj2", "RH0_bis", "is_valid", "ngen"]:
+        assert res[symbol].result == ref[symbol].result, symbol
+    assert -1 in ref["RH0_bis"].result  # error_keeper of the failed evaluations
+    for param, param_ref in zip(res.paramexplorer_list, ref.paramexplorer_list):
+        assert param.value == param_ref.value
+    assert len(res.output_list) == len(ref.output_list)
+    for output, output_ref in zip(res.output_list, ref.output_list):
+        assert output.mag.Tem_av == output_ref.mag.Tem_av
+
+
+if __name__ == "__main__":
+    test_opti_parallel(2, None, False)
+    test_opti_parallel(2, evaluate_queue, True)
@@ -0,0 +1,667 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Output/AGSFTransfer.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Output/AGSFTransfer
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import set_array, check_var, raise_
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict, from_dict_trusted
+from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
+from ._frozen import FrozenClass
+
+# Import all class method
+# Try/catch to remove unnecessary dependencies in unused method
+try:
+    from ..Methods.Output.AGSFTransfer.get_spectrum import get_spectrum
+except ImportError as error:
+    get_spectrum = error
+
+try:
+    from ..Methods.Output.AGSFTransfer.get_AGSF import get_AGSF
+except ImportError as error:
+    get_AGSF = error
+
+
+from numpy import array, array_equal
+from ._check import InitUnKnowClassError
+
+
+class AGSFTransfer(FrozenClass):
+    """Air-gap surface force transferred to several radii, stored as transfer coefficients and base spectrum (factorized) or as transferred spectra"""
+
+    VERSION = 1
+
+    # Check ImportError to remove unnecessary dependencies in unused method
+    # cf Methods.Output.AGSFTransfer.get_spectrum
+    if isinstance(get_spectrum, ImportError):
+        get_spectrum = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use AGSFTransfer method get_spectrum: " + str(get_spectrum)
+                )
+            )
+        )
+    else:
+        get_spectrum = get_spectrum
+    # cf Methods.Output.AGSFTransfer.get_AGSF
+    if isinstance(get_AGSF, ImportError):
+        get_AGSF = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use AGSFTransfer method get_AGSF: " + str(get_AGSF))
+            )
+        )
+    else:
+        get_AGSF = get_AGSF
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        Rag=None,
+        Rsbo=None,
+        freqs=None,
+        wavenumber=None,
+        Prad=None,
+        Ptan=None,
+        Sn=None,
+        Cn=None,
+        Prad_TR=None,
+        Ptan_TR=None,
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionnary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "Rag" in init_dict:
+                Rag = init_dict["Rag"]
+            if "Rsbo" in init_dict:
+                Rsbo = init_dict["Rsbo"]
+            if "freqs" in init_dict:
+                freqs = init_dict["freqs"]
+            if "wavenumber" in init_dict:
+                wavenumber = init_dict["wavenumber"]
+            if "Prad" in init_dict:
+                Prad = init_dict["Prad"]
+            if "Ptan" in init_dict:
+                Ptan = init_dict["Ptan"]
+            if "Sn" in init_dict:
+                Sn = init_dict["Sn"]
+            if "Cn" in init_dict:
+                Cn = init_dict["Cn"]
+            if "Prad_TR" in init_dict:
+                Prad_TR = init_dict["Prad_TR"]
+            if "Ptan_TR" in init_dict:
+                Ptan_TR = init_dict["Ptan_TR"]
+        # Set the properties (value check and convertion are done in setter)
+        self.parent = None
+        self.Rag = Rag
+        self.Rsbo = Rsbo
+        self.freqs = freqs
+        self.wavenumber = wavenumber
+        self.Prad = Prad
+        self.Ptan = Ptan
+        self.Sn = Sn
+        self.Cn = Cn
+        self.Prad_TR = Prad_TR
+        self.Ptan_TR = Ptan_TR
+
+        # The class is frozen, for now it's impossible to add new properties
+        self._freeze()
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        AGSFTransfer_str = ""
+        if self.parent is None:
+            AGSFTransfer_str += "parent = None " + linesep
+        else:
+            AGSFTransfer_str += (
+                "parent = " + str(type(self.parent)) + " object" + linesep
+            )
+        AGSFTransfer_str += "Rag = " + str(self.Rag) + linesep
+        AGSFTransfer_str += (
+            "Rsbo = "
+            + linesep
+            + str(self.Rsbo).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        AGSFTransfer_str += (
+            "freqs = "
+            + linesep
+            + str(self.freqs).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        AGSFTransfer_str += (
+            "wavenumber = "
+            + linesep
+            + str(self.wavenumber).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        AGSFTransfer_str += (
+            "Prad = "
+            + linesep
+            + str(self.Prad).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        AGSFTransfer_str += (
+            "Ptan = "
+            + linesep
+            + str(self.Ptan).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        AGSFTransfer_str += (
+            "Sn = "
+            + linesep
+            + str(self.Sn).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        AGSFTransfer_str += (
+            "Cn = "
+            + linesep
+            + str(self.Cn).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        AGSFTransfer_str += (
+            "Prad_TR = "
+            + linesep
+            + str(self.Prad_TR).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        AGSFTransfer_str += (
+            "Ptan_TR = "
+            + linesep
+            + str(self.Ptan_TR).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        return AGSFTransfer_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+        if other.Rag != self.Rag:
+            return False
+        if not array_equal(other.Rsbo, self.Rsbo):
+            return False
+        if not array_equal(other.freqs, self.freqs):
+            return False
+        if not array_equal(other.wavenumber, self.wavenumber):
+            return False
+        if not array_equal(other.Prad, self.Prad):
+            return False
+        if not array_equal(other.Ptan, self.Ptan):
+            return False
+        if not array_equal(other.Sn, self.Sn):
+            return False
+        if not array_equal(other.Cn, self.Cn):
+            return False
+        if not array_equal(other.Prad_TR, self.Prad_TR):
+            return False
+        if not array_equal(other.Ptan_TR, self.Ptan_TR):
+            return False
+        return True
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+        S += getsizeof(self.Rag)
+        S += getsizeof(self.Rsbo)
+        S += getsizeof(self.freqs)
+        S += getsizeof(self.wavenumber)
+        S += getsizeof(self.Prad)
+        S += getsizeof(self.Ptan)
+        S += getsizeof(self.Sn)
+        S += getsizeof(self.Cn)
+        S += getsizeof(self.Prad_TR)
+        S += getsizeof(self.Ptan_TR)
+        return S
+
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        AGSFTransfer_dict = dict()
+        AGSFTransfer_dict["Rag"] = self.Rag
+        if self.Rsbo is None:
+            AGSFTransfer_dict["Rsbo"] = None
+        else:
+            if type_handle_ndarray == 0:
+                AGSFTransfer_dict["Rsbo"] = self.Rsbo.tolist()
+            elif type_handle_ndarray == 1:
+                AGSFTransfer_dict["Rsbo"] = self.Rsbo.copy()
+            elif type_handle_ndarray == 2:
+                AGSFTransfer_dict["Rsbo"] = self.Rsbo
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.freqs is None:
+            AGSFTransfer_dict["freqs"] = None
+        else:
+            if type_handle_ndarray == 0:
+                AGSFTransfer_dict["freqs"] = self.freqs.tolist()
+            elif type_handle_ndarray == 1:
+                AGSFTransfer_dict["freqs"] = self.freqs.copy()
+            elif type_handle_ndarray == 2:
+                AGSFTransfer_dict["freqs"] = self.freqs
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.wavenumber is None:
+            AGSFTransfer_dict["wavenumber"] = None
+        else:
+            if type_handle_ndarray == 0:
+                AGSFTransfer_dict["wavenumber"] = self.wavenumber.tolist()
+            elif type_handle_ndarray == 1:
+                AGSFTransfer_dict["wavenumber"] = self.wavenumber.copy()
+            elif type_handle_ndarray == 2:
+                AGSFTransfer_dict["wavenumber"] = self.wavenumber
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.Prad is None:
+            AGSFTransfer_dict["Prad"] = None
+        else:
+            if type_handle_ndarray == 0:
+                AGSFTransfer_dict["Prad"] = self.Prad.tolist()
+            elif type_handle_ndarray == 1:
+                AGSFTransfer_dict["Prad"] = self.Prad.copy()
+            elif type_handle_ndarray == 2:
+                AGSFTransfer_dict["Prad"] = self.Prad
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.Ptan is None:
+            AGSFTransfer_dict["Ptan"] = None
+        else:
+            if type_handle_ndarray == 0:
+                AGSFTransfer_dict["Ptan"] = self.Ptan.tolist()
+            elif type_handle_ndarray == 1:
+                AGSFTransfer_dict["Ptan"] = self.Ptan.copy()
+            elif type_handle_ndarray == 2:
+                AGSFTransfer_dict["Ptan"] = self.Ptan
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.Sn is None:
+            AGSFTransfer_dict["Sn"] = None
+        else:
+            if type_handle_ndarray == 0:
+                AGSFTransfer_dict["Sn"] = self.Sn.tolist()
+            elif type_handle_ndarray == 1:
+                AGSFTransfer_dict["Sn"] = self.Sn.copy()
+            elif type_handle_ndarray == 2:
+                AGSFTransfer_dict["Sn"] = self.Sn
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.Cn is None:
+            AGSFTransfer_dict["Cn"] = None
+        else:
+            if type_handle_ndarray == 0:
+                AGSFTransfer_dict["Cn"] = self.Cn.tolist()
+            elif type_handle_ndarray == 1:
+                AGSFTransfer_dict["Cn"] = self.Cn.copy()
+            elif type_handle_ndarray == 2:
+                AGSFTransfer_dict["Cn"] = self.Cn
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.Prad_TR is None:
+            AGSFTransfer_dict["Prad_TR"] = None
+        else:
+            if type_handle_ndarray == 0:
+                AGSFTransfer_dict["Prad_TR"] = self.Prad_TR.tolist()
+            elif type_handle_ndarray == 1:
+                AGSFTransfer_dict["Prad_TR"] = self.Prad_TR.copy()
+            elif type_handle_ndarray == 2:
+                AGSFTransfer_dict["Prad_TR"] = self.Prad_TR
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.Ptan_TR is None:
+            AGSFTransfer_dict["Ptan_TR"] = None
+        else:
+            if type_handle_ndarray == 0:
+                AGSFTransfer_dict["Ptan_TR"] = self.Ptan_TR.tolist()
+            elif type_handle_ndarray == 1:
+                AGSFTransfer_dict["Ptan_TR"] = self.Ptan_TR.copy()
+            elif type_handle_ndarray == 2:
+                AGSFTransfer_dict["Ptan_TR"] = self.Ptan_TR
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        # The class name is added to the dict for deserialisation purpose
+        AGSFTransfer_dict["__class__"] = "AGSFTransfer"
+        return AGSFTransfer_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.Rag = None
+        self.Rsbo = None
+        self.freqs = None
+        self.wavenumber = None
+        self.Prad = None
+        self.Ptan = None
+        self.Sn = None
+        self.Cn = None
+        self.Prad_TR = None
+        self.Ptan_TR = None
+
+    def _get_Rag(self):
+        """getter of Rag"""
+        return self._Rag
+
+    def _set_Rag(self, value):
+        """setter of Rag"""
+        check_var("Rag", value, "float")
+        self._Rag = value
+
+    Rag = property(
+        fget=_get_Rag,
+        fset=_set_Rag,
+        doc=u"""Radius of the base air-gap surface force
+
+        :Type: float
+        """,
+    )
+
+    def _get_Rsbo(self):
+        """getter of Rsbo"""
+        if isinstance(self._Rsbo, LazyArray):
+            self._set_Rsbo(self._Rsbo.load())
+        return self._Rsbo
+
+    def _set_Rsbo(self, value):
+        """setter of Rsbo"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Rsbo", value, "ndarray")
+        self._Rsbo = value
+
+    Rsbo = property(
+        fget=_get_Rsbo,
+        fset=_set_Rsbo,
+        doc=u"""Radii of the transferred air-gap surface force
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_freqs(self):
+        """getter of freqs"""
+        if isinstance(self._freqs, LazyArray):
+            self._set_freqs(self._freqs.load())
+        return self._freqs
+
+    def _set_freqs(self, value):
+        """setter of freqs"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("freqs", value, "ndarray")
+        self._freqs = value
+
+    freqs = property(
+        fget=_get_freqs,
+        fset=_set_freqs,
+        doc=u"""Frequencies of the spectra
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_wavenumber(self):
+        """getter of wavenumber"""
+        if isinstance(self._wavenumber, LazyArray):
+            self._set_wavenumber(self._wavenumber.load())
+        return self._wavenumber
+
+    def _set_wavenumber(self, value):
+        """setter of wavenumber"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("wavenumber", value, "ndarray")
+        self._wavenumber = value
+
+    wavenumber = property(
+        fget=_get_wavenumber,
+        fset=_set_wavenumber,
+        doc=u"""Wavenumbers of the spectra
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_Prad(self):
+        """getter of Prad"""
+        if isinstance(self._Prad, LazyArray):
+            self._set_Prad(self._Prad.load())
+        return self._Prad
+
+    def _set_Prad(self, value):
+        """setter of Prad"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Prad", value, "ndarray")
+        self._Prad = value
+
+    Prad = property(
+        fget=_get_Prad,
+        fset=_set_Prad,
+        doc=u"""Radial spectrum of the base air-gap surface force
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_Ptan(self):
+        """getter of Ptan"""
+        if isinstance(self._Ptan, LazyArray):
+            self._set_Ptan(self._Ptan.load())
+        return self._Ptan
+
+    def _set_Ptan(self, value):
+        """setter of Ptan"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Ptan", value, "ndarray")
+        self._Ptan = value
+
+    Ptan = property(
+        fget=_get_Ptan,
+        fset=_set_Ptan,
+        doc=u"""Tangential spectrum of the base air-gap surface force
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_Sn(self):
+        """getter of Sn"""
+        if isinstance(self._Sn, LazyArray):
+            self._set_Sn(self._Sn.load())
+        return self._Sn
+
+    def _set_Sn(self, value):
+        """setter of Sn"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Sn", value, "ndarray")
+        self._Sn = value
+
+    Sn = property(
+        fget=_get_Sn,
+        fset=_set_Sn,
+        doc=u"""Transfer coefficients of each radius (Sn of the publication)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_Cn(self):
+        """getter of Cn"""
+        if isinstance(self._Cn, LazyArray):
+            self._set_Cn(self._Cn.load())
+        return self._Cn
+
+    def _set_Cn(self, value):
+        """setter of Cn"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Cn", value, "ndarray")
+        self._Cn = value
+
+    Cn = property(
+        fget=_get_Cn,
+        fset=_set_Cn,
+        doc=u"""Transfer coefficients of each radius (Cn of the publication)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_Prad_TR(self):
+        """getter of Prad_TR"""
+        if isinstance(self._Prad_TR, LazyArray):
+            self._set_Prad_TR(self._Prad_TR.load())
+        return self._Prad_TR
+
+    def _set_Prad_TR(self, value):
+        """setter of Prad_TR"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Prad_TR", value, "ndarray")
+        self._Prad_TR = value
+
+    Prad_TR = property(
+        fget=_get_Prad_TR,
+        fset=_set_Prad_TR,
+        doc=u"""Transferred radial spectra (None if factorized)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_Ptan_TR(self):
+        """getter of Ptan_TR"""
+        if isinstance(self._Ptan_TR, LazyArray):
+            self._set_Ptan_TR(self._Ptan_TR.load())
+        return self._Ptan_TR
+
+    def _set_Ptan_TR(self, value):
+        """setter of Ptan_TR"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Ptan_TR", value, "ndarray")
+        self._Ptan_TR = value
+
+    Ptan_TR = property(
+        fget=_get_Ptan_TR,
+        fset=_set_Ptan_TR,
+        doc=u"""Transferred tangential spectra (None if factorized)
+
+        :Type: ndarray
+        """,
+    )
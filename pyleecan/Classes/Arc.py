@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Line import Line
 
@@ -116,6 +116,7 @@ class Arc(Line):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -135,7 +136,7 @@ class Arc(Line):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Set the properties (value check and convertion are done in setter)
         # Call Line init
@@ -171,11 +172,18 @@ class Arc(Line):
         S += super(Arc, self).__sizeof__()
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Line
-        Arc_dict = super(Arc, self).as_dict()
+        Arc_dict = super(Arc, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         Arc_dict["__class__"] = "Arc"
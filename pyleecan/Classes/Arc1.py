@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Arc import Arc
 
@@ -212,6 +212,7 @@ class Arc1(Arc):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -240,15 +241,15 @@ class Arc1(Arc):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "begin" in list(init_dict.keys()):
+            if "begin" in init_dict:
                 begin = init_dict["begin"]
-            if "end" in list(init_dict.keys()):
+            if "end" in init_dict:
                 end = init_dict["end"]
-            if "radius" in list(init_dict.keys()):
+            if "radius" in init_dict:
                 radius = init_dict["radius"]
-            if "is_trigo_direction" in list(init_dict.keys()):
+            if "is_trigo_direction" in init_dict:
                 is_trigo_direction = init_dict["is_trigo_direction"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Set the properties (value check and convertion are done in setter)
         self.begin = begin
@@ -304,11 +305,18 @@ class Arc1(Arc):
         S += getsizeof(self.is_trigo_direction)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Arc
-        Arc1_dict = super(Arc1, self).as_dict()
+        Arc1_dict = super(Arc1, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.begin is None:
             Arc1_dict["begin"] = None
         elif isinstance(self.begin, float):
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -26,6 +26,7 @@ class Bore(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -70,8 +71,13 @@ class Bore(FrozenClass):
         S = 0  # Full size of the object
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Bore_dict = dict()
         # The class name is added to the dict for deserialisation purpose
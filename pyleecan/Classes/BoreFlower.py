@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Bore import Bore
 
@@ -45,6 +45,7 @@ class BoreFlower(Bore):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -64,11 +65,11 @@ class BoreFlower(Bore):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "N" in list(init_dict.keys()):
+            if "N" in init_dict:
                 N = init_dict["N"]
-            if "Rarc" in list(init_dict.keys()):
+            if "Rarc" in init_dict:
                 Rarc = init_dict["Rarc"]
-            if "alpha" in list(init_dict.keys()):
+            if "alpha" in init_dict:
                 alpha = init_dict["alpha"]
         # Set the properties (value check and convertion are done in setter)
         self.N = N
@@ -119,11 +120,18 @@ class BoreFlower(Bore):
         S += getsizeof(self.alpha)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Bore
-        BoreFlower_dict = super(BoreFlower, self).as_dict()
+        BoreFlower_dict = super(BoreFlower, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         BoreFlower_dict["N"] = self.N
         BoreFlower_dict["Rarc"] = self.Rarc
         BoreFlower_dict["alpha"] = self.alpha
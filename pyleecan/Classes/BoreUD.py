@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Bore import Bore
 
@@ -46,6 +46,7 @@ class BoreUD(Bore):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -65,7 +66,7 @@ class BoreUD(Bore):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "line_list" in list(init_dict.keys()):
+            if "line_list" in init_dict:
                 line_list = init_dict["line_list"]
         # Set the properties (value check and convertion are done in setter)
         self.line_list = line_list
@@ -114,18 +115,27 @@ class BoreUD(Bore):
                 S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Bore
-        BoreUD_dict = super(BoreUD, self).as_dict()
+        BoreUD_dict = super(BoreUD, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.line_list is None:
             BoreUD_dict["line_list"] = None
         else:
             BoreUD_dict["line_list"] = list()
             for obj in self.line_list:
                 if obj is not None:
-                    BoreUD_dict["line_list"].append(obj.as_dict())
+                    BoreUD_dict["line_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     BoreUD_dict["line_list"].append(None)
         # The class name is added to the dict for deserialisation purpose
@@ -10,9 +10,10 @@ from logging import getLogger
 from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from ._frozen import FrozenClass
 
 # Import all class method
@@ -37,6 +38,16 @@ try:
 except ImportError as error:
     is_exist = error
 
+try:
+    from ..Methods.Mesh.CellMat.get_adjacency import get_adjacency
+except ImportError as error:
+    get_adjacency = error
+
+try:
+    from ..Methods.Mesh.CellMat.add_cells import add_cells
+except ImportError as error:
+    add_cells = error
+
 
 from numpy import array, array_equal
 from ._check import InitUnKnowClassError
@@ -90,9 +101,30 @@ class CellMat(FrozenClass):
         )
     else:
         is_exist = is_exist
+    # cf Methods.Mesh.CellMat.get_adjacency
+    if isinstance(get_adjacency, ImportError):
+        get_adjacency = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use CellMat method get_adjacency: " + str(get_adjacency)
+                )
+            )
+        )
+    else:
+        get_adjacency = get_adjacency
+    # cf Methods.Mesh.CellMat.add_cells
+    if isinstance(add_cells, ImportError):
+        add_cells = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use CellMat method add_cells: " + str(add_cells))
+            )
+        )
+    else:
+        add_cells = add_cells
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -121,15 +153,15 @@ class CellMat(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "connectivity" in list(init_dict.keys()):
+            if "connectivity" in init_dict:
                 connectivity = init_dict["connectivity"]
-            if "nb_cell" in list(init_dict.keys()):
+            if "nb_cell" in init_dict:
                 nb_cell = init_dict["nb_cell"]
-            if "nb_pt_per_cell" in list(init_dict.keys()):
+            if "nb_pt_per_cell" in init_dict:
                 nb_pt_per_cell = init_dict["nb_pt_per_cell"]
-            if "indice" in list(init_dict.keys()):
+            if "indice" in init_dict:
                 indice = init_dict["indice"]
-            if "interpolation" in list(init_dict.keys()):
+            if "interpolation" in init_dict:
                 interpolation = init_dict["interpolation"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -205,24 +237,49 @@ class CellMat(FrozenClass):
         S += getsizeof(self.interpolation)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         CellMat_dict = dict()
         if self.connectivity is None:
             CellMat_dict["connectivity"] = None
         else:
-            CellMat_dict["connectivity"] = self.connectivity.tolist()
+            if type_handle_ndarray == 0:
+                CellMat_dict["connectivity"] = self.connectivity.tolist()
+            elif type_handle_ndarray == 1:
+                CellMat_dict["connectivity"] = self.connectivity.copy()
+            elif type_handle_ndarray == 2:
+                CellMat_dict["connectivity"] = self.connectivity
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         CellMat_dict["nb_cell"] = self.nb_cell
         CellMat_dict["nb_pt_per_cell"] = self.nb_pt_per_cell
         if self.indice is None:
             CellMat_dict["indice"] = None
         else:
-            CellMat_dict["indice"] = self.indice.tolist()
+            if type_handle_ndarray == 0:
+                CellMat_dict["indice"] = self.indice.tolist()
+            elif type_handle_ndarray == 1:
+                CellMat_dict["indice"] = self.indice.copy()
+            elif type_handle_ndarray == 2:
+                CellMat_dict["indice"] = self.indice
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         if self.interpolation is None:
             CellMat_dict["interpolation"] = None
         else:
-            CellMat_dict["interpolation"] = self.interpolation.as_dict()
+            CellMat_dict["interpolation"] = child_as_dict(
+                self.interpolation, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         CellMat_dict["__class__"] = "CellMat"
         return CellMat_dict
@@ -239,6 +296,8 @@ class CellMat(FrozenClass):
 
     def _get_connectivity(self):
         """getter of connectivity"""
+        if isinstance(self._connectivity, LazyArray):
+            self._set_connectivity(self._connectivity.load())
         return self._connectivity
 
     def _set_connectivity(self, value):
@@ -250,7 +309,8 @@ class CellMat(FrozenClass):
                 value = array(value)
             except:
                 pass
-        check_var("connectivity", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("connectivity", value, "ndarray")
         self._connectivity = value
 
     connectivity = property(
@@ -300,6 +360,8 @@ class CellMat(FrozenClass):
 
     def _get_indice(self):
         """getter of indice"""
+        if isinstance(self._indice, LazyArray):
+            self._set_indice(self._indice.load())
         return self._indice
 
     def _set_indice(self, value):
@@ -311,7 +373,8 @@ class CellMat(FrozenClass):
                 value = array(value)
             except:
                 pass
-        check_var("indice", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("indice", value, "ndarray")
         self._indice = value
 
     indice = property(
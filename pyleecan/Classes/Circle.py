@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Surface import Surface
 
@@ -160,6 +160,7 @@ class Circle(Surface):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -188,15 +189,15 @@ class Circle(Surface):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "radius" in list(init_dict.keys()):
+            if "radius" in init_dict:
                 radius = init_dict["radius"]
-            if "center" in list(init_dict.keys()):
+            if "center" in init_dict:
                 center = init_dict["center"]
-            if "line_label" in list(init_dict.keys()):
+            if "line_label" in init_dict:
                 line_label = init_dict["line_label"]
-            if "point_ref" in list(init_dict.keys()):
+            if "point_ref" in init_dict:
                 point_ref = init_dict["point_ref"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Set the properties (value check and convertion are done in setter)
         self.radius = radius
@@ -247,11 +248,18 @@ class Circle(Surface):
         S += getsizeof(self.line_label)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Surface
-        Circle_dict = super(Circle, self).as_dict()
+        Circle_dict = super(Circle, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         Circle_dict["radius"] = self.radius
         if self.center is None:
             Circle_dict["center"] = None
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Conductor import Conductor
 
@@ -127,6 +127,7 @@ class CondType11(Conductor):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -160,25 +161,25 @@ class CondType11(Conductor):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Hwire" in list(init_dict.keys()):
+            if "Hwire" in init_dict:
                 Hwire = init_dict["Hwire"]
-            if "Wwire" in list(init_dict.keys()):
+            if "Wwire" in init_dict:
                 Wwire = init_dict["Wwire"]
-            if "Nwppc_rad" in list(init_dict.keys()):
+            if "Nwppc_rad" in init_dict:
                 Nwppc_rad = init_dict["Nwppc_rad"]
-            if "Nwppc_tan" in list(init_dict.keys()):
+            if "Nwppc_tan" in init_dict:
                 Nwppc_tan = init_dict["Nwppc_tan"]
-            if "Wins_wire" in list(init_dict.keys()):
+            if "Wins_wire" in init_dict:
                 Wins_wire = init_dict["Wins_wire"]
-            if "Wins_coil" in list(init_dict.keys()):
+            if "Wins_coil" in init_dict:
                 Wins_coil = init_dict["Wins_coil"]
-            if "type_winding_shape" in list(init_dict.keys()):
+            if "type_winding_shape" in init_dict:
                 type_winding_shape = init_dict["type_winding_shape"]
-            if "alpha_ew" in list(init_dict.keys()):
+            if "alpha_ew" in init_dict:
                 alpha_ew = init_dict["alpha_ew"]
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Set the properties (value check and convertion are done in setter)
         self.Hwire = Hwire
@@ -256,11 +257,18 @@ class CondType11(Conductor):
         S += getsizeof(self.alpha_ew)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Conductor
-        CondType11_dict = super(CondType11, self).as_dict()
+        CondType11_dict = super(CondType11, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         CondType11_dict["Hwire"] = self.Hwire
         CondType11_dict["Wwire"] = self.Wwire
         CondType11_dict["Nwppc_rad"] = self.Nwppc_rad
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Conductor import Conductor
 
@@ -141,6 +141,7 @@ class CondType12(Conductor):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -171,19 +172,19 @@ class CondType12(Conductor):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Wwire" in list(init_dict.keys()):
+            if "Wwire" in init_dict:
                 Wwire = init_dict["Wwire"]
-            if "Wins_cond" in list(init_dict.keys()):
+            if "Wins_cond" in init_dict:
                 Wins_cond = init_dict["Wins_cond"]
-            if "Nwppc" in list(init_dict.keys()):
+            if "Nwppc" in init_dict:
                 Nwppc = init_dict["Nwppc"]
-            if "Wins_wire" in list(init_dict.keys()):
+            if "Wins_wire" in init_dict:
                 Wins_wire = init_dict["Wins_wire"]
-            if "Kwoh" in list(init_dict.keys()):
+            if "Kwoh" in init_dict:
                 Kwoh = init_dict["Kwoh"]
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Set the properties (value check and convertion are done in setter)
         self.Wwire = Wwire
@@ -244,11 +245,18 @@ class CondType12(Conductor):
         S += getsizeof(self.Kwoh)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Conductor
-        CondType12_dict = super(CondType12, self).as_dict()
+        CondType12_dict = super(CondType12, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         CondType12_dict["Wwire"] = self.Wwire
         CondType12_dict["Wins_cond"] = self.Wins_cond
         CondType12_dict["Nwppc"] = self.Nwppc
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Conductor import Conductor
 
@@ -110,6 +110,7 @@ class CondType21(Conductor):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -138,15 +139,15 @@ class CondType21(Conductor):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Hbar" in list(init_dict.keys()):
+            if "Hbar" in init_dict:
                 Hbar = init_dict["Hbar"]
-            if "Wbar" in list(init_dict.keys()):
+            if "Wbar" in init_dict:
                 Wbar = init_dict["Wbar"]
-            if "Wins" in list(init_dict.keys()):
+            if "Wins" in init_dict:
                 Wins = init_dict["Wins"]
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Set the properties (value check and convertion are done in setter)
         self.Hbar = Hbar
@@ -197,11 +198,18 @@ class CondType21(Conductor):
         S += getsizeof(self.Wins)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Conductor
-        CondType21_dict = super(CondType21, self).as_dict()
+        CondType21_dict = super(CondType21, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         CondType21_dict["Hbar"] = self.Hbar
         CondType21_dict["Wbar"] = self.Wbar
         CondType21_dict["Wins"] = self.Wins
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Conductor import Conductor
 
@@ -64,6 +64,7 @@ class CondType22(Conductor):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -85,11 +86,11 @@ class CondType22(Conductor):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Sbar" in list(init_dict.keys()):
+            if "Sbar" in init_dict:
                 Sbar = init_dict["Sbar"]
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Set the properties (value check and convertion are done in setter)
         self.Sbar = Sbar
@@ -130,11 +131,18 @@ class CondType22(Conductor):
         S += getsizeof(self.Sbar)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Conductor
-        CondType22_dict = super(CondType22, self).as_dict()
+        CondType22_dict = super(CondType22, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         CondType22_dict["Sbar"] = self.Sbar
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -44,6 +44,7 @@ class Conductor(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -63,9 +64,9 @@ class Conductor(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "cond_mat" in list(init_dict.keys()):
+            if "cond_mat" in init_dict:
                 cond_mat = init_dict["cond_mat"]
-            if "ins_mat" in list(init_dict.keys()):
+            if "ins_mat" in init_dict:
                 ins_mat = init_dict["ins_mat"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -114,18 +115,27 @@ class Conductor(FrozenClass):
         S += getsizeof(self.ins_mat)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Conductor_dict = dict()
         if self.cond_mat is None:
             Conductor_dict["cond_mat"] = None
         else:
-            Conductor_dict["cond_mat"] = self.cond_mat.as_dict()
+            Conductor_dict["cond_mat"] = child_as_dict(
+                self.cond_mat, type_handle_ndarray, **kwargs
+            )
         if self.ins_mat is None:
             Conductor_dict["ins_mat"] = None
         else:
-            Conductor_dict["ins_mat"] = self.ins_mat.as_dict()
+            Conductor_dict["ins_mat"] = child_as_dict(
+                self.ins_mat, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         Conductor_dict["__class__"] = "Conductor"
         return Conductor_dict
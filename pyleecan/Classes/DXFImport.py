@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -45,6 +45,7 @@ class DXFImport(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -66,11 +67,11 @@ class DXFImport(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "file_path" in list(init_dict.keys()):
+            if "file_path" in init_dict:
                 file_path = init_dict["file_path"]
-            if "surf_dict" in list(init_dict.keys()):
+            if "surf_dict" in init_dict:
                 surf_dict = init_dict["surf_dict"]
-            if "BC_list" in list(init_dict.keys()):
+            if "BC_list" in init_dict:
                 BC_list = init_dict["BC_list"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -125,8 +126,13 @@ class DXFImport(FrozenClass):
                 S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         DXFImport_dict = dict()
         DXFImport_dict["file_path"] = self.file_path
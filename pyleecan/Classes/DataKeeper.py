@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -31,6 +31,7 @@ class DataKeeper(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -60,17 +61,17 @@ class DataKeeper(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "symbol" in list(init_dict.keys()):
+            if "symbol" in init_dict:
                 symbol = init_dict["symbol"]
-            if "unit" in list(init_dict.keys()):
+            if "unit" in init_dict:
                 unit = init_dict["unit"]
-            if "keeper" in list(init_dict.keys()):
+            if "keeper" in init_dict:
                 keeper = init_dict["keeper"]
-            if "error_keeper" in list(init_dict.keys()):
+            if "error_keeper" in init_dict:
                 error_keeper = init_dict["error_keeper"]
-            if "result" in list(init_dict.keys()):
+            if "result" in init_dict:
                 result = init_dict["result"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -148,8 +149,13 @@ class DataKeeper(FrozenClass):
                 S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         DataKeeper_dict = dict()
         DataKeeper_dict["name"] = self.name
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -26,6 +26,7 @@ class Drive(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -47,11 +48,11 @@ class Drive(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Umax" in list(init_dict.keys()):
+            if "Umax" in init_dict:
                 Umax = init_dict["Umax"]
-            if "Imax" in list(init_dict.keys()):
+            if "Imax" in init_dict:
                 Imax = init_dict["Imax"]
-            if "is_current" in list(init_dict.keys()):
+            if "is_current" in init_dict:
                 is_current = init_dict["is_current"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -97,8 +98,13 @@ class Drive(FrozenClass):
         S += getsizeof(self.is_current)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Drive_dict = dict()
         Drive_dict["Umax"] = self.Umax
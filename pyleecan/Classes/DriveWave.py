@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Drive import Drive
 
@@ -44,6 +44,7 @@ class DriveWave(Drive):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -71,13 +72,13 @@ class DriveWave(Drive):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "wave" in list(init_dict.keys()):
+            if "wave" in init_dict:
                 wave = init_dict["wave"]
-            if "Umax" in list(init_dict.keys()):
+            if "Umax" in init_dict:
                 Umax = init_dict["Umax"]
-            if "Imax" in list(init_dict.keys()):
+            if "Imax" in init_dict:
                 Imax = init_dict["Imax"]
-            if "is_current" in list(init_dict.keys()):
+            if "is_current" in init_dict:
                 is_current = init_dict["is_current"]
         # Set the properties (value check and convertion are done in setter)
         self.wave = wave
@@ -122,15 +123,24 @@ class DriveWave(Drive):
         S += getsizeof(self.wave)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Drive
-        DriveWave_dict = super(DriveWave, self).as_dict()
+        DriveWave_dict = super(DriveWave, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.wave is None:
             DriveWave_dict["wave"] = None
         else:
-            DriveWave_dict["wave"] = self.wave.as_dict()
+            DriveWave_dict["wave"] = child_as_dict(
+                self.wave, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         DriveWave_dict["__class__"] = "DriveWave"
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .EEC import EEC
 
@@ -94,6 +94,7 @@ class EEC_PMSM(EEC):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -122,15 +123,15 @@ class EEC_PMSM(EEC):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "indmag" in list(init_dict.keys()):
+            if "indmag" in init_dict:
                 indmag = init_dict["indmag"]
-            if "fluxlink" in list(init_dict.keys()):
+            if "fluxlink" in init_dict:
                 fluxlink = init_dict["fluxlink"]
-            if "parameters" in list(init_dict.keys()):
+            if "parameters" in init_dict:
                 parameters = init_dict["parameters"]
-            if "freq0" in list(init_dict.keys()):
+            if "freq0" in init_dict:
                 freq0 = init_dict["freq0"]
-            if "drive" in list(init_dict.keys()):
+            if "drive" in init_dict:
                 drive = init_dict["drive"]
         # Set the properties (value check and convertion are done in setter)
         self.indmag = indmag
@@ -205,19 +206,30 @@ class EEC_PMSM(EEC):
         S += getsizeof(self.drive)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from EEC
-        EEC_PMSM_dict = super(EEC_PMSM, self).as_dict()
+        EEC_PMSM_dict = super(EEC_PMSM, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.indmag is None:
             EEC_PMSM_dict["indmag"] = None
         else:
-            EEC_PMSM_dict["indmag"] = self.indmag.as_dict()
+            EEC_PMSM_dict["indmag"] = child_as_dict(
+                self.indmag, type_handle_ndarray, **kwargs
+            )
         if self.fluxlink is None:
             EEC_PMSM_dict["fluxlink"] = None
         else:
-            EEC_PMSM_dict["fluxlink"] = self.fluxlink.as_dict()
+            EEC_PMSM_dict["fluxlink"] = child_as_dict(
+                self.fluxlink, type_handle_ndarray, **kwargs
+            )
         EEC_PMSM_dict["parameters"] = (
             self.parameters.copy() if self.parameters is not None else None
         )
@@ -225,7 +237,9 @@ class EEC_PMSM(EEC):
         if self.drive is None:
             EEC_PMSM_dict["drive"] = None
         else:
-            EEC_PMSM_dict["drive"] = self.drive.as_dict()
+            EEC_PMSM_dict["drive"] = child_as_dict(
+                self.drive, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         EEC_PMSM_dict["__class__"] = "EEC_PMSM"
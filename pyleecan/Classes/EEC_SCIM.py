@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .EEC import EEC
 
@@ -91,6 +91,7 @@ class EEC_SCIM(EEC):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -122,21 +123,21 @@ class EEC_SCIM(EEC):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "I" in list(init_dict.keys()):
+            if "I" in init_dict:
                 I = init_dict["I"]
-            if "parameters" in list(init_dict.keys()):
+            if "parameters" in init_dict:
                 parameters = init_dict["parameters"]
-            if "is_periodicity_a" in list(init_dict.keys()):
+            if "is_periodicity_a" in init_dict:
                 is_periodicity_a = init_dict["is_periodicity_a"]
-            if "nb_worker" in list(init_dict.keys()):
+            if "nb_worker" in init_dict:
                 nb_worker = init_dict["nb_worker"]
-            if "N0" in list(init_dict.keys()):
+            if "N0" in init_dict:
                 N0 = init_dict["N0"]
-            if "felec" in list(init_dict.keys()):
+            if "felec" in init_dict:
                 felec = init_dict["felec"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Nrev" in list(init_dict.keys()):
+            if "Nrev" in init_dict:
                 Nrev = init_dict["Nrev"]
         # Set the properties (value check and convertion are done in setter)
         self.I = I
@@ -214,11 +215,18 @@ class EEC_SCIM(EEC):
         S += getsizeof(self.Nrev)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from EEC
-        EEC_SCIM_dict = super(EEC_SCIM, self).as_dict()
+        EEC_SCIM_dict = super(EEC_SCIM, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         EEC_SCIM_dict["I"] = self.I
         EEC_SCIM_dict["parameters"] = (
             self.parameters.copy() if self.parameters is not None else None
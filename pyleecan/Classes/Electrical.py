@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -77,6 +77,7 @@ class Electrical(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -98,9 +99,9 @@ class Electrical(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "eec" in list(init_dict.keys()):
+            if "eec" in init_dict:
                 eec = init_dict["eec"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -145,14 +146,21 @@ class Electrical(FrozenClass):
         S += getsizeof(self.logger_name)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Electrical_dict = dict()
         if self.eec is None:
             Electrical_dict["eec"] = None
         else:
-            Electrical_dict["eec"] = self.eec.as_dict()
+            Electrical_dict["eec"] = child_as_dict(
+                self.eec, type_handle_ndarray, **kwargs
+            )
         Electrical_dict["logger_name"] = self.logger_name
         # The class name is added to the dict for deserialisation purpose
         Electrical_dict["__class__"] = "Electrical"
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Elmer import Elmer
 
@@ -76,6 +76,7 @@ class ElmerResults(Elmer):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -105,17 +106,17 @@ class ElmerResults(Elmer):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "data" in list(init_dict.keys()):
+            if "data" in init_dict:
                 data = init_dict["data"]
-            if "file" in list(init_dict.keys()):
+            if "file" in init_dict:
                 file = init_dict["file"]
-            if "usecols" in list(init_dict.keys()):
+            if "usecols" in init_dict:
                 usecols = init_dict["usecols"]
-            if "columns" in list(init_dict.keys()):
+            if "columns" in init_dict:
                 columns = init_dict["columns"]
-            if "is_scalars" in list(init_dict.keys()):
+            if "is_scalars" in init_dict:
                 is_scalars = init_dict["is_scalars"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.data = data
@@ -192,11 +193,18 @@ class ElmerResults(Elmer):
         S += getsizeof(self.is_scalars)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Elmer
-        ElmerResults_dict = super(ElmerResults, self).as_dict()
+        ElmerResults_dict = super(ElmerResults, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         ElmerResults_dict["data"] = self.data.copy() if self.data is not None else None
         ElmerResults_dict["file"] = self.file
         ElmerResults_dict["usecols"] = (
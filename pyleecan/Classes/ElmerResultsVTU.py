@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Elmer import Elmer
 
@@ -46,6 +46,7 @@ class ElmerResultsVTU(Elmer):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -73,13 +74,13 @@ class ElmerResultsVTU(Elmer):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
-            if "file_path" in list(init_dict.keys()):
+            if "file_path" in init_dict:
                 file_path = init_dict["file_path"]
-            if "store_dict" in list(init_dict.keys()):
+            if "store_dict" in init_dict:
                 store_dict = init_dict["store_dict"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.label = label
@@ -132,11 +133,18 @@ class ElmerResultsVTU(Elmer):
                 S += getsizeof(value) + getsizeof(key)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Elmer
-        ElmerResultsVTU_dict = super(ElmerResultsVTU, self).as_dict()
+        ElmerResultsVTU_dict = super(ElmerResultsVTU, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         ElmerResultsVTU_dict["label"] = self.label
         ElmerResultsVTU_dict["file_path"] = self.file_path
         ElmerResultsVTU_dict["store_dict"] = (
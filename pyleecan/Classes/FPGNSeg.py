@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .GaussPoint import GaussPoint
 
@@ -46,6 +46,7 @@ class FPGNSeg(GaussPoint):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -65,7 +66,7 @@ class FPGNSeg(GaussPoint):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "nb_gauss_point" in list(init_dict.keys()):
+            if "nb_gauss_point" in init_dict:
                 nb_gauss_point = init_dict["nb_gauss_point"]
         # Set the properties (value check and convertion are done in setter)
         self.nb_gauss_point = nb_gauss_point
@@ -106,11 +107,18 @@ class FPGNSeg(GaussPoint):
         S += getsizeof(self.nb_gauss_point)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from GaussPoint
-        FPGNSeg_dict = super(FPGNSeg, self).as_dict()
+        FPGNSeg_dict = super(FPGNSeg, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         FPGNSeg_dict["nb_gauss_point"] = self.nb_gauss_point
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Simulation/FluxMapDQ.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Simulation/FluxMapDQ
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import set_array, check_var, raise_
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict, from_dict_trusted
+from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
+from ._frozen import FrozenClass
+
+# Import all class method
+# Try/catch to remove unnecessary dependencies in unused method
+try:
+    from ..Methods.Simulation.FluxMapDQ.comp_flux_map import comp_flux_map
+except ImportError as error:
+    comp_flux_map = error
+
+try:
+    from ..Methods.Simulation.FluxMapDQ.interpolate import interpolate
+except ImportError as error:
+    interpolate = error
+
+
+from numpy import array, array_equal
+from ._check import InitUnKnowClassError
+
+
+class FluxMapDQ(FrozenClass):
+    """Flux linkage map of a synchronous machine as a function of the d-axis and q-axis currents (computed once on a grid, then interpolated)"""
+
+    VERSION = 1
+
+    # Check ImportError to remove unnecessary dependencies in unused method
+    # cf Methods.Simulation.FluxMapDQ.comp_flux_map
+    if isinstance(comp_flux_map, ImportError):
+        comp_flux_map = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use FluxMapDQ method comp_flux_map: " + str(comp_flux_map)
+                )
+            )
+        )
+    else:
+        comp_flux_map = comp_flux_map
+    # cf Methods.Simulation.FluxMapDQ.interpolate
+    if isinstance(interpolate, ImportError):
+        interpolate = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use FluxMapDQ method interpolate: " + str(interpolate)
+                )
+            )
+        )
+    else:
+        interpolate = interpolate
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        Id=None,
+        Iq=None,
+        Phid=None,
+        Phiq=None,
+        nb_proc=1,
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionnary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "Id" in init_dict:
+                Id = init_dict["Id"]
+            if "Iq" in init_dict:
+                Iq = init_dict["Iq"]
+            if "Phid" in init_dict:
+                Phid = init_dict["Phid"]
+            if "Phiq" in init_dict:
+                Phiq = init_dict["Phiq"]
+            if "nb_proc" in init_dict:
+                nb_proc = init_dict["nb_proc"]
+        # Set the properties (value check and convertion are done in setter)
+        self.parent = None
+        self.Id = Id
+        self.Iq = Iq
+        self.Phid = Phid
+        self.Phiq = Phiq
+        self.nb_proc = nb_proc
+
+        # The class is frozen, for now it's impossible to add new properties
+        self._freeze()
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        FluxMapDQ_str = ""
+        if self.parent is None:
+            FluxMapDQ_str += "parent = None " + linesep
+        else:
+            FluxMapDQ_str += "parent = " + str(type(self.parent)) + " object" + linesep
+        FluxMapDQ_str += (
+            "Id = "
+            + linesep
+            + str(self.Id).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        FluxMapDQ_str += (
+            "Iq = "
+            + linesep
+            + str(self.Iq).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        FluxMapDQ_str += (
+            "Phid = "
+            + linesep
+            + str(self.Phid).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        FluxMapDQ_str += (
+            "Phiq = "
+            + linesep
+            + str(self.Phiq).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        FluxMapDQ_str += "nb_proc = " + str(self.nb_proc) + linesep
+        return FluxMapDQ_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+        if not array_equal(other.Id, self.Id):
+            return False
+        if not array_equal(other.Iq, self.Iq):
+            return False
+        if not array_equal(other.Phid, self.Phid):
+            return False
+        if not array_equal(other.Phiq, self.Phiq):
+            return False
+        if other.nb_proc != self.nb_proc:
+            return False
+        return True
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+        S += getsizeof(self.Id)
+        S += getsizeof(self.Iq)
+        S += getsizeof(self.Phid)
+        S += getsizeof(self.Phiq)
+        S += getsizeof(self.nb_proc)
+        return S
+
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        FluxMapDQ_dict = dict()
+        if self.Id is None:
+            FluxMapDQ_dict["Id"] = None
+        else:
+            if type_handle_ndarray == 0:
+                FluxMapDQ_dict["Id"] = self.Id.tolist()
+            elif type_handle_ndarray == 1:
+                FluxMapDQ_dict["Id"] = self.Id.copy()
+            elif type_handle_ndarray == 2:
+                FluxMapDQ_dict["Id"] = self.Id
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.Iq is None:
+            FluxMapDQ_dict["Iq"] = None
+        else:
+            if type_handle_ndarray == 0:
+                FluxMapDQ_dict["Iq"] = self.Iq.tolist()
+            elif type_handle_ndarray == 1:
+                FluxMapDQ_dict["Iq"] = self.Iq.copy()
+            elif type_handle_ndarray == 2:
+                FluxMapDQ_dict["Iq"] = self.Iq
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.Phid is None:
+            FluxMapDQ_dict["Phid"] = None
+        else:
+            if type_handle_ndarray == 0:
+                FluxMapDQ_dict["Phid"] = self.Phid.tolist()
+            elif type_handle_ndarray == 1:
+                FluxMapDQ_dict["Phid"] = self.Phid.copy()
+            elif type_handle_ndarray == 2:
+                FluxMapDQ_dict["Phid"] = self.Phid
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        if self.Phiq is None:
+            FluxMapDQ_dict["Phiq"] = None
+        else:
+            if type_handle_ndarray == 0:
+                FluxMapDQ_dict["Phiq"] = self.Phiq.tolist()
+            elif type_handle_ndarray == 1:
+                FluxMapDQ_dict["Phiq"] = self.Phiq.copy()
+            elif type_handle_ndarray == 2:
+                FluxMapDQ_dict["Phiq"] = self.Phiq
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        FluxMapDQ_dict["nb_proc"] = self.nb_proc
+        # The class name is added to the dict for deserialisation purpose
+        FluxMapDQ_dict["__class__"] = "FluxMapDQ"
+        return FluxMapDQ_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.Id = None
+        self.Iq = None
+        self.Phid = None
+        self.Phiq = None
+        self.nb_proc = None
+
+    def _get_Id(self):
+        """getter of Id"""
+        if isinstance(self._Id, LazyArray):
+            self._set_Id(self._Id.load())
+        return self._Id
+
+    def _set_Id(self, value):
+        """setter of Id"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Id", value, "ndarray")
+        self._Id = value
+
+    Id = property(
+        fget=_get_Id,
+        fset=_set_Id,
+        doc=u"""d-axis currents of the map grid (increasing values)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_Iq(self):
+        """getter of Iq"""
+        if isinstance(self._Iq, LazyArray):
+            self._set_Iq(self._Iq.load())
+        return self._Iq
+
+    def _set_Iq(self, value):
+        """setter of Iq"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Iq", value, "ndarray")
+        self._Iq = value
+
+    Iq = property(
+        fget=_get_Iq,
+        fset=_set_Iq,
+        doc=u"""q-axis currents of the map grid (increasing values)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_Phid(self):
+        """getter of Phid"""
+        if isinstance(self._Phid, LazyArray):
+            self._set_Phid(self._Phid.load())
+        return self._Phid
+
+    def _set_Phid(self, value):
+        """setter of Phid"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Phid", value, "ndarray")
+        self._Phid = value
+
+    Phid = property(
+        fget=_get_Phid,
+        fset=_set_Phid,
+        doc=u"""d-axis flux linkage on the grid (None if not computed)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_Phiq(self):
+        """getter of Phiq"""
+        if isinstance(self._Phiq, LazyArray):
+            self._set_Phiq(self._Phiq.load())
+        return self._Phiq
+
+    def _set_Phiq(self, value):
+        """setter of Phiq"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Phiq", value, "ndarray")
+        self._Phiq = value
+
+    Phiq = property(
+        fget=_get_Phiq,
+        fset=_set_Phiq,
+        doc=u"""q-axis flux linkage on the grid (None if not computed)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_nb_proc(self):
+        """getter of nb_proc"""
+        return self._nb_proc
+
+    def _set_nb_proc(self, value):
+        """setter of nb_proc"""
+        check_var("nb_proc", value, "int", Vmin=0)
+        self._nb_proc = value
+
+    nb_proc = property(
+        fget=_get_nb_proc,
+        fset=_set_nb_proc,
+        doc=u"""Number of processes to compute the map (0 to use all the cpu)
+
+        :Type: int
+        :min: 0
+        """,
+    )
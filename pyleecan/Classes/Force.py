@@ -7,12 +7,13 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from ._frozen import FrozenClass
 
 # Import all class method
@@ -32,7 +33,15 @@ try:
 except ImportError as error:
     comp_AGSF_transfer = error
 
+try:
+    from ..Methods.Simulation.Force.comp_AGSF_transfer_batch import (
+        comp_AGSF_transfer_batch,
+    )
+except ImportError as error:
+    comp_AGSF_transfer_batch = error
+
 
+from numpy import array, array_equal
 from ._check import InitUnKnowClassError
 
 
@@ -72,9 +81,22 @@ class Force(FrozenClass):
         )
     else:
         comp_AGSF_transfer = comp_AGSF_transfer
+    # cf Methods.Simulation.Force.comp_AGSF_transfer_batch
+    if isinstance(comp_AGSF_transfer_batch, ImportError):
+        comp_AGSF_transfer_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use Force method comp_AGSF_transfer_batch: "
+                    + str(comp_AGSF_transfer_batch)
+                )
+            )
+        )
+    else:
+        comp_AGSF_transfer_batch = comp_AGSF_transfer_batch
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -86,6 +108,8 @@ class Force(FrozenClass):
         max_wavenumber_transfer=None,
         Rsbo_enforced_transfer=None,
         logger_name="Pyleecan.Force",
+        Rsbo_transfer=None,
+        is_transfer_factorized=False,
         init_dict=None,
         init_str=None,
     ):
@@ -104,18 +128,22 @@ class Force(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "is_periodicity_t" in list(init_dict.keys()):
+            if "is_periodicity_t" in init_dict:
                 is_periodicity_t = init_dict["is_periodicity_t"]
-            if "is_periodicity_a" in list(init_dict.keys()):
+            if "is_periodicity_a" in init_dict:
                 is_periodicity_a = init_dict["is_periodicity_a"]
-            if "is_agsf_transfer" in list(init_dict.keys()):
+            if "is_agsf_transfer" in init_dict:
                 is_agsf_transfer = init_dict["is_agsf_transfer"]
-            if "max_wavenumber_transfer" in list(init_dict.keys()):
+            if "max_wavenumber_transfer" in init_dict:
                 max_wavenumber_transfer = init_dict["max_wavenumber_transfer"]
-            if "Rsbo_enforced_transfer" in list(init_dict.keys()):
+            if "Rsbo_enforced_transfer" in init_dict:
                 Rsbo_enforced_transfer = init_dict["Rsbo_enforced_transfer"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
+            if "Rsbo_transfer" in init_dict:
+                Rsbo_transfer = init_dict["Rsbo_transfer"]
+            if "is_transfer_factorized" in init_dict:
+                is_transfer_factorized = init_dict["is_transfer_factorized"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.is_periodicity_t = is_periodicity_t
@@ -124,6 +152,8 @@ class Force(FrozenClass):
         self.max_wavenumber_transfer = max_wavenumber_transfer
         self.Rsbo_enforced_transfer = Rsbo_enforced_transfer
         self.logger_name = logger_name
+        self.Rsbo_transfer = Rsbo_transfer
+        self.is_transfer_factorized = is_transfer_factorized
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -146,6 +176,16 @@ class Force(FrozenClass):
             "Rsbo_enforced_transfer = " + str(self.Rsbo_enforced_transfer) + linesep
         )
         Force_str += 'logger_name = "' + str(self.logger_name) + '"' + linesep
+        Force_str += (
+            "Rsbo_transfer = "
+            + linesep
+            + str(self.Rsbo_transfer).replace(linesep, linesep + "\t")
+            + linesep
+            + linesep
+        )
+        Force_str += (
+            "is_transfer_factorized = " + str(self.is_transfer_factorized) + linesep
+        )
         return Force_str
 
     def __eq__(self, other):
@@ -165,6 +205,10 @@ class Force(FrozenClass):
             return False
         if other.logger_name != self.logger_name:
             return False
+        if not array_equal(other.Rsbo_transfer, self.Rsbo_transfer):
+            return False
+        if other.is_transfer_factorized != self.is_transfer_factorized:
+            return False
         return True
 
     def __sizeof__(self):
@@ -177,10 +221,17 @@ class Force(FrozenClass):
         S += getsizeof(self.max_wavenumber_transfer)
         S += getsizeof(self.Rsbo_enforced_transfer)
         S += getsizeof(self.logger_name)
+        S += getsizeof(self.Rsbo_transfer)
+        S += getsizeof(self.is_transfer_factorized)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Force_dict = dict()
         Force_dict["is_periodicity_t"] = self.is_periodicity_t
@@ -189,6 +240,20 @@ class Force(FrozenClass):
         Force_dict["max_wavenumber_transfer"] = self.max_wavenumber_transfer
         Force_dict["Rsbo_enforced_transfer"] = self.Rsbo_enforced_transfer
         Force_dict["logger_name"] = self.logger_name
+        if self.Rsbo_transfer is None:
+            Force_dict["Rsbo_transfer"] = None
+        else:
+            if type_handle_ndarray == 0:
+                Force_dict["Rsbo_transfer"] = self.Rsbo_transfer.tolist()
+            elif type_handle_ndarray == 1:
+                Force_dict["Rsbo_transfer"] = self.Rsbo_transfer.copy()
+            elif type_handle_ndarray == 2:
+                Force_dict["Rsbo_transfer"] = self.Rsbo_transfer
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
+        Force_dict["is_transfer_factorized"] = self.is_transfer_factorized
         # The class name is added to the dict for deserialisation purpose
         Force_dict["__class__"] = "Force"
         return Force_dict
@@ -202,6 +267,8 @@ class Force(FrozenClass):
         self.max_wavenumber_transfer = None
         self.Rsbo_enforced_transfer = None
         self.logger_name = None
+        self.Rsbo_transfer = None
+        self.is_transfer_factorized = None
 
     def _get_is_periodicity_t(self):
         """getter of is_periodicity_t"""
@@ -310,3 +377,49 @@ class Force(FrozenClass):
         :Type: str
         """,
     )
+
+    def _get_Rsbo_transfer(self):
+        """getter of Rsbo_transfer"""
+        if isinstance(self._Rsbo_transfer, LazyArray):
+            self._set_Rsbo_transfer(self._Rsbo_transfer.load())
+        return self._Rsbo_transfer
+
+    def _set_Rsbo_transfer(self, value):
+        """setter of Rsbo_transfer"""
+        if type(value) is int and value == -1:
+            value = array([])
+        elif type(value) is list:
+            try:
+                value = array(value)
+            except:
+                pass
+        if not isinstance(value, LazyArray):
+            check_var("Rsbo_transfer", value, "ndarray")
+        self._Rsbo_transfer = value
+
+    Rsbo_transfer = property(
+        fget=_get_Rsbo_transfer,
+        fset=_set_Rsbo_transfer,
+        doc=u"""Radii to transfer the AGSF to (stored in output.force.AGSF_transfer)
+
+        :Type: ndarray
+        """,
+    )
+
+    def _get_is_transfer_factorized(self):
+        """getter of is_transfer_factorized"""
+        return self._is_transfer_factorized
+
+    def _set_is_transfer_factorized(self, value):
+        """setter of is_transfer_factorized"""
+        check_var("is_transfer_factorized", value, "bool")
+        self._is_transfer_factorized = value
+
+    is_transfer_factorized = property(
+        fget=_get_is_transfer_factorized,
+        fset=_set_is_transfer_factorized,
+        doc=u"""True to store the AGSF transferred to Rsbo_transfer as transfer coefficients and base spectrum
+
+        :Type: bool
+        """,
+    )
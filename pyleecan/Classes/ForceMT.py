@@ -7,11 +7,11 @@
 from os import linesep
 from sys import getsizeof
 from logging import getLogger
-from ._check import check_var, raise_
+from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Force import Force
 
@@ -28,6 +28,7 @@ except ImportError as error:
     comp_force_nodal = error
 
 
+from numpy import array, array_equal
 from ._check import InitUnKnowClassError
 
 
@@ -61,6 +62,7 @@ class ForceMT(Force):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -72,6 +74,8 @@ class ForceMT(Force):
         max_wavenumber_transfer=None,
         Rsbo_enforced_transfer=None,
         logger_name="Pyleecan.Force",
+        Rsbo_transfer=None,
+        is_transfer_factorized=False,
         init_dict=None,
         init_str=None,
     ):
@@ -90,18 +94,22 @@ class ForceMT(Force):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "is_periodicity_t" in list(init_dict.keys()):
+            if "is_periodicity_t" in init_dict:
                 is_periodicity_t = init_dict["is_periodicity_t"]
-            if "is_periodicity_a" in list(init_dict.keys()):
+            if "is_periodicity_a" in init_dict:
                 is_periodicity_a = init_dict["is_periodicity_a"]
-            if "is_agsf_transfer" in list(init_dict.keys()):
+            if "is_agsf_transfer" in init_dict:
                 is_agsf_transfer = init_dict["is_agsf_transfer"]
-            if "max_wavenumber_transfer" in list(init_dict.keys()):
+            if "max_wavenumber_transfer" in init_dict:
                 max_wavenumber_transfer = init_dict["max_wavenumber_transfer"]
-            if "Rsbo_enforced_transfer" in list(init_dict.keys()):
+            if "Rsbo_enforced_transfer" in init_dict:
                 Rsbo_enforced_transfer = init_dict["Rsbo_enforced_transfer"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
+            if "Rsbo_transfer" in init_dict:
+                Rsbo_transfer = init_dict["Rsbo_transfer"]
+            if "is_transfer_factorized" in init_dict:
+                is_transfer_factorized = init_dict["is_transfer_factorized"]
         # Set the properties (value check and convertion are done in setter)
         # Call Force init
         super(ForceMT, self).__init__(
@@ -111,6 +119,8 @@ class ForceMT(Force):
             max_wavenumber_transfer=max_wavenumber_transfer,
             Rsbo_enforced_transfer=Rsbo_enforced_transfer,
             logger_name=logger_name,
+            Rsbo_transfer=Rsbo_transfer,
+            is_transfer_factorized=is_transfer_factorized,
         )
         # The class is frozen (in Force init), for now it's impossible to
         # add new properties
@@ -143,11 +153,18 @@ class ForceMT(Force):
         S += super(ForceMT, self).__sizeof__()
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Force
-        ForceMT_dict = super(ForceMT, self).as_dict()
+        ForceMT_dict = super(ForceMT, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         ForceMT_dict["__class__"] = "ForceMT"
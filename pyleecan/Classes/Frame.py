@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -133,6 +133,7 @@ class Frame(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -154,13 +155,13 @@ class Frame(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Lfra" in list(init_dict.keys()):
+            if "Lfra" in init_dict:
                 Lfra = init_dict["Lfra"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -215,8 +216,13 @@ class Frame(FrozenClass):
         S += getsizeof(self.mat_type)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Frame_dict = dict()
         Frame_dict["Lfra"] = self.Lfra
@@ -225,7 +231,9 @@ class Frame(FrozenClass):
         if self.mat_type is None:
             Frame_dict["mat_type"] = None
         else:
-            Frame_dict["mat_type"] = self.mat_type.as_dict()
+            Frame_dict["mat_type"] = child_as_dict(
+                self.mat_type, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         Frame_dict["__class__"] = "Frame"
         return Frame_dict
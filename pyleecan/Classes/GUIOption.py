@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -26,6 +26,7 @@ class GUIOption(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -45,7 +46,7 @@ class GUIOption(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "unit" in list(init_dict.keys()):
+            if "unit" in init_dict:
                 unit = init_dict["unit"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -85,14 +86,21 @@ class GUIOption(FrozenClass):
         S += getsizeof(self.unit)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         GUIOption_dict = dict()
         if self.unit is None:
             GUIOption_dict["unit"] = None
         else:
-            GUIOption_dict["unit"] = self.unit.as_dict()
+            GUIOption_dict["unit"] = child_as_dict(
+                self.unit, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         GUIOption_dict["__class__"] = "GUIOption"
         return GUIOption_dict
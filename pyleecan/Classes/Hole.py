@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -209,6 +209,7 @@ class Hole(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -228,9 +229,9 @@ class Hole(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -275,15 +276,22 @@ class Hole(FrozenClass):
         S += getsizeof(self.mat_void)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Hole_dict = dict()
         Hole_dict["Zh"] = self.Zh
         if self.mat_void is None:
             Hole_dict["mat_void"] = None
         else:
-            Hole_dict["mat_void"] = self.mat_void.as_dict()
+            Hole_dict["mat_void"] = child_as_dict(
+                self.mat_void, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         Hole_dict["__class__"] = "Hole"
         return Hole_dict
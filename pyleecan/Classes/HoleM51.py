@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .HoleMag import HoleMag
 
@@ -185,6 +185,7 @@ class HoleM51(HoleMag):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -224,37 +225,37 @@ class HoleM51(HoleMag):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "H2" in list(init_dict.keys()):
+            if "H2" in init_dict:
                 H2 = init_dict["H2"]
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "W2" in list(init_dict.keys()):
+            if "W2" in init_dict:
                 W2 = init_dict["W2"]
-            if "W3" in list(init_dict.keys()):
+            if "W3" in init_dict:
                 W3 = init_dict["W3"]
-            if "W4" in list(init_dict.keys()):
+            if "W4" in init_dict:
                 W4 = init_dict["W4"]
-            if "W5" in list(init_dict.keys()):
+            if "W5" in init_dict:
                 W5 = init_dict["W5"]
-            if "W6" in list(init_dict.keys()):
+            if "W6" in init_dict:
                 W6 = init_dict["W6"]
-            if "W7" in list(init_dict.keys()):
+            if "W7" in init_dict:
                 W7 = init_dict["W7"]
-            if "magnet_0" in list(init_dict.keys()):
+            if "magnet_0" in init_dict:
                 magnet_0 = init_dict["magnet_0"]
-            if "magnet_1" in list(init_dict.keys()):
+            if "magnet_1" in init_dict:
                 magnet_1 = init_dict["magnet_1"]
-            if "magnet_2" in list(init_dict.keys()):
+            if "magnet_2" in init_dict:
                 magnet_2 = init_dict["magnet_2"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Set the properties (value check and convertion are done in setter)
         self.H0 = H0
@@ -372,11 +373,18 @@ class HoleM51(HoleMag):
         S += getsizeof(self.magnet_2)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from HoleMag
-        HoleM51_dict = super(HoleM51, self).as_dict()
+        HoleM51_dict = super(HoleM51, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         HoleM51_dict["H0"] = self.H0
         HoleM51_dict["H1"] = self.H1
         HoleM51_dict["H2"] = self.H2
@@ -391,15 +399,21 @@ class HoleM51(HoleMag):
         if self.magnet_0 is None:
             HoleM51_dict["magnet_0"] = None
         else:
-            HoleM51_dict["magnet_0"] = self.magnet_0.as_dict()
+            HoleM51_dict["magnet_0"] = child_as_dict(
+                self.magnet_0, type_handle_ndarray, **kwargs
+            )
         if self.magnet_1 is None:
             HoleM51_dict["magnet_1"] = None
         else:
-            HoleM51_dict["magnet_1"] = self.magnet_1.as_dict()
+            HoleM51_dict["magnet_1"] = child_as_dict(
+                self.magnet_1, type_handle_ndarray, **kwargs
+            )
         if self.magnet_2 is None:
             HoleM51_dict["magnet_2"] = None
         else:
-            HoleM51_dict["magnet_2"] = self.magnet_2.as_dict()
+            HoleM51_dict["magnet_2"] = child_as_dict(
+                self.magnet_2, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         HoleM51_dict["__class__"] = "HoleM51"
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Hole import Hole
 
@@ -125,6 +125,7 @@ class HoleM54(Hole):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -154,17 +155,17 @@ class HoleM54(Hole):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "R1" in list(init_dict.keys()):
+            if "R1" in init_dict:
                 R1 = init_dict["R1"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Set the properties (value check and convertion are done in setter)
         self.H0 = H0
@@ -220,11 +221,18 @@ class HoleM54(Hole):
         S += getsizeof(self.R1)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Hole
-        HoleM54_dict = super(HoleM54, self).as_dict()
+        HoleM54_dict = super(HoleM54, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         HoleM54_dict["H0"] = self.H0
         HoleM54_dict["H1"] = self.H1
         HoleM54_dict["W0"] = self.W0
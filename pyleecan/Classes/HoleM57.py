@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .HoleMag import HoleMag
 
@@ -157,6 +157,7 @@ class HoleM57(HoleMag):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -191,27 +192,27 @@ class HoleM57(HoleMag):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "H2" in list(init_dict.keys()):
+            if "H2" in init_dict:
                 H2 = init_dict["H2"]
-            if "W2" in list(init_dict.keys()):
+            if "W2" in init_dict:
                 W2 = init_dict["W2"]
-            if "W3" in list(init_dict.keys()):
+            if "W3" in init_dict:
                 W3 = init_dict["W3"]
-            if "W4" in list(init_dict.keys()):
+            if "W4" in init_dict:
                 W4 = init_dict["W4"]
-            if "magnet_0" in list(init_dict.keys()):
+            if "magnet_0" in init_dict:
                 magnet_0 = init_dict["magnet_0"]
-            if "magnet_1" in list(init_dict.keys()):
+            if "magnet_1" in init_dict:
                 magnet_1 = init_dict["magnet_1"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Set the properties (value check and convertion are done in setter)
         self.W0 = W0
@@ -300,11 +301,18 @@ class HoleM57(HoleMag):
         S += getsizeof(self.magnet_1)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from HoleMag
-        HoleM57_dict = super(HoleM57, self).as_dict()
+        HoleM57_dict = super(HoleM57, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         HoleM57_dict["W0"] = self.W0
         HoleM57_dict["H1"] = self.H1
         HoleM57_dict["W1"] = self.W1
@@ -315,11 +323,15 @@ class HoleM57(HoleMag):
         if self.magnet_0 is None:
             HoleM57_dict["magnet_0"] = None
         else:
-            HoleM57_dict["magnet_0"] = self.magnet_0.as_dict()
+            HoleM57_dict["magnet_0"] = child_as_dict(
+                self.magnet_0, type_handle_ndarray, **kwargs
+            )
         if self.magnet_1 is None:
             HoleM57_dict["magnet_1"] = None
         else:
-            HoleM57_dict["magnet_1"] = self.magnet_1.as_dict()
+            HoleM57_dict["magnet_1"] = child_as_dict(
+                self.magnet_1, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         HoleM57_dict["__class__"] = "HoleM57"
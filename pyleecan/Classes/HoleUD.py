@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .HoleMag import HoleMag
 
@@ -111,6 +111,7 @@ class HoleUD(HoleMag):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -138,13 +139,13 @@ class HoleUD(HoleMag):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "surf_list" in list(init_dict.keys()):
+            if "surf_list" in init_dict:
                 surf_list = init_dict["surf_list"]
-            if "magnet_dict" in list(init_dict.keys()):
+            if "magnet_dict" in init_dict:
                 magnet_dict = init_dict["magnet_dict"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Set the properties (value check and convertion are done in setter)
         self.surf_list = surf_list
@@ -207,18 +208,27 @@ class HoleUD(HoleMag):
                 S += getsizeof(value) + getsizeof(key)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from HoleMag
-        HoleUD_dict = super(HoleUD, self).as_dict()
+        HoleUD_dict = super(HoleUD, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.surf_list is None:
             HoleUD_dict["surf_list"] = None
         else:
             HoleUD_dict["surf_list"] = list()
             for obj in self.surf_list:
                 if obj is not None:
-                    HoleUD_dict["surf_list"].append(obj.as_dict())
+                    HoleUD_dict["surf_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     HoleUD_dict["surf_list"].append(None)
         if self.magnet_dict is None:
@@ -227,7 +237,9 @@ class HoleUD(HoleMag):
             HoleUD_dict["magnet_dict"] = dict()
             for key, obj in self.magnet_dict.items():
                 if obj is not None:
-                    HoleUD_dict["magnet_dict"][key] = obj.as_dict()
+                    HoleUD_dict["magnet_dict"][key] = child_as_dict(
+                        obj, type_handle_ndarray, **kwargs
+                    )
                 else:
                     HoleUD_dict["magnet_dict"][key] = None
         # The class name is added to the dict for deserialisation purpose
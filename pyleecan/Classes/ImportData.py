@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -44,6 +44,7 @@ class ImportData(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -74,19 +75,19 @@ class ImportData(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "axes" in list(init_dict.keys()):
+            if "axes" in init_dict:
                 axes = init_dict["axes"]
-            if "field" in list(init_dict.keys()):
+            if "field" in init_dict:
                 field = init_dict["field"]
-            if "unit" in list(init_dict.keys()):
+            if "unit" in init_dict:
                 unit = init_dict["unit"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "symbol" in list(init_dict.keys()):
+            if "symbol" in init_dict:
                 symbol = init_dict["symbol"]
-            if "normalizations" in list(init_dict.keys()):
+            if "normalizations" in init_dict:
                 normalizations = init_dict["normalizations"]
-            if "symmetries" in list(init_dict.keys()):
+            if "symmetries" in init_dict:
                 symmetries = init_dict["symmetries"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -166,8 +167,13 @@ class ImportData(FrozenClass):
                 S += getsizeof(value) + getsizeof(key)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         ImportData_dict = dict()
         if self.axes is None:
@@ -176,13 +182,17 @@ class ImportData(FrozenClass):
             ImportData_dict["axes"] = list()
             for obj in self.axes:
                 if obj is not None:
-                    ImportData_dict["axes"].append(obj.as_dict())
+                    ImportData_dict["axes"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     ImportData_dict["axes"].append(None)
         if self.field is None:
             ImportData_dict["field"] = None
         else:
-            ImportData_dict["field"] = self.field.as_dict()
+            ImportData_dict["field"] = child_as_dict(
+                self.field, type_handle_ndarray, **kwargs
+            )
         ImportData_dict["unit"] = self.unit
         ImportData_dict["name"] = self.name
         ImportData_dict["symbol"] = self.symbol
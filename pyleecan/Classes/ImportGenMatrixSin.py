@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .ImportMatrix import ImportMatrix
 
@@ -64,6 +64,7 @@ class ImportGenMatrixSin(ImportMatrix):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -83,9 +84,9 @@ class ImportGenMatrixSin(ImportMatrix):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "sin_list" in list(init_dict.keys()):
+            if "sin_list" in init_dict:
                 sin_list = init_dict["sin_list"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Set the properties (value check and convertion are done in setter)
         self.sin_list = sin_list
@@ -134,18 +135,27 @@ class ImportGenMatrixSin(ImportMatrix):
                 S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from ImportMatrix
-        ImportGenMatrixSin_dict = super(ImportGenMatrixSin, self).as_dict()
+        ImportGenMatrixSin_dict = super(ImportGenMatrixSin, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.sin_list is None:
             ImportGenMatrixSin_dict["sin_list"] = None
         else:
             ImportGenMatrixSin_dict["sin_list"] = list()
             for obj in self.sin_list:
                 if obj is not None:
-                    ImportGenMatrixSin_dict["sin_list"].append(obj.as_dict())
+                    ImportGenMatrixSin_dict["sin_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     ImportGenMatrixSin_dict["sin_list"].append(None)
         # The class name is added to the dict for deserialisation purpose
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .ImportMatrix import ImportMatrix
 
@@ -76,6 +76,7 @@ class ImportGenVectLin(ImportMatrix):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -104,15 +105,15 @@ class ImportGenVectLin(ImportMatrix):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "start" in list(init_dict.keys()):
+            if "start" in init_dict:
                 start = init_dict["start"]
-            if "stop" in list(init_dict.keys()):
+            if "stop" in init_dict:
                 stop = init_dict["stop"]
-            if "num" in list(init_dict.keys()):
+            if "num" in init_dict:
                 num = init_dict["num"]
-            if "endpoint" in list(init_dict.keys()):
+            if "endpoint" in init_dict:
                 endpoint = init_dict["endpoint"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Set the properties (value check and convertion are done in setter)
         self.start = start
@@ -168,11 +169,18 @@ class ImportGenVectLin(ImportMatrix):
         S += getsizeof(self.endpoint)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from ImportMatrix
-        ImportGenVectLin_dict = super(ImportGenVectLin, self).as_dict()
+        ImportGenVectLin_dict = super(ImportGenVectLin, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         ImportGenVectLin_dict["start"] = self.start
         ImportGenVectLin_dict["stop"] = self.stop
         ImportGenVectLin_dict["num"] = self.num
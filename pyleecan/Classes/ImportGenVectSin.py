@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .ImportMatrix import ImportMatrix
 
@@ -45,6 +45,7 @@ class ImportGenVectSin(ImportMatrix):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -74,17 +75,17 @@ class ImportGenVectSin(ImportMatrix):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "f" in list(init_dict.keys()):
+            if "f" in init_dict:
                 f = init_dict["f"]
-            if "A" in list(init_dict.keys()):
+            if "A" in init_dict:
                 A = init_dict["A"]
-            if "Phi" in list(init_dict.keys()):
+            if "Phi" in init_dict:
                 Phi = init_dict["Phi"]
-            if "N" in list(init_dict.keys()):
+            if "N" in init_dict:
                 N = init_dict["N"]
-            if "Tf" in list(init_dict.keys()):
+            if "Tf" in init_dict:
                 Tf = init_dict["Tf"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Set the properties (value check and convertion are done in setter)
         self.f = f
@@ -145,11 +146,18 @@ class ImportGenVectSin(ImportMatrix):
         S += getsizeof(self.Tf)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from ImportMatrix
-        ImportGenVectSin_dict = super(ImportGenVectSin, self).as_dict()
+        ImportGenVectSin_dict = super(ImportGenVectSin, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         ImportGenVectSin_dict["f"] = self.f
         ImportGenVectSin_dict["A"] = self.A
         ImportGenVectSin_dict["Phi"] = self.Phi
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .ImportMatrix import ImportMatrix
 
@@ -43,6 +43,7 @@ class ImportMatlab(ImportMatrix):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -69,11 +70,11 @@ class ImportMatlab(ImportMatrix):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "file_path" in list(init_dict.keys()):
+            if "file_path" in init_dict:
                 file_path = init_dict["file_path"]
-            if "var_name" in list(init_dict.keys()):
+            if "var_name" in init_dict:
                 var_name = init_dict["var_name"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Set the properties (value check and convertion are done in setter)
         self.file_path = file_path
@@ -119,11 +120,18 @@ class ImportMatlab(ImportMatrix):
         S += getsizeof(self.var_name)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from ImportMatrix
-        ImportMatlab_dict = super(ImportMatlab, self).as_dict()
+        ImportMatlab_dict = super(ImportMatlab, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         ImportMatlab_dict["file_path"] = self.file_path
         ImportMatlab_dict["var_name"] = self.var_name
         # The class name is added to the dict for deserialisation purpose
@@ -11,8 +11,9 @@ from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from .ImportMatrix import ImportMatrix
 
 # Import all class method
@@ -46,6 +47,7 @@ class ImportMatrixVal(ImportMatrix):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -65,9 +67,9 @@ class ImportMatrixVal(ImportMatrix):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "value" in list(init_dict.keys()):
+            if "value" in init_dict:
                 value = init_dict["value"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Set the properties (value check and convertion are done in setter)
         self.value = value
@@ -114,15 +116,31 @@ class ImportMatrixVal(ImportMatrix):
         S += getsizeof(self.value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from ImportMatrix
-        ImportMatrixVal_dict = super(ImportMatrixVal, self).as_dict()
+        ImportMatrixVal_dict = super(ImportMatrixVal, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.value is None:
             ImportMatrixVal_dict["value"] = None
         else:
-            ImportMatrixVal_dict["value"] = self.value.tolist()
+            if type_handle_ndarray == 0:
+                ImportMatrixVal_dict["value"] = self.value.tolist()
+            elif type_handle_ndarray == 1:
+                ImportMatrixVal_dict["value"] = self.value.copy()
+            elif type_handle_ndarray == 2:
+                ImportMatrixVal_dict["value"] = self.value
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         ImportMatrixVal_dict["__class__"] = "ImportMatrixVal"
@@ -137,6 +155,8 @@ class ImportMatrixVal(ImportMatrix):
 
     def _get_value(self):
         """getter of value"""
+        if isinstance(self._value, LazyArray):
+            self._set_value(self._value.load())
         return self._value
 
     def _set_value(self, value):
@@ -148,7 +168,8 @@ class ImportMatrixVal(ImportMatrix):
                 value = array(value)
             except:
                 pass
-        check_var("value", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("value", value, "ndarray")
         self._value = value
 
     value = property(
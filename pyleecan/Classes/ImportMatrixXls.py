@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .ImportMatrix import ImportMatrix
 
@@ -45,6 +45,7 @@ class ImportMatrixXls(ImportMatrix):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -75,19 +76,19 @@ class ImportMatrixXls(ImportMatrix):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "file_path" in list(init_dict.keys()):
+            if "file_path" in init_dict:
                 file_path = init_dict["file_path"]
-            if "sheet" in list(init_dict.keys()):
+            if "sheet" in init_dict:
                 sheet = init_dict["sheet"]
-            if "skiprows" in list(init_dict.keys()):
+            if "skiprows" in init_dict:
                 skiprows = init_dict["skiprows"]
-            if "usecols" in list(init_dict.keys()):
+            if "usecols" in init_dict:
                 usecols = init_dict["usecols"]
-            if "axes_colrows" in list(init_dict.keys()):
+            if "axes_colrows" in init_dict:
                 axes_colrows = init_dict["axes_colrows"]
-            if "is_allsheets" in list(init_dict.keys()):
+            if "is_allsheets" in init_dict:
                 is_allsheets = init_dict["is_allsheets"]
-            if "is_transpose" in list(init_dict.keys()):
+            if "is_transpose" in init_dict:
                 is_transpose = init_dict["is_transpose"]
         # Set the properties (value check and convertion are done in setter)
         self.file_path = file_path
@@ -155,11 +156,18 @@ class ImportMatrixXls(ImportMatrix):
         S += getsizeof(self.is_allsheets)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from ImportMatrix
-        ImportMatrixXls_dict = super(ImportMatrixXls, self).as_dict()
+        ImportMatrixXls_dict = super(ImportMatrixXls, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         ImportMatrixXls_dict["file_path"] = self.file_path
         ImportMatrixXls_dict["sheet"] = self.sheet
         ImportMatrixXls_dict["skiprows"] = self.skiprows
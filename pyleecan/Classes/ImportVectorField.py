@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -46,6 +46,7 @@ class ImportVectorField(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -67,11 +68,11 @@ class ImportVectorField(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "components" in list(init_dict.keys()):
+            if "components" in init_dict:
                 components = init_dict["components"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "symbol" in list(init_dict.keys()):
+            if "symbol" in init_dict:
                 symbol = init_dict["symbol"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -130,8 +131,13 @@ class ImportVectorField(FrozenClass):
         S += getsizeof(self.symbol)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         ImportVectorField_dict = dict()
         if self.components is None:
@@ -140,7 +146,9 @@ class ImportVectorField(FrozenClass):
             ImportVectorField_dict["components"] = dict()
             for key, obj in self.components.items():
                 if obj is not None:
-                    ImportVectorField_dict["components"][key] = obj.as_dict()
+                    ImportVectorField_dict["components"][key] = child_as_dict(
+                        obj, type_handle_ndarray, **kwargs
+                    )
                 else:
                     ImportVectorField_dict["components"][key] = None
         ImportVectorField_dict["name"] = self.name
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .IndMag import IndMag
 
@@ -63,6 +63,7 @@ class IndMagFEMM(IndMag):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -92,17 +93,17 @@ class IndMagFEMM(IndMag):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "FEMM_dict" in list(init_dict.keys()):
+            if "FEMM_dict" in init_dict:
                 FEMM_dict = init_dict["FEMM_dict"]
-            if "type_calc_leakage" in list(init_dict.keys()):
+            if "type_calc_leakage" in init_dict:
                 type_calc_leakage = init_dict["type_calc_leakage"]
-            if "is_sliding_band" in list(init_dict.keys()):
+            if "is_sliding_band" in init_dict:
                 is_sliding_band = init_dict["is_sliding_band"]
-            if "is_periodicity_a" in list(init_dict.keys()):
+            if "is_periodicity_a" in init_dict:
                 is_periodicity_a = init_dict["is_periodicity_a"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Kgeo_fineness" in list(init_dict.keys()):
+            if "Kgeo_fineness" in init_dict:
                 Kgeo_fineness = init_dict["Kgeo_fineness"]
         # Set the properties (value check and convertion are done in setter)
         self.FEMM_dict = FEMM_dict
@@ -170,11 +171,18 @@ class IndMagFEMM(IndMag):
         S += getsizeof(self.Kgeo_fineness)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from IndMag
-        IndMagFEMM_dict = super(IndMagFEMM, self).as_dict()
+        IndMagFEMM_dict = super(IndMagFEMM, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         IndMagFEMM_dict["FEMM_dict"] = (
             self.FEMM_dict.copy() if self.FEMM_dict is not None else None
         )
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -76,6 +76,7 @@ class Input(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -105,17 +106,17 @@ class Input(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Nrev" in list(init_dict.keys()):
+            if "Nrev" in init_dict:
                 Nrev = init_dict["Nrev"]
-            if "Na_tot" in list(init_dict.keys()):
+            if "Na_tot" in init_dict:
                 Na_tot = init_dict["Na_tot"]
-            if "N0" in list(init_dict.keys()):
+            if "N0" in init_dict:
                 N0 = init_dict["N0"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -184,18 +185,25 @@ class Input(FrozenClass):
         S += getsizeof(self.N0)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Input_dict = dict()
         if self.time is None:
             Input_dict["time"] = None
         else:
-            Input_dict["time"] = self.time.as_dict()
+            Input_dict["time"] = child_as_dict(self.time, type_handle_ndarray, **kwargs)
         if self.angle is None:
             Input_dict["angle"] = None
         else:
-            Input_dict["angle"] = self.angle.as_dict()
+            Input_dict["angle"] = child_as_dict(
+                self.angle, type_handle_ndarray, **kwargs
+            )
         Input_dict["Nt_tot"] = self.Nt_tot
         Input_dict["Nrev"] = self.Nrev
         Input_dict["Na_tot"] = self.Na_tot
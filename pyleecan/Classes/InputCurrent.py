@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Input import Input
 
@@ -67,6 +67,7 @@ class InputCurrent(Input):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -105,35 +106,35 @@ class InputCurrent(Input):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Is" in list(init_dict.keys()):
+            if "Is" in init_dict:
                 Is = init_dict["Is"]
-            if "Ir" in list(init_dict.keys()):
+            if "Ir" in init_dict:
                 Ir = init_dict["Ir"]
-            if "angle_rotor" in list(init_dict.keys()):
+            if "angle_rotor" in init_dict:
                 angle_rotor = init_dict["angle_rotor"]
-            if "rot_dir" in list(init_dict.keys()):
+            if "rot_dir" in init_dict:
                 rot_dir = init_dict["rot_dir"]
-            if "angle_rotor_initial" in list(init_dict.keys()):
+            if "angle_rotor_initial" in init_dict:
                 angle_rotor_initial = init_dict["angle_rotor_initial"]
-            if "Tem_av_ref" in list(init_dict.keys()):
+            if "Tem_av_ref" in init_dict:
                 Tem_av_ref = init_dict["Tem_av_ref"]
-            if "Id_ref" in list(init_dict.keys()):
+            if "Id_ref" in init_dict:
                 Id_ref = init_dict["Id_ref"]
-            if "Iq_ref" in list(init_dict.keys()):
+            if "Iq_ref" in init_dict:
                 Iq_ref = init_dict["Iq_ref"]
-            if "felec" in list(init_dict.keys()):
+            if "felec" in init_dict:
                 felec = init_dict["felec"]
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Nrev" in list(init_dict.keys()):
+            if "Nrev" in init_dict:
                 Nrev = init_dict["Nrev"]
-            if "Na_tot" in list(init_dict.keys()):
+            if "Na_tot" in init_dict:
                 Na_tot = init_dict["Na_tot"]
-            if "N0" in list(init_dict.keys()):
+            if "N0" in init_dict:
                 N0 = init_dict["N0"]
         # Set the properties (value check and convertion are done in setter)
         self.Is = Is
@@ -232,23 +233,36 @@ class InputCurrent(Input):
         S += getsizeof(self.felec)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Input
-        InputCurrent_dict = super(InputCurrent, self).as_dict()
+        InputCurrent_dict = super(InputCurrent, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.Is is None:
             InputCurrent_dict["Is"] = None
         else:
-            InputCurrent_dict["Is"] = self.Is.as_dict()
+            InputCurrent_dict["Is"] = child_as_dict(
+                self.Is, type_handle_ndarray, **kwargs
+            )
         if self.Ir is None:
             InputCurrent_dict["Ir"] = None
         else:
-            InputCurrent_dict["Ir"] = self.Ir.as_dict()
+            InputCurrent_dict["Ir"] = child_as_dict(
+                self.Ir, type_handle_ndarray, **kwargs
+            )
         if self.angle_rotor is None:
             InputCurrent_dict["angle_rotor"] = None
         else:
-            InputCurrent_dict["angle_rotor"] = self.angle_rotor.as_dict()
+            InputCurrent_dict["angle_rotor"] = child_as_dict(
+                self.angle_rotor, type_handle_ndarray, **kwargs
+            )
         InputCurrent_dict["rot_dir"] = self.rot_dir
         InputCurrent_dict["angle_rotor_initial"] = self.angle_rotor_initial
         InputCurrent_dict["Tem_av_ref"] = self.Tem_av_ref
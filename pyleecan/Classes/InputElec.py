@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Input import Input
 
@@ -76,6 +76,7 @@ class InputElec(Input):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -111,29 +112,29 @@ class InputElec(Input):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "rot_dir" in list(init_dict.keys()):
+            if "rot_dir" in init_dict:
                 rot_dir = init_dict["rot_dir"]
-            if "Id_ref" in list(init_dict.keys()):
+            if "Id_ref" in init_dict:
                 Id_ref = init_dict["Id_ref"]
-            if "Iq_ref" in list(init_dict.keys()):
+            if "Iq_ref" in init_dict:
                 Iq_ref = init_dict["Iq_ref"]
-            if "Ud_ref" in list(init_dict.keys()):
+            if "Ud_ref" in init_dict:
                 Ud_ref = init_dict["Ud_ref"]
-            if "Uq_ref" in list(init_dict.keys()):
+            if "Uq_ref" in init_dict:
                 Uq_ref = init_dict["Uq_ref"]
-            if "felec" in list(init_dict.keys()):
+            if "felec" in init_dict:
                 felec = init_dict["felec"]
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Nrev" in list(init_dict.keys()):
+            if "Nrev" in init_dict:
                 Nrev = init_dict["Nrev"]
-            if "Na_tot" in list(init_dict.keys()):
+            if "Na_tot" in init_dict:
                 Na_tot = init_dict["Na_tot"]
-            if "N0" in list(init_dict.keys()):
+            if "N0" in init_dict:
                 N0 = init_dict["N0"]
         # Set the properties (value check and convertion are done in setter)
         self.rot_dir = rot_dir
@@ -201,11 +202,18 @@ class InputElec(Input):
         S += getsizeof(self.felec)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Input
-        InputElec_dict = super(InputElec, self).as_dict()
+        InputElec_dict = super(InputElec, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         InputElec_dict["rot_dir"] = self.rot_dir
         InputElec_dict["Id_ref"] = self.Id_ref
         InputElec_dict["Iq_ref"] = self.Iq_ref
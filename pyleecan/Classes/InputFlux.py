@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Input import Input
 
@@ -77,6 +77,7 @@ class InputFlux(Input):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -113,31 +114,31 @@ class InputFlux(Input):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "per_a" in list(init_dict.keys()):
+            if "per_a" in init_dict:
                 per_a = init_dict["per_a"]
-            if "per_t" in list(init_dict.keys()):
+            if "per_t" in init_dict:
                 per_t = init_dict["per_t"]
-            if "is_antiper_a" in list(init_dict.keys()):
+            if "is_antiper_a" in init_dict:
                 is_antiper_a = init_dict["is_antiper_a"]
-            if "is_antiper_t" in list(init_dict.keys()):
+            if "is_antiper_t" in init_dict:
                 is_antiper_t = init_dict["is_antiper_t"]
-            if "B_dict" in list(init_dict.keys()):
+            if "B_dict" in init_dict:
                 B_dict = init_dict["B_dict"]
-            if "unit" in list(init_dict.keys()):
+            if "unit" in init_dict:
                 unit = init_dict["unit"]
-            if "OP" in list(init_dict.keys()):
+            if "OP" in init_dict:
                 OP = init_dict["OP"]
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Nrev" in list(init_dict.keys()):
+            if "Nrev" in init_dict:
                 Nrev = init_dict["Nrev"]
-            if "Na_tot" in list(init_dict.keys()):
+            if "Na_tot" in init_dict:
                 Na_tot = init_dict["Na_tot"]
-            if "N0" in list(init_dict.keys()):
+            if "N0" in init_dict:
                 N0 = init_dict["N0"]
         # Set the properties (value check and convertion are done in setter)
         self.per_a = per_a
@@ -216,11 +217,18 @@ class InputFlux(Input):
         S += getsizeof(self.OP)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Input
-        InputFlux_dict = super(InputFlux, self).as_dict()
+        InputFlux_dict = super(InputFlux, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         InputFlux_dict["per_a"] = self.per_a
         InputFlux_dict["per_t"] = self.per_t
         InputFlux_dict["is_antiper_a"] = self.is_antiper_a
@@ -232,7 +240,7 @@ class InputFlux(Input):
         if self.OP is None:
             InputFlux_dict["OP"] = None
         else:
-            InputFlux_dict["OP"] = self.OP.as_dict()
+            InputFlux_dict["OP"] = child_as_dict(self.OP, type_handle_ndarray, **kwargs)
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         InputFlux_dict["__class__"] = "InputFlux"
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Input import Input
 
@@ -48,6 +48,7 @@ class InputForce(Input):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -78,19 +79,19 @@ class InputForce(Input):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "P" in list(init_dict.keys()):
+            if "P" in init_dict:
                 P = init_dict["P"]
-            if "time" in list(init_dict.keys()):
+            if "time" in init_dict:
                 time = init_dict["time"]
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Nrev" in list(init_dict.keys()):
+            if "Nrev" in init_dict:
                 Nrev = init_dict["Nrev"]
-            if "Na_tot" in list(init_dict.keys()):
+            if "Na_tot" in init_dict:
                 Na_tot = init_dict["Na_tot"]
-            if "N0" in list(init_dict.keys()):
+            if "N0" in init_dict:
                 N0 = init_dict["N0"]
         # Set the properties (value check and convertion are done in setter)
         self.P = P
@@ -137,15 +138,22 @@ class InputForce(Input):
         S += getsizeof(self.P)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Input
-        InputForce_dict = super(InputForce, self).as_dict()
+        InputForce_dict = super(InputForce, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.P is None:
             InputForce_dict["P"] = None
         else:
-            InputForce_dict["P"] = self.P.as_dict()
+            InputForce_dict["P"] = child_as_dict(self.P, type_handle_ndarray, **kwargs)
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         InputForce_dict["__class__"] = "InputForce"
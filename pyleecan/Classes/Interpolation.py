@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -29,6 +29,7 @@ class Interpolation(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -55,11 +56,11 @@ class Interpolation(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "ref_cell" in list(init_dict.keys()):
+            if "ref_cell" in init_dict:
                 ref_cell = init_dict["ref_cell"]
-            if "gauss_point" in list(init_dict.keys()):
+            if "gauss_point" in init_dict:
                 gauss_point = init_dict["gauss_point"]
-            if "scalar_product" in list(init_dict.keys()):
+            if "scalar_product" in init_dict:
                 scalar_product = init_dict["scalar_product"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -125,22 +126,33 @@ class Interpolation(FrozenClass):
         S += getsizeof(self.scalar_product)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Interpolation_dict = dict()
         if self.ref_cell is None:
             Interpolation_dict["ref_cell"] = None
         else:
-            Interpolation_dict["ref_cell"] = self.ref_cell.as_dict()
+            Interpolation_dict["ref_cell"] = child_as_dict(
+                self.ref_cell, type_handle_ndarray, **kwargs
+            )
         if self.gauss_point is None:
             Interpolation_dict["gauss_point"] = None
         else:
-            Interpolation_dict["gauss_point"] = self.gauss_point.as_dict()
+            Interpolation_dict["gauss_point"] = child_as_dict(
+                self.gauss_point, type_handle_ndarray, **kwargs
+            )
         if self.scalar_product is None:
             Interpolation_dict["scalar_product"] = None
         else:
-            Interpolation_dict["scalar_product"] = self.scalar_product.as_dict()
+            Interpolation_dict["scalar_product"] = child_as_dict(
+                self.scalar_product, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         Interpolation_dict["__class__"] = "Interpolation"
         return Interpolation_dict
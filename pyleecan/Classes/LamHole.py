@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Lamination import Lamination
 
@@ -209,6 +209,7 @@ class LamHole(Lamination):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -245,31 +246,31 @@ class LamHole(Lamination):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "hole" in list(init_dict.keys()):
+            if "hole" in init_dict:
                 hole = init_dict["hole"]
-            if "bore" in list(init_dict.keys()):
+            if "bore" in init_dict:
                 bore = init_dict["bore"]
-            if "L1" in list(init_dict.keys()):
+            if "L1" in init_dict:
                 L1 = init_dict["L1"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Nrvd" in list(init_dict.keys()):
+            if "Nrvd" in init_dict:
                 Nrvd = init_dict["Nrvd"]
-            if "Wrvd" in list(init_dict.keys()):
+            if "Wrvd" in init_dict:
                 Wrvd = init_dict["Wrvd"]
-            if "Kf1" in list(init_dict.keys()):
+            if "Kf1" in init_dict:
                 Kf1 = init_dict["Kf1"]
-            if "is_internal" in list(init_dict.keys()):
+            if "is_internal" in init_dict:
                 is_internal = init_dict["is_internal"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "is_stator" in list(init_dict.keys()):
+            if "is_stator" in init_dict:
                 is_stator = init_dict["is_stator"]
-            if "axial_vent" in list(init_dict.keys()):
+            if "axial_vent" in init_dict:
                 axial_vent = init_dict["axial_vent"]
-            if "notch" in list(init_dict.keys()):
+            if "notch" in init_dict:
                 notch = init_dict["notch"]
         # Set the properties (value check and convertion are done in setter)
         self.hole = hole
@@ -337,24 +338,35 @@ class LamHole(Lamination):
         S += getsizeof(self.bore)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Lamination
-        LamHole_dict = super(LamHole, self).as_dict()
+        LamHole_dict = super(LamHole, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.hole is None:
             LamHole_dict["hole"] = None
         else:
             LamHole_dict["hole"] = list()
             for obj in self.hole:
                 if obj is not None:
-                    LamHole_dict["hole"].append(obj.as_dict())
+                    LamHole_dict["hole"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     LamHole_dict["hole"].append(None)
         if self.bore is None:
             LamHole_dict["bore"] = None
         else:
-            LamHole_dict["bore"] = self.bore.as_dict()
+            LamHole_dict["bore"] = child_as_dict(
+                self.bore, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         LamHole_dict["__class__"] = "LamHole"
@@ -10,9 +10,10 @@ from logging import getLogger
 from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from .Lamination import Lamination
 
 # Import all class method
@@ -177,6 +178,7 @@ class LamSlotMulti(Lamination):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -213,31 +215,31 @@ class LamSlotMulti(Lamination):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "slot_list" in list(init_dict.keys()):
+            if "slot_list" in init_dict:
                 slot_list = init_dict["slot_list"]
-            if "alpha" in list(init_dict.keys()):
+            if "alpha" in init_dict:
                 alpha = init_dict["alpha"]
-            if "L1" in list(init_dict.keys()):
+            if "L1" in init_dict:
                 L1 = init_dict["L1"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Nrvd" in list(init_dict.keys()):
+            if "Nrvd" in init_dict:
                 Nrvd = init_dict["Nrvd"]
-            if "Wrvd" in list(init_dict.keys()):
+            if "Wrvd" in init_dict:
                 Wrvd = init_dict["Wrvd"]
-            if "Kf1" in list(init_dict.keys()):
+            if "Kf1" in init_dict:
                 Kf1 = init_dict["Kf1"]
-            if "is_internal" in list(init_dict.keys()):
+            if "is_internal" in init_dict:
                 is_internal = init_dict["is_internal"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "is_stator" in list(init_dict.keys()):
+            if "is_stator" in init_dict:
                 is_stator = init_dict["is_stator"]
-            if "axial_vent" in list(init_dict.keys()):
+            if "axial_vent" in init_dict:
                 axial_vent = init_dict["axial_vent"]
-            if "notch" in list(init_dict.keys()):
+            if "notch" in init_dict:
                 notch = init_dict["notch"]
         # Set the properties (value check and convertion are done in setter)
         self.slot_list = slot_list
@@ -309,24 +311,42 @@ class LamSlotMulti(Lamination):
         S += getsizeof(self.alpha)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Lamination
-        LamSlotMulti_dict = super(LamSlotMulti, self).as_dict()
+        LamSlotMulti_dict = super(LamSlotMulti, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.slot_list is None:
             LamSlotMulti_dict["slot_list"] = None
         else:
             LamSlotMulti_dict["slot_list"] = list()
             for obj in self.slot_list:
                 if obj is not None:
-                    LamSlotMulti_dict["slot_list"].append(obj.as_dict())
+                    LamSlotMulti_dict["slot_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     LamSlotMulti_dict["slot_list"].append(None)
         if self.alpha is None:
             LamSlotMulti_dict["alpha"] = None
         else:
-            LamSlotMulti_dict["alpha"] = self.alpha.tolist()
+            if type_handle_ndarray == 0:
+                LamSlotMulti_dict["alpha"] = self.alpha.tolist()
+            elif type_handle_ndarray == 1:
+                LamSlotMulti_dict["alpha"] = self.alpha.copy()
+            elif type_handle_ndarray == 2:
+                LamSlotMulti_dict["alpha"] = self.alpha
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         LamSlotMulti_dict["__class__"] = "LamSlotMulti"
@@ -375,6 +395,8 @@ class LamSlotMulti(Lamination):
 
     def _get_alpha(self):
         """getter of alpha"""
+        if isinstance(self._alpha, LazyArray):
+            self._set_alpha(self._alpha.load())
         return self._alpha
 
     def _set_alpha(self, value):
@@ -386,7 +408,8 @@ class LamSlotMulti(Lamination):
                 value = array(value)
             except:
                 pass
-        check_var("alpha", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("alpha", value, "ndarray")
         self._alpha = value
 
     alpha = property(
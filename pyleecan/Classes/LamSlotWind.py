@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .LamSlot import LamSlot
 
@@ -378,6 +378,7 @@ class LamSlotWind(LamSlot):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -415,33 +416,33 @@ class LamSlotWind(LamSlot):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Ksfill" in list(init_dict.keys()):
+            if "Ksfill" in init_dict:
                 Ksfill = init_dict["Ksfill"]
-            if "winding" in list(init_dict.keys()):
+            if "winding" in init_dict:
                 winding = init_dict["winding"]
-            if "slot" in list(init_dict.keys()):
+            if "slot" in init_dict:
                 slot = init_dict["slot"]
-            if "L1" in list(init_dict.keys()):
+            if "L1" in init_dict:
                 L1 = init_dict["L1"]
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "Nrvd" in list(init_dict.keys()):
+            if "Nrvd" in init_dict:
                 Nrvd = init_dict["Nrvd"]
-            if "Wrvd" in list(init_dict.keys()):
+            if "Wrvd" in init_dict:
                 Wrvd = init_dict["Wrvd"]
-            if "Kf1" in list(init_dict.keys()):
+            if "Kf1" in init_dict:
                 Kf1 = init_dict["Kf1"]
-            if "is_internal" in list(init_dict.keys()):
+            if "is_internal" in init_dict:
                 is_internal = init_dict["is_internal"]
-            if "Rint" in list(init_dict.keys()):
+            if "Rint" in init_dict:
                 Rint = init_dict["Rint"]
-            if "Rext" in list(init_dict.keys()):
+            if "Rext" in init_dict:
                 Rext = init_dict["Rext"]
-            if "is_stator" in list(init_dict.keys()):
+            if "is_stator" in init_dict:
                 is_stator = init_dict["is_stator"]
-            if "axial_vent" in list(init_dict.keys()):
+            if "axial_vent" in init_dict:
                 axial_vent = init_dict["axial_vent"]
-            if "notch" in list(init_dict.keys()):
+            if "notch" in init_dict:
                 notch = init_dict["notch"]
         # Set the properties (value check and convertion are done in setter)
         self.Ksfill = Ksfill
@@ -504,16 +505,25 @@ class LamSlotWind(LamSlot):
         S += getsizeof(self.winding)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from LamSlot
-        LamSlotWind_dict = super(LamSlotWind, self).as_dict()
+        LamSlotWind_dict = super(LamSlotWind, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         LamSlotWind_dict["Ksfill"] = self.Ksfill
         if self.winding is None:
             LamSlotWind_dict["winding"] = None
         else:
-            LamSlotWind_dict["winding"] = self.winding.as_dict()
+            LamSlotWind_dict["winding"] = child_as_dict(
+                self.winding, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         LamSlotWind_dict["__class__"] = "LamSlotWind"
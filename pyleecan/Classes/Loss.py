@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -71,6 +71,7 @@ class Loss(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -97,11 +98,11 @@ class Loss(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "model_index" in list(init_dict.keys()):
+            if "model_index" in init_dict:
                 model_index = init_dict["model_index"]
-            if "model_list" in list(init_dict.keys()):
+            if "model_list" in init_dict:
                 model_list = init_dict["model_list"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -157,8 +158,13 @@ class Loss(FrozenClass):
         S += getsizeof(self.logger_name)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Loss_dict = dict()
         Loss_dict["model_index"] = (
@@ -170,7 +176,9 @@ class Loss(FrozenClass):
             Loss_dict["model_list"] = list()
             for obj in self.model_list:
                 if obj is not None:
-                    Loss_dict["model_list"].append(obj.as_dict())
+                    Loss_dict["model_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     Loss_dict["model_list"].append(None)
         Loss_dict["logger_name"] = self.logger_name
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .LossModel import LossModel
 
@@ -86,6 +86,7 @@ class LossModelBertotti(LossModel):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -119,25 +120,25 @@ class LossModelBertotti(LossModel):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "k_hy" in list(init_dict.keys()):
+            if "k_hy" in init_dict:
                 k_hy = init_dict["k_hy"]
-            if "k_ed" in list(init_dict.keys()):
+            if "k_ed" in init_dict:
                 k_ed = init_dict["k_ed"]
-            if "k_ex" in list(init_dict.keys()):
+            if "k_ex" in init_dict:
                 k_ex = init_dict["k_ex"]
-            if "alpha_hy" in list(init_dict.keys()):
+            if "alpha_hy" in init_dict:
                 alpha_hy = init_dict["alpha_hy"]
-            if "alpha_ed" in list(init_dict.keys()):
+            if "alpha_ed" in init_dict:
                 alpha_ed = init_dict["alpha_ed"]
-            if "alpha_ex" in list(init_dict.keys()):
+            if "alpha_ex" in init_dict:
                 alpha_ex = init_dict["alpha_ex"]
-            if "group" in list(init_dict.keys()):
+            if "group" in init_dict:
                 group = init_dict["group"]
-            if "get_meshsolution" in list(init_dict.keys()):
+            if "get_meshsolution" in init_dict:
                 get_meshsolution = init_dict["get_meshsolution"]
-            if "N0" in list(init_dict.keys()):
+            if "N0" in init_dict:
                 N0 = init_dict["N0"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
         # Set the properties (value check and convertion are done in setter)
         self.k_hy = k_hy
@@ -224,11 +225,18 @@ class LossModelBertotti(LossModel):
                 S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from LossModel
-        LossModelBertotti_dict = super(LossModelBertotti, self).as_dict()
+        LossModelBertotti_dict = super(LossModelBertotti, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         LossModelBertotti_dict["k_hy"] = self.k_hy
         LossModelBertotti_dict["k_ed"] = self.k_ed
         LossModelBertotti_dict["k_ex"] = self.k_ex
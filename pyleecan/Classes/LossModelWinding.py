@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .LossModel import LossModel
 
@@ -45,6 +45,7 @@ class LossModelWinding(LossModel):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -64,9 +65,9 @@ class LossModelWinding(LossModel):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "temperature" in list(init_dict.keys()):
+            if "temperature" in init_dict:
                 temperature = init_dict["temperature"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
         # Set the properties (value check and convertion are done in setter)
         self.temperature = temperature
@@ -107,11 +108,18 @@ class LossModelWinding(LossModel):
         S += getsizeof(self.temperature)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from LossModel
-        LossModelWinding_dict = super(LossModelWinding, self).as_dict()
+        LossModelWinding_dict = super(LossModelWinding, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         LossModelWinding_dict["temperature"] = self.temperature
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .MachineAsync import MachineAsync
 
@@ -64,6 +64,7 @@ class MachineDFIM(MachineAsync):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -95,21 +96,21 @@ class MachineDFIM(MachineAsync):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "rotor" in list(init_dict.keys()):
+            if "rotor" in init_dict:
                 rotor = init_dict["rotor"]
-            if "stator" in list(init_dict.keys()):
+            if "stator" in init_dict:
                 stator = init_dict["stator"]
-            if "frame" in list(init_dict.keys()):
+            if "frame" in init_dict:
                 frame = init_dict["frame"]
-            if "shaft" in list(init_dict.keys()):
+            if "shaft" in init_dict:
                 shaft = init_dict["shaft"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "type_machine" in list(init_dict.keys()):
+            if "type_machine" in init_dict:
                 type_machine = init_dict["type_machine"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.rotor = rotor
@@ -170,19 +171,30 @@ class MachineDFIM(MachineAsync):
         S += getsizeof(self.stator)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from MachineAsync
-        MachineDFIM_dict = super(MachineDFIM, self).as_dict()
+        MachineDFIM_dict = super(MachineDFIM, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.rotor is None:
             MachineDFIM_dict["rotor"] = None
         else:
-            MachineDFIM_dict["rotor"] = self.rotor.as_dict()
+            MachineDFIM_dict["rotor"] = child_as_dict(
+                self.rotor, type_handle_ndarray, **kwargs
+            )
         if self.stator is None:
             MachineDFIM_dict["stator"] = None
         else:
-            MachineDFIM_dict["stator"] = self.stator.as_dict()
+            MachineDFIM_dict["stator"] = child_as_dict(
+                self.stator, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         MachineDFIM_dict["__class__"] = "MachineDFIM"
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .MachineSync import MachineSync
 
@@ -31,6 +31,7 @@ except ImportError as error:
 from ._check import InitUnKnowClassError
 from .LamHole import LamHole
 from .LamSlotWind import LamSlotWind
+from .FluxMapDQ import FluxMapDQ
 from .Frame import Frame
 from .Shaft import Shaft
 
@@ -65,6 +66,7 @@ class MachineIPMSM(MachineSync):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -72,6 +74,7 @@ class MachineIPMSM(MachineSync):
         self,
         rotor=-1,
         stator=-1,
+        flux_map=None,
         frame=-1,
         shaft=-1,
         name="default_machine",
@@ -96,27 +99,30 @@ class MachineIPMSM(MachineSync):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "rotor" in list(init_dict.keys()):
+            if "rotor" in init_dict:
                 rotor = init_dict["rotor"]
-            if "stator" in list(init_dict.keys()):
+            if "stator" in init_dict:
                 stator = init_dict["stator"]
-            if "frame" in list(init_dict.keys()):
+            if "flux_map" in init_dict:
+                flux_map = init_dict["flux_map"]
+            if "frame" in init_dict:
                 frame = init_dict["frame"]
-            if "shaft" in list(init_dict.keys()):
+            if "shaft" in init_dict:
                 shaft = init_dict["shaft"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "type_machine" in list(init_dict.keys()):
+            if "type_machine" in init_dict:
                 type_machine = init_dict["type_machine"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.rotor = rotor
         self.stator = stator
         # Call MachineSync init
         super(MachineIPMSM, self).__init__(
+            flux_map=flux_map,
             frame=frame,
             shaft=shaft,
             name=name,
@@ -171,19 +177,30 @@ class MachineIPMSM(MachineSync):
         S += getsizeof(self.stator)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from MachineSync
-        MachineIPMSM_dict = super(MachineIPMSM, self).as_dict()
+        MachineIPMSM_dict = super(MachineIPMSM, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.rotor is None:
             MachineIPMSM_dict["rotor"] = None
         else:
-            MachineIPMSM_dict["rotor"] = self.rotor.as_dict()
+            MachineIPMSM_dict["rotor"] = child_as_dict(
+                self.rotor, type_handle_ndarray, **kwargs
+            )
         if self.stator is None:
             MachineIPMSM_dict["stator"] = None
         else:
-            MachineIPMSM_dict["stator"] = self.stator.as_dict()
+            MachineIPMSM_dict["stator"] = child_as_dict(
+                self.stator, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         MachineIPMSM_dict["__class__"] = "MachineIPMSM"
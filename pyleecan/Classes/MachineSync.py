@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Machine import Machine
 
@@ -24,6 +24,7 @@ except ImportError as error:
 
 
 from ._check import InitUnKnowClassError
+from .FluxMapDQ import FluxMapDQ
 from .Frame import Frame
 from .Shaft import Shaft
 
@@ -48,11 +49,13 @@ class MachineSync(Machine):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
     def __init__(
         self,
+        flux_map=None,
         frame=-1,
         shaft=-1,
         name="default_machine",
@@ -77,19 +80,22 @@ class MachineSync(Machine):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "frame" in list(init_dict.keys()):
+            if "flux_map" in init_dict:
+                flux_map = init_dict["flux_map"]
+            if "frame" in init_dict:
                 frame = init_dict["frame"]
-            if "shaft" in list(init_dict.keys()):
+            if "shaft" in init_dict:
                 shaft = init_dict["shaft"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "type_machine" in list(init_dict.keys()):
+            if "type_machine" in init_dict:
                 type_machine = init_dict["type_machine"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
+        self.flux_map = flux_map
         # Call Machine init
         super(MachineSync, self).__init__(
             frame=frame,
@@ -108,6 +114,11 @@ class MachineSync(Machine):
         MachineSync_str = ""
         # Get the properties inherited from Machine
         MachineSync_str += super(MachineSync, self).__str__()
+        if self.flux_map is not None:
+            tmp = self.flux_map.__str__().replace(linesep, linesep + "\t").rstrip("\t")
+            MachineSync_str += "flux_map = " + tmp
+        else:
+            MachineSync_str += "flux_map = None" + linesep + linesep
         return MachineSync_str
 
     def __eq__(self, other):
@@ -119,6 +130,8 @@ class MachineSync(Machine):
         # Check the properties inherited from Machine
         if not super(MachineSync, self).__eq__(other):
             return False
+        if other.flux_map != self.flux_map:
+            return False
         return True
 
     def __sizeof__(self):
@@ -128,13 +141,27 @@ class MachineSync(Machine):
 
         # Get size of the properties inherited from Machine
         S += super(MachineSync, self).__sizeof__()
+        S += getsizeof(self.flux_map)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Machine
-        MachineSync_dict = super(MachineSync, self).as_dict()
+        MachineSync_dict = super(MachineSync, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
+        if self.flux_map is None:
+            MachineSync_dict["flux_map"] = None
+        else:
+            MachineSync_dict["flux_map"] = child_as_dict(
+                self.flux_map, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         MachineSync_dict["__class__"] = "MachineSync"
@@ -143,5 +170,37 @@ class MachineSync(Machine):
     def _set_None(self):
         """Set all the properties to None (except pyleecan object)"""
 
+        if self.flux_map is not None:
+            self.flux_map._set_None()
         # Set to None the properties inherited from Machine
         super(MachineSync, self)._set_None()
+
+    def _get_flux_map(self):
+        """getter of flux_map"""
+        return self._flux_map
+
+    def _set_flux_map(self, value):
+        """setter of flux_map"""
+        if isinstance(value, str):  # Load from file
+            value = load_init_dict(value)[1]
+        if isinstance(value, dict) and "__class__" in value:
+            class_obj = import_class(
+                "pyleecan.Classes", value.get("__class__"), "flux_map"
+            )
+            value = class_obj(init_dict=value)
+        elif type(value) is int and value == -1:  # Default constructor
+            value = FluxMapDQ()
+        check_var("flux_map", value, "FluxMapDQ")
+        self._flux_map = value
+
+        if self._flux_map is not None:
+            self._flux_map.parent = self
+
+    flux_map = property(
+        fget=_get_flux_map,
+        fset=_set_flux_map,
+        doc=u"""Id/Iq flux linkage map of the machine (interpolated by EEC_PMSM)
+
+        :Type: FluxMapDQ
+        """,
+    )
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Machine import Machine
 
@@ -65,6 +65,7 @@ class MachineUD(Machine):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -96,21 +97,21 @@ class MachineUD(Machine):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "lam_list" in list(init_dict.keys()):
+            if "lam_list" in init_dict:
                 lam_list = init_dict["lam_list"]
-            if "is_sync" in list(init_dict.keys()):
+            if "is_sync" in init_dict:
                 is_sync = init_dict["is_sync"]
-            if "frame" in list(init_dict.keys()):
+            if "frame" in init_dict:
                 frame = init_dict["frame"]
-            if "shaft" in list(init_dict.keys()):
+            if "shaft" in init_dict:
                 shaft = init_dict["shaft"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "type_machine" in list(init_dict.keys()):
+            if "type_machine" in init_dict:
                 type_machine = init_dict["type_machine"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.lam_list = lam_list
@@ -169,18 +170,27 @@ class MachineUD(Machine):
         S += getsizeof(self.is_sync)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Machine
-        MachineUD_dict = super(MachineUD, self).as_dict()
+        MachineUD_dict = super(MachineUD, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.lam_list is None:
             MachineUD_dict["lam_list"] = None
         else:
             MachineUD_dict["lam_list"] = list()
             for obj in self.lam_list:
                 if obj is not None:
-                    MachineUD_dict["lam_list"].append(obj.as_dict())
+                    MachineUD_dict["lam_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     MachineUD_dict["lam_list"].append(None)
         MachineUD_dict["is_sync"] = self.is_sync
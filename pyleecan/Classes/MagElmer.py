@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Magnetics import Magnetics
 
@@ -142,6 +142,7 @@ class MagElmer(Magnetics):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -188,51 +189,51 @@ class MagElmer(Magnetics):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Kmesh_fineness" in list(init_dict.keys()):
+            if "Kmesh_fineness" in init_dict:
                 Kmesh_fineness = init_dict["Kmesh_fineness"]
-            if "Kgeo_fineness" in list(init_dict.keys()):
+            if "Kgeo_fineness" in init_dict:
                 Kgeo_fineness = init_dict["Kgeo_fineness"]
-            if "file_name" in list(init_dict.keys()):
+            if "file_name" in init_dict:
                 file_name = init_dict["file_name"]
-            if "FEA_dict" in list(init_dict.keys()):
+            if "FEA_dict" in init_dict:
                 FEA_dict = init_dict["FEA_dict"]
-            if "is_get_mesh" in list(init_dict.keys()):
+            if "is_get_mesh" in init_dict:
                 is_get_mesh = init_dict["is_get_mesh"]
-            if "is_save_FEA" in list(init_dict.keys()):
+            if "is_save_FEA" in init_dict:
                 is_save_FEA = init_dict["is_save_FEA"]
-            if "transform_list" in list(init_dict.keys()):
+            if "transform_list" in init_dict:
                 transform_list = init_dict["transform_list"]
-            if "rotor_dxf" in list(init_dict.keys()):
+            if "rotor_dxf" in init_dict:
                 rotor_dxf = init_dict["rotor_dxf"]
-            if "stator_dxf" in list(init_dict.keys()):
+            if "stator_dxf" in init_dict:
                 stator_dxf = init_dict["stator_dxf"]
-            if "import_file" in list(init_dict.keys()):
+            if "import_file" in init_dict:
                 import_file = init_dict["import_file"]
-            if "nb_worker" in list(init_dict.keys()):
+            if "nb_worker" in init_dict:
                 nb_worker = init_dict["nb_worker"]
-            if "is_remove_slotS" in list(init_dict.keys()):
+            if "is_remove_slotS" in init_dict:
                 is_remove_slotS = init_dict["is_remove_slotS"]
-            if "is_remove_slotR" in list(init_dict.keys()):
+            if "is_remove_slotR" in init_dict:
                 is_remove_slotR = init_dict["is_remove_slotR"]
-            if "is_remove_vent" in list(init_dict.keys()):
+            if "is_remove_vent" in init_dict:
                 is_remove_vent = init_dict["is_remove_vent"]
-            if "is_mmfs" in list(init_dict.keys()):
+            if "is_mmfs" in init_dict:
                 is_mmfs = init_dict["is_mmfs"]
-            if "is_mmfr" in list(init_dict.keys()):
+            if "is_mmfr" in init_dict:
                 is_mmfr = init_dict["is_mmfr"]
-            if "type_BH_stator" in list(init_dict.keys()):
+            if "type_BH_stator" in init_dict:
                 type_BH_stator = init_dict["type_BH_stator"]
-            if "type_BH_rotor" in list(init_dict.keys()):
+            if "type_BH_rotor" in init_dict:
                 type_BH_rotor = init_dict["type_BH_rotor"]
-            if "is_periodicity_t" in list(init_dict.keys()):
+            if "is_periodicity_t" in init_dict:
                 is_periodicity_t = init_dict["is_periodicity_t"]
-            if "is_periodicity_a" in list(init_dict.keys()):
+            if "is_periodicity_a" in init_dict:
                 is_periodicity_a = init_dict["is_periodicity_a"]
-            if "angle_stator_shift" in list(init_dict.keys()):
+            if "angle_stator_shift" in init_dict:
                 angle_stator_shift = init_dict["angle_stator_shift"]
-            if "angle_rotor_shift" in list(init_dict.keys()):
+            if "angle_rotor_shift" in init_dict:
                 angle_rotor_shift = init_dict["angle_rotor_shift"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.Kmesh_fineness = Kmesh_fineness
@@ -355,11 +356,18 @@ class MagElmer(Magnetics):
         S += getsizeof(self.nb_worker)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Magnetics
-        MagElmer_dict = super(MagElmer, self).as_dict()
+        MagElmer_dict = super(MagElmer, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         MagElmer_dict["Kmesh_fineness"] = self.Kmesh_fineness
         MagElmer_dict["Kgeo_fineness"] = self.Kgeo_fineness
         MagElmer_dict["file_name"] = self.file_name
@@ -374,11 +382,15 @@ class MagElmer(Magnetics):
         if self.rotor_dxf is None:
             MagElmer_dict["rotor_dxf"] = None
         else:
-            MagElmer_dict["rotor_dxf"] = self.rotor_dxf.as_dict()
+            MagElmer_dict["rotor_dxf"] = child_as_dict(
+                self.rotor_dxf, type_handle_ndarray, **kwargs
+            )
         if self.stator_dxf is None:
             MagElmer_dict["stator_dxf"] = None
         else:
-            MagElmer_dict["stator_dxf"] = self.stator_dxf.as_dict()
+            MagElmer_dict["stator_dxf"] = child_as_dict(
+                self.stator_dxf, type_handle_ndarray, **kwargs
+            )
         MagElmer_dict["import_file"] = self.import_file
         MagElmer_dict["nb_worker"] = self.nb_worker
         # The class name is added to the dict for deserialisation purpose
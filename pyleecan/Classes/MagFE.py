@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Simulation/MagFE.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Simulation/MagFE
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import check_var, raise_
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict, from_dict_trusted
+from ..Functions.Load.import_class import import_class
+from .Magnetics import Magnetics
+
+# Import all class method
+# Try/catch to remove unnecessary dependencies in unused method
+try:
+    from ..Methods.Simulation.MagFE.comp_flux_airgap import comp_flux_airgap
+except ImportError as error:
+    comp_flux_airgap = error
+
+try:
+    from ..Methods.Simulation.MagFE.solve_FE import solve_FE
+except ImportError as error:
+    solve_FE = error
+
+try:
+    from ..Methods.Simulation.MagFE.build_meshsolution import build_meshsolution
+except ImportError as error:
+    build_meshsolution = error
+
+
+from ._check import InitUnKnowClassError
+
+
+class MagFE(Magnetics):
+    """Magnetic module: native 2D Finite Element model (without external software)"""
+
+    VERSION = 1
+
+    # Check ImportError to remove unnecessary dependencies in unused method
+    # cf Methods.Simulation.MagFE.comp_flux_airgap
+    if isinstance(comp_flux_airgap, ImportError):
+        comp_flux_airgap = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MagFE method comp_flux_airgap: " + str(comp_flux_airgap)
+                )
+            )
+        )
+    else:
+        comp_flux_airgap = comp_flux_airgap
+    # cf Methods.Simulation.MagFE.solve_FE
+    if isinstance(solve_FE, ImportError):
+        solve_FE = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use MagFE method solve_FE: " + str(solve_FE))
+            )
+        )
+    else:
+        solve_FE = solve_FE
+    # cf Methods.Simulation.MagFE.build_meshsolution
+    if isinstance(build_meshsolution, ImportError):
+        build_meshsolution = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MagFE method build_meshsolution: "
+                    + str(build_meshsolution)
+                )
+            )
+        )
+    else:
+        build_meshsolution = build_meshsolution
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        Kmesh_fineness=1,
+        is_get_mesh=False,
+        is_save_FEA=False,
+        Rag_enforced=None,
+        nb_iter_max=50,
+        tol_newton=1e-06,
+        is_remove_slotS=False,
+        is_remove_slotR=False,
+        is_remove_vent=False,
+        is_mmfs=True,
+        is_mmfr=True,
+        type_BH_stator=0,
+        type_BH_rotor=0,
+        is_periodicity_t=False,
+        is_periodicity_a=False,
+        angle_stator_shift=0,
+        angle_rotor_shift=0,
+        logger_name="Pyleecan.Magnetics",
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionnary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "Kmesh_fineness" in init_dict:
+                Kmesh_fineness = init_dict["Kmesh_fineness"]
+            if "is_get_mesh" in init_dict:
+                is_get_mesh = init_dict["is_get_mesh"]
+            if "is_save_FEA" in init_dict:
+                is_save_FEA = init_dict["is_save_FEA"]
+            if "Rag_enforced" in init_dict:
+                Rag_enforced = init_dict["Rag_enforced"]
+            if "nb_iter_max" in init_dict:
+                nb_iter_max = init_dict["nb_iter_max"]
+            if "tol_newton" in init_dict:
+                tol_newton = init_dict["tol_newton"]
+            if "is_remove_slotS" in init_dict:
+                is_remove_slotS = init_dict["is_remove_slotS"]
+            if "is_remove_slotR" in init_dict:
+                is_remove_slotR = init_dict["is_remove_slotR"]
+            if "is_remove_vent" in init_dict:
+                is_remove_vent = init_dict["is_remove_vent"]
+            if "is_mmfs" in init_dict:
+                is_mmfs = init_dict["is_mmfs"]
+            if "is_mmfr" in init_dict:
+                is_mmfr = init_dict["is_mmfr"]
+            if "type_BH_stator" in init_dict:
+                type_BH_stator = init_dict["type_BH_stator"]
+            if "type_BH_rotor" in init_dict:
+                type_BH_rotor = init_dict["type_BH_rotor"]
+            if "is_periodicity_t" in init_dict:
+                is_periodicity_t = init_dict["is_periodicity_t"]
+            if "is_periodicity_a" in init_dict:
+                is_periodicity_a = init_dict["is_periodicity_a"]
+            if "angle_stator_shift" in init_dict:
+                angle_stator_shift = init_dict["angle_stator_shift"]
+            if "angle_rotor_shift" in init_dict:
+                angle_rotor_shift = init_dict["angle_rotor_shift"]
+            if "logger_name" in init_dict:
+                logger_name = init_dict["logger_name"]
+        # Set the properties (value check and convertion are done in setter)
+        self.Kmesh_fineness = Kmesh_fineness
+        self.is_get_mesh = is_get_mesh
+        self.is_save_FEA = is_save_FEA
+        self.Rag_enforced = Rag_enforced
+        self.nb_iter_max = nb_iter_max
+        self.tol_newton = tol_newton
+        # Call Magnetics init
+        super(MagFE, self).__init__(
+            is_remove_slotS=is_remove_slotS,
+            is_remove_slotR=is_remove_slotR,
+            is_remove_vent=is_remove_vent,
+            is_mmfs=is_mmfs,
+            is_mmfr=is_mmfr,
+            type_BH_stator=type_BH_stator,
+            type_BH_rotor=type_BH_rotor,
+            is_periodicity_t=is_periodicity_t,
+            is_periodicity_a=is_periodicity_a,
+            angle_stator_shift=angle_stator_shift,
+            angle_rotor_shift=angle_rotor_shift,
+            logger_name=logger_name,
+        )
+        # The class is frozen (in Magnetics init), for now it's impossible to
+        # add new properties
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        MagFE_str = ""
+        # Get the properties inherited from Magnetics
+        MagFE_str += super(MagFE, self).__str__()
+        MagFE_str += "Kmesh_fineness = " + str(self.Kmesh_fineness) + linesep
+        MagFE_str += "is_get_mesh = " + str(self.is_get_mesh) + linesep
+        MagFE_str += "is_save_FEA = " + str(self.is_save_FEA) + linesep
+        MagFE_str += "Rag_enforced = " + str(self.Rag_enforced) + linesep
+        MagFE_str += "nb_iter_max = " + str(self.nb_iter_max) + linesep
+        MagFE_str += "tol_newton = " + str(self.tol_newton) + linesep
+        return MagFE_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+
+        # Check the properties inherited from Magnetics
+        if not super(MagFE, self).__eq__(other):
+            return False
+        if other.Kmesh_fineness != self.Kmesh_fineness:
+            return False
+        if other.is_get_mesh != self.is_get_mesh:
+            return False
+        if other.is_save_FEA != self.is_save_FEA:
+            return False
+        if other.Rag_enforced != self.Rag_enforced:
+            return False
+        if other.nb_iter_max != self.nb_iter_max:
+            return False
+        if other.tol_newton != self.tol_newton:
+            return False
+        return True
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+
+        # Get size of the properties inherited from Magnetics
+        S += super(MagFE, self).__sizeof__()
+        S += getsizeof(self.Kmesh_fineness)
+        S += getsizeof(self.is_get_mesh)
+        S += getsizeof(self.is_save_FEA)
+        S += getsizeof(self.Rag_enforced)
+        S += getsizeof(self.nb_iter_max)
+        S += getsizeof(self.tol_newton)
+        return S
+
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        # Get the properties inherited from Magnetics
+        MagFE_dict = super(MagFE, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
+        MagFE_dict["Kmesh_fineness"] = self.Kmesh_fineness
+        MagFE_dict["is_get_mesh"] = self.is_get_mesh
+        MagFE_dict["is_save_FEA"] = self.is_save_FEA
+        MagFE_dict["Rag_enforced"] = self.Rag_enforced
+        MagFE_dict["nb_iter_max"] = self.nb_iter_max
+        MagFE_dict["tol_newton"] = self.tol_newton
+        # The class name is added to the dict for deserialisation purpose
+        # Overwrite the mother class name
+        MagFE_dict["__class__"] = "MagFE"
+        return MagFE_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.Kmesh_fineness = None
+        self.is_get_mesh = None
+        self.is_save_FEA = None
+        self.Rag_enforced = None
+        self.nb_iter_max = None
+        self.tol_newton = None
+        # Set to None the properties inherited from Magnetics
+        super(MagFE, self)._set_None()
+
+    def _get_Kmesh_fineness(self):
+        """getter of Kmesh_fineness"""
+        return self._Kmesh_fineness
+
+    def _set_Kmesh_fineness(self, value):
+        """setter of Kmesh_fineness"""
+        check_var("Kmesh_fineness", value, "float")
+        self._Kmesh_fineness = value
+
+    Kmesh_fineness = property(
+        fget=_get_Kmesh_fineness,
+        fset=_set_Kmesh_fineness,
+        doc=u"""global coefficient to adjust mesh fineness (1 : default , > 1 : finner , < 1 : less fine)
+
+        :Type: float
+        """,
+    )
+
+    def _get_is_get_mesh(self):
+        """getter of is_get_mesh"""
+        return self._is_get_mesh
+
+    def _set_is_get_mesh(self, value):
+        """setter of is_get_mesh"""
+        check_var("is_get_mesh", value, "bool")
+        self._is_get_mesh = value
+
+    is_get_mesh = property(
+        fget=_get_is_get_mesh,
+        fset=_set_is_get_mesh,
+        doc=u"""To save FEA mesh for latter post-procesing 
+
+        :Type: bool
+        """,
+    )
+
+    def _get_is_save_FEA(self):
+        """getter of is_save_FEA"""
+        return self._is_save_FEA
+
+    def _set_is_save_FEA(self, value):
+        """setter of is_save_FEA"""
+        check_var("is_save_FEA", value, "bool")
+        self._is_save_FEA = value
+
+    is_save_FEA = property(
+        fget=_get_is_save_FEA,
+        fset=_set_is_save_FEA,
+        doc=u"""To save FEA mesh and solution in .h5 file
+
+        :Type: bool
+        """,
+    )
+
+    def _get_Rag_enforced(self):
+        """getter of Rag_enforced"""
+        return self._Rag_enforced
+
+    def _set_Rag_enforced(self, value):
+        """setter of Rag_enforced"""
+        check_var("Rag_enforced", value, "float")
+        self._Rag_enforced = value
+
+    Rag_enforced = property(
+        fget=_get_Rag_enforced,
+        fset=_set_Rag_enforced,
+        doc=u"""To enforce a different radius value for air-gap outputs
+
+        :Type: float
+        """,
+    )
+
+    def _get_nb_iter_max(self):
+        """getter of nb_iter_max"""
+        return self._nb_iter_max
+
+    def _set_nb_iter_max(self, value):
+        """setter of nb_iter_max"""
+        check_var("nb_iter_max", value, "int", Vmin=1)
+        self._nb_iter_max = value
+
+    nb_iter_max = property(
+        fget=_get_nb_iter_max,
+        fset=_set_nb_iter_max,
+        doc=u"""Maximum number of Newton iterations per time step (nonlinear materials)
+
+        :Type: int
+        :min: 1
+        """,
+    )
+
+    def _get_tol_newton(self):
+        """getter of tol_newton"""
+        return self._tol_newton
+
+    def _set_tol_newton(self, value):
+        """setter of tol_newton"""
+        check_var("tol_newton", value, "float", Vmin=0)
+        self._tol_newton = value
+
+    tol_newton = property(
+        fget=_get_tol_newton,
+        fset=_set_tol_newton,
+        doc=u"""Relative tolerance on the vector potential update to stop the Newton iterations
+
+        :Type: float
+        :min: 0
+        """,
+    )
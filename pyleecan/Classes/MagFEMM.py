@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Magnetics import Magnetics
 
@@ -52,6 +52,11 @@ try:
 except ImportError as error:
     solve_FEMM_parallel = error
 
+try:
+    from ..Methods.Simulation.MagFEMM.solve_FEMM_step import solve_FEMM_step
+except ImportError as error:
+    solve_FEMM_step = error
+
 
 from ._check import InitUnKnowClassError
 from .DXFImport import DXFImport
@@ -143,9 +148,21 @@ class MagFEMM(Magnetics):
         )
     else:
         solve_FEMM_parallel = solve_FEMM_parallel
+    # cf Methods.Simulation.MagFEMM.solve_FEMM_step
+    if isinstance(solve_FEMM_step, ImportError):
+        solve_FEMM_step = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MagFEMM method solve_FEMM_step: " + str(solve_FEMM_step)
+                )
+            )
+        )
+    else:
+        solve_FEMM_step = solve_FEMM_step
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -166,6 +183,7 @@ class MagFEMM(Magnetics):
         is_close_femm=True,
         nb_worker=1,
         Rag_enforced=None,
+        is_batch_airgap=True,
         is_remove_slotS=False,
         is_remove_slotR=False,
         is_remove_vent=False,
@@ -196,59 +214,61 @@ class MagFEMM(Magnetics):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Kmesh_fineness" in list(init_dict.keys()):
+            if "Kmesh_fineness" in init_dict:
                 Kmesh_fineness = init_dict["Kmesh_fineness"]
-            if "Kgeo_fineness" in list(init_dict.keys()):
+            if "Kgeo_fineness" in init_dict:
                 Kgeo_fineness = init_dict["Kgeo_fineness"]
-            if "type_calc_leakage" in list(init_dict.keys()):
+            if "type_calc_leakage" in init_dict:
                 type_calc_leakage = init_dict["type_calc_leakage"]
-            if "file_name" in list(init_dict.keys()):
+            if "file_name" in init_dict:
                 file_name = init_dict["file_name"]
-            if "FEMM_dict_enforced" in list(init_dict.keys()):
+            if "FEMM_dict_enforced" in init_dict:
                 FEMM_dict_enforced = init_dict["FEMM_dict_enforced"]
-            if "is_get_mesh" in list(init_dict.keys()):
+            if "is_get_mesh" in init_dict:
                 is_get_mesh = init_dict["is_get_mesh"]
-            if "is_save_FEA" in list(init_dict.keys()):
+            if "is_save_FEA" in init_dict:
                 is_save_FEA = init_dict["is_save_FEA"]
-            if "is_sliding_band" in list(init_dict.keys()):
+            if "is_sliding_band" in init_dict:
                 is_sliding_band = init_dict["is_sliding_band"]
-            if "transform_list" in list(init_dict.keys()):
+            if "transform_list" in init_dict:
                 transform_list = init_dict["transform_list"]
-            if "rotor_dxf" in list(init_dict.keys()):
+            if "rotor_dxf" in init_dict:
                 rotor_dxf = init_dict["rotor_dxf"]
-            if "stator_dxf" in list(init_dict.keys()):
+            if "stator_dxf" in init_dict:
                 stator_dxf = init_dict["stator_dxf"]
-            if "import_file" in list(init_dict.keys()):
+            if "import_file" in init_dict:
                 import_file = init_dict["import_file"]
-            if "is_close_femm" in list(init_dict.keys()):
+            if "is_close_femm" in init_dict:
                 is_close_femm = init_dict["is_close_femm"]
-            if "nb_worker" in list(init_dict.keys()):
+            if "nb_worker" in init_dict:
                 nb_worker = init_dict["nb_worker"]
-            if "Rag_enforced" in list(init_dict.keys()):
+            if "Rag_enforced" in init_dict:
                 Rag_enforced = init_dict["Rag_enforced"]
-            if "is_remove_slotS" in list(init_dict.keys()):
+            if "is_batch_airgap" in init_dict:
+                is_batch_airgap = init_dict["is_batch_airgap"]
+            if "is_remove_slotS" in init_dict:
                 is_remove_slotS = init_dict["is_remove_slotS"]
-            if "is_remove_slotR" in list(init_dict.keys()):
+            if "is_remove_slotR" in init_dict:
                 is_remove_slotR = init_dict["is_remove_slotR"]
-            if "is_remove_vent" in list(init_dict.keys()):
+            if "is_remove_vent" in init_dict:
                 is_remove_vent = init_dict["is_remove_vent"]
-            if "is_mmfs" in list(init_dict.keys()):
+            if "is_mmfs" in init_dict:
                 is_mmfs = init_dict["is_mmfs"]
-            if "is_mmfr" in list(init_dict.keys()):
+            if "is_mmfr" in init_dict:
                 is_mmfr = init_dict["is_mmfr"]
-            if "type_BH_stator" in list(init_dict.keys()):
+            if "type_BH_stator" in init_dict:
                 type_BH_stator = init_dict["type_BH_stator"]
-            if "type_BH_rotor" in list(init_dict.keys()):
+            if "type_BH_rotor" in init_dict:
                 type_BH_rotor = init_dict["type_BH_rotor"]
-            if "is_periodicity_t" in list(init_dict.keys()):
+            if "is_periodicity_t" in init_dict:
                 is_periodicity_t = init_dict["is_periodicity_t"]
-            if "is_periodicity_a" in list(init_dict.keys()):
+            if "is_periodicity_a" in init_dict:
                 is_periodicity_a = init_dict["is_periodicity_a"]
-            if "angle_stator_shift" in list(init_dict.keys()):
+            if "angle_stator_shift" in init_dict:
                 angle_stator_shift = init_dict["angle_stator_shift"]
-            if "angle_rotor_shift" in list(init_dict.keys()):
+            if "angle_rotor_shift" in init_dict:
                 angle_rotor_shift = init_dict["angle_rotor_shift"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.Kmesh_fineness = Kmesh_fineness
@@ -266,6 +286,7 @@ class MagFEMM(Magnetics):
         self.is_close_femm = is_close_femm
         self.nb_worker = nb_worker
         self.Rag_enforced = Rag_enforced
+        self.is_batch_airgap = is_batch_airgap
         # Call Magnetics init
         super(MagFEMM, self).__init__(
             is_remove_slotS=is_remove_slotS,
@@ -320,6 +341,7 @@ class MagFEMM(Magnetics):
         MagFEMM_str += "is_close_femm = " + str(self.is_close_femm) + linesep
         MagFEMM_str += "nb_worker = " + str(self.nb_worker) + linesep
         MagFEMM_str += "Rag_enforced = " + str(self.Rag_enforced) + linesep
+        MagFEMM_str += "is_batch_airgap = " + str(self.is_batch_airgap) + linesep
         return MagFEMM_str
 
     def __eq__(self, other):
@@ -361,6 +383,8 @@ class MagFEMM(Magnetics):
             return False
         if other.Rag_enforced != self.Rag_enforced:
             return False
+        if other.is_batch_airgap != self.is_batch_airgap:
+            return False
         return True
 
     def __sizeof__(self):
@@ -389,13 +413,21 @@ class MagFEMM(Magnetics):
         S += getsizeof(self.is_close_femm)
         S += getsizeof(self.nb_worker)
         S += getsizeof(self.Rag_enforced)
+        S += getsizeof(self.is_batch_airgap)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Magnetics
-        MagFEMM_dict = super(MagFEMM, self).as_dict()
+        MagFEMM_dict = super(MagFEMM, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         MagFEMM_dict["Kmesh_fineness"] = self.Kmesh_fineness
         MagFEMM_dict["Kgeo_fineness"] = self.Kgeo_fineness
         MagFEMM_dict["type_calc_leakage"] = self.type_calc_leakage
@@ -414,15 +446,20 @@ class MagFEMM(Magnetics):
         if self.rotor_dxf is None:
             MagFEMM_dict["rotor_dxf"] = None
         else:
-            MagFEMM_dict["rotor_dxf"] = self.rotor_dxf.as_dict()
+            MagFEMM_dict["rotor_dxf"] = child_as_dict(
+                self.rotor_dxf, type_handle_ndarray, **kwargs
+            )
         if self.stator_dxf is None:
             MagFEMM_dict["stator_dxf"] = None
         else:
-            MagFEMM_dict["stator_dxf"] = self.stator_dxf.as_dict()
+            MagFEMM_dict["stator_dxf"] = child_as_dict(
+                self.stator_dxf, type_handle_ndarray, **kwargs
+            )
         MagFEMM_dict["import_file"] = self.import_file
         MagFEMM_dict["is_close_femm"] = self.is_close_femm
         MagFEMM_dict["nb_worker"] = self.nb_worker
         MagFEMM_dict["Rag_enforced"] = self.Rag_enforced
+        MagFEMM_dict["is_batch_airgap"] = self.is_batch_airgap
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         MagFEMM_dict["__class__"] = "MagFEMM"
@@ -448,6 +485,7 @@ class MagFEMM(Magnetics):
         self.is_close_femm = None
         self.nb_worker = None
         self.Rag_enforced = None
+        self.is_batch_airgap = None
         # Set to None the properties inherited from Magnetics
         super(MagFEMM, self)._set_None()
 
@@ -750,3 +788,21 @@ class MagFEMM(Magnetics):
         :Type: float
         """,
     )
+
+    def _get_is_batch_airgap(self):
+        """getter of is_batch_airgap"""
+        return self._is_batch_airgap
+
+    def _set_is_batch_airgap(self, value):
+        """setter of is_batch_airgap"""
+        check_var("is_batch_airgap", value, "bool")
+        self._is_batch_airgap = value
+
+    is_batch_airgap = property(
+        fget=_get_is_batch_airgap,
+        fset=_set_is_batch_airgap,
+        doc=u"""True to get the airgap flux density of each time step with a single LUA script call (else one FEMM call per angle)
+
+        :Type: bool
+        """,
+    )
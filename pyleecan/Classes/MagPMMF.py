@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# File generated according to Generator/ClassesRef/Simulation/MagPMMF.csv
+# WARNING! All changes made in this file will be lost!
+"""Method code available at https://github.com/Eomys/pyleecan/tree/master/pyleecan/Methods/Simulation/MagPMMF
+"""
+
+from os import linesep
+from sys import getsizeof
+from logging import getLogger
+from ._check import check_var, raise_
+from ..Functions.get_logger import get_logger
+from ..Functions.save import save
+from ..Functions.copy import copy
+from ..Functions.load import load_init_dict, from_dict_trusted
+from ..Functions.Load.import_class import import_class
+from .Magnetics import Magnetics
+
+# Import all class method
+# Try/catch to remove unnecessary dependencies in unused method
+try:
+    from ..Methods.Simulation.MagPMMF.comp_flux_airgap import comp_flux_airgap
+except ImportError as error:
+    comp_flux_airgap = error
+
+try:
+    from ..Methods.Simulation.MagPMMF.comp_slot_gap import comp_slot_gap
+except ImportError as error:
+    comp_slot_gap = error
+
+try:
+    from ..Methods.Simulation.MagPMMF.comp_magnet_mmf import comp_magnet_mmf
+except ImportError as error:
+    comp_magnet_mmf = error
+
+try:
+    from ..Methods.Simulation.MagPMMF.comp_iron_gap import comp_iron_gap
+except ImportError as error:
+    comp_iron_gap = error
+
+
+from ._check import InitUnKnowClassError
+
+
+class MagPMMF(Magnetics):
+    """Magnetic module: analytical permeance x magnetomotive force model (fast screening of designs)"""
+
+    VERSION = 1
+
+    # Check ImportError to remove unnecessary dependencies in unused method
+    # cf Methods.Simulation.MagPMMF.comp_flux_airgap
+    if isinstance(comp_flux_airgap, ImportError):
+        comp_flux_airgap = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MagPMMF method comp_flux_airgap: "
+                    + str(comp_flux_airgap)
+                )
+            )
+        )
+    else:
+        comp_flux_airgap = comp_flux_airgap
+    # cf Methods.Simulation.MagPMMF.comp_slot_gap
+    if isinstance(comp_slot_gap, ImportError):
+        comp_slot_gap = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MagPMMF method comp_slot_gap: " + str(comp_slot_gap)
+                )
+            )
+        )
+    else:
+        comp_slot_gap = comp_slot_gap
+    # cf Methods.Simulation.MagPMMF.comp_magnet_mmf
+    if isinstance(comp_magnet_mmf, ImportError):
+        comp_magnet_mmf = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MagPMMF method comp_magnet_mmf: " + str(comp_magnet_mmf)
+                )
+            )
+        )
+    else:
+        comp_magnet_mmf = comp_magnet_mmf
+    # cf Methods.Simulation.MagPMMF.comp_iron_gap
+    if isinstance(comp_iron_gap, ImportError):
+        comp_iron_gap = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MagPMMF method comp_iron_gap: " + str(comp_iron_gap)
+                )
+            )
+        )
+    else:
+        comp_iron_gap = comp_iron_gap
+    # save and copy methods are available in all object
+    save = save
+    copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
+    # get_logger method is available in all object
+    get_logger = get_logger
+
+    def __init__(
+        self,
+        Rag_enforced=None,
+        is_slotting=True,
+        is_remove_slotS=False,
+        is_remove_slotR=False,
+        is_remove_vent=False,
+        is_mmfs=True,
+        is_mmfr=True,
+        type_BH_stator=0,
+        type_BH_rotor=0,
+        is_periodicity_t=False,
+        is_periodicity_a=False,
+        angle_stator_shift=0,
+        angle_rotor_shift=0,
+        logger_name="Pyleecan.Magnetics",
+        init_dict=None,
+        init_str=None,
+    ):
+        """Constructor of the class. Can be use in three ways :
+        - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
+            for pyleecan type, -1 will call the default constructor
+        - __init__ (init_dict = d) d must be a dictionnary with property names as keys
+        - __init__ (init_str = s) s must be a string
+        s is the file path to load
+
+        ndarray or list can be given for Vector and Matrix
+        object or dict can be given for pyleecan Object"""
+
+        if init_str is not None:  # Load from a file
+            init_dict = load_init_dict(init_str)[1]
+        if init_dict is not None:  # Initialisation by dict
+            assert type(init_dict) is dict
+            # Overwrite default value with init_dict content
+            if "Rag_enforced" in init_dict:
+                Rag_enforced = init_dict["Rag_enforced"]
+            if "is_slotting" in init_dict:
+                is_slotting = init_dict["is_slotting"]
+            if "is_remove_slotS" in init_dict:
+                is_remove_slotS = init_dict["is_remove_slotS"]
+            if "is_remove_slotR" in init_dict:
+                is_remove_slotR = init_dict["is_remove_slotR"]
+            if "is_remove_vent" in init_dict:
+                is_remove_vent = init_dict["is_remove_vent"]
+            if "is_mmfs" in init_dict:
+                is_mmfs = init_dict["is_mmfs"]
+            if "is_mmfr" in init_dict:
+                is_mmfr = init_dict["is_mmfr"]
+            if "type_BH_stator" in init_dict:
+                type_BH_stator = init_dict["type_BH_stator"]
+            if "type_BH_rotor" in init_dict:
+                type_BH_rotor = init_dict["type_BH_rotor"]
+            if "is_periodicity_t" in init_dict:
+                is_periodicity_t = init_dict["is_periodicity_t"]
+            if "is_periodicity_a" in init_dict:
+                is_periodicity_a = init_dict["is_periodicity_a"]
+            if "angle_stator_shift" in init_dict:
+                angle_stator_shift = init_dict["angle_stator_shift"]
+            if "angle_rotor_shift" in init_dict:
+                angle_rotor_shift = init_dict["angle_rotor_shift"]
+            if "logger_name" in init_dict:
+                logger_name = init_dict["logger_name"]
+        # Set the properties (value check and convertion are done in setter)
+        self.Rag_enforced = Rag_enforced
+        self.is_slotting = is_slotting
+        # Call Magnetics init
+        super(MagPMMF, self).__init__(
+            is_remove_slotS=is_remove_slotS,
+            is_remove_slotR=is_remove_slotR,
+            is_remove_vent=is_remove_vent,
+            is_mmfs=is_mmfs,
+            is_mmfr=is_mmfr,
+            type_BH_stator=type_BH_stator,
+            type_BH_rotor=type_BH_rotor,
+            is_periodicity_t=is_periodicity_t,
+            is_periodicity_a=is_periodicity_a,
+            angle_stator_shift=angle_stator_shift,
+            angle_rotor_shift=angle_rotor_shift,
+            logger_name=logger_name,
+        )
+        # The class is frozen (in Magnetics init), for now it's impossible to
+        # add new properties
+
+    def __str__(self):
+        """Convert this object in a readeable string (for print)"""
+
+        MagPMMF_str = ""
+        # Get the properties inherited from Magnetics
+        MagPMMF_str += super(MagPMMF, self).__str__()
+        MagPMMF_str += "Rag_enforced = " + str(self.Rag_enforced) + linesep
+        MagPMMF_str += "is_slotting = " + str(self.is_slotting) + linesep
+        return MagPMMF_str
+
+    def __eq__(self, other):
+        """Compare two objects (skip parent)"""
+
+        if type(other) != type(self):
+            return False
+
+        # Check the properties inherited from Magnetics
+        if not super(MagPMMF, self).__eq__(other):
+            return False
+        if other.Rag_enforced != self.Rag_enforced:
+            return False
+        if other.is_slotting != self.is_slotting:
+            return False
+        return True
+
+    def __sizeof__(self):
+        """Return the size in memory of the object (including all subobject)"""
+
+        S = 0  # Full size of the object
+
+        # Get size of the properties inherited from Magnetics
+        S += super(MagPMMF, self).__sizeof__()
+        S += getsizeof(self.Rag_enforced)
+        S += getsizeof(self.is_slotting)
+        return S
+
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
+
+        # Get the properties inherited from Magnetics
+        MagPMMF_dict = super(MagPMMF, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
+        MagPMMF_dict["Rag_enforced"] = self.Rag_enforced
+        MagPMMF_dict["is_slotting"] = self.is_slotting
+        # The class name is added to the dict for deserialisation purpose
+        # Overwrite the mother class name
+        MagPMMF_dict["__class__"] = "MagPMMF"
+        return MagPMMF_dict
+
+    def _set_None(self):
+        """Set all the properties to None (except pyleecan object)"""
+
+        self.Rag_enforced = None
+        self.is_slotting = None
+        # Set to None the properties inherited from Magnetics
+        super(MagPMMF, self)._set_None()
+
+    def _get_Rag_enforced(self):
+        """getter of Rag_enforced"""
+        return self._Rag_enforced
+
+    def _set_Rag_enforced(self, value):
+        """setter of Rag_enforced"""
+        check_var("Rag_enforced", value, "float")
+        self._Rag_enforced = value
+
+    Rag_enforced = property(
+        fget=_get_Rag_enforced,
+        fset=_set_Rag_enforced,
+        doc=u"""To enforce a different radius value for air-gap outputs
+
+        :Type: float
+        """,
+    )
+
+    def _get_is_slotting(self):
+        """getter of is_slotting"""
+        return self._is_slotting
+
+    def _set_is_slotting(self, value):
+        """setter of is_slotting"""
+        check_var("is_slotting", value, "bool")
+        self._is_slotting = value
+
+    is_slotting = property(
+        fget=_get_is_slotting,
+        fset=_set_is_slotting,
+        doc=u"""True to model the permeance of the slot openings (circular flux paths)
+
+        :Type: bool
+        """,
+    )
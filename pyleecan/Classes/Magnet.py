@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -27,6 +27,7 @@ class Magnet(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -53,11 +54,11 @@ class Magnet(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "mat_type" in list(init_dict.keys()):
+            if "mat_type" in init_dict:
                 mat_type = init_dict["mat_type"]
-            if "type_magnetization" in list(init_dict.keys()):
+            if "type_magnetization" in init_dict:
                 type_magnetization = init_dict["type_magnetization"]
-            if "Lmag" in list(init_dict.keys()):
+            if "Lmag" in init_dict:
                 Lmag = init_dict["Lmag"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -107,14 +108,21 @@ class Magnet(FrozenClass):
         S += getsizeof(self.Lmag)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Magnet_dict = dict()
         if self.mat_type is None:
             Magnet_dict["mat_type"] = None
         else:
-            Magnet_dict["mat_type"] = self.mat_type.as_dict()
+            Magnet_dict["mat_type"] = child_as_dict(
+                self.mat_type, type_handle_ndarray, **kwargs
+            )
         Magnet_dict["type_magnetization"] = self.type_magnetization
         Magnet_dict["Lmag"] = self.Lmag
         # The class name is added to the dict for deserialisation purpose
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -58,6 +58,7 @@ class Magnetics(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -93,29 +94,29 @@ class Magnetics(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "is_remove_slotS" in list(init_dict.keys()):
+            if "is_remove_slotS" in init_dict:
                 is_remove_slotS = init_dict["is_remove_slotS"]
-            if "is_remove_slotR" in list(init_dict.keys()):
+            if "is_remove_slotR" in init_dict:
                 is_remove_slotR = init_dict["is_remove_slotR"]
-            if "is_remove_vent" in list(init_dict.keys()):
+            if "is_remove_vent" in init_dict:
                 is_remove_vent = init_dict["is_remove_vent"]
-            if "is_mmfs" in list(init_dict.keys()):
+            if "is_mmfs" in init_dict:
                 is_mmfs = init_dict["is_mmfs"]
-            if "is_mmfr" in list(init_dict.keys()):
+            if "is_mmfr" in init_dict:
                 is_mmfr = init_dict["is_mmfr"]
-            if "type_BH_stator" in list(init_dict.keys()):
+            if "type_BH_stator" in init_dict:
                 type_BH_stator = init_dict["type_BH_stator"]
-            if "type_BH_rotor" in list(init_dict.keys()):
+            if "type_BH_rotor" in init_dict:
                 type_BH_rotor = init_dict["type_BH_rotor"]
-            if "is_periodicity_t" in list(init_dict.keys()):
+            if "is_periodicity_t" in init_dict:
                 is_periodicity_t = init_dict["is_periodicity_t"]
-            if "is_periodicity_a" in list(init_dict.keys()):
+            if "is_periodicity_a" in init_dict:
                 is_periodicity_a = init_dict["is_periodicity_a"]
-            if "angle_stator_shift" in list(init_dict.keys()):
+            if "angle_stator_shift" in init_dict:
                 angle_stator_shift = init_dict["angle_stator_shift"]
-            if "angle_rotor_shift" in list(init_dict.keys()):
+            if "angle_rotor_shift" in init_dict:
                 angle_rotor_shift = init_dict["angle_rotor_shift"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -208,8 +209,13 @@ class Magnetics(FrozenClass):
         S += getsizeof(self.logger_name)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Magnetics_dict = dict()
         Magnetics_dict["is_remove_slotS"] = self.is_remove_slotS
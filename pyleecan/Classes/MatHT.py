@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -26,6 +26,7 @@ class MatHT(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -54,15 +55,15 @@ class MatHT(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "lambda_x" in list(init_dict.keys()):
+            if "lambda_x" in init_dict:
                 lambda_x = init_dict["lambda_x"]
-            if "lambda_y" in list(init_dict.keys()):
+            if "lambda_y" in init_dict:
                 lambda_y = init_dict["lambda_y"]
-            if "lambda_z" in list(init_dict.keys()):
+            if "lambda_z" in init_dict:
                 lambda_z = init_dict["lambda_z"]
-            if "Cp" in list(init_dict.keys()):
+            if "Cp" in init_dict:
                 Cp = init_dict["Cp"]
-            if "alpha" in list(init_dict.keys()):
+            if "alpha" in init_dict:
                 alpha = init_dict["alpha"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -118,8 +119,13 @@ class MatHT(FrozenClass):
         S += getsizeof(self.alpha)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         MatHT_dict = dict()
         MatHT_dict["lambda_x"] = self.lambda_x
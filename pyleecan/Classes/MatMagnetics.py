@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -62,6 +62,7 @@ class MatMagnetics(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -92,19 +93,19 @@ class MatMagnetics(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "mur_lin" in list(init_dict.keys()):
+            if "mur_lin" in init_dict:
                 mur_lin = init_dict["mur_lin"]
-            if "Hc" in list(init_dict.keys()):
+            if "Hc" in init_dict:
                 Hc = init_dict["Hc"]
-            if "Brm20" in list(init_dict.keys()):
+            if "Brm20" in init_dict:
                 Brm20 = init_dict["Brm20"]
-            if "alpha_Br" in list(init_dict.keys()):
+            if "alpha_Br" in init_dict:
                 alpha_Br = init_dict["alpha_Br"]
-            if "Wlam" in list(init_dict.keys()):
+            if "Wlam" in init_dict:
                 Wlam = init_dict["Wlam"]
-            if "BH_curve" in list(init_dict.keys()):
+            if "BH_curve" in init_dict:
                 BH_curve = init_dict["BH_curve"]
-            if "LossData" in list(init_dict.keys()):
+            if "LossData" in init_dict:
                 LossData = init_dict["LossData"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -180,8 +181,13 @@ class MatMagnetics(FrozenClass):
         S += getsizeof(self.LossData)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         MatMagnetics_dict = dict()
         MatMagnetics_dict["mur_lin"] = self.mur_lin
@@ -192,11 +198,15 @@ class MatMagnetics(FrozenClass):
         if self.BH_curve is None:
             MatMagnetics_dict["BH_curve"] = None
         else:
-            MatMagnetics_dict["BH_curve"] = self.BH_curve.as_dict()
+            MatMagnetics_dict["BH_curve"] = child_as_dict(
+                self.BH_curve, type_handle_ndarray, **kwargs
+            )
         if self.LossData is None:
             MatMagnetics_dict["LossData"] = None
         else:
-            MatMagnetics_dict["LossData"] = self.LossData.as_dict()
+            MatMagnetics_dict["LossData"] = child_as_dict(
+                self.LossData, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         MatMagnetics_dict["__class__"] = "MatMagnetics"
         return MatMagnetics_dict
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -26,6 +26,7 @@ class MatStructural(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -59,25 +60,25 @@ class MatStructural(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "rho" in list(init_dict.keys()):
+            if "rho" in init_dict:
                 rho = init_dict["rho"]
-            if "Ex" in list(init_dict.keys()):
+            if "Ex" in init_dict:
                 Ex = init_dict["Ex"]
-            if "Ey" in list(init_dict.keys()):
+            if "Ey" in init_dict:
                 Ey = init_dict["Ey"]
-            if "Ez" in list(init_dict.keys()):
+            if "Ez" in init_dict:
                 Ez = init_dict["Ez"]
-            if "nu_xy" in list(init_dict.keys()):
+            if "nu_xy" in init_dict:
                 nu_xy = init_dict["nu_xy"]
-            if "nu_xz" in list(init_dict.keys()):
+            if "nu_xz" in init_dict:
                 nu_xz = init_dict["nu_xz"]
-            if "nu_yz" in list(init_dict.keys()):
+            if "nu_yz" in init_dict:
                 nu_yz = init_dict["nu_yz"]
-            if "Gxz" in list(init_dict.keys()):
+            if "Gxz" in init_dict:
                 Gxz = init_dict["Gxz"]
-            if "Gxy" in list(init_dict.keys()):
+            if "Gxy" in init_dict:
                 Gxy = init_dict["Gxy"]
-            if "Gyz" in list(init_dict.keys()):
+            if "Gyz" in init_dict:
                 Gyz = init_dict["Gyz"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -160,8 +161,13 @@ class MatStructural(FrozenClass):
         S += getsizeof(self.Gyz)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         MatStructural_dict = dict()
         MatStructural_dict["rho"] = self.rho
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -30,6 +30,7 @@ class Material(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -62,23 +63,23 @@ class Material(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "is_isotropic" in list(init_dict.keys()):
+            if "is_isotropic" in init_dict:
                 is_isotropic = init_dict["is_isotropic"]
-            if "elec" in list(init_dict.keys()):
+            if "elec" in init_dict:
                 elec = init_dict["elec"]
-            if "mag" in list(init_dict.keys()):
+            if "mag" in init_dict:
                 mag = init_dict["mag"]
-            if "struct" in list(init_dict.keys()):
+            if "struct" in init_dict:
                 struct = init_dict["struct"]
-            if "HT" in list(init_dict.keys()):
+            if "HT" in init_dict:
                 HT = init_dict["HT"]
-            if "eco" in list(init_dict.keys()):
+            if "eco" in init_dict:
                 eco = init_dict["eco"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "path" in list(init_dict.keys()):
+            if "path" in init_dict:
                 path = init_dict["path"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -174,8 +175,13 @@ class Material(FrozenClass):
         S += getsizeof(self.path)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Material_dict = dict()
         Material_dict["name"] = self.name
@@ -183,23 +189,31 @@ class Material(FrozenClass):
         if self.elec is None:
             Material_dict["elec"] = None
         else:
-            Material_dict["elec"] = self.elec.as_dict()
+            Material_dict["elec"] = child_as_dict(
+                self.elec, type_handle_ndarray, **kwargs
+            )
         if self.mag is None:
             Material_dict["mag"] = None
         else:
-            Material_dict["mag"] = self.mag.as_dict()
+            Material_dict["mag"] = child_as_dict(
+                self.mag, type_handle_ndarray, **kwargs
+            )
         if self.struct is None:
             Material_dict["struct"] = None
         else:
-            Material_dict["struct"] = self.struct.as_dict()
+            Material_dict["struct"] = child_as_dict(
+                self.struct, type_handle_ndarray, **kwargs
+            )
         if self.HT is None:
             Material_dict["HT"] = None
         else:
-            Material_dict["HT"] = self.HT.as_dict()
+            Material_dict["HT"] = child_as_dict(self.HT, type_handle_ndarray, **kwargs)
         if self.eco is None:
             Material_dict["eco"] = None
         else:
-            Material_dict["eco"] = self.eco.as_dict()
+            Material_dict["eco"] = child_as_dict(
+                self.eco, type_handle_ndarray, **kwargs
+            )
         Material_dict["desc"] = self.desc
         Material_dict["path"] = self.path
         # The class name is added to the dict for deserialisation purpose
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Mesh import Mesh
 
@@ -67,6 +67,36 @@ try:
 except ImportError as error:
     interface = error
 
+try:
+    from ..Methods.Mesh.MeshMat.find_cell_batch import find_cell_batch
+except ImportError as error:
+    find_cell_batch = error
+
+try:
+    from ..Methods.Mesh.MeshMat.get_search_tree import get_search_tree
+except ImportError as error:
+    get_search_tree = error
+
+try:
+    from ..Methods.Mesh.MeshMat.get_adjacency import get_adjacency
+except ImportError as error:
+    get_adjacency = error
+
+try:
+    from ..Methods.Mesh.MeshMat.add_cells import add_cells
+except ImportError as error:
+    add_cells = error
+
+try:
+    from ..Methods.Mesh.MeshMat.get_cell_geometry import get_cell_geometry
+except ImportError as error:
+    get_cell_geometry = error
+
+try:
+    from ..Methods.Mesh.MeshMat.integrate import integrate
+except ImportError as error:
+    integrate = error
+
 
 from ._check import InitUnKnowClassError
 from .CellMat import CellMat
@@ -173,9 +203,73 @@ class MeshMat(Mesh):
         )
     else:
         interface = interface
+    # cf Methods.Mesh.MeshMat.find_cell_batch
+    if isinstance(find_cell_batch, ImportError):
+        find_cell_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MeshMat method find_cell_batch: " + str(find_cell_batch)
+                )
+            )
+        )
+    else:
+        find_cell_batch = find_cell_batch
+    # cf Methods.Mesh.MeshMat.get_search_tree
+    if isinstance(get_search_tree, ImportError):
+        get_search_tree = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MeshMat method get_search_tree: " + str(get_search_tree)
+                )
+            )
+        )
+    else:
+        get_search_tree = get_search_tree
+    # cf Methods.Mesh.MeshMat.get_adjacency
+    if isinstance(get_adjacency, ImportError):
+        get_adjacency = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MeshMat method get_adjacency: " + str(get_adjacency)
+                )
+            )
+        )
+    else:
+        get_adjacency = get_adjacency
+    # cf Methods.Mesh.MeshMat.add_cells
+    if isinstance(add_cells, ImportError):
+        add_cells = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use MeshMat method add_cells: " + str(add_cells))
+            )
+        )
+    else:
+        add_cells = add_cells
+    # cf Methods.Mesh.MeshMat.get_cell_geometry
+    if isinstance(get_cell_geometry, ImportError):
+        get_cell_geometry = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MeshMat method get_cell_geometry: "
+                    + str(get_cell_geometry)
+                )
+            )
+        )
+    else:
+        get_cell_geometry = get_cell_geometry
+    # cf Methods.Mesh.MeshMat.integrate
+    if isinstance(integrate, ImportError):
+        integrate = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use MeshMat method integrate: " + str(integrate))
+            )
+        )
+    else:
+        integrate = integrate
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -197,13 +291,13 @@ class MeshMat(Mesh):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "cell" in list(init_dict.keys()):
+            if "cell" in init_dict:
                 cell = init_dict["cell"]
-            if "point" in list(init_dict.keys()):
+            if "point" in init_dict:
                 point = init_dict["point"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
-            if "dimension" in list(init_dict.keys()):
+            if "dimension" in init_dict:
                 dimension = init_dict["dimension"]
         # Set the properties (value check and convertion are done in setter)
         self.cell = cell
@@ -259,24 +353,35 @@ class MeshMat(Mesh):
         S += getsizeof(self.point)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Mesh
-        MeshMat_dict = super(MeshMat, self).as_dict()
+        MeshMat_dict = super(MeshMat, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.cell is None:
             MeshMat_dict["cell"] = None
         else:
             MeshMat_dict["cell"] = dict()
             for key, obj in self.cell.items():
                 if obj is not None:
-                    MeshMat_dict["cell"][key] = obj.as_dict()
+                    MeshMat_dict["cell"][key] = child_as_dict(
+                        obj, type_handle_ndarray, **kwargs
+                    )
                 else:
                     MeshMat_dict["cell"][key] = None
         if self.point is None:
             MeshMat_dict["point"] = None
         else:
-            MeshMat_dict["point"] = self.point.as_dict()
+            MeshMat_dict["point"] = child_as_dict(
+                self.point, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         MeshMat_dict["__class__"] = "MeshMat"
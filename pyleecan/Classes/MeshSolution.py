@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, _handle_ndarray, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -64,6 +64,11 @@ try:
 except ImportError as error:
     get_group = error
 
+try:
+    from ..Methods.Mesh.MeshSolution.interpolate import interpolate
+except ImportError as error:
+    interpolate = error
+
 
 from numpy import array, array_equal
 from ._check import InitUnKnowClassError
@@ -176,9 +181,21 @@ class MeshSolution(FrozenClass):
         )
     else:
         get_group = get_group
+    # cf Methods.Mesh.MeshSolution.interpolate
+    if isinstance(interpolate, ImportError):
+        interpolate = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use MeshSolution method interpolate: " + str(interpolate)
+                )
+            )
+        )
+    else:
+        interpolate = interpolate
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -208,17 +225,17 @@ class MeshSolution(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
-            if "mesh" in list(init_dict.keys()):
+            if "mesh" in init_dict:
                 mesh = init_dict["mesh"]
-            if "is_same_mesh" in list(init_dict.keys()):
+            if "is_same_mesh" in init_dict:
                 is_same_mesh = init_dict["is_same_mesh"]
-            if "solution" in list(init_dict.keys()):
+            if "solution" in init_dict:
                 solution = init_dict["solution"]
-            if "group" in list(init_dict.keys()):
+            if "group" in init_dict:
                 group = init_dict["group"]
-            if "dimension" in list(init_dict.keys()):
+            if "dimension" in init_dict:
                 dimension = init_dict["dimension"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -312,8 +329,13 @@ class MeshSolution(FrozenClass):
         S += getsizeof(self.dimension)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         MeshSolution_dict = dict()
         MeshSolution_dict["label"] = self.label
@@ -323,7 +345,9 @@ class MeshSolution(FrozenClass):
             MeshSolution_dict["mesh"] = list()
             for obj in self.mesh:
                 if obj is not None:
-                    MeshSolution_dict["mesh"].append(obj.as_dict())
+                    MeshSolution_dict["mesh"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     MeshSolution_dict["mesh"].append(None)
         MeshSolution_dict["is_same_mesh"] = self.is_same_mesh
@@ -333,7 +357,9 @@ class MeshSolution(FrozenClass):
             MeshSolution_dict["solution"] = list()
             for obj in self.solution:
                 if obj is not None:
-                    MeshSolution_dict["solution"].append(obj.as_dict())
+                    MeshSolution_dict["solution"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     MeshSolution_dict["solution"].append(None)
         if self.group is None:
@@ -341,7 +367,9 @@ class MeshSolution(FrozenClass):
         else:
             MeshSolution_dict["group"] = dict()
             for key, obj in self.group.items():
-                MeshSolution_dict["group"][key] = obj.tolist()
+                MeshSolution_dict["group"][key] = _handle_ndarray(
+                    obj, type_handle_ndarray
+                )
         MeshSolution_dict["dimension"] = self.dimension
         # The class name is added to the dict for deserialisation purpose
         MeshSolution_dict["__class__"] = "MeshSolution"
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Mesh import Mesh
 
@@ -158,6 +158,7 @@ class MeshVTK(Mesh):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -192,27 +193,27 @@ class MeshVTK(Mesh):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "mesh" in list(init_dict.keys()):
+            if "mesh" in init_dict:
                 mesh = init_dict["mesh"]
-            if "is_pyvista_mesh" in list(init_dict.keys()):
+            if "is_pyvista_mesh" in init_dict:
                 is_pyvista_mesh = init_dict["is_pyvista_mesh"]
-            if "format" in list(init_dict.keys()):
+            if "format" in init_dict:
                 format = init_dict["format"]
-            if "path" in list(init_dict.keys()):
+            if "path" in init_dict:
                 path = init_dict["path"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "surf" in list(init_dict.keys()):
+            if "surf" in init_dict:
                 surf = init_dict["surf"]
-            if "is_vtk_surf" in list(init_dict.keys()):
+            if "is_vtk_surf" in init_dict:
                 is_vtk_surf = init_dict["is_vtk_surf"]
-            if "surf_path" in list(init_dict.keys()):
+            if "surf_path" in init_dict:
                 surf_path = init_dict["surf_path"]
-            if "surf_name" in list(init_dict.keys()):
+            if "surf_name" in init_dict:
                 surf_name = init_dict["surf_name"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
-            if "dimension" in list(init_dict.keys()):
+            if "dimension" in init_dict:
                 dimension = init_dict["dimension"]
         # Set the properties (value check and convertion are done in setter)
         self.mesh = mesh
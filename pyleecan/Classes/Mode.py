@@ -11,7 +11,7 @@ from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .SolutionMat import SolutionMat
 
@@ -93,6 +93,7 @@ class Mode(SolutionMat):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -126,25 +127,25 @@ class Mode(SolutionMat):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "nat_freq" in list(init_dict.keys()):
+            if "nat_freq" in init_dict:
                 nat_freq = init_dict["nat_freq"]
-            if "order_circ" in list(init_dict.keys()):
+            if "order_circ" in init_dict:
                 order_circ = init_dict["order_circ"]
-            if "order_long" in list(init_dict.keys()):
+            if "order_long" in init_dict:
                 order_long = init_dict["order_long"]
-            if "field" in list(init_dict.keys()):
+            if "field" in init_dict:
                 field = init_dict["field"]
-            if "indice" in list(init_dict.keys()):
+            if "indice" in init_dict:
                 indice = init_dict["indice"]
-            if "axis_name" in list(init_dict.keys()):
+            if "axis_name" in init_dict:
                 axis_name = init_dict["axis_name"]
-            if "axis_size" in list(init_dict.keys()):
+            if "axis_size" in init_dict:
                 axis_size = init_dict["axis_size"]
-            if "type_cell" in list(init_dict.keys()):
+            if "type_cell" in init_dict:
                 type_cell = init_dict["type_cell"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
-            if "dimension" in list(init_dict.keys()):
+            if "dimension" in init_dict:
                 dimension = init_dict["dimension"]
         # Set the properties (value check and convertion are done in setter)
         self.nat_freq = nat_freq
@@ -203,11 +204,18 @@ class Mode(SolutionMat):
         S += getsizeof(self.order_long)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from SolutionMat
-        Mode_dict = super(Mode, self).as_dict()
+        Mode_dict = super(Mode, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         Mode_dict["nat_freq"] = self.nat_freq
         Mode_dict["order_circ"] = self.order_circ
         Mode_dict["order_long"] = self.order_long
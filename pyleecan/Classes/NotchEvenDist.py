@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Notch import Notch
 
@@ -47,6 +47,7 @@ class NotchEvenDist(Notch):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -66,9 +67,9 @@ class NotchEvenDist(Notch):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "alpha" in list(init_dict.keys()):
+            if "alpha" in init_dict:
                 alpha = init_dict["alpha"]
-            if "notch_shape" in list(init_dict.keys()):
+            if "notch_shape" in init_dict:
                 notch_shape = init_dict["notch_shape"]
         # Set the properties (value check and convertion are done in setter)
         self.alpha = alpha
@@ -120,16 +121,25 @@ class NotchEvenDist(Notch):
         S += getsizeof(self.notch_shape)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Notch
-        NotchEvenDist_dict = super(NotchEvenDist, self).as_dict()
+        NotchEvenDist_dict = super(NotchEvenDist, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         NotchEvenDist_dict["alpha"] = self.alpha
         if self.notch_shape is None:
             NotchEvenDist_dict["notch_shape"] = None
         else:
-            NotchEvenDist_dict["notch_shape"] = self.notch_shape.as_dict()
+            NotchEvenDist_dict["notch_shape"] = child_as_dict(
+                self.notch_shape, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         NotchEvenDist_dict["__class__"] = "NotchEvenDist"
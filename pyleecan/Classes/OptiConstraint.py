@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -31,6 +31,7 @@ class OptiConstraint(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -58,13 +59,13 @@ class OptiConstraint(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "type_const" in list(init_dict.keys()):
+            if "type_const" in init_dict:
                 type_const = init_dict["type_const"]
-            if "value" in list(init_dict.keys()):
+            if "value" in init_dict:
                 value = init_dict["value"]
-            if "get_variable" in list(init_dict.keys()):
+            if "get_variable" in init_dict:
                 get_variable = init_dict["get_variable"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -124,8 +125,13 @@ class OptiConstraint(FrozenClass):
         S += getsizeof(self._get_variable_str)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OptiConstraint_dict = dict()
         OptiConstraint_dict["name"] = self.name
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .ParamExplorer import ParamExplorer
 
@@ -31,6 +31,7 @@ class OptiDesignVar(ParamExplorer):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -61,19 +62,19 @@ class OptiDesignVar(ParamExplorer):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "type_var" in list(init_dict.keys()):
+            if "type_var" in init_dict:
                 type_var = init_dict["type_var"]
-            if "space" in list(init_dict.keys()):
+            if "space" in init_dict:
                 space = init_dict["space"]
-            if "get_value" in list(init_dict.keys()):
+            if "get_value" in init_dict:
                 get_value = init_dict["get_value"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "symbol" in list(init_dict.keys()):
+            if "symbol" in init_dict:
                 symbol = init_dict["symbol"]
-            if "unit" in list(init_dict.keys()):
+            if "unit" in init_dict:
                 unit = init_dict["unit"]
-            if "setter" in list(init_dict.keys()):
+            if "setter" in init_dict:
                 setter = init_dict["setter"]
         # Set the properties (value check and convertion are done in setter)
         self.type_var = type_var
@@ -138,11 +139,18 @@ class OptiDesignVar(ParamExplorer):
         S += getsizeof(self._get_value_str)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from ParamExplorer
-        OptiDesignVar_dict = super(OptiDesignVar, self).as_dict()
+        OptiDesignVar_dict = super(OptiDesignVar, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         OptiDesignVar_dict["type_var"] = self.type_var
         OptiDesignVar_dict["space"] = (
             self.space.copy() if self.space is not None else None
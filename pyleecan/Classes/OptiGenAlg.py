@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .OptiSolver import OptiSolver
 
@@ -33,6 +33,7 @@ class OptiGenAlg(OptiSolver):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -49,6 +50,11 @@ class OptiGenAlg(OptiSolver):
         xoutput=-1,
         logger_name="Pyleecan.OptiSolver",
         is_keep_all_output=False,
+        nb_proc=1,
+        evaluator=None,
+        cache_size=0,
+        cache_decimals=10,
+        cache_path=None,
         init_dict=None,
         init_str=None,
     ):
@@ -67,28 +73,38 @@ class OptiGenAlg(OptiSolver):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "selector" in list(init_dict.keys()):
+            if "selector" in init_dict:
                 selector = init_dict["selector"]
-            if "crossover" in list(init_dict.keys()):
+            if "crossover" in init_dict:
                 crossover = init_dict["crossover"]
-            if "mutator" in list(init_dict.keys()):
+            if "mutator" in init_dict:
                 mutator = init_dict["mutator"]
-            if "p_cross" in list(init_dict.keys()):
+            if "p_cross" in init_dict:
                 p_cross = init_dict["p_cross"]
-            if "p_mutate" in list(init_dict.keys()):
+            if "p_mutate" in init_dict:
                 p_mutate = init_dict["p_mutate"]
-            if "size_pop" in list(init_dict.keys()):
+            if "size_pop" in init_dict:
                 size_pop = init_dict["size_pop"]
-            if "nb_gen" in list(init_dict.keys()):
+            if "nb_gen" in init_dict:
                 nb_gen = init_dict["nb_gen"]
-            if "problem" in list(init_dict.keys()):
+            if "problem" in init_dict:
                 problem = init_dict["problem"]
-            if "xoutput" in list(init_dict.keys()):
+            if "xoutput" in init_dict:
                 xoutput = init_dict["xoutput"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "is_keep_all_output" in list(init_dict.keys()):
+            if "is_keep_all_output" in init_dict:
                 is_keep_all_output = init_dict["is_keep_all_output"]
+            if "nb_proc" in init_dict:
+                nb_proc = init_dict["nb_proc"]
+            if "evaluator" in init_dict:
+                evaluator = init_dict["evaluator"]
+            if "cache_size" in init_dict:
+                cache_size = init_dict["cache_size"]
+            if "cache_decimals" in init_dict:
+                cache_decimals = init_dict["cache_decimals"]
+            if "cache_path" in init_dict:
+                cache_path = init_dict["cache_path"]
         # Set the properties (value check and convertion are done in setter)
         self.selector = selector
         self.crossover = crossover
@@ -103,6 +119,11 @@ class OptiGenAlg(OptiSolver):
             xoutput=xoutput,
             logger_name=logger_name,
             is_keep_all_output=is_keep_all_output,
+            nb_proc=nb_proc,
+            evaluator=evaluator,
+            cache_size=cache_size,
+            cache_decimals=cache_decimals,
+            cache_path=cache_path,
         )
         # The class is frozen (in OptiSolver init), for now it's impossible to
         # add new properties
@@ -178,11 +199,18 @@ class OptiGenAlg(OptiSolver):
         S += getsizeof(self.nb_gen)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from OptiSolver
-        OptiGenAlg_dict = super(OptiGenAlg, self).as_dict()
+        OptiGenAlg_dict = super(OptiGenAlg, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self._selector_str is not None:
             OptiGenAlg_dict["selector"] = self._selector_str
         else:
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -36,6 +36,7 @@ class OptiProblem(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -66,19 +67,19 @@ class OptiProblem(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "simu" in list(init_dict.keys()):
+            if "simu" in init_dict:
                 simu = init_dict["simu"]
-            if "design_var" in list(init_dict.keys()):
+            if "design_var" in init_dict:
                 design_var = init_dict["design_var"]
-            if "obj_func" in list(init_dict.keys()):
+            if "obj_func" in init_dict:
                 obj_func = init_dict["obj_func"]
-            if "eval_func" in list(init_dict.keys()):
+            if "eval_func" in init_dict:
                 eval_func = init_dict["eval_func"]
-            if "constraint" in list(init_dict.keys()):
+            if "constraint" in init_dict:
                 constraint = init_dict["constraint"]
-            if "preprocessing" in list(init_dict.keys()):
+            if "preprocessing" in init_dict:
                 preprocessing = init_dict["preprocessing"]
-            if "datakeeper_list" in list(init_dict.keys()):
+            if "datakeeper_list" in init_dict:
                 datakeeper_list = init_dict["datakeeper_list"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -195,21 +196,30 @@ class OptiProblem(FrozenClass):
                 S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OptiProblem_dict = dict()
         if self.simu is None:
             OptiProblem_dict["simu"] = None
         else:
-            OptiProblem_dict["simu"] = self.simu.as_dict()
+            OptiProblem_dict["simu"] = child_as_dict(
+                self.simu, type_handle_ndarray, **kwargs
+            )
         if self.design_var is None:
             OptiProblem_dict["design_var"] = None
         else:
             OptiProblem_dict["design_var"] = list()
             for obj in self.design_var:
                 if obj is not None:
-                    OptiProblem_dict["design_var"].append(obj.as_dict())
+                    OptiProblem_dict["design_var"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     OptiProblem_dict["design_var"].append(None)
         if self.obj_func is None:
@@ -218,7 +228,9 @@ class OptiProblem(FrozenClass):
             OptiProblem_dict["obj_func"] = list()
             for obj in self.obj_func:
                 if obj is not None:
-                    OptiProblem_dict["obj_func"].append(obj.as_dict())
+                    OptiProblem_dict["obj_func"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     OptiProblem_dict["obj_func"].append(None)
         if self._eval_func_str is not None:
@@ -231,7 +243,9 @@ class OptiProblem(FrozenClass):
             OptiProblem_dict["constraint"] = list()
             for obj in self.constraint:
                 if obj is not None:
-                    OptiProblem_dict["constraint"].append(obj.as_dict())
+                    OptiProblem_dict["constraint"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     OptiProblem_dict["constraint"].append(None)
         if self._preprocessing_str is not None:
@@ -244,7 +258,9 @@ class OptiProblem(FrozenClass):
             OptiProblem_dict["datakeeper_list"] = list()
             for obj in self.datakeeper_list:
                 if obj is not None:
-                    OptiProblem_dict["datakeeper_list"].append(obj.as_dict())
+                    OptiProblem_dict["datakeeper_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     OptiProblem_dict["datakeeper_list"].append(None)
         # The class name is added to the dict for deserialisation purpose
@@ -10,11 +10,16 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
+from ntpath import basename
+from os.path import isfile
+from ._check import CheckTypeError
+import numpy as np
+import random
 from ._check import InitUnKnowClassError
 from .OptiProblem import OptiProblem
 from .XOutput import XOutput
@@ -28,6 +33,7 @@ class OptiSolver(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -37,6 +43,11 @@ class OptiSolver(FrozenClass):
         xoutput=-1,
         logger_name="Pyleecan.OptiSolver",
         is_keep_all_output=False,
+        nb_proc=1,
+        evaluator=None,
+        cache_size=0,
+        cache_decimals=10,
+        cache_path=None,
         init_dict=None,
         init_str=None,
     ):
@@ -55,20 +66,35 @@ class OptiSolver(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "problem" in list(init_dict.keys()):
+            if "problem" in init_dict:
                 problem = init_dict["problem"]
-            if "xoutput" in list(init_dict.keys()):
+            if "xoutput" in init_dict:
                 xoutput = init_dict["xoutput"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "is_keep_all_output" in list(init_dict.keys()):
+            if "is_keep_all_output" in init_dict:
                 is_keep_all_output = init_dict["is_keep_all_output"]
+            if "nb_proc" in init_dict:
+                nb_proc = init_dict["nb_proc"]
+            if "evaluator" in init_dict:
+                evaluator = init_dict["evaluator"]
+            if "cache_size" in init_dict:
+                cache_size = init_dict["cache_size"]
+            if "cache_decimals" in init_dict:
+                cache_decimals = init_dict["cache_decimals"]
+            if "cache_path" in init_dict:
+                cache_path = init_dict["cache_path"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.problem = problem
         self.xoutput = xoutput
         self.logger_name = logger_name
         self.is_keep_all_output = is_keep_all_output
+        self.nb_proc = nb_proc
+        self.evaluator = evaluator
+        self.cache_size = cache_size
+        self.cache_decimals = cache_decimals
+        self.cache_path = cache_path
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -95,6 +121,16 @@ class OptiSolver(FrozenClass):
         OptiSolver_str += (
             "is_keep_all_output = " + str(self.is_keep_all_output) + linesep
         )
+        OptiSolver_str += "nb_proc = " + str(self.nb_proc) + linesep
+        if self._evaluator_str is not None:
+            OptiSolver_str += "evaluator = " + self._evaluator_str + linesep
+        elif self._evaluator_func is not None:
+            OptiSolver_str += "evaluator = " + str(self._evaluator_func) + linesep
+        else:
+            OptiSolver_str += "evaluator = None" + linesep + linesep
+        OptiSolver_str += "cache_size = " + str(self.cache_size) + linesep
+        OptiSolver_str += "cache_decimals = " + str(self.cache_decimals) + linesep
+        OptiSolver_str += 'cache_path = "' + str(self.cache_path) + '"' + linesep
         return OptiSolver_str
 
     def __eq__(self, other):
@@ -110,6 +146,16 @@ class OptiSolver(FrozenClass):
             return False
         if other.is_keep_all_output != self.is_keep_all_output:
             return False
+        if other.nb_proc != self.nb_proc:
+            return False
+        if other._evaluator_str != self._evaluator_str:
+            return False
+        if other.cache_size != self.cache_size:
+            return False
+        if other.cache_decimals != self.cache_decimals:
+            return False
+        if other.cache_path != self.cache_path:
+            return False
         return True
 
     def __sizeof__(self):
@@ -120,22 +166,44 @@ class OptiSolver(FrozenClass):
         S += getsizeof(self.xoutput)
         S += getsizeof(self.logger_name)
         S += getsizeof(self.is_keep_all_output)
+        S += getsizeof(self.nb_proc)
+        S += getsizeof(self._evaluator_str)
+        S += getsizeof(self.cache_size)
+        S += getsizeof(self.cache_decimals)
+        S += getsizeof(self.cache_path)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OptiSolver_dict = dict()
         if self.problem is None:
             OptiSolver_dict["problem"] = None
         else:
-            OptiSolver_dict["problem"] = self.problem.as_dict()
+            OptiSolver_dict["problem"] = child_as_dict(
+                self.problem, type_handle_ndarray, **kwargs
+            )
         if self.xoutput is None:
             OptiSolver_dict["xoutput"] = None
         else:
-            OptiSolver_dict["xoutput"] = self.xoutput.as_dict()
+            OptiSolver_dict["xoutput"] = child_as_dict(
+                self.xoutput, type_handle_ndarray, **kwargs
+            )
         OptiSolver_dict["logger_name"] = self.logger_name
         OptiSolver_dict["is_keep_all_output"] = self.is_keep_all_output
+        OptiSolver_dict["nb_proc"] = self.nb_proc
+        if self._evaluator_str is not None:
+            OptiSolver_dict["evaluator"] = self._evaluator_str
+        else:
+            OptiSolver_dict["evaluator"] = None
+        OptiSolver_dict["cache_size"] = self.cache_size
+        OptiSolver_dict["cache_decimals"] = self.cache_decimals
+        OptiSolver_dict["cache_path"] = self.cache_path
         # The class name is added to the dict for deserialisation purpose
         OptiSolver_dict["__class__"] = "OptiSolver"
         return OptiSolver_dict
@@ -149,6 +217,11 @@ class OptiSolver(FrozenClass):
             self.xoutput._set_None()
         self.logger_name = None
         self.is_keep_all_output = None
+        self.nb_proc = None
+        self.evaluator = None
+        self.cache_size = None
+        self.cache_decimals = None
+        self.cache_path = None
 
     def _get_problem(self):
         """getter of problem"""
@@ -245,3 +318,112 @@ class OptiSolver(FrozenClass):
         :Type: bool
         """,
     )
+
+    def _get_nb_proc(self):
+        """getter of nb_proc"""
+        return self._nb_proc
+
+    def _set_nb_proc(self, value):
+        """setter of nb_proc"""
+        check_var("nb_proc", value, "int", Vmin=0)
+        self._nb_proc = value
+
+    nb_proc = property(
+        fget=_get_nb_proc,
+        fset=_set_nb_proc,
+        doc=u"""Number of processes used to evaluate the individuals of a generation (1 to evaluate them one after the other, 0 to use all the cpu)
+
+        :Type: int
+        :min: 0
+        """,
+    )
+
+    def _get_evaluator(self):
+        """getter of evaluator"""
+        return self._evaluator_func
+
+    def _set_evaluator(self, value):
+        """setter of evaluator"""
+        if value is None:
+            self._evaluator_str = None
+            self._evaluator_func = None
+        elif isinstance(value, str) and "lambda" in value:
+            self._evaluator_str = value
+            self._evaluator_func = eval(value)
+        elif isinstance(value, str) and isfile(value) and value[-3:] == ".py":
+            self._evaluator_str = value
+            f = open(value, "r")
+            exec(f.read(), globals())
+            self._evaluator_func = eval(basename(value[:-3]))
+        elif callable(value):
+            self._evaluator_str = None
+            self._evaluator_func = value
+        else:
+            raise CheckTypeError(
+                "For property evaluator Expected function or str (path to python file or lambda), got: "
+                + str(type(value))
+            )
+
+    evaluator = property(
+        fget=_get_evaluator,
+        fset=_set_evaluator,
+        doc=u"""Function evaluator(solver, indiv_list) yielding (index, evaluation_failure) once each individual is evaluated (None: evaluate_serial if nb_proc is 1, evaluate_pool otherwise)
+
+        :Type: function
+        """,
+    )
+
+    def _get_cache_size(self):
+        """getter of cache_size"""
+        return self._cache_size
+
+    def _set_cache_size(self, value):
+        """setter of cache_size"""
+        check_var("cache_size", value, "int", Vmin=0)
+        self._cache_size = value
+
+    cache_size = property(
+        fget=_get_cache_size,
+        fset=_set_cache_size,
+        doc=u"""Maximum number of evaluations stored in the fitness cache (0 to disable the cache, None for no limit)
+
+        :Type: int
+        :min: 0
+        """,
+    )
+
+    def _get_cache_decimals(self):
+        """getter of cache_decimals"""
+        return self._cache_decimals
+
+    def _set_cache_decimals(self, value):
+        """setter of cache_decimals"""
+        check_var("cache_decimals", value, "int")
+        self._cache_decimals = value
+
+    cache_decimals = property(
+        fget=_get_cache_decimals,
+        fset=_set_cache_decimals,
+        doc=u"""Number of decimals of the design variables used to identify the cached evaluations
+
+        :Type: int
+        """,
+    )
+
+    def _get_cache_path(self):
+        """getter of cache_path"""
+        return self._cache_path
+
+    def _set_cache_path(self, value):
+        """setter of cache_path"""
+        check_var("cache_path", value, "str")
+        self._cache_path = value
+
+    cache_path = property(
+        fget=_get_cache_path,
+        fset=_set_cache_path,
+        doc=u"""Path of the file to load and save the fitness cache (None to keep the cache in memory only)
+
+        :Type: str
+        """,
+    )
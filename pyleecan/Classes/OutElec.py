@@ -10,9 +10,10 @@ from logging import getLogger
 from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, copy_data, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from ._frozen import FrozenClass
 
 # Import all class method
@@ -88,6 +89,7 @@ class OutElec(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -129,41 +131,41 @@ class OutElec(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Time" in list(init_dict.keys()):
+            if "Time" in init_dict:
                 Time = init_dict["Time"]
-            if "Angle" in list(init_dict.keys()):
+            if "Angle" in init_dict:
                 Angle = init_dict["Angle"]
-            if "Is" in list(init_dict.keys()):
+            if "Is" in init_dict:
                 Is = init_dict["Is"]
-            if "Ir" in list(init_dict.keys()):
+            if "Ir" in init_dict:
                 Ir = init_dict["Ir"]
-            if "angle_rotor" in list(init_dict.keys()):
+            if "angle_rotor" in init_dict:
                 angle_rotor = init_dict["angle_rotor"]
-            if "N0" in list(init_dict.keys()):
+            if "N0" in init_dict:
                 N0 = init_dict["N0"]
-            if "angle_rotor_initial" in list(init_dict.keys()):
+            if "angle_rotor_initial" in init_dict:
                 angle_rotor_initial = init_dict["angle_rotor_initial"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "Tem_av_ref" in list(init_dict.keys()):
+            if "Tem_av_ref" in init_dict:
                 Tem_av_ref = init_dict["Tem_av_ref"]
-            if "Id_ref" in list(init_dict.keys()):
+            if "Id_ref" in init_dict:
                 Id_ref = init_dict["Id_ref"]
-            if "Iq_ref" in list(init_dict.keys()):
+            if "Iq_ref" in init_dict:
                 Iq_ref = init_dict["Iq_ref"]
-            if "felec" in list(init_dict.keys()):
+            if "felec" in init_dict:
                 felec = init_dict["felec"]
-            if "Ud_ref" in list(init_dict.keys()):
+            if "Ud_ref" in init_dict:
                 Ud_ref = init_dict["Ud_ref"]
-            if "Uq_ref" in list(init_dict.keys()):
+            if "Uq_ref" in init_dict:
                 Uq_ref = init_dict["Uq_ref"]
-            if "Pj_losses" in list(init_dict.keys()):
+            if "Pj_losses" in init_dict:
                 Pj_losses = init_dict["Pj_losses"]
-            if "Pem_av_ref" in list(init_dict.keys()):
+            if "Pem_av_ref" in init_dict:
                 Pem_av_ref = init_dict["Pem_av_ref"]
-            if "Us" in list(init_dict.keys()):
+            if "Us" in init_dict:
                 Us = init_dict["Us"]
-            if "internal" in list(init_dict.keys()):
+            if "internal" in init_dict:
                 internal = init_dict["internal"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -296,30 +298,52 @@ class OutElec(FrozenClass):
         S += getsizeof(self.internal)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OutElec_dict = dict()
         if self.Time is None:
             OutElec_dict["Time"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutElec_dict["Time"] = self.Time.as_dict()
+        else:
+            OutElec_dict["Time"] = copy_data(self.Time, type_handle_ndarray)
         if self.Angle is None:
             OutElec_dict["Angle"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutElec_dict["Angle"] = self.Angle.as_dict()
+        else:
+            OutElec_dict["Angle"] = copy_data(self.Angle, type_handle_ndarray)
         if self.Is is None:
             OutElec_dict["Is"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutElec_dict["Is"] = self.Is.as_dict()
+        else:
+            OutElec_dict["Is"] = copy_data(self.Is, type_handle_ndarray)
         if self.Ir is None:
             OutElec_dict["Ir"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutElec_dict["Ir"] = self.Ir.as_dict()
+        else:
+            OutElec_dict["Ir"] = copy_data(self.Ir, type_handle_ndarray)
         if self.angle_rotor is None:
             OutElec_dict["angle_rotor"] = None
         else:
-            OutElec_dict["angle_rotor"] = self.angle_rotor.tolist()
+            if type_handle_ndarray == 0:
+                OutElec_dict["angle_rotor"] = self.angle_rotor.tolist()
+            elif type_handle_ndarray == 1:
+                OutElec_dict["angle_rotor"] = self.angle_rotor.copy()
+            elif type_handle_ndarray == 2:
+                OutElec_dict["angle_rotor"] = self.angle_rotor
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         OutElec_dict["N0"] = self.N0
         OutElec_dict["angle_rotor_initial"] = self.angle_rotor_initial
         OutElec_dict["logger_name"] = self.logger_name
@@ -333,12 +357,16 @@ class OutElec(FrozenClass):
         OutElec_dict["Pem_av_ref"] = self.Pem_av_ref
         if self.Us is None:
             OutElec_dict["Us"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutElec_dict["Us"] = self.Us.as_dict()
+        else:
+            OutElec_dict["Us"] = copy_data(self.Us, type_handle_ndarray)
         if self.internal is None:
             OutElec_dict["internal"] = None
         else:
-            OutElec_dict["internal"] = self.internal.as_dict()
+            OutElec_dict["internal"] = child_as_dict(
+                self.internal, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         OutElec_dict["__class__"] = "OutElec"
         return OutElec_dict
@@ -476,6 +504,8 @@ class OutElec(FrozenClass):
 
     def _get_angle_rotor(self):
         """getter of angle_rotor"""
+        if isinstance(self._angle_rotor, LazyArray):
+            self._set_angle_rotor(self._angle_rotor.load())
         return self._angle_rotor
 
     def _set_angle_rotor(self, value):
@@ -487,7 +517,8 @@ class OutElec(FrozenClass):
                 value = array(value)
             except:
                 pass
-        check_var("angle_rotor", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("angle_rotor", value, "ndarray")
         self._angle_rotor = value
 
     angle_rotor = property(
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, copy_data, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -24,6 +24,7 @@ except ImportError as error:
 
 
 from ._check import InitUnKnowClassError
+from .AGSFTransfer import AGSFTransfer
 
 
 class OutForce(FrozenClass):
@@ -43,6 +44,7 @@ class OutForce(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -53,6 +55,7 @@ class OutForce(FrozenClass):
         AGSF=None,
         logger_name="Pyleecan.Force",
         Rag=None,
+        AGSF_transfer=None,
         init_dict=None,
         init_str=None,
     ):
@@ -71,16 +74,18 @@ class OutForce(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Time" in list(init_dict.keys()):
+            if "Time" in init_dict:
                 Time = init_dict["Time"]
-            if "Angle" in list(init_dict.keys()):
+            if "Angle" in init_dict:
                 Angle = init_dict["Angle"]
-            if "AGSF" in list(init_dict.keys()):
+            if "AGSF" in init_dict:
                 AGSF = init_dict["AGSF"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "Rag" in list(init_dict.keys()):
+            if "Rag" in init_dict:
                 Rag = init_dict["Rag"]
+            if "AGSF_transfer" in init_dict:
+                AGSF_transfer = init_dict["AGSF_transfer"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.Time = Time
@@ -88,6 +93,7 @@ class OutForce(FrozenClass):
         self.AGSF = AGSF
         self.logger_name = logger_name
         self.Rag = Rag
+        self.AGSF_transfer = AGSF_transfer
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -105,6 +111,15 @@ class OutForce(FrozenClass):
         OutForce_str += "AGSF = " + str(self.AGSF) + linesep + linesep
         OutForce_str += 'logger_name = "' + str(self.logger_name) + '"' + linesep
         OutForce_str += "Rag = " + str(self.Rag) + linesep
+        if self.AGSF_transfer is not None:
+            tmp = (
+                self.AGSF_transfer.__str__()
+                .replace(linesep, linesep + "\t")
+                .rstrip("\t")
+            )
+            OutForce_str += "AGSF_transfer = " + tmp
+        else:
+            OutForce_str += "AGSF_transfer = None" + linesep + linesep
         return OutForce_str
 
     def __eq__(self, other):
@@ -122,6 +137,8 @@ class OutForce(FrozenClass):
             return False
         if other.Rag != self.Rag:
             return False
+        if other.AGSF_transfer != self.AGSF_transfer:
+            return False
         return True
 
     def __sizeof__(self):
@@ -133,26 +150,44 @@ class OutForce(FrozenClass):
         S += getsizeof(self.AGSF)
         S += getsizeof(self.logger_name)
         S += getsizeof(self.Rag)
+        S += getsizeof(self.AGSF_transfer)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OutForce_dict = dict()
         if self.Time is None:
             OutForce_dict["Time"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutForce_dict["Time"] = self.Time.as_dict()
+        else:
+            OutForce_dict["Time"] = copy_data(self.Time, type_handle_ndarray)
         if self.Angle is None:
             OutForce_dict["Angle"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutForce_dict["Angle"] = self.Angle.as_dict()
+        else:
+            OutForce_dict["Angle"] = copy_data(self.Angle, type_handle_ndarray)
         if self.AGSF is None:
             OutForce_dict["AGSF"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutForce_dict["AGSF"] = self.AGSF.as_dict()
+        else:
+            OutForce_dict["AGSF"] = copy_data(self.AGSF, type_handle_ndarray)
         OutForce_dict["logger_name"] = self.logger_name
         OutForce_dict["Rag"] = self.Rag
+        if self.AGSF_transfer is None:
+            OutForce_dict["AGSF_transfer"] = None
+        else:
+            OutForce_dict["AGSF_transfer"] = child_as_dict(
+                self.AGSF_transfer, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         OutForce_dict["__class__"] = "OutForce"
         return OutForce_dict
@@ -165,6 +200,8 @@ class OutForce(FrozenClass):
         self.AGSF = None
         self.logger_name = None
         self.Rag = None
+        if self.AGSF_transfer is not None:
+            self.AGSF_transfer._set_None()
 
     def _get_Time(self):
         """getter of Time"""
@@ -282,3 +319,33 @@ class OutForce(FrozenClass):
         :Type: float
         """,
     )
+
+    def _get_AGSF_transfer(self):
+        """getter of AGSF_transfer"""
+        return self._AGSF_transfer
+
+    def _set_AGSF_transfer(self, value):
+        """setter of AGSF_transfer"""
+        if isinstance(value, str):  # Load from file
+            value = load_init_dict(value)[1]
+        if isinstance(value, dict) and "__class__" in value:
+            class_obj = import_class(
+                "pyleecan.Classes", value.get("__class__"), "AGSF_transfer"
+            )
+            value = class_obj(init_dict=value)
+        elif type(value) is int and value == -1:  # Default constructor
+            value = AGSFTransfer()
+        check_var("AGSF_transfer", value, "AGSFTransfer")
+        self._AGSF_transfer = value
+
+        if self._AGSF_transfer is not None:
+            self._AGSF_transfer.parent = self
+
+    AGSF_transfer = property(
+        fget=_get_AGSF_transfer,
+        fset=_set_AGSF_transfer,
+        doc=u"""Air Gap Surface Force transferred to Force.Rsbo_transfer
+
+        :Type: AGSFTransfer
+        """,
+    )
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -27,6 +27,7 @@ class OutGeo(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -63,31 +64,31 @@ class OutGeo(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "stator" in list(init_dict.keys()):
+            if "stator" in init_dict:
                 stator = init_dict["stator"]
-            if "rotor" in list(init_dict.keys()):
+            if "rotor" in init_dict:
                 rotor = init_dict["rotor"]
-            if "Wgap_mec" in list(init_dict.keys()):
+            if "Wgap_mec" in init_dict:
                 Wgap_mec = init_dict["Wgap_mec"]
-            if "Wgap_mag" in list(init_dict.keys()):
+            if "Wgap_mag" in init_dict:
                 Wgap_mag = init_dict["Wgap_mag"]
-            if "Rgap_mec" in list(init_dict.keys()):
+            if "Rgap_mec" in init_dict:
                 Rgap_mec = init_dict["Rgap_mec"]
-            if "Lgap" in list(init_dict.keys()):
+            if "Lgap" in init_dict:
                 Lgap = init_dict["Lgap"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "angle_offset_initial" in list(init_dict.keys()):
+            if "angle_offset_initial" in init_dict:
                 angle_offset_initial = init_dict["angle_offset_initial"]
-            if "rot_dir" in list(init_dict.keys()):
+            if "rot_dir" in init_dict:
                 rot_dir = init_dict["rot_dir"]
-            if "per_a" in list(init_dict.keys()):
+            if "per_a" in init_dict:
                 per_a = init_dict["per_a"]
-            if "is_antiper_a" in list(init_dict.keys()):
+            if "is_antiper_a" in init_dict:
                 is_antiper_a = init_dict["is_antiper_a"]
-            if "per_t" in list(init_dict.keys()):
+            if "per_t" in init_dict:
                 per_t = init_dict["per_t"]
-            if "is_antiper_t" in list(init_dict.keys()):
+            if "is_antiper_t" in init_dict:
                 is_antiper_t = init_dict["is_antiper_t"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -193,18 +194,27 @@ class OutGeo(FrozenClass):
         S += getsizeof(self.is_antiper_t)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OutGeo_dict = dict()
         if self.stator is None:
             OutGeo_dict["stator"] = None
         else:
-            OutGeo_dict["stator"] = self.stator.as_dict()
+            OutGeo_dict["stator"] = child_as_dict(
+                self.stator, type_handle_ndarray, **kwargs
+            )
         if self.rotor is None:
             OutGeo_dict["rotor"] = None
         else:
-            OutGeo_dict["rotor"] = self.rotor.as_dict()
+            OutGeo_dict["rotor"] = child_as_dict(
+                self.rotor, type_handle_ndarray, **kwargs
+            )
         OutGeo_dict["Wgap_mec"] = self.Wgap_mec
         OutGeo_dict["Wgap_mag"] = self.Wgap_mag
         OutGeo_dict["Rgap_mec"] = self.Rgap_mec
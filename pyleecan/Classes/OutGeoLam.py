@@ -11,8 +11,9 @@ from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from ._frozen import FrozenClass
 
 from numpy import array, array_equal
@@ -27,6 +28,7 @@ class OutGeoLam(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -60,25 +62,25 @@ class OutGeoLam(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "name_phase" in list(init_dict.keys()):
+            if "name_phase" in init_dict:
                 name_phase = init_dict["name_phase"]
-            if "BH_curve" in list(init_dict.keys()):
+            if "BH_curve" in init_dict:
                 BH_curve = init_dict["BH_curve"]
-            if "Ksfill" in list(init_dict.keys()):
+            if "Ksfill" in init_dict:
                 Ksfill = init_dict["Ksfill"]
-            if "S_slot" in list(init_dict.keys()):
+            if "S_slot" in init_dict:
                 S_slot = init_dict["S_slot"]
-            if "S_slot_wind" in list(init_dict.keys()):
+            if "S_slot_wind" in init_dict:
                 S_slot_wind = init_dict["S_slot_wind"]
-            if "S_wind_act" in list(init_dict.keys()):
+            if "S_wind_act" in init_dict:
                 S_wind_act = init_dict["S_wind_act"]
-            if "per_a" in list(init_dict.keys()):
+            if "per_a" in init_dict:
                 per_a = init_dict["per_a"]
-            if "is_antiper_a" in list(init_dict.keys()):
+            if "is_antiper_a" in init_dict:
                 is_antiper_a = init_dict["is_antiper_a"]
-            if "per_t" in list(init_dict.keys()):
+            if "per_t" in init_dict:
                 per_t = init_dict["per_t"]
-            if "is_antiper_t" in list(init_dict.keys()):
+            if "is_antiper_t" in init_dict:
                 is_antiper_t = init_dict["is_antiper_t"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -172,8 +174,13 @@ class OutGeoLam(FrozenClass):
         S += getsizeof(self.is_antiper_t)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OutGeoLam_dict = dict()
         OutGeoLam_dict["name_phase"] = (
@@ -182,7 +189,16 @@ class OutGeoLam(FrozenClass):
         if self.BH_curve is None:
             OutGeoLam_dict["BH_curve"] = None
         else:
-            OutGeoLam_dict["BH_curve"] = self.BH_curve.tolist()
+            if type_handle_ndarray == 0:
+                OutGeoLam_dict["BH_curve"] = self.BH_curve.tolist()
+            elif type_handle_ndarray == 1:
+                OutGeoLam_dict["BH_curve"] = self.BH_curve.copy()
+            elif type_handle_ndarray == 2:
+                OutGeoLam_dict["BH_curve"] = self.BH_curve
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         OutGeoLam_dict["Ksfill"] = self.Ksfill
         OutGeoLam_dict["S_slot"] = self.S_slot
         OutGeoLam_dict["S_slot_wind"] = self.S_slot_wind
@@ -231,6 +247,8 @@ class OutGeoLam(FrozenClass):
 
     def _get_BH_curve(self):
         """getter of BH_curve"""
+        if isinstance(self._BH_curve, LazyArray):
+            self._set_BH_curve(self._BH_curve.load())
         return self._BH_curve
 
     def _set_BH_curve(self, value):
@@ -242,7 +260,8 @@ class OutGeoLam(FrozenClass):
                 value = array(value)
             except:
                 pass
-        check_var("BH_curve", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("BH_curve", value, "ndarray")
         self._BH_curve = value
 
     BH_curve = property(
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -61,6 +61,7 @@ class OutLoss(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -88,13 +89,13 @@ class OutLoss(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "loss_list" in list(init_dict.keys()):
+            if "loss_list" in init_dict:
                 loss_list = init_dict["loss_list"]
-            if "meshsol_list" in list(init_dict.keys()):
+            if "meshsol_list" in init_dict:
                 meshsol_list = init_dict["meshsol_list"]
-            if "loss_index" in list(init_dict.keys()):
+            if "loss_index" in init_dict:
                 loss_index = init_dict["loss_index"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -158,8 +159,13 @@ class OutLoss(FrozenClass):
         S += getsizeof(self.logger_name)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OutLoss_dict = dict()
         if self.loss_list is None:
@@ -168,7 +174,9 @@ class OutLoss(FrozenClass):
             OutLoss_dict["loss_list"] = list()
             for obj in self.loss_list:
                 if obj is not None:
-                    OutLoss_dict["loss_list"].append(obj.as_dict())
+                    OutLoss_dict["loss_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     OutLoss_dict["loss_list"].append(None)
         if self.meshsol_list is None:
@@ -177,7 +185,9 @@ class OutLoss(FrozenClass):
             OutLoss_dict["meshsol_list"] = list()
             for obj in self.meshsol_list:
                 if obj is not None:
-                    OutLoss_dict["meshsol_list"].append(obj.as_dict())
+                    OutLoss_dict["meshsol_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     OutLoss_dict["meshsol_list"].append(None)
         OutLoss_dict["loss_index"] = (
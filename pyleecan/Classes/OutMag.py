@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, copy_data, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -88,6 +88,7 @@ class OutMag(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -125,33 +126,33 @@ class OutMag(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Time" in list(init_dict.keys()):
+            if "Time" in init_dict:
                 Time = init_dict["Time"]
-            if "Angle" in list(init_dict.keys()):
+            if "Angle" in init_dict:
                 Angle = init_dict["Angle"]
-            if "B" in list(init_dict.keys()):
+            if "B" in init_dict:
                 B = init_dict["B"]
-            if "Tem" in list(init_dict.keys()):
+            if "Tem" in init_dict:
                 Tem = init_dict["Tem"]
-            if "Tem_av" in list(init_dict.keys()):
+            if "Tem_av" in init_dict:
                 Tem_av = init_dict["Tem_av"]
-            if "Tem_rip_norm" in list(init_dict.keys()):
+            if "Tem_rip_norm" in init_dict:
                 Tem_rip_norm = init_dict["Tem_rip_norm"]
-            if "Tem_rip_pp" in list(init_dict.keys()):
+            if "Tem_rip_pp" in init_dict:
                 Tem_rip_pp = init_dict["Tem_rip_pp"]
-            if "Phi_wind_stator" in list(init_dict.keys()):
+            if "Phi_wind_stator" in init_dict:
                 Phi_wind_stator = init_dict["Phi_wind_stator"]
-            if "Phi_wind" in list(init_dict.keys()):
+            if "Phi_wind" in init_dict:
                 Phi_wind = init_dict["Phi_wind"]
-            if "emf" in list(init_dict.keys()):
+            if "emf" in init_dict:
                 emf = init_dict["emf"]
-            if "meshsolution" in list(init_dict.keys()):
+            if "meshsolution" in init_dict:
                 meshsolution = init_dict["meshsolution"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "internal" in list(init_dict.keys()):
+            if "internal" in init_dict:
                 internal = init_dict["internal"]
-            if "Rag" in list(init_dict.keys()):
+            if "Rag" in init_dict:
                 Rag = init_dict["Rag"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -268,55 +269,80 @@ class OutMag(FrozenClass):
         S += getsizeof(self.Rag)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OutMag_dict = dict()
         if self.Time is None:
             OutMag_dict["Time"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutMag_dict["Time"] = self.Time.as_dict()
+        else:
+            OutMag_dict["Time"] = copy_data(self.Time, type_handle_ndarray)
         if self.Angle is None:
             OutMag_dict["Angle"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutMag_dict["Angle"] = self.Angle.as_dict()
+        else:
+            OutMag_dict["Angle"] = copy_data(self.Angle, type_handle_ndarray)
         if self.B is None:
             OutMag_dict["B"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutMag_dict["B"] = self.B.as_dict()
+        else:
+            OutMag_dict["B"] = copy_data(self.B, type_handle_ndarray)
         if self.Tem is None:
             OutMag_dict["Tem"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutMag_dict["Tem"] = self.Tem.as_dict()
+        else:
+            OutMag_dict["Tem"] = copy_data(self.Tem, type_handle_ndarray)
         OutMag_dict["Tem_av"] = self.Tem_av
         OutMag_dict["Tem_rip_norm"] = self.Tem_rip_norm
         OutMag_dict["Tem_rip_pp"] = self.Tem_rip_pp
         if self.Phi_wind_stator is None:
             OutMag_dict["Phi_wind_stator"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutMag_dict["Phi_wind_stator"] = self.Phi_wind_stator.as_dict()
+        else:
+            OutMag_dict["Phi_wind_stator"] = copy_data(
+                self.Phi_wind_stator, type_handle_ndarray
+            )
         if self.Phi_wind is None:
             OutMag_dict["Phi_wind"] = None
         else:
             OutMag_dict["Phi_wind"] = dict()
             for key, obj in self.Phi_wind.items():
                 if obj is not None:
-                    OutMag_dict["Phi_wind"][key] = obj.as_dict()
+                    OutMag_dict["Phi_wind"][key] = child_as_dict(
+                        obj, type_handle_ndarray, **kwargs
+                    )
                 else:
                     OutMag_dict["Phi_wind"][key] = None
         if self.emf is None:
             OutMag_dict["emf"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutMag_dict["emf"] = self.emf.as_dict()
+        else:
+            OutMag_dict["emf"] = copy_data(self.emf, type_handle_ndarray)
         if self.meshsolution is None:
             OutMag_dict["meshsolution"] = None
         else:
-            OutMag_dict["meshsolution"] = self.meshsolution.as_dict()
+            OutMag_dict["meshsolution"] = child_as_dict(
+                self.meshsolution, type_handle_ndarray, **kwargs
+            )
         OutMag_dict["logger_name"] = self.logger_name
         if self.internal is None:
             OutMag_dict["internal"] = None
         else:
-            OutMag_dict["internal"] = self.internal.as_dict()
+            OutMag_dict["internal"] = child_as_dict(
+                self.internal, type_handle_ndarray, **kwargs
+            )
         OutMag_dict["Rag"] = self.Rag
         # The class name is added to the dict for deserialisation purpose
         OutMag_dict["__class__"] = "OutMag"
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .OutInternal import OutInternal
 
@@ -43,6 +43,7 @@ class OutMagElmer(OutInternal):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -62,7 +63,7 @@ class OutMagElmer(OutInternal):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "FEA_dict" in list(init_dict.keys()):
+            if "FEA_dict" in init_dict:
                 FEA_dict = init_dict["FEA_dict"]
         # Set the properties (value check and convertion are done in setter)
         self.FEA_dict = FEA_dict
@@ -105,11 +106,18 @@ class OutMagElmer(OutInternal):
                 S += getsizeof(value) + getsizeof(key)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from OutInternal
-        OutMagElmer_dict = super(OutMagElmer, self).as_dict()
+        OutMagElmer_dict = super(OutMagElmer, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         OutMagElmer_dict["FEA_dict"] = (
             self.FEA_dict.copy() if self.FEA_dict is not None else None
         )
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .OutInternal import OutInternal
 
@@ -44,10 +44,18 @@ class OutMagFEMM(OutInternal):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
-    def __init__(self, FEMM_dict=None, handler_list=-1, init_dict=None, init_str=None):
+    def __init__(
+        self,
+        FEMM_dict=None,
+        handler_list=-1,
+        worker_stat=None,
+        init_dict=None,
+        init_str=None,
+    ):
         """Constructor of the class. Can be use in three ways :
         - __init__ (arg1 = 1, arg3 = 5) every parameters have name and default values
             for pyleecan type, -1 will call the default constructor
@@ -63,13 +71,16 @@ class OutMagFEMM(OutInternal):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "FEMM_dict" in list(init_dict.keys()):
+            if "FEMM_dict" in init_dict:
                 FEMM_dict = init_dict["FEMM_dict"]
-            if "handler_list" in list(init_dict.keys()):
+            if "handler_list" in init_dict:
                 handler_list = init_dict["handler_list"]
+            if "worker_stat" in init_dict:
+                worker_stat = init_dict["worker_stat"]
         # Set the properties (value check and convertion are done in setter)
         self.FEMM_dict = FEMM_dict
         self.handler_list = handler_list
+        self.worker_stat = worker_stat
         # Call OutInternal init
         super(OutMagFEMM, self).__init__()
         # The class is frozen (in OutInternal init), for now it's impossible to
@@ -92,6 +103,12 @@ class OutMagFEMM(OutInternal):
             OutMagFEMM_str += (
                 "handler_list[" + str(ii) + "] =" + tmp + linesep + linesep
             )
+        OutMagFEMM_str += (
+            "worker_stat = "
+            + linesep
+            + str(self.worker_stat).replace(linesep, linesep + "\t")
+            + linesep
+        )
         return OutMagFEMM_str
 
     def __eq__(self, other):
@@ -107,6 +124,8 @@ class OutMagFEMM(OutInternal):
             return False
         if other.handler_list != self.handler_list:
             return False
+        if other.worker_stat != self.worker_stat:
+            return False
         return True
 
     def __sizeof__(self):
@@ -122,13 +141,23 @@ class OutMagFEMM(OutInternal):
         if self.handler_list is not None:
             for value in self.handler_list:
                 S += getsizeof(value)
+        if self.worker_stat is not None:
+            for value in self.worker_stat:
+                S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from OutInternal
-        OutMagFEMM_dict = super(OutMagFEMM, self).as_dict()
+        OutMagFEMM_dict = super(OutMagFEMM, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         OutMagFEMM_dict["FEMM_dict"] = (
             self.FEMM_dict.copy() if self.FEMM_dict is not None else None
         )
@@ -138,9 +167,14 @@ class OutMagFEMM(OutInternal):
             OutMagFEMM_dict["handler_list"] = list()
             for obj in self.handler_list:
                 if obj is not None:
-                    OutMagFEMM_dict["handler_list"].append(obj.as_dict())
+                    OutMagFEMM_dict["handler_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     OutMagFEMM_dict["handler_list"].append(None)
+        OutMagFEMM_dict["worker_stat"] = (
+            self.worker_stat.copy() if self.worker_stat is not None else None
+        )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         OutMagFEMM_dict["__class__"] = "OutMagFEMM"
@@ -151,6 +185,7 @@ class OutMagFEMM(OutInternal):
 
         self.FEMM_dict = None
         self.handler_list = None
+        self.worker_stat = None
         # Set to None the properties inherited from OutInternal
         super(OutMagFEMM, self)._set_None()
 
@@ -206,3 +241,23 @@ class OutMagFEMM(OutInternal):
         :Type: [_FEMMHandler]
         """,
     )
+
+    def _get_worker_stat(self):
+        """getter of worker_stat"""
+        return self._worker_stat
+
+    def _set_worker_stat(self, value):
+        """setter of worker_stat"""
+        if type(value) is int and value == -1:
+            value = list()
+        check_var("worker_stat", value, "list")
+        self._worker_stat = value
+
+    worker_stat = property(
+        fget=_get_worker_stat,
+        fset=_set_worker_stat,
+        doc=u"""Statistics of the parallel FEMM workers (nb_task: number of time steps, time: time spent solving, usage: time ratio)
+
+        :Type: list
+        """,
+    )
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -26,6 +26,7 @@ class OutPost(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -45,9 +46,9 @@ class OutPost(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "legend_name" in list(init_dict.keys()):
+            if "legend_name" in init_dict:
                 legend_name = init_dict["legend_name"]
-            if "line_color" in list(init_dict.keys()):
+            if "line_color" in init_dict:
                 line_color = init_dict["line_color"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -88,8 +89,13 @@ class OutPost(FrozenClass):
         S += getsizeof(self.line_color)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OutPost_dict = dict()
         OutPost_dict["legend_name"] = self.legend_name
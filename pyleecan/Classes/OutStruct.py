@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, copy_data, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -27,6 +27,7 @@ class OutStruct(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -60,25 +61,25 @@ class OutStruct(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Time" in list(init_dict.keys()):
+            if "Time" in init_dict:
                 Time = init_dict["Time"]
-            if "Angle" in list(init_dict.keys()):
+            if "Angle" in init_dict:
                 Angle = init_dict["Angle"]
-            if "Nt_tot" in list(init_dict.keys()):
+            if "Nt_tot" in init_dict:
                 Nt_tot = init_dict["Nt_tot"]
-            if "Na_tot" in list(init_dict.keys()):
+            if "Na_tot" in init_dict:
                 Na_tot = init_dict["Na_tot"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "Yr" in list(init_dict.keys()):
+            if "Yr" in init_dict:
                 Yr = init_dict["Yr"]
-            if "Vr" in list(init_dict.keys()):
+            if "Vr" in init_dict:
                 Vr = init_dict["Vr"]
-            if "Ar" in list(init_dict.keys()):
+            if "Ar" in init_dict:
                 Ar = init_dict["Ar"]
-            if "meshsolution" in list(init_dict.keys()):
+            if "meshsolution" in init_dict:
                 meshsolution = init_dict["meshsolution"]
-            if "FEA_dict" in list(init_dict.keys()):
+            if "FEA_dict" in init_dict:
                 FEA_dict = init_dict["FEA_dict"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -169,37 +170,54 @@ class OutStruct(FrozenClass):
                 S += getsizeof(value) + getsizeof(key)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         OutStruct_dict = dict()
         if self.Time is None:
             OutStruct_dict["Time"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutStruct_dict["Time"] = self.Time.as_dict()
+        else:
+            OutStruct_dict["Time"] = copy_data(self.Time, type_handle_ndarray)
         if self.Angle is None:
             OutStruct_dict["Angle"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutStruct_dict["Angle"] = self.Angle.as_dict()
+        else:
+            OutStruct_dict["Angle"] = copy_data(self.Angle, type_handle_ndarray)
         OutStruct_dict["Nt_tot"] = self.Nt_tot
         OutStruct_dict["Na_tot"] = self.Na_tot
         OutStruct_dict["logger_name"] = self.logger_name
         if self.Yr is None:
             OutStruct_dict["Yr"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutStruct_dict["Yr"] = self.Yr.as_dict()
+        else:
+            OutStruct_dict["Yr"] = copy_data(self.Yr, type_handle_ndarray)
         if self.Vr is None:
             OutStruct_dict["Vr"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutStruct_dict["Vr"] = self.Vr.as_dict()
+        else:
+            OutStruct_dict["Vr"] = copy_data(self.Vr, type_handle_ndarray)
         if self.Ar is None:
             OutStruct_dict["Ar"] = None
-        else:
+        elif type_handle_ndarray == 0:
             OutStruct_dict["Ar"] = self.Ar.as_dict()
+        else:
+            OutStruct_dict["Ar"] = copy_data(self.Ar, type_handle_ndarray)
         if self.meshsolution is None:
             OutStruct_dict["meshsolution"] = None
         else:
-            OutStruct_dict["meshsolution"] = self.meshsolution.as_dict()
+            OutStruct_dict["meshsolution"] = child_as_dict(
+                self.meshsolution, type_handle_ndarray, **kwargs
+            )
         OutStruct_dict["FEA_dict"] = (
             self.FEA_dict.copy() if self.FEA_dict is not None else None
         )
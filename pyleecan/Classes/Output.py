@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -268,6 +268,7 @@ class Output(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -301,25 +302,25 @@ class Output(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "simu" in list(init_dict.keys()):
+            if "simu" in init_dict:
                 simu = init_dict["simu"]
-            if "path_result" in list(init_dict.keys()):
+            if "path_result" in init_dict:
                 path_result = init_dict["path_result"]
-            if "geo" in list(init_dict.keys()):
+            if "geo" in init_dict:
                 geo = init_dict["geo"]
-            if "elec" in list(init_dict.keys()):
+            if "elec" in init_dict:
                 elec = init_dict["elec"]
-            if "mag" in list(init_dict.keys()):
+            if "mag" in init_dict:
                 mag = init_dict["mag"]
-            if "struct" in list(init_dict.keys()):
+            if "struct" in init_dict:
                 struct = init_dict["struct"]
-            if "post" in list(init_dict.keys()):
+            if "post" in init_dict:
                 post = init_dict["post"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "force" in list(init_dict.keys()):
+            if "force" in init_dict:
                 force = init_dict["force"]
-            if "loss" in list(init_dict.keys()):
+            if "loss" in init_dict:
                 loss = init_dict["loss"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -432,44 +433,61 @@ class Output(FrozenClass):
         S += getsizeof(self.loss)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Output_dict = dict()
         if self.simu is None:
             Output_dict["simu"] = None
         else:
-            Output_dict["simu"] = self.simu.as_dict()
+            Output_dict["simu"] = child_as_dict(
+                self.simu, type_handle_ndarray, **kwargs
+            )
         Output_dict["path_result"] = self.path_result
         if self.geo is None:
             Output_dict["geo"] = None
         else:
-            Output_dict["geo"] = self.geo.as_dict()
+            Output_dict["geo"] = child_as_dict(self.geo, type_handle_ndarray, **kwargs)
         if self.elec is None:
             Output_dict["elec"] = None
         else:
-            Output_dict["elec"] = self.elec.as_dict()
+            Output_dict["elec"] = child_as_dict(
+                self.elec, type_handle_ndarray, **kwargs
+            )
         if self.mag is None:
             Output_dict["mag"] = None
         else:
-            Output_dict["mag"] = self.mag.as_dict()
+            Output_dict["mag"] = child_as_dict(self.mag, type_handle_ndarray, **kwargs)
         if self.struct is None:
             Output_dict["struct"] = None
         else:
-            Output_dict["struct"] = self.struct.as_dict()
+            Output_dict["struct"] = child_as_dict(
+                self.struct, type_handle_ndarray, **kwargs
+            )
         if self.post is None:
             Output_dict["post"] = None
         else:
-            Output_dict["post"] = self.post.as_dict()
+            Output_dict["post"] = child_as_dict(
+                self.post, type_handle_ndarray, **kwargs
+            )
         Output_dict["logger_name"] = self.logger_name
         if self.force is None:
             Output_dict["force"] = None
         else:
-            Output_dict["force"] = self.force.as_dict()
+            Output_dict["force"] = child_as_dict(
+                self.force, type_handle_ndarray, **kwargs
+            )
         if self.loss is None:
             Output_dict["loss"] = None
         else:
-            Output_dict["loss"] = self.loss.as_dict()
+            Output_dict["loss"] = child_as_dict(
+                self.loss, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         Output_dict["__class__"] = "Output"
         return Output_dict
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .ParamExplorer import ParamExplorer
 
@@ -67,6 +67,7 @@ class ParamExplorerSet(ParamExplorer):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -95,15 +96,15 @@ class ParamExplorerSet(ParamExplorer):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "value" in list(init_dict.keys()):
+            if "value" in init_dict:
                 value = init_dict["value"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "symbol" in list(init_dict.keys()):
+            if "symbol" in init_dict:
                 symbol = init_dict["symbol"]
-            if "unit" in list(init_dict.keys()):
+            if "unit" in init_dict:
                 unit = init_dict["unit"]
-            if "setter" in list(init_dict.keys()):
+            if "setter" in init_dict:
                 setter = init_dict["setter"]
         # Set the properties (value check and convertion are done in setter)
         self.value = value
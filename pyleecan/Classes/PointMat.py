@@ -11,8 +11,9 @@ from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from ._frozen import FrozenClass
 
 # Import all class method
@@ -37,6 +38,16 @@ try:
 except ImportError as error:
     is_exist = error
 
+try:
+    from ..Methods.Mesh.PointMat.add_points import add_points
+except ImportError as error:
+    add_points = error
+
+try:
+    from ..Methods.Mesh.PointMat.get_row import get_row
+except ImportError as error:
+    get_row = error
+
 
 from numpy import array, array_equal
 from ._check import InitUnKnowClassError
@@ -84,9 +95,28 @@ class PointMat(FrozenClass):
         )
     else:
         is_exist = is_exist
+    # cf Methods.Mesh.PointMat.add_points
+    if isinstance(add_points, ImportError):
+        add_points = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use PointMat method add_points: " + str(add_points))
+            )
+        )
+    else:
+        add_points = add_points
+    # cf Methods.Mesh.PointMat.get_row
+    if isinstance(get_row, ImportError):
+        get_row = property(
+            fget=lambda x: raise_(
+                ImportError("Can't use PointMat method get_row: " + str(get_row))
+            )
+        )
+    else:
+        get_row = get_row
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -114,13 +144,13 @@ class PointMat(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "coordinate" in list(init_dict.keys()):
+            if "coordinate" in init_dict:
                 coordinate = init_dict["coordinate"]
-            if "nb_pt" in list(init_dict.keys()):
+            if "nb_pt" in init_dict:
                 nb_pt = init_dict["nb_pt"]
-            if "delta" in list(init_dict.keys()):
+            if "delta" in init_dict:
                 delta = init_dict["delta"]
-            if "indice" in list(init_dict.keys()):
+            if "indice" in init_dict:
                 indice = init_dict["indice"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -183,20 +213,43 @@ class PointMat(FrozenClass):
         S += getsizeof(self.indice)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         PointMat_dict = dict()
         if self.coordinate is None:
             PointMat_dict["coordinate"] = None
         else:
-            PointMat_dict["coordinate"] = self.coordinate.tolist()
+            if type_handle_ndarray == 0:
+                PointMat_dict["coordinate"] = self.coordinate.tolist()
+            elif type_handle_ndarray == 1:
+                PointMat_dict["coordinate"] = self.coordinate.copy()
+            elif type_handle_ndarray == 2:
+                PointMat_dict["coordinate"] = self.coordinate
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         PointMat_dict["nb_pt"] = self.nb_pt
         PointMat_dict["delta"] = self.delta
         if self.indice is None:
             PointMat_dict["indice"] = None
         else:
-            PointMat_dict["indice"] = self.indice.tolist()
+            if type_handle_ndarray == 0:
+                PointMat_dict["indice"] = self.indice.tolist()
+            elif type_handle_ndarray == 1:
+                PointMat_dict["indice"] = self.indice.copy()
+            elif type_handle_ndarray == 2:
+                PointMat_dict["indice"] = self.indice
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         # The class name is added to the dict for deserialisation purpose
         PointMat_dict["__class__"] = "PointMat"
         return PointMat_dict
@@ -211,6 +264,8 @@ class PointMat(FrozenClass):
 
     def _get_coordinate(self):
         """getter of coordinate"""
+        if isinstance(self._coordinate, LazyArray):
+            self._set_coordinate(self._coordinate.load())
         return self._coordinate
 
     def _set_coordinate(self, value):
@@ -222,7 +277,8 @@ class PointMat(FrozenClass):
                 value = array(value)
             except:
                 pass
-        check_var("coordinate", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("coordinate", value, "ndarray")
         self._coordinate = value
 
     coordinate = property(
@@ -272,6 +328,8 @@ class PointMat(FrozenClass):
 
     def _get_indice(self):
         """getter of indice"""
+        if isinstance(self._indice, LazyArray):
+            self._set_indice(self._indice.load())
         return self._indice
 
     def _set_indice(self, value):
@@ -283,7 +341,8 @@ class PointMat(FrozenClass):
                 value = array(value)
             except:
                 pass
-        check_var("indice", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("indice", value, "ndarray")
         self._indice = value
 
     indice = property(
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Surface import Surface
 
@@ -164,6 +164,7 @@ class PolarArc(Surface):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -185,13 +186,13 @@ class PolarArc(Surface):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "angle" in list(init_dict.keys()):
+            if "angle" in init_dict:
                 angle = init_dict["angle"]
-            if "height" in list(init_dict.keys()):
+            if "height" in init_dict:
                 height = init_dict["height"]
-            if "point_ref" in list(init_dict.keys()):
+            if "point_ref" in init_dict:
                 point_ref = init_dict["point_ref"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Set the properties (value check and convertion are done in setter)
         self.angle = angle
@@ -237,11 +238,18 @@ class PolarArc(Surface):
         S += getsizeof(self.height)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Surface
-        PolarArc_dict = super(PolarArc, self).as_dict()
+        PolarArc_dict = super(PolarArc, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         PolarArc_dict["angle"] = self.angle
         PolarArc_dict["height"] = self.height
         # The class name is added to the dict for deserialisation purpose
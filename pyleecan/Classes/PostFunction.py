@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Post import Post
 
@@ -31,6 +31,7 @@ class PostFunction(Post):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -50,7 +51,7 @@ class PostFunction(Post):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "run" in list(init_dict.keys()):
+            if "run" in init_dict:
                 run = init_dict["run"]
         # Set the properties (value check and convertion are done in setter)
         self.run = run
@@ -96,11 +97,18 @@ class PostFunction(Post):
         S += getsizeof(self._run_str)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Post
-        PostFunction_dict = super(PostFunction, self).as_dict()
+        PostFunction_dict = super(PostFunction, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self._run_str is not None:
             PostFunction_dict["run"] = self._run_str
         else:
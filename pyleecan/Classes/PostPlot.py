@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .PostMethod import PostMethod
 
@@ -43,6 +43,7 @@ class PostPlot(PostMethod):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -71,15 +72,15 @@ class PostPlot(PostMethod):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "method" in list(init_dict.keys()):
+            if "method" in init_dict:
                 method = init_dict["method"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "param_list" in list(init_dict.keys()):
+            if "param_list" in init_dict:
                 param_list = init_dict["param_list"]
-            if "param_dict" in list(init_dict.keys()):
+            if "param_dict" in init_dict:
                 param_dict = init_dict["param_dict"]
-            if "save_format" in list(init_dict.keys()):
+            if "save_format" in init_dict:
                 save_format = init_dict["save_format"]
         # Set the properties (value check and convertion are done in setter)
         self.method = method
@@ -149,11 +150,18 @@ class PostPlot(PostMethod):
         S += getsizeof(self.save_format)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from PostMethod
-        PostPlot_dict = super(PostPlot, self).as_dict()
+        PostPlot_dict = super(PostPlot, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         PostPlot_dict["method"] = self.method
         PostPlot_dict["name"] = self.name
         PostPlot_dict["param_list"] = (
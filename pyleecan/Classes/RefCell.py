@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -22,6 +22,16 @@ try:
 except ImportError as error:
     interpolation = error
 
+try:
+    from ..Methods.Mesh.RefCell.is_inside_batch import is_inside_batch
+except ImportError as error:
+    is_inside_batch = error
+
+try:
+    from ..Methods.Mesh.RefCell.jacobian_batch import jacobian_batch
+except ImportError as error:
+    jacobian_batch = error
+
 
 from ._check import InitUnKnowClassError
 
@@ -31,6 +41,7 @@ class RefCell(FrozenClass):
 
     VERSION = 1
 
+    # Check ImportError to remove unnecessary dependencies in unused method
     # cf Methods.Mesh.RefCell.interpolation
     if isinstance(interpolation, ImportError):
         interpolation = property(
@@ -42,9 +53,32 @@ class RefCell(FrozenClass):
         )
     else:
         interpolation = interpolation
+    # cf Methods.Mesh.RefCell.is_inside_batch
+    if isinstance(is_inside_batch, ImportError):
+        is_inside_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefCell method is_inside_batch: " + str(is_inside_batch)
+                )
+            )
+        )
+    else:
+        is_inside_batch = is_inside_batch
+    # cf Methods.Mesh.RefCell.jacobian_batch
+    if isinstance(jacobian_batch, ImportError):
+        jacobian_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefCell method jacobian_batch: " + str(jacobian_batch)
+                )
+            )
+        )
+    else:
+        jacobian_batch = jacobian_batch
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -64,7 +98,7 @@ class RefCell(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "epsilon" in list(init_dict.keys()):
+            if "epsilon" in init_dict:
                 epsilon = init_dict["epsilon"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -100,8 +134,13 @@ class RefCell(FrozenClass):
         S += getsizeof(self.epsilon)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         RefCell_dict = dict()
         RefCell_dict["epsilon"] = self.epsilon
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .RefCell import RefCell
 
@@ -123,6 +123,7 @@ class RefQuad4(RefCell):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -142,7 +143,7 @@ class RefQuad4(RefCell):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "epsilon" in list(init_dict.keys()):
+            if "epsilon" in init_dict:
                 epsilon = init_dict["epsilon"]
         # Set the properties (value check and convertion are done in setter)
         # Call RefCell init
@@ -178,11 +179,18 @@ class RefQuad4(RefCell):
         S += super(RefQuad4, self).__sizeof__()
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from RefCell
-        RefQuad4_dict = super(RefQuad4, self).as_dict()
+        RefQuad4_dict = super(RefQuad4, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         RefQuad4_dict["__class__"] = "RefQuad4"
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .RefCell import RefCell
 
@@ -52,6 +52,16 @@ try:
 except ImportError as error:
     get_normal = error
 
+try:
+    from ..Methods.Mesh.RefSegmentP1.is_inside_batch import is_inside_batch
+except ImportError as error:
+    is_inside_batch = error
+
+try:
+    from ..Methods.Mesh.RefSegmentP1.jacobian_batch import jacobian_batch
+except ImportError as error:
+    jacobian_batch = error
+
 
 from ._check import InitUnKnowClassError
 
@@ -140,9 +150,34 @@ class RefSegmentP1(RefCell):
         )
     else:
         get_normal = get_normal
+    # cf Methods.Mesh.RefSegmentP1.is_inside_batch
+    if isinstance(is_inside_batch, ImportError):
+        is_inside_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefSegmentP1 method is_inside_batch: "
+                    + str(is_inside_batch)
+                )
+            )
+        )
+    else:
+        is_inside_batch = is_inside_batch
+    # cf Methods.Mesh.RefSegmentP1.jacobian_batch
+    if isinstance(jacobian_batch, ImportError):
+        jacobian_batch = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use RefSegmentP1 method jacobian_batch: "
+                    + str(jacobian_batch)
+                )
+            )
+        )
+    else:
+        jacobian_batch = jacobian_batch
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -162,7 +197,7 @@ class RefSegmentP1(RefCell):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "epsilon" in list(init_dict.keys()):
+            if "epsilon" in init_dict:
                 epsilon = init_dict["epsilon"]
         # Set the properties (value check and convertion are done in setter)
         # Call RefCell init
@@ -198,11 +233,18 @@ class RefSegmentP1(RefCell):
         S += super(RefSegmentP1, self).__sizeof__()
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from RefCell
-        RefSegmentP1_dict = super(RefSegmentP1, self).as_dict()
+        RefSegmentP1_dict = super(RefSegmentP1, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         RefSegmentP1_dict["__class__"] = "RefSegmentP1"
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Elmer import Elmer
 
@@ -172,6 +172,7 @@ class Section(Elmer):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -201,17 +202,17 @@ class Section(Elmer):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "section" in list(init_dict.keys()):
+            if "section" in init_dict:
                 section = init_dict["section"]
-            if "id" in list(init_dict.keys()):
+            if "id" in init_dict:
                 id = init_dict["id"]
-            if "comment" in list(init_dict.keys()):
+            if "comment" in init_dict:
                 comment = init_dict["comment"]
-            if "_statements" in list(init_dict.keys()):
+            if "_statements" in init_dict:
                 _statements = init_dict["_statements"]
-            if "_comments" in list(init_dict.keys()):
+            if "_comments" in init_dict:
                 _comments = init_dict["_comments"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.section = section
@@ -276,11 +277,18 @@ class Section(Elmer):
                 S += getsizeof(value) + getsizeof(key)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Elmer
-        Section_dict = super(Section, self).as_dict()
+        Section_dict = super(Section, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         Section_dict["section"] = self.section
         Section_dict["id"] = self.id
         Section_dict["comment"] = self.comment
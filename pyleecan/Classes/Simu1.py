@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Simulation import Simulation
 
@@ -52,6 +52,7 @@ class Simu1(Simulation):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -71,6 +72,8 @@ class Simu1(Simulation):
         postproc_list=-1,
         index=None,
         path_result=None,
+        result_cache_dir=None,
+        result_cache_size=1000,
         init_dict=None,
         init_str=None,
     ):
@@ -89,34 +92,38 @@ class Simu1(Simulation):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "elec" in list(init_dict.keys()):
+            if "elec" in init_dict:
                 elec = init_dict["elec"]
-            if "mag" in list(init_dict.keys()):
+            if "mag" in init_dict:
                 mag = init_dict["mag"]
-            if "struct" in list(init_dict.keys()):
+            if "struct" in init_dict:
                 struct = init_dict["struct"]
-            if "force" in list(init_dict.keys()):
+            if "force" in init_dict:
                 force = init_dict["force"]
-            if "loss" in list(init_dict.keys()):
+            if "loss" in init_dict:
                 loss = init_dict["loss"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "machine" in list(init_dict.keys()):
+            if "machine" in init_dict:
                 machine = init_dict["machine"]
-            if "input" in list(init_dict.keys()):
+            if "input" in init_dict:
                 input = init_dict["input"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "var_simu" in list(init_dict.keys()):
+            if "var_simu" in init_dict:
                 var_simu = init_dict["var_simu"]
-            if "postproc_list" in list(init_dict.keys()):
+            if "postproc_list" in init_dict:
                 postproc_list = init_dict["postproc_list"]
-            if "index" in list(init_dict.keys()):
+            if "index" in init_dict:
                 index = init_dict["index"]
-            if "path_result" in list(init_dict.keys()):
+            if "path_result" in init_dict:
                 path_result = init_dict["path_result"]
+            if "result_cache_dir" in init_dict:
+                result_cache_dir = init_dict["result_cache_dir"]
+            if "result_cache_size" in init_dict:
+                result_cache_size = init_dict["result_cache_size"]
         # Set the properties (value check and convertion are done in setter)
         self.elec = elec
         self.mag = mag
@@ -134,6 +141,8 @@ class Simu1(Simulation):
             postproc_list=postproc_list,
             index=index,
             path_result=path_result,
+            result_cache_dir=result_cache_dir,
+            result_cache_size=result_cache_size,
         )
         # The class is frozen (in Simulation init), for now it's impossible to
         # add new properties
@@ -206,31 +215,42 @@ class Simu1(Simulation):
         S += getsizeof(self.loss)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Simulation
-        Simu1_dict = super(Simu1, self).as_dict()
+        Simu1_dict = super(Simu1, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.elec is None:
             Simu1_dict["elec"] = None
         else:
-            Simu1_dict["elec"] = self.elec.as_dict()
+            Simu1_dict["elec"] = child_as_dict(self.elec, type_handle_ndarray, **kwargs)
         if self.mag is None:
             Simu1_dict["mag"] = None
         else:
-            Simu1_dict["mag"] = self.mag.as_dict()
+            Simu1_dict["mag"] = child_as_dict(self.mag, type_handle_ndarray, **kwargs)
         if self.struct is None:
             Simu1_dict["struct"] = None
         else:
-            Simu1_dict["struct"] = self.struct.as_dict()
+            Simu1_dict["struct"] = child_as_dict(
+                self.struct, type_handle_ndarray, **kwargs
+            )
         if self.force is None:
             Simu1_dict["force"] = None
         else:
-            Simu1_dict["force"] = self.force.as_dict()
+            Simu1_dict["force"] = child_as_dict(
+                self.force, type_handle_ndarray, **kwargs
+            )
         if self.loss is None:
             Simu1_dict["loss"] = None
         else:
-            Simu1_dict["loss"] = self.loss.as_dict()
+            Simu1_dict["loss"] = child_as_dict(self.loss, type_handle_ndarray, **kwargs)
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         Simu1_dict["__class__"] = "Simu1"
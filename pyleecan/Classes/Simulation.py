@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -64,6 +64,7 @@ class Simulation(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -78,6 +79,8 @@ class Simulation(FrozenClass):
         postproc_list=-1,
         index=None,
         path_result=None,
+        result_cache_dir=None,
+        result_cache_size=1000,
         init_dict=None,
         init_str=None,
     ):
@@ -96,24 +99,28 @@ class Simulation(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "machine" in list(init_dict.keys()):
+            if "machine" in init_dict:
                 machine = init_dict["machine"]
-            if "input" in list(init_dict.keys()):
+            if "input" in init_dict:
                 input = init_dict["input"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "var_simu" in list(init_dict.keys()):
+            if "var_simu" in init_dict:
                 var_simu = init_dict["var_simu"]
-            if "postproc_list" in list(init_dict.keys()):
+            if "postproc_list" in init_dict:
                 postproc_list = init_dict["postproc_list"]
-            if "index" in list(init_dict.keys()):
+            if "index" in init_dict:
                 index = init_dict["index"]
-            if "path_result" in list(init_dict.keys()):
+            if "path_result" in init_dict:
                 path_result = init_dict["path_result"]
+            if "result_cache_dir" in init_dict:
+                result_cache_dir = init_dict["result_cache_dir"]
+            if "result_cache_size" in init_dict:
+                result_cache_size = init_dict["result_cache_size"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.name = name
@@ -125,6 +132,8 @@ class Simulation(FrozenClass):
         self.postproc_list = postproc_list
         self.index = index
         self.path_result = path_result
+        self.result_cache_dir = result_cache_dir
+        self.result_cache_size = result_cache_size
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -167,6 +176,10 @@ class Simulation(FrozenClass):
             )
         Simulation_str += "index = " + str(self.index) + linesep
         Simulation_str += 'path_result = "' + str(self.path_result) + '"' + linesep
+        Simulation_str += (
+            'result_cache_dir = "' + str(self.result_cache_dir) + '"' + linesep
+        )
+        Simulation_str += "result_cache_size = " + str(self.result_cache_size) + linesep
         return Simulation_str
 
     def __eq__(self, other):
@@ -192,6 +205,10 @@ class Simulation(FrozenClass):
             return False
         if other.path_result != self.path_result:
             return False
+        if other.result_cache_dir != self.result_cache_dir:
+            return False
+        if other.result_cache_size != self.result_cache_size:
+            return False
         return True
 
     def __sizeof__(self):
@@ -209,10 +226,17 @@ class Simulation(FrozenClass):
                 S += getsizeof(value)
         S += getsizeof(self.index)
         S += getsizeof(self.path_result)
+        S += getsizeof(self.result_cache_dir)
+        S += getsizeof(self.result_cache_size)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Simulation_dict = dict()
         Simulation_dict["name"] = self.name
@@ -220,27 +244,37 @@ class Simulation(FrozenClass):
         if self.machine is None:
             Simulation_dict["machine"] = None
         else:
-            Simulation_dict["machine"] = self.machine.as_dict()
+            Simulation_dict["machine"] = child_as_dict(
+                self.machine, type_handle_ndarray, **kwargs
+            )
         if self.input is None:
             Simulation_dict["input"] = None
         else:
-            Simulation_dict["input"] = self.input.as_dict()
+            Simulation_dict["input"] = child_as_dict(
+                self.input, type_handle_ndarray, **kwargs
+            )
         Simulation_dict["logger_name"] = self.logger_name
         if self.var_simu is None:
             Simulation_dict["var_simu"] = None
         else:
-            Simulation_dict["var_simu"] = self.var_simu.as_dict()
+            Simulation_dict["var_simu"] = child_as_dict(
+                self.var_simu, type_handle_ndarray, **kwargs
+            )
         if self.postproc_list is None:
             Simulation_dict["postproc_list"] = None
         else:
             Simulation_dict["postproc_list"] = list()
             for obj in self.postproc_list:
                 if obj is not None:
-                    Simulation_dict["postproc_list"].append(obj.as_dict())
+                    Simulation_dict["postproc_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     Simulation_dict["postproc_list"].append(None)
         Simulation_dict["index"] = self.index
         Simulation_dict["path_result"] = self.path_result
+        Simulation_dict["result_cache_dir"] = self.result_cache_dir
+        Simulation_dict["result_cache_size"] = self.result_cache_size
         # The class name is added to the dict for deserialisation purpose
         Simulation_dict["__class__"] = "Simulation"
         return Simulation_dict
@@ -260,6 +294,8 @@ class Simulation(FrozenClass):
         self.postproc_list = None
         self.index = None
         self.path_result = None
+        self.result_cache_dir = None
+        self.result_cache_size = None
 
     def _get_name(self):
         """getter of name"""
@@ -474,3 +510,40 @@ class Simulation(FrozenClass):
         :Type: str
         """,
     )
+
+    def _get_result_cache_dir(self):
+        """getter of result_cache_dir"""
+        return self._result_cache_dir
+
+    def _set_result_cache_dir(self, value):
+        """setter of result_cache_dir"""
+        check_var("result_cache_dir", value, "str")
+        self._result_cache_dir = value
+
+    result_cache_dir = property(
+        fget=_get_result_cache_dir,
+        fset=_set_result_cache_dir,
+        doc=u"""Folder of the result cache of the Electrical, Magnetics and Force modules (None to disable the cache)
+
+        :Type: str
+        """,
+    )
+
+    def _get_result_cache_size(self):
+        """getter of result_cache_size"""
+        return self._result_cache_size
+
+    def _set_result_cache_size(self, value):
+        """setter of result_cache_size"""
+        check_var("result_cache_size", value, "float", Vmin=0)
+        self._result_cache_size = value
+
+    result_cache_size = property(
+        fget=_get_result_cache_size,
+        fset=_set_result_cache_size,
+        doc=u"""Maximum size of the result cache (the least recently used results are removed first)
+
+        :Type: float
+        :min: 0
+        """,
+    )
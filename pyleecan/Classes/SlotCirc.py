@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Slot import Slot
 
@@ -161,6 +161,7 @@ class SlotCirc(Slot):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -180,11 +181,11 @@ class SlotCirc(Slot):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Set the properties (value check and convertion are done in setter)
         self.W0 = W0
@@ -230,11 +231,18 @@ class SlotCirc(Slot):
         S += getsizeof(self.H0)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Slot
-        SlotCirc_dict = super(SlotCirc, self).as_dict()
+        SlotCirc_dict = super(SlotCirc, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         SlotCirc_dict["W0"] = self.W0
         SlotCirc_dict["H0"] = self.H0
         # The class name is added to the dict for deserialisation purpose
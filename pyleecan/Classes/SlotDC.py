@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Slot import Slot
 
@@ -176,6 +176,7 @@ class SlotDC(Slot):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -208,23 +209,23 @@ class SlotDC(Slot):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "H1" in list(init_dict.keys()):
+            if "H1" in init_dict:
                 H1 = init_dict["H1"]
-            if "D1" in list(init_dict.keys()):
+            if "D1" in init_dict:
                 D1 = init_dict["D1"]
-            if "W2" in list(init_dict.keys()):
+            if "W2" in init_dict:
                 W2 = init_dict["W2"]
-            if "H2" in list(init_dict.keys()):
+            if "H2" in init_dict:
                 H2 = init_dict["H2"]
-            if "D2" in list(init_dict.keys()):
+            if "D2" in init_dict:
                 D2 = init_dict["D2"]
-            if "H3" in list(init_dict.keys()):
+            if "H3" in init_dict:
                 H3 = init_dict["H3"]
-            if "R3" in list(init_dict.keys()):
+            if "R3" in init_dict:
                 R3 = init_dict["R3"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Set the properties (value check and convertion are done in setter)
         self.W1 = W1
@@ -300,11 +301,18 @@ class SlotDC(Slot):
         S += getsizeof(self.R3)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Slot
-        SlotDC_dict = super(SlotDC, self).as_dict()
+        SlotDC_dict = super(SlotDC, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         SlotDC_dict["W1"] = self.W1
         SlotDC_dict["H1"] = self.H1
         SlotDC_dict["D1"] = self.D1
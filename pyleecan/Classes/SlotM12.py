@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Slot import Slot
 
@@ -192,6 +192,7 @@ class SlotM12(Slot):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -220,15 +221,15 @@ class SlotM12(Slot):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "W0" in list(init_dict.keys()):
+            if "W0" in init_dict:
                 W0 = init_dict["W0"]
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "Wmag" in list(init_dict.keys()):
+            if "Wmag" in init_dict:
                 Wmag = init_dict["Wmag"]
-            if "Hmag" in list(init_dict.keys()):
+            if "Hmag" in init_dict:
                 Hmag = init_dict["Hmag"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Set the properties (value check and convertion are done in setter)
         self.W0 = W0
@@ -284,11 +285,18 @@ class SlotM12(Slot):
         S += getsizeof(self.Hmag)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Slot
-        SlotM12_dict = super(SlotM12, self).as_dict()
+        SlotM12_dict = super(SlotM12, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         SlotM12_dict["W0"] = self.W0
         SlotM12_dict["H0"] = self.H0
         SlotM12_dict["Wmag"] = self.Wmag
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Slot import Slot
 
@@ -95,6 +95,7 @@ class SlotUD(Slot):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -123,15 +124,15 @@ class SlotUD(Slot):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "line_list" in list(init_dict.keys()):
+            if "line_list" in init_dict:
                 line_list = init_dict["line_list"]
-            if "wind_begin_index" in list(init_dict.keys()):
+            if "wind_begin_index" in init_dict:
                 wind_begin_index = init_dict["wind_begin_index"]
-            if "wind_end_index" in list(init_dict.keys()):
+            if "wind_end_index" in init_dict:
                 wind_end_index = init_dict["wind_end_index"]
-            if "type_line_wind" in list(init_dict.keys()):
+            if "type_line_wind" in init_dict:
                 type_line_wind = init_dict["type_line_wind"]
-            if "Zs" in list(init_dict.keys()):
+            if "Zs" in init_dict:
                 Zs = init_dict["Zs"]
         # Set the properties (value check and convertion are done in setter)
         self.line_list = line_list
@@ -195,18 +196,27 @@ class SlotUD(Slot):
         S += getsizeof(self.type_line_wind)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Slot
-        SlotUD_dict = super(SlotUD, self).as_dict()
+        SlotUD_dict = super(SlotUD, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.line_list is None:
             SlotUD_dict["line_list"] = None
         else:
             SlotUD_dict["line_list"] = list()
             for obj in self.line_list:
                 if obj is not None:
-                    SlotUD_dict["line_list"].append(obj.as_dict())
+                    SlotUD_dict["line_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     SlotUD_dict["line_list"].append(None)
         SlotUD_dict["wind_begin_index"] = self.wind_begin_index
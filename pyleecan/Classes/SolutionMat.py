@@ -11,8 +11,9 @@ from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from .Solution import Solution
 
 # Import all class method
@@ -77,6 +78,7 @@ class SolutionMat(Solution):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -107,19 +109,19 @@ class SolutionMat(Solution):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "field" in list(init_dict.keys()):
+            if "field" in init_dict:
                 field = init_dict["field"]
-            if "indice" in list(init_dict.keys()):
+            if "indice" in init_dict:
                 indice = init_dict["indice"]
-            if "axis_name" in list(init_dict.keys()):
+            if "axis_name" in init_dict:
                 axis_name = init_dict["axis_name"]
-            if "axis_size" in list(init_dict.keys()):
+            if "axis_size" in init_dict:
                 axis_size = init_dict["axis_size"]
-            if "type_cell" in list(init_dict.keys()):
+            if "type_cell" in init_dict:
                 type_cell = init_dict["type_cell"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
-            if "dimension" in list(init_dict.keys()):
+            if "dimension" in init_dict:
                 dimension = init_dict["dimension"]
         # Set the properties (value check and convertion are done in setter)
         self.field = field
@@ -203,19 +205,44 @@ class SolutionMat(Solution):
                 S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Solution
-        SolutionMat_dict = super(SolutionMat, self).as_dict()
+        SolutionMat_dict = super(SolutionMat, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.field is None:
             SolutionMat_dict["field"] = None
         else:
-            SolutionMat_dict["field"] = self.field.tolist()
+            if type_handle_ndarray == 0:
+                SolutionMat_dict["field"] = self.field.tolist()
+            elif type_handle_ndarray == 1:
+                SolutionMat_dict["field"] = self.field.copy()
+            elif type_handle_ndarray == 2:
+                SolutionMat_dict["field"] = self.field
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         if self.indice is None:
             SolutionMat_dict["indice"] = None
         else:
-            SolutionMat_dict["indice"] = self.indice.tolist()
+            if type_handle_ndarray == 0:
+                SolutionMat_dict["indice"] = self.indice.tolist()
+            elif type_handle_ndarray == 1:
+                SolutionMat_dict["indice"] = self.indice.copy()
+            elif type_handle_ndarray == 2:
+                SolutionMat_dict["indice"] = self.indice
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         SolutionMat_dict["axis_name"] = (
             self.axis_name.copy() if self.axis_name is not None else None
         )
@@ -239,6 +266,8 @@ class SolutionMat(Solution):
 
     def _get_field(self):
         """getter of field"""
+        if isinstance(self._field, LazyArray):
+            self._set_field(self._field.load())
         return self._field
 
     def _set_field(self, value):
@@ -250,7 +279,8 @@ class SolutionMat(Solution):
                 value = array(value)
             except:
                 pass
-        check_var("field", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("field", value, "ndarray")
         self._field = value
 
     field = property(
@@ -264,6 +294,8 @@ class SolutionMat(Solution):
 
     def _get_indice(self):
         """getter of indice"""
+        if isinstance(self._indice, LazyArray):
+            self._set_indice(self._indice.load())
         return self._indice
 
     def _set_indice(self, value):
@@ -275,7 +307,8 @@ class SolutionMat(Solution):
                 value = array(value)
             except:
                 pass
-        check_var("indice", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("indice", value, "ndarray")
         self._indice = value
 
     indice = property(
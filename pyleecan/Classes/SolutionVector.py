@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, copy_data
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Solution import Solution
 
@@ -79,6 +79,7 @@ class SolutionVector(Solution):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -106,13 +107,13 @@ class SolutionVector(Solution):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "field" in list(init_dict.keys()):
+            if "field" in init_dict:
                 field = init_dict["field"]
-            if "type_cell" in list(init_dict.keys()):
+            if "type_cell" in init_dict:
                 type_cell = init_dict["type_cell"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
-            if "dimension" in list(init_dict.keys()):
+            if "dimension" in init_dict:
                 dimension = init_dict["dimension"]
         # Set the properties (value check and convertion are done in setter)
         self.field = field
@@ -155,15 +156,24 @@ class SolutionVector(Solution):
         S += getsizeof(self.field)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Solution
-        SolutionVector_dict = super(SolutionVector, self).as_dict()
+        SolutionVector_dict = super(SolutionVector, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.field is None:
             SolutionVector_dict["field"] = None
-        else:
+        elif type_handle_ndarray == 0:
             SolutionVector_dict["field"] = self.field.as_dict()
+        else:
+            SolutionVector_dict["field"] = copy_data(self.field, type_handle_ndarray)
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         SolutionVector_dict["__class__"] = "SolutionVector"
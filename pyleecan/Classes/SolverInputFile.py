@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Elmer import Elmer
 
@@ -43,6 +43,7 @@ class SolverInputFile(Elmer):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -64,9 +65,9 @@ class SolverInputFile(Elmer):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "sections" in list(init_dict.keys()):
+            if "sections" in init_dict:
                 sections = init_dict["sections"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.sections = sections
@@ -114,11 +115,18 @@ class SolverInputFile(Elmer):
                 S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Elmer
-        SolverInputFile_dict = super(SolverInputFile, self).as_dict()
+        SolverInputFile_dict = super(SolverInputFile, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         SolverInputFile_dict["sections"] = (
             self.sections.copy() if self.sections is not None else None
         )
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Structural import Structural
 
@@ -136,6 +136,7 @@ class StructElmer(Structural):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -167,21 +168,21 @@ class StructElmer(Structural):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Kmesh_fineness" in list(init_dict.keys()):
+            if "Kmesh_fineness" in init_dict:
                 Kmesh_fineness = init_dict["Kmesh_fineness"]
-            if "path_name" in list(init_dict.keys()):
+            if "path_name" in init_dict:
                 path_name = init_dict["path_name"]
-            if "FEA_dict_enforced" in list(init_dict.keys()):
+            if "FEA_dict_enforced" in init_dict:
                 FEA_dict_enforced = init_dict["FEA_dict_enforced"]
-            if "is_get_mesh" in list(init_dict.keys()):
+            if "is_get_mesh" in init_dict:
                 is_get_mesh = init_dict["is_get_mesh"]
-            if "is_save_FEA" in list(init_dict.keys()):
+            if "is_save_FEA" in init_dict:
                 is_save_FEA = init_dict["is_save_FEA"]
-            if "transform_list" in list(init_dict.keys()):
+            if "transform_list" in init_dict:
                 transform_list = init_dict["transform_list"]
-            if "include_magnets" in list(init_dict.keys()):
+            if "include_magnets" in init_dict:
                 include_magnets = init_dict["include_magnets"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
         # Set the properties (value check and convertion are done in setter)
         self.Kmesh_fineness = Kmesh_fineness
@@ -263,11 +264,18 @@ class StructElmer(Structural):
         S += getsizeof(self.include_magnets)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Structural
-        StructElmer_dict = super(StructElmer, self).as_dict()
+        StructElmer_dict = super(StructElmer, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         StructElmer_dict["Kmesh_fineness"] = self.Kmesh_fineness
         StructElmer_dict["path_name"] = self.path_name
         StructElmer_dict["FEA_dict_enforced"] = (
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Surface import Surface
 
@@ -179,6 +179,7 @@ class SurfLine(Surface):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -200,11 +201,11 @@ class SurfLine(Surface):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "line_list" in list(init_dict.keys()):
+            if "line_list" in init_dict:
                 line_list = init_dict["line_list"]
-            if "point_ref" in list(init_dict.keys()):
+            if "point_ref" in init_dict:
                 point_ref = init_dict["point_ref"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Set the properties (value check and convertion are done in setter)
         self.line_list = line_list
@@ -253,18 +254,27 @@ class SurfLine(Surface):
                 S += getsizeof(value)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Surface
-        SurfLine_dict = super(SurfLine, self).as_dict()
+        SurfLine_dict = super(SurfLine, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.line_list is None:
             SurfLine_dict["line_list"] = None
         else:
             SurfLine_dict["line_list"] = list()
             for obj in self.line_list:
                 if obj is not None:
-                    SurfLine_dict["line_list"].append(obj.as_dict())
+                    SurfLine_dict["line_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     SurfLine_dict["line_list"].append(None)
         # The class name is added to the dict for deserialisation purpose
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Surface import Surface
 
@@ -179,6 +179,7 @@ class SurfRing(Surface):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -206,13 +207,13 @@ class SurfRing(Surface):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "out_surf" in list(init_dict.keys()):
+            if "out_surf" in init_dict:
                 out_surf = init_dict["out_surf"]
-            if "in_surf" in list(init_dict.keys()):
+            if "in_surf" in init_dict:
                 in_surf = init_dict["in_surf"]
-            if "point_ref" in list(init_dict.keys()):
+            if "point_ref" in init_dict:
                 point_ref = init_dict["point_ref"]
-            if "label" in list(init_dict.keys()):
+            if "label" in init_dict:
                 label = init_dict["label"]
         # Set the properties (value check and convertion are done in setter)
         self.out_surf = out_surf
@@ -266,19 +267,30 @@ class SurfRing(Surface):
         S += getsizeof(self.in_surf)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Surface
-        SurfRing_dict = super(SurfRing, self).as_dict()
+        SurfRing_dict = super(SurfRing, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.out_surf is None:
             SurfRing_dict["out_surf"] = None
         else:
-            SurfRing_dict["out_surf"] = self.out_surf.as_dict()
+            SurfRing_dict["out_surf"] = child_as_dict(
+                self.out_surf, type_handle_ndarray, **kwargs
+            )
         if self.in_surf is None:
             SurfRing_dict["in_surf"] = None
         else:
-            SurfRing_dict["in_surf"] = self.in_surf.as_dict()
+            SurfRing_dict["in_surf"] = child_as_dict(
+                self.in_surf, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         SurfRing_dict["__class__"] = "SurfRing"
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -113,6 +113,7 @@ class Unit(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -132,11 +133,11 @@ class Unit(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "unit_m" in list(init_dict.keys()):
+            if "unit_m" in init_dict:
                 unit_m = init_dict["unit_m"]
-            if "unit_rad" in list(init_dict.keys()):
+            if "unit_rad" in init_dict:
                 unit_rad = init_dict["unit_rad"]
-            if "unit_m2" in list(init_dict.keys()):
+            if "unit_m2" in init_dict:
                 unit_m2 = init_dict["unit_m2"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -182,8 +183,13 @@ class Unit(FrozenClass):
         S += getsizeof(self.unit_m2)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Unit_dict = dict()
         Unit_dict["unit_m"] = self.unit_m
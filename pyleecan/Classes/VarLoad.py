@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .VarSimu import VarSimu
 
@@ -83,6 +83,7 @@ class VarLoad(VarSimu):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -99,6 +100,8 @@ class VarLoad(VarSimu):
         postproc_list=-1,
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
+        nb_proc=1,
+        chunk_size=1,
         init_dict=None,
         init_str=None,
     ):
@@ -117,28 +120,32 @@ class VarLoad(VarSimu):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "datakeeper_list" in list(init_dict.keys()):
+            if "datakeeper_list" in init_dict:
                 datakeeper_list = init_dict["datakeeper_list"]
-            if "is_keep_all_output" in list(init_dict.keys()):
+            if "is_keep_all_output" in init_dict:
                 is_keep_all_output = init_dict["is_keep_all_output"]
-            if "stop_if_error" in list(init_dict.keys()):
+            if "stop_if_error" in init_dict:
                 stop_if_error = init_dict["stop_if_error"]
-            if "ref_simu_index" in list(init_dict.keys()):
+            if "ref_simu_index" in init_dict:
                 ref_simu_index = init_dict["ref_simu_index"]
-            if "nb_simu" in list(init_dict.keys()):
+            if "nb_simu" in init_dict:
                 nb_simu = init_dict["nb_simu"]
-            if "is_reuse_femm_file" in list(init_dict.keys()):
+            if "is_reuse_femm_file" in init_dict:
                 is_reuse_femm_file = init_dict["is_reuse_femm_file"]
-            if "postproc_list" in list(init_dict.keys()):
+            if "postproc_list" in init_dict:
                 postproc_list = init_dict["postproc_list"]
-            if "pre_keeper_postproc_list" in list(init_dict.keys()):
+            if "pre_keeper_postproc_list" in init_dict:
                 pre_keeper_postproc_list = init_dict["pre_keeper_postproc_list"]
-            if "post_keeper_postproc_list" in list(init_dict.keys()):
+            if "post_keeper_postproc_list" in init_dict:
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
+            if "nb_proc" in init_dict:
+                nb_proc = init_dict["nb_proc"]
+            if "chunk_size" in init_dict:
+                chunk_size = init_dict["chunk_size"]
         # Set the properties (value check and convertion are done in setter)
         # Call VarSimu init
         super(VarLoad, self).__init__(
@@ -153,6 +160,8 @@ class VarLoad(VarSimu):
             postproc_list=postproc_list,
             pre_keeper_postproc_list=pre_keeper_postproc_list,
             post_keeper_postproc_list=post_keeper_postproc_list,
+            nb_proc=nb_proc,
+            chunk_size=chunk_size,
         )
         # The class is frozen (in VarSimu init), for now it's impossible to
         # add new properties
@@ -185,11 +194,18 @@ class VarLoad(VarSimu):
         S += super(VarLoad, self).__sizeof__()
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from VarSimu
-        VarLoad_dict = super(VarLoad, self).as_dict()
+        VarLoad_dict = super(VarLoad, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         VarLoad_dict["__class__"] = "VarLoad"
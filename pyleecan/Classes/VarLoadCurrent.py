@@ -11,8 +11,9 @@ from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from .VarLoad import VarLoad
 
 # Import all class method
@@ -121,6 +122,7 @@ class VarLoadCurrent(VarLoad):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -141,6 +143,8 @@ class VarLoadCurrent(VarLoad):
         postproc_list=-1,
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
+        nb_proc=1,
+        chunk_size=1,
         init_dict=None,
         init_str=None,
     ):
@@ -159,36 +163,40 @@ class VarLoadCurrent(VarLoad):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "OP_matrix" in list(init_dict.keys()):
+            if "OP_matrix" in init_dict:
                 OP_matrix = init_dict["OP_matrix"]
-            if "type_OP_matrix" in list(init_dict.keys()):
+            if "type_OP_matrix" in init_dict:
                 type_OP_matrix = init_dict["type_OP_matrix"]
-            if "is_torque" in list(init_dict.keys()):
+            if "is_torque" in init_dict:
                 is_torque = init_dict["is_torque"]
-            if "is_power" in list(init_dict.keys()):
+            if "is_power" in init_dict:
                 is_power = init_dict["is_power"]
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "datakeeper_list" in list(init_dict.keys()):
+            if "datakeeper_list" in init_dict:
                 datakeeper_list = init_dict["datakeeper_list"]
-            if "is_keep_all_output" in list(init_dict.keys()):
+            if "is_keep_all_output" in init_dict:
                 is_keep_all_output = init_dict["is_keep_all_output"]
-            if "stop_if_error" in list(init_dict.keys()):
+            if "stop_if_error" in init_dict:
                 stop_if_error = init_dict["stop_if_error"]
-            if "ref_simu_index" in list(init_dict.keys()):
+            if "ref_simu_index" in init_dict:
                 ref_simu_index = init_dict["ref_simu_index"]
-            if "nb_simu" in list(init_dict.keys()):
+            if "nb_simu" in init_dict:
                 nb_simu = init_dict["nb_simu"]
-            if "is_reuse_femm_file" in list(init_dict.keys()):
+            if "is_reuse_femm_file" in init_dict:
                 is_reuse_femm_file = init_dict["is_reuse_femm_file"]
-            if "postproc_list" in list(init_dict.keys()):
+            if "postproc_list" in init_dict:
                 postproc_list = init_dict["postproc_list"]
-            if "pre_keeper_postproc_list" in list(init_dict.keys()):
+            if "pre_keeper_postproc_list" in init_dict:
                 pre_keeper_postproc_list = init_dict["pre_keeper_postproc_list"]
-            if "post_keeper_postproc_list" in list(init_dict.keys()):
+            if "post_keeper_postproc_list" in init_dict:
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
+            if "nb_proc" in init_dict:
+                nb_proc = init_dict["nb_proc"]
+            if "chunk_size" in init_dict:
+                chunk_size = init_dict["chunk_size"]
         # Set the properties (value check and convertion are done in setter)
         self.OP_matrix = OP_matrix
         self.type_OP_matrix = type_OP_matrix
@@ -207,6 +215,8 @@ class VarLoadCurrent(VarLoad):
             postproc_list=postproc_list,
             pre_keeper_postproc_list=pre_keeper_postproc_list,
             post_keeper_postproc_list=post_keeper_postproc_list,
+            nb_proc=nb_proc,
+            chunk_size=chunk_size,
         )
         # The class is frozen (in VarLoad init), for now it's impossible to
         # add new properties
@@ -261,15 +271,31 @@ class VarLoadCurrent(VarLoad):
         S += getsizeof(self.is_power)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from VarLoad
-        VarLoadCurrent_dict = super(VarLoadCurrent, self).as_dict()
+        VarLoadCurrent_dict = super(VarLoadCurrent, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.OP_matrix is None:
             VarLoadCurrent_dict["OP_matrix"] = None
         else:
-            VarLoadCurrent_dict["OP_matrix"] = self.OP_matrix.tolist()
+            if type_handle_ndarray == 0:
+                VarLoadCurrent_dict["OP_matrix"] = self.OP_matrix.tolist()
+            elif type_handle_ndarray == 1:
+                VarLoadCurrent_dict["OP_matrix"] = self.OP_matrix.copy()
+            elif type_handle_ndarray == 2:
+                VarLoadCurrent_dict["OP_matrix"] = self.OP_matrix
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         VarLoadCurrent_dict["type_OP_matrix"] = self.type_OP_matrix
         VarLoadCurrent_dict["is_torque"] = self.is_torque
         VarLoadCurrent_dict["is_power"] = self.is_power
@@ -290,6 +316,8 @@ class VarLoadCurrent(VarLoad):
 
     def _get_OP_matrix(self):
         """getter of OP_matrix"""
+        if isinstance(self._OP_matrix, LazyArray):
+            self._set_OP_matrix(self._OP_matrix.load())
         return self._OP_matrix
 
     def _set_OP_matrix(self, value):
@@ -301,7 +329,8 @@ class VarLoadCurrent(VarLoad):
                 value = array(value)
             except:
                 pass
-        check_var("OP_matrix", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("OP_matrix", value, "ndarray")
         self._OP_matrix = value
 
     OP_matrix = property(
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -92,6 +92,7 @@ class VarSimu(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -108,6 +109,8 @@ class VarSimu(FrozenClass):
         postproc_list=-1,
         pre_keeper_postproc_list=None,
         post_keeper_postproc_list=None,
+        nb_proc=1,
+        chunk_size=1,
         init_dict=None,
         init_str=None,
     ):
@@ -126,28 +129,32 @@ class VarSimu(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "name" in list(init_dict.keys()):
+            if "name" in init_dict:
                 name = init_dict["name"]
-            if "desc" in list(init_dict.keys()):
+            if "desc" in init_dict:
                 desc = init_dict["desc"]
-            if "datakeeper_list" in list(init_dict.keys()):
+            if "datakeeper_list" in init_dict:
                 datakeeper_list = init_dict["datakeeper_list"]
-            if "is_keep_all_output" in list(init_dict.keys()):
+            if "is_keep_all_output" in init_dict:
                 is_keep_all_output = init_dict["is_keep_all_output"]
-            if "stop_if_error" in list(init_dict.keys()):
+            if "stop_if_error" in init_dict:
                 stop_if_error = init_dict["stop_if_error"]
-            if "ref_simu_index" in list(init_dict.keys()):
+            if "ref_simu_index" in init_dict:
                 ref_simu_index = init_dict["ref_simu_index"]
-            if "nb_simu" in list(init_dict.keys()):
+            if "nb_simu" in init_dict:
                 nb_simu = init_dict["nb_simu"]
-            if "is_reuse_femm_file" in list(init_dict.keys()):
+            if "is_reuse_femm_file" in init_dict:
                 is_reuse_femm_file = init_dict["is_reuse_femm_file"]
-            if "postproc_list" in list(init_dict.keys()):
+            if "postproc_list" in init_dict:
                 postproc_list = init_dict["postproc_list"]
-            if "pre_keeper_postproc_list" in list(init_dict.keys()):
+            if "pre_keeper_postproc_list" in init_dict:
                 pre_keeper_postproc_list = init_dict["pre_keeper_postproc_list"]
-            if "post_keeper_postproc_list" in list(init_dict.keys()):
+            if "post_keeper_postproc_list" in init_dict:
                 post_keeper_postproc_list = init_dict["post_keeper_postproc_list"]
+            if "nb_proc" in init_dict:
+                nb_proc = init_dict["nb_proc"]
+            if "chunk_size" in init_dict:
+                chunk_size = init_dict["chunk_size"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
         self.name = name
@@ -161,6 +168,8 @@ class VarSimu(FrozenClass):
         self.postproc_list = postproc_list
         self.pre_keeper_postproc_list = pre_keeper_postproc_list
         self.post_keeper_postproc_list = post_keeper_postproc_list
+        self.nb_proc = nb_proc
+        self.chunk_size = chunk_size
 
         # The class is frozen, for now it's impossible to add new properties
         self._freeze()
@@ -222,6 +231,8 @@ class VarSimu(FrozenClass):
             VarSimu_str += (
                 "post_keeper_postproc_list[" + str(ii) + "] =" + tmp + linesep + linesep
             )
+        VarSimu_str += "nb_proc = " + str(self.nb_proc) + linesep
+        VarSimu_str += "chunk_size = " + str(self.chunk_size) + linesep
         return VarSimu_str
 
     def __eq__(self, other):
@@ -251,6 +262,10 @@ class VarSimu(FrozenClass):
             return False
         if other.post_keeper_postproc_list != self.post_keeper_postproc_list:
             return False
+        if other.nb_proc != self.nb_proc:
+            return False
+        if other.chunk_size != self.chunk_size:
+            return False
         return True
 
     def __sizeof__(self):
@@ -276,10 +291,17 @@ class VarSimu(FrozenClass):
         if self.post_keeper_postproc_list is not None:
             for value in self.post_keeper_postproc_list:
                 S += getsizeof(value)
+        S += getsizeof(self.nb_proc)
+        S += getsizeof(self.chunk_size)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         VarSimu_dict = dict()
         VarSimu_dict["name"] = self.name
@@ -290,7 +312,9 @@ class VarSimu(FrozenClass):
             VarSimu_dict["datakeeper_list"] = list()
             for obj in self.datakeeper_list:
                 if obj is not None:
-                    VarSimu_dict["datakeeper_list"].append(obj.as_dict())
+                    VarSimu_dict["datakeeper_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     VarSimu_dict["datakeeper_list"].append(None)
         VarSimu_dict["is_keep_all_output"] = self.is_keep_all_output
@@ -304,7 +328,9 @@ class VarSimu(FrozenClass):
             VarSimu_dict["postproc_list"] = list()
             for obj in self.postproc_list:
                 if obj is not None:
-                    VarSimu_dict["postproc_list"].append(obj.as_dict())
+                    VarSimu_dict["postproc_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     VarSimu_dict["postproc_list"].append(None)
         if self.pre_keeper_postproc_list is None:
@@ -313,7 +339,9 @@ class VarSimu(FrozenClass):
             VarSimu_dict["pre_keeper_postproc_list"] = list()
             for obj in self.pre_keeper_postproc_list:
                 if obj is not None:
-                    VarSimu_dict["pre_keeper_postproc_list"].append(obj.as_dict())
+                    VarSimu_dict["pre_keeper_postproc_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     VarSimu_dict["pre_keeper_postproc_list"].append(None)
         if self.post_keeper_postproc_list is None:
@@ -322,9 +350,13 @@ class VarSimu(FrozenClass):
             VarSimu_dict["post_keeper_postproc_list"] = list()
             for obj in self.post_keeper_postproc_list:
                 if obj is not None:
-                    VarSimu_dict["post_keeper_postproc_list"].append(obj.as_dict())
+                    VarSimu_dict["post_keeper_postproc_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     VarSimu_dict["post_keeper_postproc_list"].append(None)
+        VarSimu_dict["nb_proc"] = self.nb_proc
+        VarSimu_dict["chunk_size"] = self.chunk_size
         # The class name is added to the dict for deserialisation purpose
         VarSimu_dict["__class__"] = "VarSimu"
         return VarSimu_dict
@@ -343,6 +375,8 @@ class VarSimu(FrozenClass):
         self.postproc_list = None
         self.pre_keeper_postproc_list = None
         self.post_keeper_postproc_list = None
+        self.nb_proc = None
+        self.chunk_size = None
 
     def _get_name(self):
         """getter of name"""
@@ -606,3 +640,41 @@ class VarSimu(FrozenClass):
         :Type: [Post]
         """,
     )
+
+    def _get_nb_proc(self):
+        """getter of nb_proc"""
+        return self._nb_proc
+
+    def _set_nb_proc(self, value):
+        """setter of nb_proc"""
+        check_var("nb_proc", value, "int", Vmin=0)
+        self._nb_proc = value
+
+    nb_proc = property(
+        fget=_get_nb_proc,
+        fset=_set_nb_proc,
+        doc=u"""Number of processes used to run the simulations (1 to run them one after the other, 0 to use all the cpu)
+
+        :Type: int
+        :min: 0
+        """,
+    )
+
+    def _get_chunk_size(self):
+        """getter of chunk_size"""
+        return self._chunk_size
+
+    def _set_chunk_size(self, value):
+        """setter of chunk_size"""
+        check_var("chunk_size", value, "int", Vmin=1)
+        self._chunk_size = value
+
+    chunk_size = property(
+        fget=_get_chunk_size,
+        fset=_set_chunk_size,
+        doc=u"""Number of simulations sent at once to each process (nb_proc > 1 only)
+
+        :Type: int
+        :min: 1
+        """,
+    )
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Hole import Hole
 
@@ -111,6 +111,7 @@ class VentilationPolar(Hole):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -140,17 +141,17 @@ class VentilationPolar(Hole):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "Alpha0" in list(init_dict.keys()):
+            if "Alpha0" in init_dict:
                 Alpha0 = init_dict["Alpha0"]
-            if "D0" in list(init_dict.keys()):
+            if "D0" in init_dict:
                 D0 = init_dict["D0"]
-            if "H0" in list(init_dict.keys()):
+            if "H0" in init_dict:
                 H0 = init_dict["H0"]
-            if "W1" in list(init_dict.keys()):
+            if "W1" in init_dict:
                 W1 = init_dict["W1"]
-            if "Zh" in list(init_dict.keys()):
+            if "Zh" in init_dict:
                 Zh = init_dict["Zh"]
-            if "mat_void" in list(init_dict.keys()):
+            if "mat_void" in init_dict:
                 mat_void = init_dict["mat_void"]
         # Set the properties (value check and convertion are done in setter)
         self.Alpha0 = Alpha0
@@ -206,11 +207,18 @@ class VentilationPolar(Hole):
         S += getsizeof(self.W1)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Hole
-        VentilationPolar_dict = super(VentilationPolar, self).as_dict()
+        VentilationPolar_dict = super(VentilationPolar, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         VentilationPolar_dict["Alpha0"] = self.Alpha0
         VentilationPolar_dict["D0"] = self.D0
         VentilationPolar_dict["H0"] = self.H0
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from ._frozen import FrozenClass
 
@@ -111,6 +111,7 @@ class Winding(FrozenClass):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -143,23 +144,23 @@ class Winding(FrozenClass):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "is_reverse_wind" in list(init_dict.keys()):
+            if "is_reverse_wind" in init_dict:
                 is_reverse_wind = init_dict["is_reverse_wind"]
-            if "Nslot_shift_wind" in list(init_dict.keys()):
+            if "Nslot_shift_wind" in init_dict:
                 Nslot_shift_wind = init_dict["Nslot_shift_wind"]
-            if "qs" in list(init_dict.keys()):
+            if "qs" in init_dict:
                 qs = init_dict["qs"]
-            if "Ntcoil" in list(init_dict.keys()):
+            if "Ntcoil" in init_dict:
                 Ntcoil = init_dict["Ntcoil"]
-            if "Npcpp" in list(init_dict.keys()):
+            if "Npcpp" in init_dict:
                 Npcpp = init_dict["Npcpp"]
-            if "type_connection" in list(init_dict.keys()):
+            if "type_connection" in init_dict:
                 type_connection = init_dict["type_connection"]
-            if "p" in list(init_dict.keys()):
+            if "p" in init_dict:
                 p = init_dict["p"]
-            if "Lewout" in list(init_dict.keys()):
+            if "Lewout" in init_dict:
                 Lewout = init_dict["Lewout"]
-            if "conductor" in list(init_dict.keys()):
+            if "conductor" in init_dict:
                 conductor = init_dict["conductor"]
         # Set the properties (value check and convertion are done in setter)
         self.parent = None
@@ -239,8 +240,13 @@ class Winding(FrozenClass):
         S += getsizeof(self.conductor)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         Winding_dict = dict()
         Winding_dict["is_reverse_wind"] = self.is_reverse_wind
@@ -254,7 +260,9 @@ class Winding(FrozenClass):
         if self.conductor is None:
             Winding_dict["conductor"] = None
         else:
-            Winding_dict["conductor"] = self.conductor.as_dict()
+            Winding_dict["conductor"] = child_as_dict(
+                self.conductor, type_handle_ndarray, **kwargs
+            )
         # The class name is added to the dict for deserialisation purpose
         Winding_dict["__class__"] = "Winding"
         return Winding_dict
@@ -11,7 +11,7 @@ from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Winding import Winding
 
@@ -65,6 +65,7 @@ class WindingCW2LR(Winding):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -97,23 +98,23 @@ class WindingCW2LR(Winding):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "is_reverse_wind" in list(init_dict.keys()):
+            if "is_reverse_wind" in init_dict:
                 is_reverse_wind = init_dict["is_reverse_wind"]
-            if "Nslot_shift_wind" in list(init_dict.keys()):
+            if "Nslot_shift_wind" in init_dict:
                 Nslot_shift_wind = init_dict["Nslot_shift_wind"]
-            if "qs" in list(init_dict.keys()):
+            if "qs" in init_dict:
                 qs = init_dict["qs"]
-            if "Ntcoil" in list(init_dict.keys()):
+            if "Ntcoil" in init_dict:
                 Ntcoil = init_dict["Ntcoil"]
-            if "Npcpp" in list(init_dict.keys()):
+            if "Npcpp" in init_dict:
                 Npcpp = init_dict["Npcpp"]
-            if "type_connection" in list(init_dict.keys()):
+            if "type_connection" in init_dict:
                 type_connection = init_dict["type_connection"]
-            if "p" in list(init_dict.keys()):
+            if "p" in init_dict:
                 p = init_dict["p"]
-            if "Lewout" in list(init_dict.keys()):
+            if "Lewout" in init_dict:
                 Lewout = init_dict["Lewout"]
-            if "conductor" in list(init_dict.keys()):
+            if "conductor" in init_dict:
                 conductor = init_dict["conductor"]
         # Set the properties (value check and convertion are done in setter)
         # Call Winding init
@@ -159,11 +160,18 @@ class WindingCW2LR(Winding):
         S += super(WindingCW2LR, self).__sizeof__()
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Winding
-        WindingCW2LR_dict = super(WindingCW2LR, self).as_dict()
+        WindingCW2LR_dict = super(WindingCW2LR, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         WindingCW2LR_dict["__class__"] = "WindingCW2LR"
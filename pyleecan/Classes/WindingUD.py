@@ -11,8 +11,9 @@ from ._check import set_array, check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
 from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
+from ..Functions.Load.lazy_array import LazyArray
 from .Winding import Winding
 
 # Import all class method
@@ -66,6 +67,7 @@ class WindingUD(Winding):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -99,25 +101,25 @@ class WindingUD(Winding):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "user_wind_mat" in list(init_dict.keys()):
+            if "user_wind_mat" in init_dict:
                 user_wind_mat = init_dict["user_wind_mat"]
-            if "is_reverse_wind" in list(init_dict.keys()):
+            if "is_reverse_wind" in init_dict:
                 is_reverse_wind = init_dict["is_reverse_wind"]
-            if "Nslot_shift_wind" in list(init_dict.keys()):
+            if "Nslot_shift_wind" in init_dict:
                 Nslot_shift_wind = init_dict["Nslot_shift_wind"]
-            if "qs" in list(init_dict.keys()):
+            if "qs" in init_dict:
                 qs = init_dict["qs"]
-            if "Ntcoil" in list(init_dict.keys()):
+            if "Ntcoil" in init_dict:
                 Ntcoil = init_dict["Ntcoil"]
-            if "Npcpp" in list(init_dict.keys()):
+            if "Npcpp" in init_dict:
                 Npcpp = init_dict["Npcpp"]
-            if "type_connection" in list(init_dict.keys()):
+            if "type_connection" in init_dict:
                 type_connection = init_dict["type_connection"]
-            if "p" in list(init_dict.keys()):
+            if "p" in init_dict:
                 p = init_dict["p"]
-            if "Lewout" in list(init_dict.keys()):
+            if "Lewout" in init_dict:
                 Lewout = init_dict["Lewout"]
-            if "conductor" in list(init_dict.keys()):
+            if "conductor" in init_dict:
                 conductor = init_dict["conductor"]
         # Set the properties (value check and convertion are done in setter)
         self.user_wind_mat = user_wind_mat
@@ -174,15 +176,31 @@ class WindingUD(Winding):
         S += getsizeof(self.user_wind_mat)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Winding
-        WindingUD_dict = super(WindingUD, self).as_dict()
+        WindingUD_dict = super(WindingUD, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.user_wind_mat is None:
             WindingUD_dict["user_wind_mat"] = None
         else:
-            WindingUD_dict["user_wind_mat"] = self.user_wind_mat.tolist()
+            if type_handle_ndarray == 0:
+                WindingUD_dict["user_wind_mat"] = self.user_wind_mat.tolist()
+            elif type_handle_ndarray == 1:
+                WindingUD_dict["user_wind_mat"] = self.user_wind_mat.copy()
+            elif type_handle_ndarray == 2:
+                WindingUD_dict["user_wind_mat"] = self.user_wind_mat
+            else:
+                raise Exception(
+                    "Unknown type_handle_ndarray: " + str(type_handle_ndarray)
+                )
         # The class name is added to the dict for deserialisation purpose
         # Overwrite the mother class name
         WindingUD_dict["__class__"] = "WindingUD"
@@ -197,6 +215,8 @@ class WindingUD(Winding):
 
     def _get_user_wind_mat(self):
         """getter of user_wind_mat"""
+        if isinstance(self._user_wind_mat, LazyArray):
+            self._set_user_wind_mat(self._user_wind_mat.load())
         return self._user_wind_mat
 
     def _set_user_wind_mat(self, value):
@@ -208,7 +228,8 @@ class WindingUD(Winding):
                 value = array(value)
             except:
                 pass
-        check_var("user_wind_mat", value, "ndarray")
+        if not isinstance(value, LazyArray):
+            check_var("user_wind_mat", value, "ndarray")
         self._user_wind_mat = value
 
     user_wind_mat = property(
@@ -10,8 +10,8 @@ from logging import getLogger
 from ._check import check_var, raise_
 from ..Functions.get_logger import get_logger
 from ..Functions.save import save
-from ..Functions.copy import copy
-from ..Functions.load import load_init_dict
+from ..Functions.copy import copy, child_as_dict
+from ..Functions.load import load_init_dict, from_dict_trusted
 from ..Functions.Load.import_class import import_class
 from .Output import Output
 
@@ -127,6 +127,11 @@ try:
 except ImportError as error:
     get_pareto_index = error
 
+try:
+    from ..Methods.Output.XOutput.get_pareto_rank import get_pareto_rank
+except ImportError as error:
+    get_pareto_rank = error
+
 try:
     from ..Methods.Output.XOutput.print_memory import print_memory
 except ImportError as error:
@@ -363,6 +368,17 @@ class XOutput(Output):
         )
     else:
         get_pareto_index = get_pareto_index
+    # cf Methods.Output.XOutput.get_pareto_rank
+    if isinstance(get_pareto_rank, ImportError):
+        get_pareto_rank = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use XOutput method get_pareto_rank: " + str(get_pareto_rank)
+                )
+            )
+        )
+    else:
+        get_pareto_rank = get_pareto_rank
     # cf Methods.Output.XOutput.print_memory
     if isinstance(print_memory, ImportError):
         print_memory = property(
@@ -377,6 +393,7 @@ class XOutput(Output):
     # save and copy methods are available in all object
     save = save
     copy = copy
+    from_dict_trusted = classmethod(from_dict_trusted)
     # get_logger method is available in all object
     get_logger = get_logger
 
@@ -414,33 +431,33 @@ class XOutput(Output):
         if init_dict is not None:  # Initialisation by dict
             assert type(init_dict) is dict
             # Overwrite default value with init_dict content
-            if "paramexplorer_list" in list(init_dict.keys()):
+            if "paramexplorer_list" in init_dict:
                 paramexplorer_list = init_dict["paramexplorer_list"]
-            if "output_list" in list(init_dict.keys()):
+            if "output_list" in init_dict:
                 output_list = init_dict["output_list"]
-            if "xoutput_dict" in list(init_dict.keys()):
+            if "xoutput_dict" in init_dict:
                 xoutput_dict = init_dict["xoutput_dict"]
-            if "nb_simu" in list(init_dict.keys()):
+            if "nb_simu" in init_dict:
                 nb_simu = init_dict["nb_simu"]
-            if "simu" in list(init_dict.keys()):
+            if "simu" in init_dict:
                 simu = init_dict["simu"]
-            if "path_result" in list(init_dict.keys()):
+            if "path_result" in init_dict:
                 path_result = init_dict["path_result"]
-            if "geo" in list(init_dict.keys()):
+            if "geo" in init_dict:
                 geo = init_dict["geo"]
-            if "elec" in list(init_dict.keys()):
+            if "elec" in init_dict:
                 elec = init_dict["elec"]
-            if "mag" in list(init_dict.keys()):
+            if "mag" in init_dict:
                 mag = init_dict["mag"]
-            if "struct" in list(init_dict.keys()):
+            if "struct" in init_dict:
                 struct = init_dict["struct"]
-            if "post" in list(init_dict.keys()):
+            if "post" in init_dict:
                 post = init_dict["post"]
-            if "logger_name" in list(init_dict.keys()):
+            if "logger_name" in init_dict:
                 logger_name = init_dict["logger_name"]
-            if "force" in list(init_dict.keys()):
+            if "force" in init_dict:
                 force = init_dict["force"]
-            if "loss" in list(init_dict.keys()):
+            if "loss" in init_dict:
                 loss = init_dict["loss"]
         # Set the properties (value check and convertion are done in setter)
         self.paramexplorer_list = paramexplorer_list
@@ -536,18 +553,27 @@ class XOutput(Output):
         S += getsizeof(self.nb_simu)
         return S
 
-    def as_dict(self):
-        """Convert this object in a json seriable dict (can be use in __init__)"""
+    def as_dict(self, type_handle_ndarray=0, **kwargs):
+        """Convert this object in a json seriable dict (can be use in __init__).
+        type_handle_ndarray: int
+            How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+        Optional keyword input parameter is for internal use only
+        and may prevent json serializability.
+        """
 
         # Get the properties inherited from Output
-        XOutput_dict = super(XOutput, self).as_dict()
+        XOutput_dict = super(XOutput, self).as_dict(
+            type_handle_ndarray=type_handle_ndarray, **kwargs
+        )
         if self.paramexplorer_list is None:
             XOutput_dict["paramexplorer_list"] = None
         else:
             XOutput_dict["paramexplorer_list"] = list()
             for obj in self.paramexplorer_list:
                 if obj is not None:
-                    XOutput_dict["paramexplorer_list"].append(obj.as_dict())
+                    XOutput_dict["paramexplorer_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     XOutput_dict["paramexplorer_list"].append(None)
         if self.output_list is None:
@@ -556,7 +582,9 @@ class XOutput(Output):
             XOutput_dict["output_list"] = list()
             for obj in self.output_list:
                 if obj is not None:
-                    XOutput_dict["output_list"].append(obj.as_dict())
+                    XOutput_dict["output_list"].append(
+                        child_as_dict(obj, type_handle_ndarray, **kwargs)
+                    )
                 else:
                     XOutput_dict["output_list"].append(None)
         if self.xoutput_dict is None:
@@ -565,7 +593,9 @@ class XOutput(Output):
             XOutput_dict["xoutput_dict"] = dict()
             for key, obj in self.xoutput_dict.items():
                 if obj is not None:
-                    XOutput_dict["xoutput_dict"][key] = obj.as_dict()
+                    XOutput_dict["xoutput_dict"][key] = child_as_dict(
+                        obj, type_handle_ndarray, **kwargs
+                    )
                 else:
                     XOutput_dict["xoutput_dict"][key] = None
         XOutput_dict["nb_simu"] = self.nb_simu
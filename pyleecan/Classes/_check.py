@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 
+from contextlib import contextmanager
+from threading import local
 from numpy import array, empty, int32
 from importlib import import_module
 
+# State of each thread: nb_skip = number of active skip_check_var (the
+# properties are set without checking their values if nb_skip > 0)
+_CHECK_STATE = local()
+
 
 def set_array(obj, prop, value):
     """Set an array that can be None or a list
@@ -53,7 +59,7 @@ def check_var(var_name, value, expect_type, Vmin=None, Vmax=None):
 
     """
 
-    if value is not None:
+    if value is not None and not getattr(_CHECK_STATE, "nb_skip", 0):
         type_value = type(value).__name__
         if type_value == "float64":
             type_value = "float"
@@ -67,6 +73,32 @@ def check_var(var_name, value, expect_type, Vmin=None, Vmax=None):
             check_max(var_name, value, type_value, Vmax)
 
 
+@contextmanager
+def skip_check_var():
+    """Context manager to set the properties without checking their values
+    (only for trusted data, e.g. from as_dict or from a file saved by pyleecan).
+    The conversions done in the setters (list to ndarray, dict to object...)
+    are kept. Only the current thread is affected, the calls can be nested.
+    """
+    _CHECK_STATE.nb_skip = getattr(_CHECK_STATE, "nb_skip", 0) + 1
+    try:
+        yield
+    finally:
+        _CHECK_STATE.nb_skip -= 1
+
+
+def is_check_var():
+    """Return True if the property values are checked in the current thread
+    (False in a skip_check_var context)
+
+    Returns
+    -------
+    is_check : bool
+        True if the property values are checked
+    """
+    return not getattr(_CHECK_STATE, "nb_skip", 0)
+
+
 def check_type(var_name, value, expect_type, type_value):
     """Check if value has the expected type for var_name
 
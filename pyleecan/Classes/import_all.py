@@ -4,6 +4,7 @@
 WARNING! All changes made in this file will be lost!
 """
 
+from ..Classes.AGSFTransfer import AGSFTransfer
 from ..Classes.Arc import Arc
 from ..Classes.Arc1 import Arc1
 from ..Classes.Arc2 import Arc2
@@ -33,6 +34,7 @@ from ..Classes.FPGNSeg import FPGNSeg
 from ..Classes.FPGNTri import FPGNTri
 from ..Classes.FluxLink import FluxLink
 from ..Classes.FluxLinkFEMM import FluxLinkFEMM
+from ..Classes.FluxMapDQ import FluxMapDQ
 from ..Classes.Force import Force
 from ..Classes.ForceMT import ForceMT
 from ..Classes.Frame import Frame
@@ -91,7 +93,9 @@ from ..Classes.MachineSync import MachineSync
 from ..Classes.MachineUD import MachineUD
 from ..Classes.MachineWRSM import MachineWRSM
 from ..Classes.MagElmer import MagElmer
+from ..Classes.MagFE import MagFE
 from ..Classes.MagFEMM import MagFEMM
+from ..Classes.MagPMMF import MagPMMF
 from ..Classes.Magnet import Magnet
 from ..Classes.Magnetics import Magnetics
 from ..Classes.MatEconomical import MatEconomical
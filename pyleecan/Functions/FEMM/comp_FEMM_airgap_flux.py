@@ -0,0 +1,110 @@
+import os
+from os.path import join
+
+from numpy import cos, sin, pi, loadtxt, zeros
+
+from ...definitions import MAIN_DIR
+
+
+def comp_FEMM_airgap_flux(femm, angle, Rag, is_sliding_band=True, path_lua=None):
+    """Compute the airgap flux density of the current FEMM simulation result
+
+    Parameters
+    ----------
+    femm : FEMMHandler
+        client to send command to a FEMM instance
+    angle : ndarray
+        Angle vector for calculation (Na,) [rad]
+    Rag : float
+        Radius to compute the airgap flux density (without sliding band) [m]
+    is_sliding_band : bool
+        True to get the flux density on the sliding band (else on the Rag radius)
+    path_lua : str
+        Path to the LUA script created by write_FEMM_airgap_lua (None to call
+        FEMM for each angle)
+
+    Returns
+    -------
+    Br : ndarray
+        Airgap radial flux density (Na,) [T]
+    Bt : ndarray
+        Airgap tangential flux density (Na,) [T]
+    """
+
+    Na = angle.size
+    if path_lua is not None:
+        # Single FEMM call: the LUA script writes all the values in a text file
+        femm.callfemm('dofile("' + path_lua.replace("\\", "/") + '")')
+        path_txt = path_lua[:-4] + ".txt"
+        B = loadtxt(path_txt, delimiter=" ", ndmin=2)
+        os.remove(path_txt)
+    else:
+        # One FEMM call per angle
+        B = zeros((Na, 2))
+        for jj in range(Na):
+            if is_sliding_band:
+                B[jj, :] = femm.mo_getgapb("bc_ag2", angle[jj] * 180 / pi)
+            else:
+                B[jj, :] = femm.mo_getb(Rag * cos(angle[jj]), Rag * sin(angle[jj]))
+
+    if is_sliding_band:
+        return B[:, 0], B[:, 1]
+    else:  # Cartesian to polar
+        Br = B[:, 0] * cos(angle) + B[:, 1] * sin(angle)
+        Bt = -B[:, 0] * sin(angle) + B[:, 1] * cos(angle)
+        return Br, Bt
+
+
+def write_FEMM_airgap_lua(save_path, angle, Rag, is_sliding_band=True, id_worker=0):
+    """Create the LUA script to get all the airgap flux density values at once
+    (the same script can be used for every time step)
+
+    Parameters
+    ----------
+    save_path: str
+        Full path to folder in which to save the script and its results
+    angle : ndarray
+        Angle vector for calculation (Na,) [rad]
+    Rag : float
+        Radius to compute the airgap flux density (without sliding band) [m]
+    is_sliding_band : bool
+        True to get the flux density on the sliding band (else on the Rag radius)
+    id_worker : int
+        worker index
+
+    Returns
+    -------
+    path_lua : str
+        Path to the created LUA script (to remove once the simulation is done)
+    """
+
+    idworker = str(id_worker)
+
+    path_lua_in = join(MAIN_DIR, "Functions", "FEMM", "get_airgap_B_FEMM.lua")
+    path_lua_out = join(save_path, "airgap_B" + idworker + ".lua")
+    path_txt_out = save_path + "\\"
+    path_txt_out = path_txt_out.replace("\\", "/")
+
+    if is_sliding_band:
+        p1 = angle * 180 / pi
+        p2 = zeros(0)
+    else:
+        p1 = Rag * cos(angle)
+        p2 = Rag * sin(angle)
+
+    # Create a new LUA script with current paths and points
+    file_lua = open(path_lua_in, "r")
+    text_lua = file_lua.read()
+    file_lua.close()
+    text_lua = text_lua.replace("my_path_txt", path_txt_out)
+    text_lua = text_lua.replace("my_id_worker", idworker)
+    text_lua = text_lua.replace("my_is_sliding_band", str(int(is_sliding_band)))
+    text_lua = text_lua.replace("my_Na", str(angle.size))
+    text_lua = text_lua.replace("my_p1", ",".join([repr(float(p)) for p in p1]))
+    text_lua = text_lua.replace("my_p2", ",".join([repr(float(p)) for p in p2]))
+
+    file_lua_out = open(path_lua_out, "w")
+    file_lua_out.write(text_lua)
+    file_lua_out.close()
+
+    return path_lua_out
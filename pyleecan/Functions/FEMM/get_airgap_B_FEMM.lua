@@ -0,0 +1,19 @@
+path_txt = "my_path_txt" ;
+idworker = my_id_worker ;
+is_sliding_band = my_is_sliding_band ;
+Na = my_Na ;
+p1 = {my_p1} ;
+p2 = {my_p2} ;
+
+fp=openfile(path_txt .. "airgap_B" .. tostring(idworker) .. ".txt","w")
+
+for k=1,Na do
+    if is_sliding_band == 1 then
+        b1,b2=mo_getgapb("bc_ag2",p1[k]);
+    else
+        b1,b2=mo_getb(p1[k],p2[k]);
+    end
+    write(fp,b1," ",b2,"\n");
+end
+
+closefile(fp);
@@ -0,0 +1,182 @@
+from os import remove, stat, getpid
+from os.path import isfile
+from queue import Queue, Empty
+from shutil import copyfile
+from threading import Thread, Lock
+from time import perf_counter
+
+# Persistent FEMM workers, key: path to the reference .fem file
+# value: dict with the file signature and the worker list
+FEMM_WORKERS = dict()
+_lock = Lock()
+
+
+def get_FEMM_workers(fem_file, nb_worker, handler_class):
+    """Return the FEMM workers to solve fem_file in parallel. The workers
+    (FEMM instance + copy of the .fem file) are kept between the calls so
+    that successive simulations on the same file (VarSimu) reuse them
+    without copying the file or starting FEMM again.
+
+    Parameters
+    ----------
+    fem_file : str
+        Path to the .fem file to solve
+    nb_worker : int
+        Number of workers
+    handler_class : type
+        Class of the FEMM handler to create (_FEMMHandler)
+
+    Returns
+    -------
+    worker_list : [dict]
+        List of worker dict (femm: FEMM handler, file: path to the worker
+        .fem file, is_loaded: True if the file is loaded for the current simulation)
+    """
+    sign = _get_file_sign(fem_file)
+    with _lock:
+        entry = FEMM_WORKERS.get(fem_file)
+        if (
+            entry is not None
+            and entry["sign"] == sign
+            and len(entry["worker_list"]) == nb_worker
+            and entry["handler_class"] is handler_class
+        ):
+            worker_list = entry["worker_list"]
+        else:
+            if entry is not None:  # The file has changed
+                _close_entry(entry)
+            worker_list = list()
+            for w in range(1, nb_worker + 1):
+                # Copy the file (pid in name for VarSimu running on several processes)
+                worker_file = (
+                    fem_file[:-4] + "_" + str(getpid()) + "_" + str(w) + ".fem"
+                )
+                copyfile(fem_file, worker_file)
+                worker_list.append(
+                    {"femm": handler_class(), "file": worker_file, "is_loaded": False}
+                )
+            FEMM_WORKERS[fem_file] = {
+                "sign": sign,
+                "handler_class": handler_class,
+                "worker_list": worker_list,
+            }
+    # The file must be loaded again for each simulation (reset the model state)
+    for worker in worker_list:
+        worker["is_loaded"] = False
+    return worker_list
+
+
+def load_FEMM_worker(worker):
+    """Start FEMM and load the worker file if needed
+
+    Parameters
+    ----------
+    worker : dict
+        worker dict from get_FEMM_workers
+    """
+    femm = worker["femm"]
+    if femm.HandleToFEMM is None:
+        femm.openfemm(1)
+    if not worker["is_loaded"]:
+        femm.opendocument(worker["file"])
+        worker["is_loaded"] = True
+
+
+def run_FEMM_workers(worker_list, task_list, solve_task):
+    """Solve the tasks with a dynamic scheduling: each worker takes the next
+    task of the queue as soon as it is free (load balancing between
+    fast and slow time steps).
+
+    Parameters
+    ----------
+    worker_list : [dict]
+        List of worker dict from get_FEMM_workers
+    task_list : list
+        List of the tasks to solve (hashable, e.g. time step index)
+    solve_task : function
+        solve_task(worker, task) returns the result of the task
+
+    Returns
+    -------
+    result_dict : dict
+        Result of each task (key: task)
+    stat_list : [dict]
+        Statistics of each worker (nb_task: number of solved tasks,
+        time: time spent solving, usage: time / total time)
+    """
+
+    task_queue = Queue()
+    for task in task_list:
+        task_queue.put(task)
+
+    result_dict = dict()
+    stat_list = [{"nb_task": 0, "time": 0.0} for _ in worker_list]
+    error_list = list()
+
+    def work(worker, stat):
+        while not error_list:
+            try:
+                task = task_queue.get_nowait()
+            except Empty:
+                return
+            t0 = perf_counter()
+            try:
+                result_dict[task] = solve_task(worker, task)
+            except BaseException as err:
+                error_list.append(err)
+                return
+            stat["nb_task"] += 1
+            stat["time"] += perf_counter() - t0
+
+    t_start = perf_counter()
+    thread_list = [
+        Thread(target=work, args=(worker, stat))
+        for worker, stat in zip(worker_list, stat_list)
+    ]
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+    t_tot = perf_counter() - t_start
+
+    if error_list:
+        raise error_list[0]
+
+    for stat in stat_list:
+        stat["usage"] = stat["time"] / t_tot if t_tot > 0 else 0
+    return result_dict, stat_list
+
+
+def close_FEMM_workers(fem_file=None):
+    """Close the FEMM workers and remove their files
+
+    Parameters
+    ----------
+    fem_file : str
+        Path to the .fem file of the workers to close (None to close all the workers)
+    """
+    with _lock:
+        if fem_file is None:
+            key_list = list(FEMM_WORKERS.keys())
+        else:
+            key_list = [fem_file] if fem_file in FEMM_WORKERS else []
+        for key in key_list:
+            _close_entry(FEMM_WORKERS.pop(key))
+
+
+def _close_entry(entry):
+    """Close the FEMM instances of a FEMM_WORKERS entry and remove the files"""
+    for worker in entry["worker_list"]:
+        worker["femm"].closefemm()
+        for file_path in [worker["file"], worker["file"][:-4] + ".ans"]:
+            if isfile(file_path):
+                try:
+                    remove(file_path)
+                except OSError:
+                    pass  # File still used by FEMM
+
+
+def _get_file_sign(file_path):
+    """Signature to detect a modification of the file"""
+    file_stat = stat(file_path)
+    return (file_stat.st_size, file_stat.st_mtime)
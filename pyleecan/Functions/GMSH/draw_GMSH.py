@@ -14,10 +14,90 @@ import cmath
 from os import replace
 from os.path import splitext
 
+from math import isfinite
 from numpy import pi
 
 
-def _find_point_tag(d={}, p=complex(0.0, 0.0)):
+# Tolerance to merge the points (on each coordinate)
+TOL_POINT = 1e-6
+
+
+def _build_index(d={}):
+    """Build the hash indexes of the points and lines of a GMSH dictionary
+    (to find the existing points and lines without browsing the dictionary)
+
+    Parameters
+    ----------
+    d : Dictionary
+        GMSH dictionary
+
+    Returns
+    -------
+    index : Dictionary
+        "point": quantized coordinates -> list of (order, tag, coord),
+        "point_line": point tag -> list of line tags,
+        "line_point": line tag -> [begin, end, center] point tags,
+        "surf_line": surface index -> set of line tags
+    """
+    index = {"point": {}, "point_line": {}, "line_point": {}, "surf_line": {}}
+    for s_id, s_data in d.items():
+        for lvalues in s_data.values():
+            if type(lvalues) is dict:
+                _add_line_to_index(index, s_id, lvalues)
+    return index
+
+
+def _add_line_to_index(index, idx, lvalues):
+    """Add a line of the GMSH dictionary to the indexes (in the dictionary
+    order: the first point/line found is the same as when browsing the
+    dictionary)
+
+    Parameters
+    ----------
+    index : Dictionary
+        Indexes of the GMSH dictionary
+    idx : int
+        Surface index the line belongs to
+    lvalues : Dictionary
+        Line of the GMSH dictionary
+    """
+    ltag = lvalues["tag"]
+    index["surf_line"].setdefault(idx, set()).add(ltag)
+    ptag_list = [None, None, None]
+    for pid, pvalues in lvalues.items():
+        if type(pvalues) is not dict:
+            continue
+        ptag = pvalues["tag"]
+        if pid == "begin":
+            ptag_list[0] = ptag
+        elif pid == "end":
+            ptag_list[1] = ptag
+        elif pid == "cent":
+            ptag_list[2] = ptag
+        if ptag is None:
+            continue
+        if ptag not in index["point_line"]:
+            # A point tag always has the coordinates of its first occurrence
+            coord = pvalues["coord"]
+            key = _get_point_key(coord)
+            if key is not None:
+                point_list = index["point"].setdefault(key, list())
+                point_list.append((len(index["point_line"]), ptag, coord))
+            index["point_line"][ptag] = list()
+        index["point_line"][ptag].append(ltag)
+    index["line_point"].setdefault(ltag, ptag_list)
+
+
+def _get_point_key(p):
+    """Quantized coordinates of a point (a point is within the tolerance of the
+    points of the 9 keys around its own key), None if a coordinate is not
+    finite (such a point is never merged)"""
+    if not (isfinite(p.real) and isfinite(p.imag)):
+        return None
+    return (int(p.real // TOL_POINT), int(p.imag // TOL_POINT))
+
+
+def _find_point_tag(d={}, p=complex(0.0, 0.0), index=None):
     """Find a point in the GMSH dictionary
 
     Parameters
@@ -26,6 +106,8 @@ def _find_point_tag(d={}, p=complex(0.0, 0.0)):
         GMSH dictionary
     p : Complex
         Point coordinates
+    index : Dictionary
+        Indexes of the GMSH dictionary (from _build_index, built if None)
 
     Returns
     -------
@@ -36,22 +118,29 @@ def _find_point_tag(d={}, p=complex(0.0, 0.0)):
     imag : float
         Imaginary coordinates of point
     """
-    tol = 1e-6
-    for s_data in d.values():
-        for lvalues in s_data.values():
-            if type(lvalues) is not dict:
-                continue
-            for pvalues in lvalues.values():
-                if type(pvalues) is not dict:
-                    continue
-                if pvalues["tag"] is not None:
-                    b = pvalues["coord"]
-                    if abs(p.real - b.real) < tol and abs(p.imag - b.imag) < tol:
-                        return pvalues["tag"], b.real, b.imag
-    return None, p.real, p.imag
+    if index is None:
+        index = _build_index(d)
+    key = _get_point_key(p)
+    if key is None:
+        return None, p.real, p.imag
+    kx, ky = key
+    found = None
+    for ii in (kx - 1, kx, kx + 1):
+        for jj in (ky - 1, ky, ky + 1):
+            for point in index["point"].get((ii, jj), ()):
+                b = point[2]
+                if (
+                    abs(p.real - b.real) < TOL_POINT
+                    and abs(p.imag - b.imag) < TOL_POINT
+                ):
+                    if found is None or point[0] < found[0]:
+                        found = point
+    if found is None:
+        return None, p.real, p.imag
+    return found[1], found[2].real, found[2].imag
 
 
-def _find_points_from_line(d={}, ltag=-1):
+def _find_points_from_line(d={}, ltag=-1, index=None):
     """Find points tag from existing lines
 
     Parameters
@@ -60,36 +149,20 @@ def _find_points_from_line(d={}, ltag=-1):
         GMSH dictionary
     ltag : int
         line tag
+    index : Dictionary
+        Indexes of the GMSH dictionary (from _build_index, built if None)
 
     Returns
     -------
     coord : float
         Coordinates of point if found
     """
-    btag = None
-    etag = None
-    ctag = None
-    for s_data in d.values():
-        for lvalues in s_data.values():
-            if type(lvalues) is not dict:
-                continue
-            if lvalues["tag"] != ltag:
-                continue
-            else:
-                for pid, pvalues in lvalues.items():
-                    if type(pvalues) is not dict:
-                        continue
-                    if pid == "begin":
-                        btag = pvalues["tag"]
-                    elif pid == "end":
-                        etag = pvalues["tag"]
-                    elif pid == "cent":
-                        ctag = pvalues["tag"]
-                break
-    return [btag, etag, ctag]
-
-
-def _find_lines_from_point(d={}, ptag=-1):
+    if index is None:
+        index = _build_index(d)
+    return list(index["line_point"].get(ltag, [None, None, None]))
+
+
+def _find_lines_from_point(d={}, ptag=-1, index=None):
     """Find lines that have the given point tag
 
     Parameters
@@ -98,26 +171,22 @@ def _find_lines_from_point(d={}, ptag=-1):
         GMSH dictionary
     ptag : int
         point tag
+    index : Dictionary
+        Indexes of the GMSH dictionary (from _build_index, built if None)
 
     Returns
     -------
     ltag : int
         List of line tags
     """
-    lines = list()
-    for s_data in d.values():
-        for lvalues in s_data.values():
-            if type(lvalues) is not dict:
-                continue
-            for pvalues in lvalues.values():
-                if type(pvalues) is not dict:
-                    continue
-                if pvalues["tag"] == ptag:
-                    lines.append(lvalues["tag"])
-    return lines
+    if index is None:
+        index = _build_index(d)
+    return list(index["point_line"].get(ptag, []))
 
 
-def _add_line_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc=None):
+def _add_line_to_dict(
+    geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc=None, index=None
+):
     """Draw a new line and add it to GMSH dictionary if it does not exist
 
     Parameters
@@ -134,33 +203,38 @@ def _add_line_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc=N
         Points mesh size
     n_elements : int
         Number of elements on the line for meshing control
+    index : Dictionary
+        Indexes of the GMSH dictionary (from _build_index, built if None),
+        updated with the new line
 
     Returns
     -------
     None
     """
+    if index is None:
+        index = _build_index(d)
 
     dlines = list()
     ltag = None
-    btag, bx, by = _find_point_tag(d, line.get_begin())
-    etag, ex, ey = _find_point_tag(d, line.get_end())
+    btag, bx, by = _find_point_tag(d, line.get_begin(), index)
+    etag, ex, ey = _find_point_tag(d, line.get_end(), index)
     if btag is None:
         btag = geo.addPoint(bx, by, 0, meshSize=mesh_size, tag=-1)
     else:
-        dlines.extend(_find_lines_from_point(d, btag))
+        dlines.extend(_find_lines_from_point(d, btag, index))
     if etag is None:
         etag = geo.addPoint(ex, ey, 0, meshSize=mesh_size, tag=-1)
     else:
-        dlines.extend(_find_lines_from_point(d, etag))
+        dlines.extend(_find_lines_from_point(d, etag, index))
     if isinstance(line, Arc):
-        ctag, cx, cy = _find_point_tag(d, line.get_center())
+        ctag, cx, cy = _find_point_tag(d, line.get_center(), index)
         if ctag is None:
             ctag = geo.addPoint(cx, cy, 0, meshSize=mesh_size, tag=-1)
         else:
-            dlines.extend(_find_lines_from_point(d, ctag))
+            dlines.extend(_find_lines_from_point(d, ctag, index))
         if len(dlines) > 0:
             for iline in dlines:
-                p = _find_points_from_line(d, iline)
+                p = _find_points_from_line(d, iline, index)
                 if p[0] == btag and p[1] == etag and p[2] == ctag:
                     ltag = iline
                     break
@@ -179,15 +253,7 @@ def _add_line_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc=N
                 geo.mesh.setTransfiniteCurve(ltag, n_elements + 1, "Progression")
 
         # To avoid fill the dictionary with repeated lines
-        repeated = False
-        for lvalues in d[idx].values():
-            if type(lvalues) is not dict:
-                continue
-            else:
-                if lvalues["tag"] == ltag:
-                    repeated = True
-
-        if not repeated:
+        if ltag not in index["surf_line"].get(idx, ()):
             nline = len(d[idx]) - 2
             arc_angle = cmath.phase(complex(ex, ey)) - cmath.phase(complex(bx, by))
             d[idx].update(
@@ -205,11 +271,12 @@ def _add_line_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc=N
                     }
                 }
             )
+            _add_line_to_index(index, idx, d[idx][nline])
 
     else:
         if len(dlines) > 0:
             for iline in dlines:
-                p = _find_points_from_line(d, iline)
+                p = _find_points_from_line(d, iline, index)
                 if p[0] == btag and p[1] == etag:
                     ltag = iline
                     break
@@ -228,15 +295,7 @@ def _add_line_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc=N
                 geo.mesh.setTransfiniteCurve(ltag, n_elements + 1, "Progression")
 
         # To avoid fill the dictionary with repeated lines
-        repeated = False
-        for lvalues in d[idx].values():
-            if type(lvalues) is not dict:
-                continue
-            else:
-                if lvalues["tag"] == ltag:
-                    repeated = True
-
-        if not repeated:
+        if ltag not in index["surf_line"].get(idx, ()):
             nline = len(d[idx]) - 2
             line_angle = 0.5 * (
                 cmath.phase(complex(ex, ey)) + cmath.phase(complex(bx, by))
@@ -255,11 +314,14 @@ def _add_line_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc=N
                     }
                 }
             )
+            _add_line_to_index(index, idx, d[idx][nline])
 
     return None
 
 
-def _add_agline_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc=None):
+def _add_agline_to_dict(
+    geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc=None, index=None
+):
     """Draw a new Air Gap line and add it to GMSH dictionary if it does not exist
 
     Parameters
@@ -276,34 +338,39 @@ def _add_agline_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc
         Points mesh size
     n_elements : int
         Number of elements on the line for meshing control
+    index : Dictionary
+        Indexes of the GMSH dictionary (from _build_index, built if None),
+        updated with the new line
 
     Returns
     -------
     None
     """
+    if index is None:
+        index = _build_index(d)
 
     # TO-DO: Allow repeated points for the rotor and stator sliding bands
     dlines = list()
     ltag = None
-    btag, bx, by = _find_point_tag(d, line.get_begin())
-    etag, ex, ey = _find_point_tag(d, line.get_end())
+    btag, bx, by = _find_point_tag(d, line.get_begin(), index)
+    etag, ex, ey = _find_point_tag(d, line.get_end(), index)
     if btag is None:
         btag = geo.addPoint(bx, by, 0, meshSize=mesh_size, tag=-1)
     else:
-        dlines.extend(_find_lines_from_point(d, btag))
+        dlines.extend(_find_lines_from_point(d, btag, index))
     if etag is None:
         etag = geo.addPoint(ex, ey, 0, meshSize=mesh_size, tag=-1)
     else:
-        dlines.extend(_find_lines_from_point(d, etag))
+        dlines.extend(_find_lines_from_point(d, etag, index))
     if isinstance(line, Arc):
-        ctag, cx, cy = _find_point_tag(d, line.get_center())
+        ctag, cx, cy = _find_point_tag(d, line.get_center(), index)
         if ctag is None:
             ctag = geo.addPoint(cx, cy, 0, meshSize=mesh_size, tag=-1)
         else:
-            dlines.extend(_find_lines_from_point(d, ctag))
+            dlines.extend(_find_lines_from_point(d, ctag, index))
         if len(dlines) > 0:
             for iline in dlines:
-                p = _find_points_from_line(d, iline)
+                p = _find_points_from_line(d, iline, index)
                 if p[0] == btag and p[1] == etag and p[2] == ctag:
                     ltag = iline
                     break
@@ -322,15 +389,7 @@ def _add_agline_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc
                 geo.mesh.setTransfiniteCurve(ltag, n_elements + 1, "Progression")
 
         # To avoid fill the dictionary with repeated lines
-        repeated = False
-        for lvalues in d[idx].values():
-            if type(lvalues) is not dict:
-                continue
-            else:
-                if lvalues["tag"] == ltag:
-                    repeated = True
-
-        if not repeated:
+        if ltag not in index["surf_line"].get(idx, ()):
             nline = len(d[idx]) - 2
             arc_angle = cmath.phase(complex(ex, ey)) - cmath.phase(complex(bx, by))
             d[idx].update(
@@ -347,11 +406,12 @@ def _add_agline_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc
                     }
                 }
             )
+            _add_line_to_index(index, idx, d[idx][nline])
 
     else:
         if len(dlines) > 0:
             for iline in dlines:
-                p = _find_points_from_line(d, iline)
+                p = _find_points_from_line(d, iline, index)
                 if p[0] == btag and p[1] == etag:
                     ltag = iline
                     break
@@ -370,15 +430,7 @@ def _add_agline_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc
                 geo.mesh.setTransfiniteCurve(ltag, n_elements + 1, "Progression")
 
         # To avoid fill the dictionary with repeated lines
-        repeated = False
-        for lvalues in d[idx].values():
-            if type(lvalues) is not dict:
-                continue
-            else:
-                if lvalues["tag"] == ltag:
-                    repeated = True
-
-        if not repeated:
+        if ltag not in index["surf_line"].get(idx, ()):
             nline = len(d[idx]) - 2
             line_angle = 0.5 * (
                 cmath.phase(complex(ex, ey)) + cmath.phase(complex(bx, by))
@@ -396,6 +448,7 @@ def _add_agline_to_dict(geo, line, d={}, idx=0, mesh_size=1e-2, n_elements=0, bc
                     }
                 }
             )
+            _add_line_to_index(index, idx, d[idx][nline])
 
     return None
 
@@ -513,6 +566,8 @@ def draw_GMSH(
             },
         }
     }
+    # Hash indexes of the points and lines of gmsh_dict
+    gmsh_index = _build_index(gmsh_dict)
 
     nsurf = 0  # number of surfaces
     if not is_lam_only_S:
@@ -575,6 +630,7 @@ def draw_GMSH(
                             mesh_size=mesh_size_R,
                             n_elements=n_elem,
                             bc=bc_name,
+                            index=gmsh_index,
                         )
                 elif isinstance(line, Arc) and (
                     abs(line.get_angle() * 180.0 / cmath.pi) <= tol
@@ -590,6 +646,7 @@ def draw_GMSH(
                         mesh_size=mesh_size_R,
                         n_elements=n_elem,
                         bc=bc_name,
+                        index=gmsh_index,
                     )
 
         lam_and_holes = list()
@@ -663,6 +720,7 @@ def draw_GMSH(
             },
         }
     }
+    gmsh_index = _build_index(gmsh_dict)
 
     # nsurf = 0
     if not is_lam_only_R:
@@ -721,6 +779,7 @@ def draw_GMSH(
                             mesh_size=mesh_size_S,
                             n_elements=n_elem,
                             bc=bc_name,
+                            index=gmsh_index,
                         )
                 else:
                     _add_line_to_dict(
@@ -731,6 +790,7 @@ def draw_GMSH(
                         mesh_size=mesh_size_S,
                         n_elements=n_elem,
                         bc=bc_name,
+                        index=gmsh_index,
                     )
 
         for s_data in gmsh_dict.values():
@@ -756,6 +816,7 @@ def draw_GMSH(
         # stator_dict = gmsh_dict.copy()
 
     gmsh_dict.update(rotor_dict)
+    gmsh_index = _build_index(gmsh_dict)
 
     if is_sliding_band and (not is_lam_only_R) and (not is_lam_only_S):
         sb_list = get_sliding_band(sym=sym, machine=machine)
@@ -807,6 +868,7 @@ def draw_GMSH(
                         mesh_size=mesh_size,
                         n_elements=n_elem,
                         bc=bc_name,
+                        index=gmsh_index,
                     )
             else:
                 _add_agline_to_dict(
@@ -817,6 +879,7 @@ def draw_GMSH(
                     mesh_size=mesh_size,
                     n_elements=n_elem,
                     bc=bc_name,
+                    index=gmsh_index,
                 )
 
     for s_data in gmsh_dict.values():
@@ -893,6 +956,7 @@ def draw_GMSH(
                         mesh_size=mesh_size,
                         n_elements=n_elem,
                         bc=bc_name,
+                        index=gmsh_index,
                     )
             else:
                 _add_line_to_dict(
@@ -903,6 +967,7 @@ def draw_GMSH(
                     mesh_size=mesh_size,
                     n_elements=n_elem,
                     bc=bc_name,
+                    index=gmsh_index,
                 )
 
     for s_id, s_data in gmsh_dict.items():
@@ -1,12 +1,18 @@
 from ...Classes._check import InitUnKnowClassError
 
+# Classes already imported, key: (mod_name, class_name)
+_CLASS_DICT = dict()
+
 
 def import_class(mod_name, class_name, prop_name=""):
     """Dynamical import of a class (for init_dict=class.as_dict())"""
 
+    class_obj = _CLASS_DICT.get((mod_name, class_name))
+    if class_obj is not None:
+        return class_obj
     try:
         module = __import__(mod_name + "." + class_name, fromlist=[class_name])
-        return getattr(module, class_name)
+        class_obj = getattr(module, class_name)
     except:
         if prop_name != "":
             raise InitUnKnowClassError(
@@ -19,3 +25,5 @@ def import_class(mod_name, class_name, prop_name=""):
             raise InitUnKnowClassError(
                 "Unknow class name " + class_name + " when loading"
             )
+    _CLASS_DICT[(mod_name, class_name)] = class_obj
+    return class_obj
@@ -0,0 +1,46 @@
+from h5py import File
+
+
+class LazyArray(object):
+    """Reference to an ndarray stored in a h5 file. The ndarray properties
+    can be set with a LazyArray: the array is read from the file on the first
+    access to the property (cf load_hdf5 with is_lazy=True).
+    """
+
+    def __init__(self, file_path, name, shape, dtype):
+        """Create the reference to the dataset
+
+        Parameters
+        ----------
+        file_path : str
+            path to the h5 file
+        name : str
+            full name of the dataset in the file
+        shape : tuple
+            shape of the array
+        dtype : numpy.dtype
+            type of the array elements
+        """
+        self.file_path = file_path
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __repr__(self):
+        return "LazyArray(%s:%s, shape=%s, dtype=%s)" % (
+            self.file_path,
+            self.name,
+            self.shape,
+            self.dtype,
+        )
+
+    def load(self):
+        """Read the array from the file
+
+        Returns
+        -------
+        value : ndarray
+            the stored array
+        """
+        with File(self.file_path, "r") as file:
+            return file[self.name][()]
@@ -1,7 +1,12 @@
 from h5py import File, Group
-from numpy import bool_, int32, int64, string_, array
+from numpy import bool_, int32, int64, array
 from cloudpickle import loads
 
+from .lazy_array import LazyArray
+
+# Minimum number of elements of the arrays loaded on first access (is_lazy)
+LAZY_MIN_SIZE = 100000
+
 
 def is_int(inputString):
     """Check if a string is an int"""
@@ -15,7 +20,31 @@ def is_int(inputString):
     return False
 
 
-def construct_dict_from_group(group):
+def load_ndarray(dataset, is_lazy=False):
+    """
+    Load a dataset saved from an ndarray
+
+    Parameters
+    ----------
+    dataset: h5py.Dataset
+        dataset to load
+    is_lazy: bool
+        True to return a LazyArray for the large ndarray properties (the
+        array is read on first access)
+
+    Returns
+    -------
+    value : ndarray or LazyArray
+        the stored array
+    """
+    if is_lazy and "is_lazy" in dataset.attrs.keys() and dataset.size >= LAZY_MIN_SIZE:
+        return LazyArray(
+            dataset.file.filename, dataset.name, dataset.shape, dataset.dtype
+        )
+    return dataset[()]
+
+
+def construct_dict_from_group(group, is_lazy=False):
     """
     construct_dict_from_group create a dictionnary and extract datasets and groups from the group
 
@@ -23,6 +52,8 @@ def construct_dict_from_group(group):
     ----------
     group: h5py.Group
         group to browse
+    is_lazy: bool
+        True to load the large ndarray properties on first access
 
     Returns
     -------
@@ -37,13 +68,18 @@ def construct_dict_from_group(group):
 
         for i in range(group.attrs["length_list"]):
             if hasattr(group["list_" + str(i)], "items"):  # Group in list
-                list_.append(construct_dict_from_group(group["list_" + str(i)]))
+                list_.append(
+                    construct_dict_from_group(group["list_" + str(i)], is_lazy)
+                )
             else:  # Dataset
                 dataset = group["list_" + str(i)]
+                if "ndarray" in dataset.attrs.keys():  # ndarray
+                    list_.append(load_ndarray(dataset, is_lazy))
+                    continue
                 value = dataset[()]
                 if "array_list" in dataset.attrs.keys():  # List saved as an array
                     value = value.tolist()
-                elif value == "NoneValue":  # Handle None values
+                elif value == "NoneValue" or value == b"NoneValue":  # None values
                     value = None
                 elif isinstance(value, bool_):  # bool
                     value = bool(value)
@@ -51,7 +87,7 @@ def construct_dict_from_group(group):
                     value = float(value)
                 elif isinstance(value, int32):  # int
                     value = int(value)
-                elif isinstance(value, string_):  # String
+                elif isinstance(value, bytes):  # String (numpy or h5py vlen)
                     value = value.decode("ISO-8859-2")
 
                 list_.append(value)
@@ -64,24 +100,26 @@ def construct_dict_from_group(group):
             # Check if val is a group or a dataset
             if isinstance(val, Group):  # Group
                 # Call the function recursively to load group
-                dict_[key] = construct_dict_from_group(val)
+                dict_[key] = construct_dict_from_group(val, is_lazy)
+            elif "ndarray" in val.attrs.keys():  # ndarray
+                dict_[key] = load_ndarray(val, is_lazy)
             else:  # Dataset
                 value = val[()]
                 if "array_list" in val.attrs.keys():  # List saved as an array
                     value = value.tolist()
-                elif value == "NoneValue":  # Handle None values
+                elif value == "NoneValue" or value == b"NoneValue":  # None values
                     value = None
                 elif isinstance(value, bool_):  # bool
                     value = bool(value)
                 elif isinstance(value, int64):  # float
                     value = float(value)
-                elif isinstance(value, string_):  # String
+                elif isinstance(value, bytes):  # String (numpy or h5py vlen)
                     value = value.decode("ISO-8859-2")
                 dict_[key] = value
         return dict_
 
 
-def load_hdf5(file_path):
+def load_hdf5(file_path, is_lazy=False):
     """
     Load pyleecan object from h5 file
 
@@ -90,6 +128,9 @@ def load_hdf5(file_path):
 
     file_path: str
         file path
+    is_lazy: bool
+        True to read the large ndarray properties on their first access
+        (the file must not be modified or deleted in the meantime)
 
     Returns
     -------
@@ -100,6 +141,6 @@ def load_hdf5(file_path):
     """
     with File(file_path, "r") as file:
         # file is a group
-        obj_dict = construct_dict_from_group(file)
+        obj_dict = construct_dict_from_group(file, is_lazy)
 
     return file_path, obj_dict
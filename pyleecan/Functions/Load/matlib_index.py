@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+from json import dump, load as jload
+from os import remove, replace, stat, walk
+from os.path import basename, isfile, join, relpath, splitext
+
+from .import_class import import_class
+from .retrocompatibility import convert_init_dict
+
+# Name of the index file in the material library folder
+INDEX_FILE_NAME = ".matlib_index.json"
+# Version of the index file format (the index is rebuilt if it changes)
+INDEX_VERSION = 1
+# Material properties stored in the index (to search without loading)
+INDEX_PROPERTY_LIST = [
+    "is_isotropic",
+    "desc",
+    "elec.rho",
+    "elec.epsr",
+    "mag.mur_lin",
+    "mag.Hc",
+    "mag.Brm20",
+    "mag.Wlam",
+    "struct.rho",
+    "struct.Ex",
+    "eco.cost_unit",
+]
+
+
+class MatLibIndex(object):
+    """Index of the material files of a folder and its subfolders: the name,
+    path, modification time and main properties of each material are saved in
+    an index file so that the library is listed and searched without loading
+    the materials (loaded on demand). Only the new and modified files are read
+    when the index is refreshed.
+    """
+
+    def __init__(self, mat_path, index_path=None, is_refresh=True):
+        """Load the index of a material library
+
+        Parameters
+        ----------
+        mat_path : str
+            Path to the material library folder
+        index_path : str
+            Path to the index file (default: INDEX_FILE_NAME in mat_path)
+        is_refresh : bool
+            True to update the index with the files of the folder
+        """
+        self.mat_path = mat_path
+        if index_path is None:
+            index_path = join(mat_path, INDEX_FILE_NAME)
+        self.index_path = index_path
+        # Entry of each file (relative path => dict), including the files that
+        # are not materials (to skip them until they are modified)
+        self.entry_dict = dict()
+        self.load()
+        if is_refresh:
+            self.refresh()
+
+    def __len__(self):
+        return len(self.get_entry_list())
+
+    def __iter__(self):
+        return iter(self.get_entry_list())
+
+    def get_entry_list(self):
+        """Return the entries of the materials (dict with "name", "path" relative
+        to mat_path and the INDEX_PROPERTY_LIST properties)"""
+        return [entry for entry in self.entry_dict.values() if entry["is_material"]]
+
+    def get_name_list(self):
+        """Return the names of the materials"""
+        return [entry["name"] for entry in self.get_entry_list()]
+
+    def load(self):
+        """Load the entries of the index file (no entry if the file is missing
+        or of another format)"""
+        self.entry_dict = dict()
+        if not isfile(self.index_path):
+            return
+        try:
+            with open(self.index_path, "r") as index_file:
+                index_dict = jload(index_file)
+        except ValueError:
+            return
+        if (
+            index_dict.get("version") == INDEX_VERSION
+            and index_dict.get("property_list") == INDEX_PROPERTY_LIST
+        ):
+            for entry in index_dict["entry_list"]:
+                self.entry_dict[entry["path"]] = entry
+
+    def save(self):
+        """Save the index file (nothing is done if the folder is read-only)"""
+        index_dict = {
+            "version": INDEX_VERSION,
+            "property_list": INDEX_PROPERTY_LIST,
+            "entry_list": list(self.entry_dict.values()),
+        }
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "w") as index_file:
+                dump(index_dict, index_file, indent=0)
+            replace(tmp_path, self.index_path)
+        except OSError:
+            if isfile(tmp_path):
+                remove(tmp_path)
+
+    def refresh(self):
+        """Update the index with the material files of the folder: only the new
+        and modified files (modification time or size) are read
+
+        Returns
+        -------
+        nb_update : int
+            Number of files read
+        """
+        entry_dict = dict()
+        nb_update = 0
+        for (dirpath, _, filenames) in walk(self.mat_path):
+            for file_name in filenames:
+                # For all json file in the folder and subfolder
+                if not (file_name.endswith(".json") or file_name.endswith(".h5")):
+                    continue
+                file_path = join(dirpath, file_name)
+                if file_path == self.index_path or file_name == INDEX_FILE_NAME:
+                    continue
+                rel_path = relpath(file_path, self.mat_path).replace("\\", "/")
+                file_stat = stat(file_path)
+                entry = self.entry_dict.get(rel_path)
+                if (
+                    entry is None
+                    or entry["mtime"] != file_stat.st_mtime_ns
+                    or entry["size"] != file_stat.st_size
+                ):
+                    entry = _read_entry(file_path)
+                    entry["path"] = rel_path
+                    entry["mtime"] = file_stat.st_mtime_ns
+                    entry["size"] = file_stat.st_size
+                    nb_update += 1
+                entry_dict[rel_path] = entry
+
+        is_change = nb_update > 0 or list(entry_dict) != list(self.entry_dict)
+        self.entry_dict = entry_dict
+        if is_change or not isfile(self.index_path):
+            self.save()
+        return nb_update
+
+    def get_material(self, name):
+        """Load a material of the library
+
+        Parameters
+        ----------
+        name : str
+            Name or path (relative to mat_path) of the material
+
+        Returns
+        -------
+        mat : Material
+            Material loaded from its file (with the library name and path)
+        """
+        entry = self.entry_dict.get(name)
+        if entry is None or not entry["is_material"]:
+            entry = None
+            for entry_mat in self.get_entry_list():
+                if entry_mat["name"] == name:
+                    entry = entry_mat
+                    break
+        if entry is None:
+            raise KeyError(name + " is not in the material library " + self.mat_path)
+        return _load_material(join(self.mat_path, entry["path"]))
+
+    def get_material_list(self):
+        """Load all the materials of the library (as load_matlib)"""
+        mat_list = list()
+        for entry in self.get_entry_list():
+            file_path = join(self.mat_path, entry["path"])
+            try:
+                mat_list.append(_load_material(file_path))
+            except Exception:
+                print("When loading matlib, unable to load file: " + file_path)
+        return mat_list
+
+    def search(self, criteria):
+        """Return the entries of the materials matching all the criteria
+
+        Parameters
+        ----------
+        criteria : dict
+            Property name (from INDEX_PROPERTY_LIST, "name" or "path") => value
+            or function returning True for the valid values
+
+        Returns
+        -------
+        entry_list : list
+            Entries of the matching materials
+        """
+        for prop in criteria:
+            if prop not in INDEX_PROPERTY_LIST and prop not in ["name", "path"]:
+                raise KeyError(prop + " is not a property of the material index")
+        entry_list = list()
+        for entry in self.get_entry_list():
+            is_valid = True
+            for prop, crit in criteria.items():
+                value = entry[prop]
+                if callable(crit):
+                    is_valid = value is not None and bool(crit(value))
+                else:
+                    is_valid = value == crit
+                if not is_valid:
+                    break
+            if is_valid:
+                entry_list.append(entry)
+        return entry_list
+
+
+def _read_entry(file_path):
+    """Read the index entry of a file (without creating the pyleecan objects,
+    the large arrays of the h5 files are not read)"""
+    # Imported here to avoid a circular import
+    from ..load import load_init_dict
+
+    entry = {"is_material": False, "name": _get_mat_name(file_path)}
+    try:
+        _, init_dict = load_init_dict(file_path, is_lazy=True)
+        if not isinstance(init_dict, dict):
+            return entry
+        convert_init_dict(init_dict)
+        _check_class(init_dict)
+    except Exception:
+        print("When loading matlib, unable to load file: " + file_path)
+        return entry
+
+    entry["is_material"] = init_dict.get("__class__") == "Material"
+    for prop in INDEX_PROPERTY_LIST:
+        value = init_dict
+        for name in prop.split("."):
+            value = value.get(name) if isinstance(value, dict) else None
+        if not isinstance(value, (bool, int, float, str)):
+            value = None
+        entry[prop] = value
+    return entry
+
+
+def _check_class(init_dict):
+    """Check that all the classes of an init_dict exist (as load)"""
+    if isinstance(init_dict, dict):
+        if "__class__" in init_dict:
+            import_class("pyleecan.Classes", init_dict["__class__"], "")
+        for value in init_dict.values():
+            _check_class(value)
+    elif isinstance(init_dict, list):
+        for value in init_dict:
+            _check_class(value)
+
+
+def _get_mat_name(file_path):
+    """Name of a material of the library (name of its file)"""
+    return splitext(basename(file_path))[0]
+
+
+def _load_material(file_path):
+    """Load a material of the library (None if the file is not a Material)"""
+    # Imported here to avoid a circular import
+    from ..load import load
+
+    mat = load(file_path)
+    # Update the object property
+    mat.name = _get_mat_name(file_path)
+    mat.path = file_path
+    # Keep only the materials
+    if isinstance(mat, import_class("pyleecan.Classes", "Material")):
+        return mat
+    return None
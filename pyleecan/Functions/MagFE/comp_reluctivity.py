@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from numpy import clip, concatenate, interp, linspace, pi, searchsorted, unique, where
+
+MU0 = 4 * pi * 1e-7  # Vacuum permeability [H/m]
+
+
+def get_reluctivity_table(BH, nb_point=1000, B_ext=3):
+    """Tabulate the reluctivity nu = H/B of a B(H) curve as a function of B^2
+    (piecewise linear, as needed by the Newton iterations)
+
+    Parameters
+    ----------
+    BH : ndarray
+        B(H) curve (two columns matrix: H and B(H), see MatMagnetics.get_BH)
+    nb_point : int
+        Number of points of the table
+    B_ext : float
+        The curve is extrapolated with the vacuum permeability up to
+        max(B) + B_ext [T]
+
+    Returns
+    -------
+    table : tuple
+        B^2 values [T^2] and reluctivity values [m/H]
+    """
+    B_curve, ind = unique(BH[:, 1], return_index=True)
+    H_curve = BH[ind, 0]
+    if B_curve[0] > 0:
+        B_curve = concatenate(([0], B_curve))
+        H_curve = concatenate(([0], H_curve))
+    B_max, H_max = B_curve[-1], H_curve[-1]
+
+    B = linspace(0, B_max + B_ext, nb_point)
+    H = where(
+        B <= B_max,
+        interp(B, B_curve, H_curve),
+        H_max + (B - B_max) / MU0,
+    )
+    nu = H[1:] / B[1:]
+    # Initial reluctivity (slope of the curve at B=0)
+    nu = concatenate(([H_curve[1] / B_curve[1]], nu))
+    return B ** 2, nu
+
+
+def comp_reluctivity(table, B2):
+    """Compute the reluctivity and its derivative with respect to B^2
+
+    Parameters
+    ----------
+    table : tuple
+        Reluctivity table from get_reluctivity_table
+    B2 : ndarray
+        Square of the flux density [T^2]
+
+    Returns
+    -------
+    nu : ndarray
+        Reluctivity [m/H]
+    dnu : ndarray
+        Derivative of the reluctivity with respect to B^2 [m/(H.T^2)]
+    """
+    B2_table, nu_table = table
+    ii = clip(searchsorted(B2_table, B2, side="right") - 1, 0, B2_table.size - 2)
+    dnu = (nu_table[ii + 1] - nu_table[ii]) / (B2_table[ii + 1] - B2_table[ii])
+    nu = nu_table[ii] + dnu * (B2 - B2_table[ii])
+    # Constant reluctivity beyond the table
+    is_out = B2 > B2_table[-1]
+    nu[is_out] = nu_table[-1]
+    dnu[is_out] = 0
+    return nu, dnu
@@ -0,0 +1,779 @@
+# -*- coding: utf-8 -*-
+from re import findall
+
+from matplotlib.path import Path
+from numpy import (
+    abs as np_abs,
+    angle as np_angle,
+    append,
+    arange,
+    array,
+    bincount,
+    ceil,
+    column_stack,
+    concatenate,
+    cos,
+    einsum,
+    exp,
+    floor,
+    full,
+    log,
+    ones,
+    pi,
+    real,
+    searchsorted,
+    sin,
+    unique,
+    where,
+    zeros,
+)
+from numpy.fft import rfft
+from numpy.linalg import norm
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.linalg import splu
+
+from ..FEMM import FEMM_GROUPS
+from ..Winding.find_wind_phase_color import get_phase_id
+from .comp_reluctivity import MU0, comp_reluctivity, get_reluctivity_table
+from .mesh_FE_domain import discretize_FE_surface, mesh_FE_domain
+
+# Relative permeability used for the infinite permeability (as in FEMM)
+MUR_INF = 100000
+
+
+class MagFEModel(object):
+    """2D magnetostatic finite element model (vector potential formulation, P1
+    triangles) of an angular sector of a machine with two laminations
+
+    Each lamination is meshed once at rest (in its own frame) and the rotation
+    is modelled by a moving band of triangles in the middle of the airgap,
+    rebuilt for each position between the two regular rings of nodes of the
+    laminations meshes. The element kernels and the sparsity pattern of the
+    laminations are computed once: only the reluctivity of the nonlinear
+    elements, the band and the sources change from one time step to another.
+    """
+
+    def __init__(
+        self,
+        machine,
+        sym=1,
+        is_antiper=False,
+        Kmesh_fineness=1,
+        is_mmfs=True,
+        is_mmfr=True,
+        type_BH_stator=0,
+        type_BH_rotor=0,
+    ):
+        """Mesh the machine and compute the element kernels and sources
+
+        Parameters
+        ----------
+        machine : Machine
+            Machine to model (with two laminations)
+        sym : int
+            Number of sectors of the machine (the model is on 2*pi/sym)
+        is_antiper : bool
+            True if the sector boundaries are anti-periodic
+        Kmesh_fineness : float
+            Global coefficient of the mesh fineness (> 1 for a finer mesh)
+        is_mmfs : bool
+            False to remove the stator sources (currents and magnets)
+        is_mmfr : bool
+            False to remove the rotor sources (currents and magnets)
+        type_BH_stator : int
+            0 to use the B(H) curve, 1 to use mur_lin, 2 for an infinite
+            permeability
+        type_BH_rotor : int
+            0 to use the B(H) curve, 1 to use mur_lin, 2 for an infinite
+            permeability
+        """
+        self.sym = sym
+        self.sigma = -1 if is_antiper else 1
+        self.U = 2 * pi / sym
+        self.L = (machine.stator.comp_length() + machine.rotor.comp_length()) / 2
+        lam_list = machine.get_lam_list()
+        self.lam_list = lam_list[0:2]
+        self.label_list = machine.get_lam_list_label()[0:2]
+
+        # Moving band in the middle third of the airgap
+        R_int = lam_list[0].comp_radius_mec()
+        R_ext = lam_list[1].comp_radius_mec()
+        W_sb = (R_ext - R_int) / 3
+        self.R1, self.R2 = R_int + W_sb, R_ext - W_sb
+        R_mid = (R_int + R_ext) / 2
+        h_band = W_sb / Kmesh_fineness
+
+        def comp_size(r):
+            return min(h_band + 0.25 * abs(r - R_mid), 10 * h_band)
+
+        self.Nb = int(ceil(self.U * self.R1 / h_band))
+
+        # Mesh of the laminations
+        R_far = lam_list[0].Rint if lam_list[0].Rint > 0 else lam_list[0].Rext / 20
+        point_list, cell_list, is_dirichlet_list = list(), list(), list()
+        self.elem_label = list()  # Label of the surface of each element
+        self.ring = list()  # Nodes of the airgap side of each lamination
+        nu_list, table_list, Hc_list, winding_list = list(), list(), list(), list()
+        master = list()
+        offset = 0
+        for lam, R_ring, R_far, is_mmf, type_BH in [
+            (
+                lam_list[0],
+                self.R1,
+                R_far,
+                is_mmfs if lam_list[0].is_stator else is_mmfr,
+                type_BH_stator if lam_list[0].is_stator else type_BH_rotor,
+            ),
+            (
+                lam_list[1],
+                self.R2,
+                lam_list[1].Rext,
+                is_mmfs if lam_list[1].is_stator else is_mmfr,
+                type_BH_stator if lam_list[1].is_stator else type_BH_rotor,
+            ),
+        ]:
+            surf_list = lam.build_geometry(sym=1)
+            polygon_list = [
+                discretize_FE_surface(surf, comp_size) for surf in surf_list
+            ]
+            mesh = mesh_FE_domain(
+                [poly for polys in polygon_list for poly in polys],
+                R_ring,
+                R_far,
+                self.U,
+                self.Nb,
+                comp_size,
+            )
+            point_list.append(mesh["point"])
+            cell_list.append(mesh["cell"] + offset)
+            is_dirichlet_list.append(mesh["is_dirichlet"])
+            self.ring.append(mesh["ring"][:-1] + offset)
+            master.append(mesh["edge"] + offset)
+            offset += mesh["point"].shape[0]
+
+            # Surface of each element (the lamination surfaces are the last)
+            P = mesh["point"][mesh["cell"]]
+            center = P[:, :, 0].mean(axis=1) + 1j * P[:, :, 1].mean(axis=1)
+            surf_id = _get_surf_id(surf_list, polygon_list, center)
+            self.elem_label.extend(
+                ["" if ii < 0 else surf_list[ii].label for ii in surf_id]
+            )
+            nu, table, Hc, winding = _get_material(
+                lam, surf_list, surf_id, center, is_mmf, type_BH
+            )
+            nu_list.append(nu)
+            table_list.append(table)
+            Hc_list.append(Hc)
+            winding_list.append(winding)
+
+        self.point = concatenate(point_list)
+        self.cell = concatenate(cell_list)
+        self.nb_elem_lam = [cell.shape[0] for cell in cell_list]
+        self.nu = concatenate(nu_list)
+        Hc = concatenate(Hc_list)
+
+        # Nonlinear elements (by material)
+        self.nonlinear_list = list()
+        offset = 0
+        for table, nb_elem in zip(table_list, self.nb_elem_lam):
+            if table is not None:
+                elem_id = where(self.nu[offset : offset + nb_elem] < 0)[0] + offset
+                self.nonlinear_list.append((elem_id, table))
+            offset += nb_elem
+        self.is_linear = len(self.nonlinear_list) == 0
+        self.nu[self.nu < 0] = 0  # Set at each Newton iteration
+
+        # Degrees of freedom: Dirichlet nodes and (anti-)periodic sector sides
+        nb_point = self.point.shape[0]
+        node_master = arange(nb_point)
+        self.node_sign = ones(nb_point)
+        for edge in master:
+            node_master[edge[:, 1]] = edge[:, 0]
+            self.node_sign[edge[:, 1]] = self.sigma
+        is_free = ~concatenate(is_dirichlet_list) & (node_master == arange(nb_point))
+        dof_id = full(nb_point, -1)
+        dof_id[is_free] = arange(is_free.sum())
+        self.dof = dof_id[node_master]
+        self.Ndof = int(is_free.sum())
+
+        # Element kernels
+        self.area, self.G = _comp_kernel(self.point[self.cell])
+        self.S = einsum("eki,ekj->eij", self.G, self.G) * self.area[:, None, None]
+        self.elem_dof = self.dof[self.cell]
+        self.elem_sign = self.node_sign[self.cell]
+
+        # Sparsity pattern of the laminations matrix (computed once)
+        rows = self.elem_dof[:, :, None].repeat(3, axis=2)
+        cols = self.elem_dof[:, None, :].repeat(3, axis=1)
+        self._mask = (rows >= 0) & (cols >= 0)
+        self._sign = (self.elem_sign[:, :, None] * self.elem_sign[:, None, :])[
+            self._mask
+        ]
+        lin, self._inv = unique(
+            rows[self._mask] * self.Ndof + cols[self._mask], return_inverse=True
+        )
+        self._indices = lin % self.Ndof
+        self._indptr = searchsorted(lin // self.Ndof, arange(self.Ndof + 1))
+        self._is_dof = self.elem_dof >= 0
+
+        # Sources: magnets and current density per unit current of each phase
+        self.Hc = Hc
+        self.f_mag = self.assemble_vector(
+            self.area[:, None]
+            * (Hc[:, 0:1] * self.G[:, 1, :] - Hc[:, 1:2] * self.G[:, 0, :])
+        )
+        self.F_I = dict()
+        offset = 0
+        for label, lam, winding, nb_elem in zip(
+            self.label_list, self.lam_list, winding_list, self.nb_elem_lam
+        ):
+            if winding is not None:
+                phase, density = winding
+                F = zeros((self.Ndof, lam.winding.qs))
+                for q in range(lam.winding.qs):
+                    weight = zeros(self.cell.shape[0])
+                    is_q = phase == q
+                    weight[offset : offset + nb_elem][is_q] = (
+                        density[is_q] * self.area[offset : offset + nb_elem][is_q] / 3
+                    )
+                    F[:, q] = self.assemble_vector(weight[:, None].repeat(3, axis=1))
+                self.F_I[label] = F
+            offset += nb_elem
+
+    def assemble_vector(self, w):
+        """Assemble an element vector (Nelem, 3) on the degrees of freedom"""
+        return bincount(
+            self.elem_dof[self._is_dof],
+            weights=(self.elem_sign * w)[self._is_dof],
+            minlength=self.Ndof,
+        )
+
+    def assemble_matrix(self, w):
+        """Assemble element matrices (Nelem, 3, 3) with the precomputed
+        sparsity pattern"""
+        data = bincount(
+            self._inv, weights=w[self._mask] * self._sign, minlength=self._indices.size
+        )
+        return csr_matrix(
+            (data, self._indices, self._indptr), shape=(self.Ndof, self.Ndof)
+        )
+
+    def get_node_value(self, a):
+        """Vector potential of the nodes from the degrees of freedom"""
+        return self.node_sign * append(a, 0)[self.dof]
+
+    def comp_B(self, a):
+        """Flux density of the laminations elements (Nelem, 2) [T] in the frame
+        of each lamination"""
+        grad = einsum("eki,ei->ek", self.G, self.get_node_value(a)[self.cell])
+        return column_stack((grad[:, 1], -grad[:, 0]))
+
+    def comp_reluctivity(self, a):
+        """Reluctivity of the elements (Nelem,) [m/H] and its derivative with
+        respect to B^2 (0 for the linear elements)"""
+        nu = self.nu.copy()
+        dnu = zeros(nu.size)
+        if not self.is_linear:
+            B2 = (self.comp_B(a) ** 2).sum(axis=1)
+            for elem_id, table in self.nonlinear_list:
+                nu[elem_id], dnu[elem_id] = comp_reluctivity(table, B2[elem_id])
+        return nu, dnu
+
+    def get_band(self, alpha):
+        """Triangles of the moving band for a rotation alpha of the inner
+        lamination relatively to the outer one
+
+        Parameters
+        ----------
+        alpha : float
+            Rotation of the inner lamination [rad]
+
+        Returns
+        -------
+        band_dict : dict
+            node: nodes of the triangles (2*Nb, 3)
+            sign: sign of the nodes (anti-periodicity) (2*Nb, 3)
+            S: stiffness matrices per unit reluctivity of the 2 triangle
+            shapes (2, 3, 3)
+            A1_index, A1_sign: nodes and signs of the inner ring in the order of
+            the angles (from shift)
+            shift: angle of the first node of the inner ring [rad]
+        """
+        Nb, sigma = self.Nb, self.sigma
+        delta = self.U / Nb
+        x = alpha / delta
+        q = int(floor(x))
+        frac = x - q
+        # Inner ring node at the i-th position (angle (i+frac)*delta)
+        ii = arange(Nb + 1)
+        k = (ii - q) % Nb
+        m = (k + q - ii) // Nb
+        m[-1] = m[0] + 1  # Next sector
+        sign_in = (sigma ** (m % 2)).astype(float)
+        node_in = self.ring[0][k]
+        node_out = self.ring[1][ii % Nb]
+        sign_out = ones(Nb + 1)
+        sign_out[-1] = sigma
+        i0, i1 = arange(Nb), arange(1, Nb + 1)
+        node = concatenate(
+            (
+                column_stack((node_in[i0], node_out[i1], node_out[i0])),
+                column_stack((node_in[i0], node_in[i1], node_out[i1])),
+            )
+        )
+        sign = concatenate(
+            (
+                column_stack((sign_in[i0], sign_out[i1], sign_out[i0])),
+                column_stack((sign_in[i0], sign_in[i1], sign_out[i1])),
+            )
+        )
+        # Shapes of the first triangles (the others are rotated)
+        z_in = self.R1 * exp(1j * delta * array([frac, 1 + frac]))
+        z_out = self.R2 * exp(1j * delta * array([0, 1]))
+        P = array(
+            [
+                [z_in[0], z_out[1], z_out[0]],
+                [z_in[0], z_in[1], z_out[1]],
+            ]
+        )
+        area, G = _comp_kernel(
+            column_stack((P.real.ravel(), P.imag.ravel())).reshape(2, 3, 2)
+        )
+        return {
+            "node": node,
+            "sign": sign,
+            "S": einsum("eki,ekj->eij", G, G) * area[:, None, None],
+            "A1_index": node_in[:-1],
+            "A1_sign": sign_in[:-1],
+            "shift": frac * delta,
+        }
+
+    def get_band_matrix(self, band):
+        """Stiffness matrix of the moving band (air)"""
+        Nb = self.Nb
+        S = band["S"].repeat(Nb, axis=0) / MU0
+        dof = self.dof[band["node"]]
+        sign = band["sign"] * self.node_sign[band["node"]]
+        rows = dof[:, :, None].repeat(3, axis=2)
+        cols = dof[:, None, :].repeat(3, axis=1)
+        mask = (rows >= 0) & (cols >= 0)
+        values = (S * sign[:, :, None] * sign[:, None, :])[mask]
+        return coo_matrix(
+            (values, (rows[mask], cols[mask])), shape=(self.Ndof, self.Ndof)
+        ).tocsr()
+
+    def comp_residual(self, a, K_band, f):
+        """Residual of the discrete problem, its jacobian and the reluctivity
+
+        Parameters
+        ----------
+        a : ndarray
+            Degrees of freedom (Ndof,)
+        K_band : csr_matrix
+            Stiffness matrix of the moving band
+        f : ndarray
+            Source vector (Ndof,)
+
+        Returns
+        -------
+        r : ndarray
+            Residual (Ndof,)
+        J : csr_matrix
+            Jacobian of the residual
+        """
+        nu, dnu = self.comp_reluctivity(a)
+        A_elem = self.get_node_value(a)[self.cell]
+        K_elem = nu[:, None, None] * self.S
+        r = self.assemble_vector(einsum("eij,ej->ei", K_elem, A_elem)) + K_band * a - f
+        if not self.is_linear:
+            # Derivative of the reluctivity of the nonlinear elements
+            SA = einsum("eij,ej->ei", self.S, A_elem)
+            K_elem = K_elem + 2 * (dnu / self.area)[:, None, None] * (
+                SA[:, :, None] * SA[:, None, :]
+            )
+        return r, self.assemble_matrix(K_elem) + K_band
+
+    def solve(self, alpha, f, a0=None, tol=1e-6, nb_iter_max=50):
+        """Solve the problem for a position of the inner lamination (Newton
+        iterations with damping for the nonlinear materials)
+
+        Parameters
+        ----------
+        alpha : float
+            Rotation of the inner lamination [rad]
+        f : ndarray
+            Source vector (Ndof,)
+        a0 : ndarray
+            Initial degrees of freedom (e.g. solution of the previous time step)
+        tol : float
+            Relative tolerance on the update of the degrees of freedom
+        nb_iter_max : int
+            Maximum number of Newton iterations
+
+        Returns
+        -------
+        a : ndarray
+            Degrees of freedom (Ndof,)
+        nb_iter : int
+            Number of linear systems solved
+        """
+        K_band = self.get_band_matrix(self.get_band(alpha))
+        a = zeros(self.Ndof) if a0 is None else a0.copy()
+        r, J = self.comp_residual(a, K_band, f)
+        nb_iter = 0
+        while nb_iter < nb_iter_max and norm(r) > 0:
+            da = splu(J.tocsc(), permc_spec="MMD_AT_PLUS_A").solve(r)
+            nb_iter += 1
+            if self.is_linear:
+                return a - da, nb_iter
+            # Damping of the update until the residual decreases
+            t = 1
+            while True:
+                a_new = a - t * da
+                r_new, J_new = self.comp_residual(a_new, K_band, f)
+                if norm(r_new) <= norm(r) or t < 1 / 64:
+                    break
+                t /= 2
+            a, r, J = a_new, r_new, J_new
+            if t * np_abs(da).max() <= tol * np_abs(a).max():
+                break
+        return a, nb_iter
+
+    def get_ring_value(self, a, alpha):
+        """Vector potential on the two rings of the moving band
+
+        Parameters
+        ----------
+        a : ndarray
+            Degrees of freedom (Ndof,)
+        alpha : float
+            Rotation of the inner lamination [rad]
+
+        Returns
+        -------
+        A1 : ndarray
+            Vector potential of the inner ring at the angles shift+k*U/Nb (Nb,)
+        A2 : ndarray
+            Vector potential of the outer ring at the angles k*U/Nb (Nb,)
+        shift : float
+            Angle of the first node of the inner ring [rad]
+        """
+        band = self.get_band(alpha)
+        A_node = self.get_node_value(a)
+        A1 = band["A1_sign"] * A_node[band["A1_index"]]
+        return A1, A_node[self.ring[1]], band["shift"]
+
+    def comp_airgap_flux(self, A1, A2, shift, angle, R):
+        """Compute the airgap flux density from the vector potential of the two
+        rings of the moving band
+
+        Parameters
+        ----------
+        A1 : ndarray
+            Vector potential of the inner ring (Nt, Nb)
+        A2 : ndarray
+            Vector potential of the outer ring (Nt, Nb)
+        shift : ndarray
+            Angle of the first node of the inner ring (Nt,) [rad]
+        angle : ndarray
+            Angles in the frame of the outer lamination (Na,) or (Nt, Na) [rad]
+        R : float
+            Radius (between R1 and R2) [m]
+
+        Returns
+        -------
+        Br : ndarray
+            Radial flux density (Nt, Na) [T]
+        Bt : ndarray
+            Tangential flux density (Nt, Na) [T]
+        """
+        omega, Br_coeff, Bt_coeff = self._comp_airgap_coeff(A1, A2, shift, R)
+        if angle.ndim == 1:
+            E = exp(1j * omega[:, None] * angle[None, :])
+            return real(Br_coeff.dot(E)), real(Bt_coeff.dot(E))
+        E = exp(1j * omega[None, :, None] * angle[:, None, :])
+        return (
+            real(einsum("tm,tma->ta", Br_coeff, E)),
+            real(einsum("tm,tma->ta", Bt_coeff, E)),
+        )
+
+    def comp_torque(self, A1, A2, shift):
+        """Compute the torque on the inner lamination with the Maxwell stress
+        tensor in the moving band (the same on any radius of the band)
+
+        Parameters
+        ----------
+        A1 : ndarray
+            Vector potential of the inner ring (Nt, Nb)
+        A2 : ndarray
+            Vector potential of the outer ring (Nt, Nb)
+        shift : ndarray
+            Angle of the first node of the inner ring (Nt,) [rad]
+
+        Returns
+        -------
+        Tem : ndarray
+            Torque on the inner lamination (whole machine) (Nt,) [N.m]
+        """
+        R = (self.R1 + self.R2) / 2
+        _, Br_coeff, Bt_coeff = self._comp_airgap_coeff(A1, A2, shift, R)
+        # Average of Br*Bt along the airgap (Parseval)
+        BrBt = real(Br_coeff * Bt_coeff.conj()).sum(axis=1) / 2
+        return 2 * pi * self.L * R ** 2 * BrBt / MU0
+
+    def _comp_airgap_coeff(self, A1, A2, shift, R):
+        """Fourier coefficients of the airgap flux density on the radius R:
+        exact solution of the air annulus between the two rings for each
+        harmonic of the vector potential
+
+        Returns
+        -------
+        omega : ndarray
+            Angular orders of the harmonics (Nm,)
+        Br_coeff : ndarray
+            Complex amplitudes of the radial flux density (Nt, Nm) [T]
+        Bt_coeff : ndarray
+            Complex amplitudes of the tangential flux density (Nt, Nm) [T]
+        """
+        period = self.U
+        if self.sigma == -1:
+            A1 = concatenate((A1, -A1), axis=1)
+            A2 = concatenate((A2, -A2), axis=1)
+            period = 2 * self.U
+        N = A1.shape[1]
+        c1 = rfft(A1, axis=1) / N
+        c2 = rfft(A2, axis=1) / N
+        m = arange(c1.shape[1])
+        omega = 2 * pi * m / period
+        c1 = c1 * exp(-1j * omega[None, :] * shift[:, None])
+        weight = where(m == 0, 1.0, 2.0)
+        if N % 2 == 0:
+            weight[-1] = 0  # Nyquist harmonic
+        R1, R2 = self.R1, self.R2
+        den = (R2 / R1) ** omega - (R1 / R2) ** omega
+        den[0] = 1
+        C = (
+            c1 * ((R2 / R) ** omega - (R / R2) ** omega)
+            + c2 * ((R / R1) ** omega - (R1 / R) ** omega)
+        ) / den
+        dC = (
+            (omega / R)
+            * (
+                -c1 * ((R2 / R) ** omega + (R / R2) ** omega)
+                + c2 * ((R / R1) ** omega + (R1 / R) ** omega)
+            )
+            / den
+        )
+        # Average value: logarithmic profile
+        dC[:, 0] = (c2[:, 0] - c1[:, 0]) / (R * log(R2 / R1))
+        return omega, weight * 1j * omega * C / R, -weight * dC
+
+    def get_group(self):
+        """Return the elements of each group (same groups as FEMM)
+
+        Returns
+        -------
+        group : dict
+            Name of the group => indices of its elements
+        """
+        group_id = array([_get_group(label) for label in self.elem_label])
+        group = dict()
+        for grp in FEMM_GROUPS.values():
+            ind = where(group_id == grp["name"])[0]
+            if ind.size > 0:
+                group[grp["name"]] = ind
+        return group
+
+
+def _comp_kernel(P):
+    """Area and gradient of the shape functions of P1 triangles
+
+    Parameters
+    ----------
+    P : ndarray
+        Coordinates of the triangles nodes (Nelem, 3, 2)
+
+    Returns
+    -------
+    area : ndarray
+        Area of the triangles (Nelem,)
+    G : ndarray
+        Gradient of the shape functions (Nelem, 2, 3)
+    """
+    x, y = P[:, :, 0], P[:, :, 1]
+    x1, x2, x3 = x[:, 0], x[:, 1], x[:, 2]
+    y1, y2, y3 = y[:, 0], y[:, 1], y[:, 2]
+    area2 = (x2 - x1) * (y3 - y1) - (x3 - x1) * (y2 - y1)
+    G = zeros((P.shape[0], 2, 3))
+    G[:, 0, :] = column_stack((y2 - y3, y3 - y1, y1 - y2)) / area2[:, None]
+    G[:, 1, :] = column_stack((x3 - x2, x1 - x3, x2 - x1)) / area2[:, None]
+    return np_abs(area2) / 2, G
+
+
+def _get_surf_id(surf_list, polygon_list, center):
+    """Index of the surface containing each element center (-1 for the air):
+    the lamination surfaces are tested last (they contain the others)"""
+    surf_id = full(center.size, -1)
+    order = [ii for ii, surf in enumerate(surf_list) if "Lamination" not in surf.label]
+    order += [ii for ii, surf in enumerate(surf_list) if "Lamination" in surf.label]
+    xy = column_stack((center.real, center.imag))
+    for ii in order:
+        if surf_list[ii].point_ref is None:
+            continue
+        is_free = surf_id < 0
+        path_list = [
+            Path(column_stack((poly.real, poly.imag)), closed=False)
+            for poly in polygon_list[ii]
+        ]
+        is_in = path_list[0].contains_points(xy[is_free])
+        for path in path_list[1:]:  # Inner contour of a SurfRing
+            is_in &= ~path.contains_points(xy[is_free])
+        surf_id[where(is_free)[0][is_in]] = ii
+    return surf_id
+
+
+def _get_material(lam, surf_list, surf_id, center, is_mmf, type_BH):
+    """Material properties and sources of the elements of a lamination
+
+    Parameters
+    ----------
+    lam : Lamination
+        Lamination
+    surf_list : list
+        Surfaces of the lamination
+    surf_id : ndarray
+        Surface of each element (-1 for the air)
+    center : ndarray
+        Center of each element (complex)
+    is_mmf : bool
+        False to remove the sources of the lamination
+    type_BH : int
+        0 to use the B(H) curve, 1 to use mur_lin, 2 for an infinite
+        permeability
+
+    Returns
+    -------
+    nu : ndarray
+        Reluctivity of the elements (-1 for the nonlinear elements) [m/H]
+    table : tuple
+        Reluctivity table of the nonlinear elements (None if linear)
+    Hc : ndarray
+        Coercive field of the magnets elements (Nelem, 2) [A/m]
+    winding : tuple
+        Phase index (-1 if none) and turns per unit area [1/m2] of each element
+        (None if the lamination has no winding)
+    """
+    nb_elem = center.size
+    nu = full(nb_elem, 1 / MU0)
+    Hc = zeros((nb_elem, 2))
+    table = None
+    winding = None
+    theta = np_angle(center)
+    if hasattr(lam, "winding") and lam.winding is not None:
+        wind_mat = lam.winding.comp_connection_mat(lam.slot.Zs)
+        winding = (full(nb_elem, -1), zeros(nb_elem))
+
+    for ii, surf in enumerate(surf_list):
+        is_surf = surf_id == ii
+        if not is_surf.any():
+            continue
+        label = surf.label
+        if "Lamination" in label:
+            mat = lam.mat_type.mag
+            if type_BH == 2:
+                nu[is_surf] = 1 / (MU0 * MUR_INF)
+            elif type_BH == 1 or mat.BH_curve is None:
+                nu[is_surf] = 1 / (MU0 * mat.mur_lin)
+            else:
+                nu[is_surf] = -1  # Nonlinear elements
+                table = get_reluctivity_table(mat.get_BH())
+        elif ("Wind" in label or "Bar" in label) and winding is not None:
+            st = label.split("_")
+            Nrad_id, Ntan_id, Zs_id = int(st[2][1:]), int(st[3][1:]), int(st[4][1:])
+            q_id = get_phase_id(wind_mat, Nrad_id, Ntan_id, Zs_id)
+            if q_id is not None:
+                Ntcoil = wind_mat[Nrad_id, Ntan_id, Zs_id, q_id]
+                winding[0][is_surf] = q_id
+                winding[1][is_surf] = Ntcoil / surf.comp_surface()
+        elif "Magnet" in label:
+            if "HoleMagnet" in label:
+                idx_str = findall(r"_T\d+_", label)[0][2:-1]
+                magnet = lam.hole[0].get_magnet_dict()["magnet_" + idx_str]
+            else:
+                magnet = lam.magnet
+            nu[is_surf] = 1 / (MU0 * magnet.mat_type.mag.mur_lin)
+            if is_mmf:
+                mag_angle = _get_magnetization(
+                    label, surf.point_ref, lam, theta[is_surf]
+                )
+                Hc[is_surf, 0] = magnet.mat_type.mag.Hc * cos(mag_angle)
+                Hc[is_surf, 1] = magnet.mat_type.mag.Hc * sin(mag_angle)
+
+    return nu, table, Hc, winding
+
+
+def _get_magnetization(label, point_ref, lam, theta):
+    """Magnetization direction of the magnet elements (as in FEMM)
+
+    Parameters
+    ----------
+    label : str
+        Label of the magnet surface
+    point_ref : complex
+        Reference point of the magnet surface
+    lam : Lamination
+        Lamination of the magnet
+    theta : ndarray
+        Angle of the elements centers [rad]
+
+    Returns
+    -------
+    mag_angle : ndarray
+        Magnetization direction of the elements [rad]
+    """
+    if "HoleMagnet" in label:
+        hole = lam.hole[0]
+        alpha_p = 2 * pi / hole.Zh
+        mag = (floor(np_angle(point_ref) / alpha_p) + 0.5) * alpha_p
+        hole_type = type(hole).__name__
+        if hole_type in ["HoleM50", "HoleM53"]:
+            mag += hole.comp_alpha() if "_T0_" in label else -hole.comp_alpha()
+        elif hole_type == "HoleM51":
+            if "_T0_" in label:
+                mag += hole.comp_alpha()
+            elif "_T1_" not in label:
+                mag -= hole.comp_alpha()
+        if "_S_" in label:
+            mag += pi
+        return full(theta.size, mag)
+    if "Radial" in label:
+        return theta if "_N_" in label else theta + pi
+    if "Parallel" in label:
+        mag = np_angle(point_ref)
+        return full(theta.size, mag if "_N_" in label else mag + pi)
+    if "Hallbach" in label:
+        return -(lam.slot.Zs / 2 - 1) * theta + pi / 2
+    return full(theta.size, 0.0)
+
+
+def _get_group(label):
+    """Name of the FEMM group of a surface label ("airgap" for the air)"""
+    if label == "":
+        key = "GROUP_AG"
+    elif "Lamination_Stator" in label:
+        key = "GROUP_SC"
+    elif "Lamination_Rotor" in label:
+        key = "GROUP_RC"
+    elif "Ventilation" in label:
+        key = "GROUP_SV" if "Stator" in label else "GROUP_RV"
+    elif "Hole_" in label:
+        key = "GROUP_SH" if "Stator" in label else "GROUP_RH"
+    elif "Wind" in label or "Bar" in label:
+        key = "GROUP_SW" if "Stator" in label else "GROUP_RW"
+    elif "Magnet" in label:
+        key = "GROUP_SM" if "Stator" in label else "GROUP_RM"
+    elif "Stator" in label:
+        key = "GROUP_SC"
+    else:
+        key = "GROUP_RC"
+    return FEMM_GROUPS[key]["name"]
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+from numpy import (
+    abs as np_abs,
+    angle as np_angle,
+    arange,
+    array,
+    ceil,
+    column_stack,
+    concatenate,
+    cos,
+    exp,
+    full,
+    linspace,
+    log,
+    ones,
+    pi,
+    searchsorted,
+    sin,
+    sort,
+    unique,
+    zeros,
+)
+from scipy.spatial import Delaunay, cKDTree
+
+
+def discretize_FE_surface(surf, comp_size):
+    """Discretize the contour(s) of a surface with points spaced according to
+    the mesh size function
+
+    Parameters
+    ----------
+    surf : Surface
+        Surface to discretize
+    comp_size : function
+        Mesh element size [m] as a function of the radius [m]
+
+    Returns
+    -------
+    polygon_list : list
+        List of closed polygons (complex ndarray, the first point is not
+        repeated): the outer contour and the inner one for a SurfRing
+    """
+    if hasattr(surf, "out_surf"):  # SurfRing
+        polygon_list = discretize_FE_surface(surf.out_surf, comp_size)
+        if surf.in_surf is not None:
+            polygon_list.extend(discretize_FE_surface(surf.in_surf, comp_size))
+        return polygon_list
+
+    point_list = list()
+    for line in surf.get_lines():
+        begin, end = line.get_begin(), line.get_end()
+        size = min(comp_size(abs(begin)), comp_size(abs(end)))
+        nb_point = max(int(ceil(line.comp_length() / (0.8 * size))) - 1, 0)
+        # The end of each line is the begin of the next one
+        point_list.append(array(line.discretize(nb_point))[:-1])
+    return [concatenate(point_list)]
+
+
+def mesh_FE_domain(polygon_list, R_ring, R_far, U, Nb, comp_size):
+    """Mesh the angular sector [0, U] of the annulus between the radius of the
+    airgap side (R_ring) and the other radius of a lamination (R_far)
+
+    The points (regular radial layers, discretized surface contours) are
+    triangulated in the (angle, log(radius)) plane: the sector is then a
+    rectangle (convex) and the conformal mapping to the (x, y) plane keeps the
+    quality of the Delaunay triangles. Both sector sides have the same nodes
+    (radius) for the (anti-)periodic boundary condition and the airgap side has
+    Nb regular intervals for the moving band.
+
+    Parameters
+    ----------
+    polygon_list : list
+        Discretized contours of the surfaces (complex ndarray)
+    R_ring : float
+        Radius of the airgap side of the domain [m]
+    R_far : float
+        Other radius of the domain (Dirichlet boundary) [m]
+    U : float
+        Angular width of the sector [rad]
+    Nb : int
+        Number of intervals on the airgap side
+    comp_size : function
+        Mesh element size [m] as a function of the radius [m]
+
+    Returns
+    -------
+    mesh_dict : dict
+        point: node coordinates (N, 2) [m]
+        cell: triangles (Nelem, 3) (counterclockwise)
+        ring: nodes of the airgap side (Nb+1,) at the angles k*U/Nb
+        edge: pairs of nodes of the sector sides (Nedge, 2) at the angles 0 and U
+        is_dirichlet: True for the nodes of the R_far side (N,)
+    """
+    # Radial layers from the airgap side to the other side
+    direction = 1 if R_far > R_ring else -1
+    r_list = [R_ring]
+    while direction * (R_far - r_list[-1]) > 0:
+        r_list.append(r_list[-1] + direction * comp_size(r_list[-1]))
+    if len(r_list) > 3 and direction * (r_list[-1] - R_far) > 0.5 * comp_size(R_far):
+        r_list.pop()
+    if len(r_list) < 3:
+        r_layer = linspace(R_ring, R_far, 3)
+    else:
+        r_layer = array(r_list)
+        r_layer = R_ring + (r_layer - R_ring) * (R_far - R_ring) / (
+            r_layer[-1] - R_ring
+        )
+    v_layer = log(r_layer)
+    v_ring, v_far = v_layer[0], v_layer[-1]
+    v_min, v_max = min(v_ring, v_far), max(v_ring, v_far)
+    size_layer = array([comp_size(r) for r in r_layer]) / r_layer  # in (u, v)
+    nb_layer = ceil(U / size_layer).astype(int)
+    nb_layer[nb_layer < 4] = 4
+    nb_layer[0] = Nb
+
+    # Contour points in the (u, v) plane
+    if len(polygon_list) > 0:
+        z = concatenate(polygon_list)
+    else:
+        z = zeros(0, dtype=complex)
+    u = np_angle(z) % (2 * pi)
+    u[u > 2 * pi - 1e-9] = 0
+    v = log(np_abs(z))
+    size = array([comp_size(r) for r in np_abs(z)]) / np_abs(z)
+    is_in = (v > v_min + 0.5 * size) & (v < v_max - 0.5 * size)
+    # Points on the sector sides are added on both sides
+    is_edge = is_in & ((u < 1e-9) | (np_abs(u - U) < 1e-9))
+    v_edge = v[is_edge]
+    is_in &= (u > 0.5 * size) & (u < U - 0.5 * size)
+    uv = unique(column_stack((u[is_in], v[is_in])).round(12), axis=0)
+    size = exp(-uv[:, 1]) * array([comp_size(r) for r in exp(uv[:, 1])])
+    # Remove the points too close to each other
+    if uv.shape[0] > 1:
+        tree = cKDTree(uv)
+        pairs = tree.query_pairs(0.3 * size.max(), output_type="ndarray")
+        if pairs.size > 0:
+            dist = ((uv[pairs[:, 0]] - uv[pairs[:, 1]]) ** 2).sum(axis=1) ** 0.5
+            is_close = dist < 0.3 * size[pairs].min(axis=1)
+            keep = ones(uv.shape[0], dtype=bool)
+            keep[pairs[is_close, 1]] = False
+            uv = uv[keep]
+    tree = cKDTree(uv) if uv.shape[0] > 0 else None
+
+    # Nodes on the sector sides (layers and contour points on the sides)
+    if v_edge.size > 0:
+        v_layer_sort = sort(v_layer)
+        ii = searchsorted(v_layer_sort, v_edge).clip(1, v_layer.size - 1)
+        dist = concatenate(
+            (
+                np_abs(v_edge - v_layer_sort[ii - 1])[:, None],
+                np_abs(v_edge - v_layer_sort[ii])[:, None],
+            ),
+            axis=1,
+        ).min(axis=1)
+        v_edge = v_edge[dist > 0.3 * size_layer.min()]
+    v_side = unique(concatenate((v_layer, v_edge)).round(12))
+    v_side[0], v_side[-1] = v_min, v_max
+    nb_side = v_side.size
+    u_list = [zeros(nb_side), full(nb_side, U)]
+    v_list = [v_side, v_side]
+
+    # Nodes of the airgap side and of the other side
+    for k in [0, -1]:
+        u_list.append(linspace(0, U, nb_layer[k] + 1)[1:-1])
+        v_list.append(full(nb_layer[k] - 1, v_layer[k]))
+    # Nodes of the inner layers (except close to the contours)
+    for k in range(1, v_layer.size - 1):
+        u_k = linspace(0, U, nb_layer[k] + 1)[1:-1]
+        v_k = full(u_k.size, v_layer[k])
+        if tree is not None:
+            dist, _ = tree.query(column_stack((u_k, v_k)))
+            is_kept = dist > 0.5 * size_layer[k]
+            u_k, v_k = u_k[is_kept], v_k[is_kept]
+        u_list.append(u_k)
+        v_list.append(v_k)
+    u_list.append(uv[:, 0])
+    v_list.append(uv[:, 1])
+    u_all, v_all = concatenate(u_list), concatenate(v_list)
+
+    # Triangulation in the (u, v) plane
+    cell = Delaunay(column_stack((u_all, v_all))).simplices
+    point = column_stack((exp(v_all) * cos(u_all), exp(v_all) * sin(u_all)))
+    P = point[cell]
+    area = 0.5 * (
+        (P[:, 1, 0] - P[:, 0, 0]) * (P[:, 2, 1] - P[:, 0, 1])
+        - (P[:, 2, 0] - P[:, 0, 0]) * (P[:, 1, 1] - P[:, 0, 1])
+    )
+    # Remove the flat triangles (aligned boundary points) and orient the cells
+    is_flat = np_abs(area) < 1e-8 * np_abs(area).mean()
+    cell, area = cell[~is_flat], area[~is_flat]
+    cell[area < 0] = cell[area < 0][:, [0, 2, 1]]
+
+    # Renumber the nodes (without the nodes of the flat triangles only)
+    is_used = zeros(point.shape[0], dtype=bool)
+    is_used[cell] = True
+    new_id = full(point.shape[0], -1)
+    new_id[is_used] = arange(is_used.sum())
+    ring = concatenate(
+        (
+            [v_side.searchsorted(v_ring)],
+            2 * nb_side + arange(Nb - 1),
+            [nb_side + v_side.searchsorted(v_ring)],
+        )
+    )
+    edge = column_stack((arange(nb_side), nb_side + arange(nb_side)))
+    return {
+        "point": point[is_used],
+        "cell": new_id[cell],
+        "ring": new_id[ring],
+        "edge": new_id[edge],
+        "is_dirichlet": (v_all == v_far)[is_used],
+    }
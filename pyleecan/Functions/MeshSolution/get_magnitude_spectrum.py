@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from numpy import arange, argsort, array, searchsorted, stack, take
+from SciDataTool import Data1D, DataTime
+
+from ..object_cache import get_cache
+
+
+def get_magnitude_spectrum(solution, indice=None):
+    """Get the magnitude spectrum of every component of a SolutionVector.
+    The spectrum of all the components and cells is computed in one FFT and
+    cached until the field values are replaced.
+
+    Parameters
+    ----------
+    solution : SolutionVector
+        a SolutionVector object with a time axis
+    indice : list
+        indices of the cells to return (None for all the cells)
+
+    Returns
+    -------
+    freqs : ndarray
+        frequencies of the spectrum
+    magnitude : ndarray
+        magnitude spectrum: axes of the components (time replaced by freqs)
+        and the components as last axis
+    axes : list
+        axes of the magnitude spectrum (without the components axis)
+    """
+    comp_list = list(solution.field.components.values())
+    sign = (solution.field,) + tuple((comp, comp.values) for comp in comp_list)
+    freqs, magnitude = get_cache(
+        solution, "magnitude_spectrum", sign, lambda: _comp_spectrum(comp_list)
+    )
+
+    Freq = Data1D(name="freqs", unit="", values=freqs)
+    axes = [Freq if axis.name == "time" else axis for axis in comp_list[0].axes]
+
+    if indice is not None:
+        axes_names = [axis.name for axis in axes]
+        ax_idx = axes_names.index("indice")
+        org_indice = array(axes[ax_idx].get_values())
+        indice = array(indice)
+        sorter = argsort(org_indice)
+        pos = sorter[searchsorted(org_indice, indice, sorter=sorter) % sorter.size]
+        if not (org_indice[pos] == indice).all():
+            raise ValueError("At least one indice is not part of the solution")
+        magnitude = take(magnitude, pos, axis=ax_idx)
+        axis = axes[ax_idx]
+        axes[ax_idx] = Data1D(
+            values=indice.tolist(),
+            is_components=axis.is_components,
+            symmetries=axis.symmetries,
+            symbol=axis.symbol,
+            name=axis.name,
+            unit=axis.unit,
+            normalizations=axis.normalizations,
+        )
+
+    return freqs, magnitude, axes
+
+
+def _comp_spectrum(comp_list):
+    """Magnitude spectrum of the components stacked along a last axis"""
+    ref = comp_list[0]
+    Comp = Data1D(
+        name="component", values=arange(len(comp_list)).tolist(), is_components=True
+    )
+    data = DataTime(
+        name=ref.name,
+        unit=ref.unit,
+        symbol="field",
+        axes=list(ref.axes) + [Comp],
+        values=stack([comp.values for comp in comp_list], axis=-1),
+        is_real=all(comp.is_real for comp in comp_list),
+    )
+    axes_names = ["freqs" if axis.name == "time" else axis.name for axis in ref.axes]
+    mag_dict = data.get_magnitude_along(*axes_names, "component")
+    return mag_dict["freqs"], mag_dict["field"]
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Process, Queue, cpu_count
+from queue import Empty
+
+from cloudpickle import dumps, loads
+
+from .evaluate import evaluate
+
+# Solver shared by all the evaluations of a worker process
+_worker_dict = dict()
+
+
+def evaluate_serial(solver, indiv_list):
+    """Evaluate the individuals one after the other
+
+    Parameters
+    ----------
+    solver : OptiSolver
+        optimization solver
+    indiv_list : list
+        individuals to evaluate
+
+    Yields
+    ------
+    index : int
+        Index of the individual that has just been evaluated
+    evaluation_failure : bool
+        failure of the evaluation
+    """
+    for ii, indiv in enumerate(indiv_list):
+        yield ii, evaluate(solver, indiv)
+
+
+def evaluate_pool(solver, indiv_list):
+    """Evaluate the individuals on a pool of solver.nb_proc processes and
+    update them in the individual order (as soon as they are available)
+
+    Parameters
+    ----------
+    solver : OptiSolver
+        optimization solver
+    indiv_list : list
+        individuals to evaluate
+
+    Yields
+    ------
+    index : int
+        Index of the individual that has just been evaluated
+    evaluation_failure : bool
+        failure of the evaluation
+    """
+    executor = ProcessPoolExecutor(
+        max_workers=get_nb_proc(solver),
+        initializer=_init_worker,
+        initargs=(dump_solver(solver),),
+    )
+    future_list = list()
+    try:
+        for ii, indiv in enumerate(indiv_list):
+            future_list.append(executor.submit(_evaluate_task, dump_task(ii, indiv)))
+
+        # Collect the results in the submission order
+        for ii, future in enumerate(future_list):
+            yield ii, store_result(solver, indiv_list[ii], loads(future.result())[1])
+    except BaseException:
+        # Error in a worker (or interruption): cancel the pending evaluations
+        for future in future_list:
+            future.cancel()
+        raise
+    finally:
+        executor.shutdown(wait=True)
+
+
+def evaluate_queue(solver, indiv_list):
+    """Evaluate the individuals with solver.nb_proc worker processes pulling
+    them from a task queue (same scheme as workers sharing a job queue on
+    several hosts) and update them in the individual order
+
+    Parameters
+    ----------
+    solver : OptiSolver
+        optimization solver
+    indiv_list : list
+        individuals to evaluate
+
+    Yields
+    ------
+    index : int
+        Index of the individual that has just been evaluated
+    evaluation_failure : bool
+        failure of the evaluation
+    """
+    task_queue = Queue()
+    result_queue = Queue()
+    param = dump_solver(solver)
+    worker_list = [
+        Process(target=_queue_worker, args=(param, task_queue, result_queue))
+        for _ in range(get_nb_proc(solver))
+    ]
+    for worker in worker_list:
+        worker.daemon = True
+        worker.start()
+
+    try:
+        for ii, indiv in enumerate(indiv_list):
+            task_queue.put(dump_task(ii, indiv))
+        for _ in worker_list:
+            task_queue.put(None)  # Stop the worker once the queue is empty
+
+        # The results arrive in any order: store them in the individual order
+        result_dict = dict()
+        next_index = 0
+        while next_index < len(indiv_list):
+            try:
+                index, result = loads(result_queue.get(timeout=1))
+            except Empty:
+                if not any(worker.is_alive() for worker in worker_list):
+                    raise RuntimeError(
+                        "The evaluation workers stopped before the end of the evaluation"
+                    )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            result_dict[index] = result
+            while next_index in result_dict:
+                yield next_index, store_result(
+                    solver, indiv_list[next_index], result_dict.pop(next_index)
+                )
+                next_index += 1
+    finally:
+        for worker in worker_list:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+
+
+def get_nb_proc(solver):
+    """Return the number of worker processes of the solver"""
+    if solver.nb_proc == 0:
+        return cpu_count()
+    return solver.nb_proc
+
+
+def dump_solver(solver):
+    """Serialize the problem and the logger name of the solver for the workers
+    (without the solver itself that may contain the DEAP toolbox)"""
+    parent = solver.problem.parent
+    solver.problem.parent = None
+    try:
+        # The problem can contain lambda (DataKeeper, setter...) => cloudpickle
+        return dumps(
+            (
+                solver.problem,
+                solver.logger_name,
+                solver.is_keep_all_output or len(solver.problem.constraint) > 0,
+            )
+        )
+    finally:
+        solver.problem.parent = parent
+
+
+def dump_task(index, indiv):
+    """Serialize what the worker needs to evaluate an individual"""
+    return dumps((index, list(indiv), indiv.design_var_name_list, indiv.output))
+
+
+def store_result(solver, indiv, result):
+    """Update an individual (and the solver DataKeepers) with the result of
+    its evaluation in a worker
+
+    Parameters
+    ----------
+    solver : OptiSolver
+        optimization solver
+    indiv : individual
+        evaluated individual
+    result : tuple
+        (fitness, is_simu_valid, output, keeper_list, evaluation_failure)
+
+    Returns
+    -------
+    evaluation_failure : bool
+        failure of the evaluation
+    """
+    fitness, is_simu_valid, output, keeper_list, evaluation_failure = result
+    indiv.fitness.values = fitness
+    indiv.is_simu_valid = is_simu_valid
+    if output is not None:
+        indiv.output = output
+    for datakeeper, keeper_result in zip(solver.problem.datakeeper_list, keeper_list):
+        datakeeper.result.extend(keeper_result)
+    return evaluation_failure
+
+
+class _Fitness(object):
+    """Fitness of the individuals evaluated in the workers"""
+
+    def __init__(self):
+        self.values = ()
+
+
+class _Individual(list):
+    """Individual evaluated in the workers (the DEAP classes are created in
+    the main process only)"""
+
+
+def _init_worker(param):
+    """Load the solver shared by all the evaluations of the worker"""
+    # Import here to avoid circular import
+    from ...Classes.OptiSolver import OptiSolver
+
+    problem, logger_name, is_output = loads(param)
+    _worker_dict["solver"] = OptiSolver(problem=problem, logger_name=logger_name)
+    _worker_dict["is_output"] = is_output
+
+
+def _evaluate_task(task):
+    """Evaluate an individual in the worker process"""
+    index, value_list, design_var_name_list, output = loads(task)
+    solver = _worker_dict["solver"]
+
+    indiv = _Individual(value_list)
+    indiv.design_var_name_list = design_var_name_list
+    indiv.output = output
+    indiv.fitness = _Fitness()
+    indiv.is_simu_valid = False
+
+    for datakeeper in solver.problem.datakeeper_list:
+        datakeeper.result = list()
+    evaluation_failure = evaluate(solver, indiv)
+    keeper_list = [dk.result for dk in solver.problem.datakeeper_list]
+
+    if not _worker_dict["is_output"]:
+        output = None  # Avoid sending back the full output
+    return dumps(
+        (
+            index,
+            (
+                list(indiv.fitness.values),
+                indiv.is_simu_valid,
+                output,
+                keeper_list,
+                evaluation_failure,
+            ),
+        )
+    )
+
+
+def _queue_worker(param, task_queue, result_queue):
+    """Evaluate the individuals of the task queue until None is received"""
+    _init_worker(param)
+    for task in iter(task_queue.get, None):
+        try:
+            result_queue.put(_evaluate_task(task))
+        except BaseException as err:
+            result_queue.put(dumps((loads(task)[0], err)))
+            if isinstance(err, KeyboardInterrupt):
+                break
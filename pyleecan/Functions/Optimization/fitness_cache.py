@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from hashlib import sha256
+from inspect import getsource
+from os.path import isfile
+from pickle import dump, load
+
+from ... import __version__
+from ...Classes._frozen import FrozenClass
+from ..Simulation.result_cache import _update_hash
+
+
+class FitnessCache(object):
+    """Evaluation results of the individuals of an optimization, identified by
+    their rounded design variables (the least recently used results are
+    removed first when the cache is full)
+
+    Each entry is a tuple (fitness, is_simu_valid, keeper_list, output) with
+    keeper_list the values of the DataKeepers of the problem and output the
+    evaluated output (None if it is not kept)
+    """
+
+    def __init__(self, capacity=None, decimals=10, file_path=None, signature=None):
+        """Create an empty cache
+
+        Parameters
+        ----------
+        capacity : int
+            Maximum number of entries (None for no limit)
+        decimals : int
+            Number of decimals of the design variables in the keys
+        file_path : str
+            File to load and save the entries (None: memory only)
+        signature : tuple
+            Identifies the problem the entries belong to (the saved entries of
+            another problem are not loaded)
+        """
+        self.capacity = capacity
+        self.decimals = decimals
+        self.file_path = file_path
+        self.signature = signature
+        self.entry_dict = OrderedDict()
+        # Number of evaluations found in the cache or computed
+        self.nb_hit = 0
+        self.nb_miss = 0
+
+    def __len__(self):
+        return len(self.entry_dict)
+
+    def get_key(self, indiv):
+        """Return the key of an individual (rounded design variables)"""
+        return tuple(
+            round(value, self.decimals) if isinstance(value, float) else value
+            for value in indiv
+        )
+
+    def get(self, key, is_output=False):
+        """Return the entry of key (None if it is not in the cache or if its
+        output is required but not kept)"""
+        entry = self.entry_dict.get(key)
+        if entry is None or (is_output and entry[3] is None):
+            return None
+        self.entry_dict.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """Add an entry to the cache (and remove the oldest ones if full)"""
+        self.entry_dict[key] = entry
+        self.entry_dict.move_to_end(key)
+        if self.capacity is not None:
+            while len(self.entry_dict) > self.capacity:
+                self.entry_dict.popitem(last=False)
+
+    def save(self):
+        """Save the entries to file_path (without the outputs)"""
+        entry_list = [
+            (key, (fitness, is_simu_valid, keeper_list, None))
+            for key, (fitness, is_simu_valid, keeper_list, _) in self.entry_dict.items()
+        ]
+        with open(self.file_path, "wb") as cache_file:
+            dump((self.signature, entry_list), cache_file)
+
+    def load(self):
+        """Load the entries saved in file_path
+
+        Returns
+        -------
+        is_loaded : bool
+            False if the file does not exist or belongs to another problem
+        """
+        if self.file_path is None or not isfile(self.file_path):
+            return False
+        with open(self.file_path, "rb") as cache_file:
+            signature, entry_list = load(cache_file)
+        if signature != self.signature:
+            return False
+        for key, entry in entry_list:
+            self.put(key, entry)
+        return True
+
+
+def get_problem_signature(problem):
+    """Return the signature of an optimization problem for the FitnessCache:
+    hash of the problem definition (simulation, design variables and spaces,
+    objectives, constraints, DataKeepers, setters...). The functions given as
+    python objects (not in as_dict) are identified by their source code (or
+    their name if the source is not available).
+
+    Parameters
+    ----------
+    problem : OptiProblem
+        Optimization problem
+
+    Returns
+    -------
+    signature : str
+        Hash of the problem definition
+    """
+    hasher = sha256(__version__.encode())
+    _update_hash(hasher, problem.as_dict(type_handle_ndarray=2))
+    func_list = list()
+    _get_function_list(problem, func_list)
+    _update_hash(hasher, func_list)
+    return hasher.hexdigest()
+
+
+def _get_function_list(obj, func_list):
+    """Add the description of the python functions of the properties of obj
+    (and of its pyleecan objects) to func_list"""
+    for key, value in obj.__dict__.items():
+        if key == "parent":
+            continue
+        if key.endswith("_func") and callable(value):
+            if obj.__dict__.get(key[:-5] + "_str") is None:  # Not in as_dict
+                try:
+                    func_list.append((key, getsource(value)))
+                except (OSError, TypeError):
+                    func_list.append(
+                        (
+                            key,
+                            getattr(value, "__module__", "")
+                            + "."
+                            + getattr(value, "__qualname__", repr(value)),
+                        )
+                    )
+        elif isinstance(value, FrozenClass):
+            _get_function_list(value, func_list)
+        elif isinstance(value, (list, dict)):
+            for item in value.values() if isinstance(value, dict) else value:
+                if isinstance(item, FrozenClass):
+                    _get_function_list(item, func_list)
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+
+def non_dominated_sort(fitness):
+    """Sort the individuals in non dominated fronts (minimization of every
+    objective): an individual belongs to the first front in which no other
+    individual dominates it
+
+    The individuals are browsed in lexicographic order and the front of each
+    individual is found by binary search on the fronts (Zhang et al., "An Efficient Approach
+    to Nondominated Sorting for Evolutionary Multiobjective Optimization", 2015)
+
+    Parameters
+    ----------
+    fitness : ndarray
+        Fitness values of the individuals (nb_indiv, nb_obj)
+
+    Returns
+    -------
+    rank : ndarray
+        Front index of each individual (0 for the pareto front)
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    nb_indiv = fitness.shape[0]
+    rank = np.zeros(nb_indiv, dtype=int)
+    if nb_indiv == 0:
+        return rank
+
+    if fitness.shape[1] == 1:
+        # The equal values are in the same front
+        rank[:] = np.unique(fitness[:, 0], return_inverse=True)[1].ravel()
+        return rank
+
+    # Lexicographic order: an individual can only be dominated by the previous
+    # ones, the equal individuals are consecutive
+    order = np.lexsort(fitness.T[::-1])
+    fitness = fitness[order]
+    is_same = np.zeros(nb_indiv, dtype=bool)
+    is_same[1:] = np.all(fitness[1:] == fitness[:-1], axis=1)
+    if fitness.shape[1] == 2:
+        rank[order] = _sort_2_obj(fitness)
+    elif fitness.shape[1] == 3:
+        rank[order] = _sort_3_obj(fitness, is_same)
+    else:
+        rank[order] = _sort_n_obj(fitness, is_same)
+    return rank
+
+
+def _sort_2_obj(fitness):
+    """Front index of the lexicographically sorted individuals (2 objectives)
+
+    The individuals of a front are sorted by decreasing 2nd objective: an
+    individual is dominated by a front if and only if the last individual
+    added to the front has a lower (2nd, 1st) objective tuple.
+    """
+    last_list = list()  # (2nd, 1st) objectives of the last individual of each front
+    rank = np.empty(fitness.shape[0], dtype=int)
+    for ii, (f1, f2) in enumerate(fitness.tolist()):
+        key = (f2, f1)
+        k = bisect_left(last_list, key)
+        if k == len(last_list):
+            last_list.append(key)
+        else:
+            last_list[k] = key
+        rank[ii] = k
+    return rank
+
+
+def _sort_3_obj(fitness, is_same):
+    """Front index of the lexicographically sorted individuals (3 objectives)
+
+    The previous individuals have a lower or equal 1st objective: a front
+    dominates an individual if one of its individuals has lower or equal 2nd
+    and 3rd objectives. Each front keeps the 2D pareto front of its (2nd, 3rd)
+    objectives (increasing 2nd and decreasing 3rd objective) to answer with a
+    binary search.
+    """
+    rank = np.empty(fitness.shape[0], dtype=int)
+    front_list = list()  # [list of 2nd objectives, list of 3rd objectives]
+    for ii, (_, f2, f3) in enumerate(fitness.tolist()):
+        if is_same[ii]:
+            rank[ii] = rank[ii - 1]
+            continue
+        # Binary search of the first front that does not dominate the individual
+        k_min, k_max = 0, len(front_list)
+        while k_min < k_max:
+            k = (k_min + k_max) // 2
+            obj2, obj3 = front_list[k]
+            jj = bisect_right(obj2, f2) - 1
+            if jj >= 0 and obj3[jj] <= f3:
+                k_min = k + 1
+            else:
+                k_max = k
+        if k_min == len(front_list):
+            front_list.append([[f2], [f3]])
+        else:
+            # Remove the individuals dominated by the new one (in 2D)
+            obj2, obj3 = front_list[k_min]
+            jj = bisect_left(obj2, f2)
+            jj_end = jj
+            while jj_end < len(obj3) and obj3[jj_end] >= f3:
+                jj_end += 1
+            obj2[jj:jj_end] = [f2]
+            obj3[jj:jj_end] = [f3]
+        rank[ii] = k_min
+    return rank
+
+
+def _sort_n_obj(fitness, is_same):
+    """Front index of the lexicographically sorted individuals (4 objectives
+    or more)"""
+    nb_indiv, nb_obj = fitness.shape
+    rank = np.empty(nb_indiv, dtype=int)
+    # 2nd to last objectives of the individuals of each front (the 1st
+    # objective of the previous individuals is always lower or equal)
+    front_list = list()  # [buffer (nb_obj-1, size), number of individuals]
+    for ii in range(nb_indiv):
+        if is_same[ii]:
+            rank[ii] = rank[ii - 1]
+            continue
+        value = fitness[ii, 1:]
+        # Binary search of the first front that does not dominate the individual
+        k_min, k_max = 0, len(front_list)
+        while k_min < k_max:
+            k = (k_min + k_max) // 2
+            buffer, nb = front_list[k]
+            is_le = buffer[0, :nb] <= value[0]
+            for jj in range(1, nb_obj - 1):
+                is_le &= buffer[jj, :nb] <= value[jj]
+            if is_le.any():
+                k_min = k + 1
+            else:
+                k_max = k
+        if k_min == len(front_list):
+            front_list.append([np.empty((nb_obj - 1, 64)), 0])
+        buffer, nb = front_list[k_min]
+        if nb == buffer.shape[1]:
+            buffer = np.concatenate((buffer, np.empty_like(buffer)), axis=1)
+            front_list[k_min][0] = buffer
+        buffer[:, nb] = value
+        front_list[k_min][1] = nb + 1
+        rank[ii] = k_min
+    return rank
+
+
+def crowding_distance(fitness, rank):
+    """Crowding distance of the individuals in their front (as in DEAP
+    assignCrowdingDist: the extreme individuals of each objective have an
+    infinite distance)
+
+    Parameters
+    ----------
+    fitness : ndarray
+        Fitness values of the individuals (nb_indiv, nb_obj)
+    rank : ndarray
+        Front index of each individual
+
+    Returns
+    -------
+    distance : ndarray
+        Crowding distance of each individual
+    """
+    fitness = np.asarray(fitness, dtype=float)
+    rank = np.asarray(rank)
+    nb_indiv, nb_obj = fitness.shape
+    distance = np.zeros(nb_indiv)
+    if nb_indiv == 0:
+        return distance
+
+    for jj in range(nb_obj):
+        # Sort by front then by objective value
+        order = np.lexsort((np.arange(nb_indiv), fitness[:, jj], rank))
+        value = fitness[order, jj]
+        front = rank[order]
+        is_first = np.ones(nb_indiv, dtype=bool)
+        is_first[1:] = front[1:] != front[:-1]
+        is_last = np.ones(nb_indiv, dtype=bool)
+        is_last[:-1] = is_first[1:]
+
+        # Objective range of each front
+        first_ind = np.flatnonzero(is_first)
+        last_ind = np.flatnonzero(is_last)
+        norm = nb_obj * (value[last_ind] - value[first_ind])
+        norm = np.repeat(norm, last_ind - first_ind + 1)
+
+        dist = np.zeros(nb_indiv)
+        is_inner = ~(is_first | is_last) & (norm > 0)
+        inner_ind = np.flatnonzero(is_inner)
+        dist[inner_ind] = (value[inner_ind + 1] - value[inner_ind - 1]) / norm[
+            inner_ind
+        ]
+        dist[is_first | is_last] = np.inf
+        distance[order] += dist
+    return distance
@@ -0,0 +1,43 @@
+import numpy as np
+
+from .non_dominated_sort import non_dominated_sort, crowding_distance
+
+
+def selNSGA2(pop, size):
+    """Select the best individuals according to their front and their
+    crowding distance (NSGA-II selection)
+    Same fronts and crowding distance criterion as DEAP selNSGA2 function at https://github.com/DEAP/deap/blob/master/deap/tools/emo.py
+    with a faster non dominated sort. The individuals of the last selected
+    front with equal crowding distances (e.g. the infinite distance of the
+    extreme individuals) may be chosen differently than in DEAP, as well as
+    the distances of individuals with equal objective values (they depend on
+    the order of the individuals).
+
+    Parameters
+    ----------
+    pop : list
+        list of individuals created with the DEAP toolbox
+
+    size : int
+        number of individual to select
+
+    Returns
+    -------
+    selection : list
+        list of individuals selected (sorted by front then by decreasing
+        crowding distance)
+    """
+    if len(pop) == 0:
+        return list()
+
+    # The weighted fitness values of DEAP are maximized
+    fitness = -np.array([indiv.fitness.wvalues for indiv in pop], dtype=float)
+    rank = non_dominated_sort(fitness)
+    distance = crowding_distance(fitness, rank)
+
+    # Crowding distance used by tournamentDCD
+    for indiv, dist in zip(pop, distance.tolist()):
+        indiv.fitness.crowding_dist = dist
+
+    order = np.lexsort((-distance, rank))
+    return [pop[ii] for ii in order[:size]]
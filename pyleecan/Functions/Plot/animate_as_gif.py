@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 
-import imageio
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
 from os.path import join
-from os import remove
-from glob import glob
+
+import imageio
+from cloudpickle import dumps, loads
+from matplotlib.pyplot import close, gcf, subplots
+from numpy import array
 from SciDataTool import VectorField
-from matplotlib.pyplot import subplots
+
+# Plot parameters shared by all the frames of a worker process
+_worker_dict = dict()
 
 
 def animate_as_gif(
@@ -17,10 +23,15 @@ def animate_as_gif(
     index_max=50,
     index_step=1,
     component_list=None,
+    nb_proc=1,
     **kwargs
 ):
     """Animate an existing plot command as a gif: animate
 
+    The frames are rendered in memory (on nb_proc processes) and streamed to
+    the writer in order (the file format is set by the extension of file_name,
+    e.g. ".gif" or ".mp4")
+
     Parameters
     ----------
     func : function
@@ -39,66 +50,69 @@ def animate_as_gif(
         step for the index (number of frames = index_max / index_step)
     component_list : list
         list of component names to plot in separate figures
+    nb_proc : int
+        number of processes to render the frames (0 to use all the cpu)
     kwargs : dict
         parameters of func
     """
 
-    with imageio.get_writer(join(save_path, file_name), mode="I") as writer:
-        if isinstance(data_list, list):
-            for i, data in enumerate(data_list):
-                if isinstance(data, VectorField):
-                    if component_list is None:  # default: extract all components
-                        component_list = data.components.keys()
-                    ncomp = len(component_list)
-                    fig, axs = subplots(2, ncomp, tight_layout=True, figsize=(20, 10))
-                    for j in range(0, index_max, index_step):
-                        save_path_temp = save_path + "\\temp_" + str(j) + ".png"
-                        kwargs["save_path"] = save_path_temp
-                        for k, comp in enumerate(component_list):
-                            func(
-                                data.components[comp],
-                                fig=fig,
-                                subplot_index=k,
-                                **kwargs
-                            )
-                        image = imageio.imread(save_path_temp)
-                        writer.append_data(image)
-
-                else:
-                    for j in range(0, index_max, index_step):
-                        save_path_temp = save_path + "\\temp_" + str(j) + ".png"
-                        kwargs["save_path"] = save_path_temp
-                        func(data, **kwargs)
-                        image = imageio.imread(save_path_temp)
-                        writer.append_data(image)
+    if not isinstance(data_list, list):
+        data_list = [data_list]
+    kwargs.setdefault("is_show_fig", False)
+    data_index = [
+        ii for ii in range(len(data_list)) for _ in range(0, index_max, index_step)
+    ]
+    index_list = [j for _ in data_list for j in range(0, index_max, index_step)]
 
+    nb_proc = nb_proc if nb_proc != 0 else cpu_count()
+    with imageio.get_writer(join(save_path, file_name), mode="I") as writer:
+        if nb_proc == 1 or len(index_list) < 2:
+            for ii, j in zip(data_index, index_list):
+                writer.append_data(
+                    _render_frame(
+                        func, data_list[ii], index_var, j, component_list, kwargs
+                    )
+                )
         else:
-            if isinstance(data_list, VectorField):
-                if component_list is None:  # default: extract all components
-                    component_list = data.components.keys()
-                ncomp = len(component_list)
-                for j in range(0, index_max, index_step):
-                    fig, axs = subplots(1, ncomp, tight_layout=True, figsize=(20, 10))
-                    save_path_temp = save_path + "\\temp_" + str(j) + ".png"
-                    kwargs[index_var] = j
-                    kwargs["save_path"] = save_path_temp
-                    for k, comp in enumerate(component_list):
-                        func(
-                            data_list.components[comp],
-                            fig=fig,
-                            subplot_index=k,
-                            **kwargs
-                        )
-                    image = imageio.imread(save_path_temp)
-                    writer.append_data(image)
-            else:
-                for j in range(0, index_max, index_step):
-                    save_path_temp = save_path + "\\temp_" + str(j) + ".png"
-                    kwargs[index_var] = j
-                    kwargs["save_path"] = save_path_temp
-                    func(data_list, **kwargs)
-                    image = imageio.imread(save_path_temp)
+            # The data and the plot parameters are sent once to each worker
+            param = dumps((func, data_list, index_var, component_list, kwargs))
+            with ProcessPoolExecutor(
+                max_workers=min(nb_proc, len(index_list)),
+                initializer=_init_worker,
+                initargs=(param,),
+            ) as executor:
+                for image in executor.map(_render_frame_worker, data_index, index_list):
                     writer.append_data(image)
 
-    for file in glob(save_path + "\\temp_*"):
-        remove(file)
+
+def _render_frame(func, data, index_var, index, component_list, kwargs):
+    """Plot a frame and return its RGB image (the figure is closed)"""
+    frame_kwargs = dict(kwargs)
+    frame_kwargs[index_var] = index
+    if isinstance(data, VectorField):
+        if component_list is None:  # default: extract all components
+            component_list = list(data.components.keys())
+        fig, _ = subplots(1, len(component_list), tight_layout=True, figsize=(20, 10))
+        for k, comp in enumerate(component_list):
+            func(data.components[comp], fig=fig, subplot_index=k, **frame_kwargs)
+    else:
+        func(data, **frame_kwargs)
+        fig = gcf()
+    fig.canvas.draw()
+    image = array(fig.canvas.buffer_rgba())[:, :, :3]
+    close(fig)
+    return image
+
+
+def _init_worker(param):
+    """Load the plot parameters of the worker (rendered without display)"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    _worker_dict["param"] = loads(param)
+
+
+def _render_frame_worker(ii, index):
+    """Render a frame of the ii-th data in the worker"""
+    func, data_list, index_var, component_list, kwargs = _worker_dict["param"]
+    return _render_frame(func, data_list[ii], index_var, index, component_list, kwargs)
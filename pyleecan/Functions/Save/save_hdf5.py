@@ -5,25 +5,34 @@ from ...definitions import PACKAGE_NAME
 from ... import __version__
 from datetime import datetime
 
+# Minimum number of elements of the ndarrays saved in chunked and compressed
+# datasets (the smaller ones are saved in contiguous datasets)
+CHUNK_MIN_SIZE = 1000
+# Compression filter of the chunked datasets: lzf (h5py built-in) is several
+# times faster than gzip for a similar size on float fields (with shuffle)
+COMPRESSION = "lzf"
 
-def pyleecan_dict_to_hdf5(file, obj):
+
+def pyleecan_dict_to_hdf5(file, obj_dict):
     """
     Save a dict from a pyleecan object in the hdf5 file
 
     Parameters
     ----------
     file: hdf5 file
-    obj: Pyleecan object
-        object to save
+    obj_dict: dict
+        as_dict of the pyleecan object to save
     """
-    obj_dict = obj.as_dict()
     now = datetime.now()
     obj_dict["__save_date__"] = now.strftime("%Y_%m_%d %Hh%Mmin%Ss ")
     obj_dict["__version__"] = PACKAGE_NAME + "_" + __version__
     for key, val in obj_dict.items():
         # Object that need groups
-        if isinstance(val, dict) or isinstance(val, list):
+        if isinstance(val, dict) or isinstance(val, list) or is_data(val):
             variable_to_hdf5(file, "", val, key)
+        # ndarray property
+        elif isinstance(val, np.ndarray):
+            ndarray_to_hdf5(file, "", key, val, is_lazy=True)
         # Dataset
         elif val == None:
             file[key] = "NoneValue"
@@ -31,7 +40,7 @@ def pyleecan_dict_to_hdf5(file, obj):
             file[key] = val
 
 
-def list_to_hdf5(file, group_name, name, list_to_save):
+def list_to_hdf5(file, group_name, name, list_to_save, is_pyleecan=True):
     """
     Save a list in the hdf5 file : save it as a ndarray if possible
 
@@ -45,6 +54,8 @@ def list_to_hdf5(file, group_name, name, list_to_save):
         name to extend the group or to contain the dataset
     list_to_save: list
         list to save
+    is_pyleecan: bool
+        False if the list is (part of) a SciDataTool object
 
     """
     #
@@ -64,7 +75,9 @@ def list_to_hdf5(file, group_name, name, list_to_save):
 
         # Save every element of the list
         for i, element in enumerate(list_to_save):
-            variable_to_hdf5(file, group_name, element, "list_{}".format(i))
+            variable_to_hdf5(
+                file, group_name, element, "list_{}".format(i), is_pyleecan
+            )
 
     else:  # Save as an array
         if group_name == "":
@@ -77,32 +90,120 @@ def list_to_hdf5(file, group_name, name, list_to_save):
             grp[name].attrs["array_list"] = True
 
 
-def dict_to_hdf5(file, prefix, dict_to_save):
+def ndarray_to_hdf5(file, prefix, name, array, is_lazy=False):
+    """
+    Save an ndarray as a dataset (chunked and compressed for the large ones)
+
+    Parameters
+    ----------
+    file: HDF5 file
+        file to save the data
+    prefix: str
+        name of the group
+    name: str
+        name of the dataset
+    array: ndarray
+        array to save
+    is_lazy: bool
+        True if the array can be loaded on first access (ndarray property of a
+        pyleecan object)
+    """
+    if array.dtype.kind in ["O", "U"]:
+        # Not supported by h5py: saved as a list
+        variable_to_hdf5(file, prefix, array.tolist(), name)
+        return
+
+    grp = file[prefix] if prefix else file
+    if array.size >= CHUNK_MIN_SIZE:
+        dataset = grp.create_dataset(
+            name, data=array, chunks=True, compression=COMPRESSION, shuffle=True
+        )
+    else:
+        dataset = grp.create_dataset(name, data=array)
+    # Add an attribute to load correctly
+    dataset.attrs["ndarray"] = True
+    if is_lazy:
+        dataset.attrs["is_lazy"] = True
+
+
+def is_data(variable):
+    """Check if the variable is a SciDataTool object"""
+    return type(variable).__module__.startswith("SciDataTool")
+
+
+def data_to_dict(data):
+    """
+    Convert a SciDataTool object to a dict without converting its ndarrays
+    (as_dict of SciDataTool converts them to list)
+
+    Parameters
+    ----------
+    data: Data
+        SciDataTool object
+
+    Returns
+    -------
+    data_dict: dict
+        dict to instanciate the object
     """
-    Save a list in the hdf5 file
+    data_dict = dict()
+    for key, value in data.__dict__.items():
+        # Properties are stored in "_" + property name
+        if key.startswith("_") and not key.startswith("_FrozenClass"):
+            data_dict[key[1:]] = value
+    data_dict["__class__"] = type(data).__name__
+    return data_dict
+
+
+def dict_to_hdf5(file, prefix, dict_to_save, is_pyleecan=True):
     """
+    Save a dict in the hdf5 file
+
+    Parameters
+    ----------
+    file: HDF5 file
+        file to save the data
+    prefix: str
+        name of the group
+    dict_to_save: dict
+        dict to save
+    is_pyleecan: bool
+        False if the dict is (part of) a SciDataTool object
+    """
+    # ndarrays of pyleecan objects can be loaded lazily
+    is_lazy = is_pyleecan and "__class__" in dict_to_save
     for key, value in dict_to_save.items():
         if isinstance(key, int):
             key = str(key)
-        variable_to_hdf5(file, prefix, value, key)
+        variable_to_hdf5(file, prefix, value, key, is_pyleecan, is_lazy)
 
 
-def variable_to_hdf5(file, prefix, variable, name):
+def variable_to_hdf5(file, prefix, variable, name, is_pyleecan=True, is_lazy=False):
+    # SciDataTool object
+    if is_data(variable):
+        group_name = prefix + "/" + name
+        file.create_group(group_name)
+        dict_to_hdf5(file, group_name, data_to_dict(variable), is_pyleecan=False)
+
     # Pyleecan object dict
-    if isinstance(variable, dict):
+    elif isinstance(variable, dict):
         # Create group
         group_name = prefix + "/" + name
         file.create_group(group_name)
 
         # Call function to create groups and datasets recursively
-        dict_to_hdf5(file, group_name, variable)
+        dict_to_hdf5(file, group_name, variable, is_pyleecan)
+
+    # ndarray
+    elif isinstance(variable, np.ndarray):
+        ndarray_to_hdf5(file, prefix, name, variable, is_lazy)
 
     # List
     elif isinstance(variable, list):
         # Create group
 
         # Call function to create groups and datasets recursively
-        list_to_hdf5(file, prefix, name, variable)
+        list_to_hdf5(file, prefix, name, variable, is_pyleecan)
     # Str
     elif isinstance(variable, str):
         if len(variable) == 0:
@@ -124,7 +225,7 @@ def variable_to_hdf5(file, prefix, variable, name):
         grp[name] = variable
 
 
-def save_hdf5(obj, save_path):
+def save_hdf5(obj, save_path, is_ndarray=True):
     """
     Save a pyleecan obj in hdf5 format
 
@@ -134,12 +235,22 @@ def save_hdf5(obj, save_path):
         object to save
     save_path: str
         file path
+    is_ndarray: bool
+        True to save the ndarrays as they are in chunked and compressed
+        datasets, False to convert them to list (previous format)
     """
 
+    # The dict is built before opening the file: the lazy arrays of an object
+    # loaded from save_path are read before the file is emptied
+    if is_ndarray:
+        obj_dict = obj.as_dict(type_handle_ndarray=2)
+    else:
+        obj_dict = obj.as_dict()
+
     file5 = None
     try:
         file5 = FileH5(save_path, "w")
-        pyleecan_dict_to_hdf5(file5, obj)
+        pyleecan_dict_to_hdf5(file5, obj_dict)
         file5.close()
     except Exception as err:
         if file5:
@@ -0,0 +1,140 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
+from multiprocessing.util import Finalize
+
+from cloudpickle import dumps, loads
+
+from ...FEMM.run_FEMM_workers import close_FEMM_workers
+from .run_single_simu import comp_single_simu, store_single_simu
+
+# Parameters shared by all the simulations of a worker process
+_worker_dict = dict()
+
+
+def run_pool_simu(
+    xoutput,
+    datakeeper_list,
+    simulation_list,
+    index_list,
+    stop_if_error,
+    ref_simu_index,
+    is_keep_all_output,
+    nb_proc,
+    chunk_size=1,
+    post_keeper_postproc_list=None,
+):
+    """
+    Execute simulations on a pool of processes and store the results in the
+    XOutput in the simulation index order (as soon as they are available)
+
+    Parameters:
+    -----------
+    xoutput: XOutput
+        Contains results
+    datakeeper_list
+        List of datakeeper to extract results
+    simulation_list: [Simulation]
+        Simulations to run
+    index_list: [int]
+        Index of each simulation
+    stop_if_error: bool
+        Raises an error if a simulation fails
+    ref_simu_index: tuple
+        Index of the reference simulation
+    is_keep_all_output: bool
+        store simulation output
+    nb_proc: int
+        Number of processes to use (0 to use all the cpu)
+    chunk_size: int
+        Number of simulations sent at once to each process
+    post_keeper_postproc_list : list
+        list of postprocessing to run after the datakeeper
+
+    Yields
+    ------
+    index: int
+        Index of the simulation that has just been stored
+    """
+    if nb_proc == 0:
+        nb_proc = cpu_count()
+    if chunk_size is None or chunk_size < 1:
+        chunk_size = 1
+
+    # pyleecan objects can contain lambda (DataKeeper, setter...) => cloudpickle
+    param = dumps(
+        (
+            datakeeper_list,
+            stop_if_error,
+            ref_simu_index,
+            is_keep_all_output,
+            post_keeper_postproc_list,
+        )
+    )
+
+    executor = ProcessPoolExecutor(
+        max_workers=nb_proc, initializer=_init_worker, initargs=(param,)
+    )
+    future_list = list()
+    try:
+        # Send the simulations by chunk
+        for ii in range(0, len(simulation_list), chunk_size):
+            chunk = list(
+                zip(
+                    index_list[ii : ii + chunk_size],
+                    simulation_list[ii : ii + chunk_size],
+                )
+            )
+            future_list.append(executor.submit(_run_chunk, dumps(chunk)))
+
+        # Collect the results in the submission order
+        for future in future_list:
+            for index, result, keeper_list in loads(future.result()):
+                store_single_simu(
+                    xoutput,
+                    datakeeper_list,
+                    index,
+                    result,
+                    keeper_list,
+                    is_keep_all_output,
+                )
+                yield index
+    except BaseException:
+        # stop_if_error (or interruption): cancel the pending simulations
+        for future in future_list:
+            future.cancel()
+        raise
+    finally:
+        executor.shutdown(wait=True)
+
+
+def _init_worker(param):
+    """Load the parameters shared by all the simulations of the worker"""
+    # The FEMM workers kept open between the simulations of the process are
+    # closed when the process exits (close_FEMM_workers of VarSimu.run only
+    # closes the ones of the main process)
+    Finalize(None, close_FEMM_workers, exitpriority=10)
+    (
+        _worker_dict["datakeeper_list"],
+        _worker_dict["stop_if_error"],
+        _worker_dict["ref_simu_index"],
+        _worker_dict["is_keep_all_output"],
+        _worker_dict["post_keeper_postproc_list"],
+    ) = loads(param)
+
+
+def _run_chunk(chunk):
+    """Run a list of (index, simulation) in the worker process"""
+    result_list = list()
+    for index, simulation in loads(chunk):
+        result, keeper_list = comp_single_simu(
+            _worker_dict["datakeeper_list"],
+            simulation,
+            index,
+            _worker_dict["stop_if_error"],
+            _worker_dict["ref_simu_index"],
+            post_keeper_postproc_list=_worker_dict["post_keeper_postproc_list"],
+        )
+        if not _worker_dict["is_keep_all_output"]:
+            result = None  # Avoid sending back the full output
+        result_list.append((index, result, keeper_list))
+    return dumps(result_list)
@@ -36,6 +36,53 @@ def run_single_simu(
     post_keeper_postproc_list : list
         list of postprocessing to run after the datakeeper
     """
+    result, keeper_list = comp_single_simu(
+        datakeeper_list,
+        simulation,
+        index,
+        stop_if_error,
+        ref_simu_index,
+        post_keeper_postproc_list=post_keeper_postproc_list,
+    )
+    store_single_simu(
+        xoutput, datakeeper_list, index, result, keeper_list, is_keep_all_output
+    )
+
+
+def comp_single_simu(
+    datakeeper_list,
+    simulation,
+    index,
+    stop_if_error,
+    ref_simu_index,
+    post_keeper_postproc_list=None,
+):
+    """
+    Execute a simulation and compute its datakeepers values
+    (without access to the XOutput so that it can run in another process)
+
+    Parameters:
+    -----------
+    datakeeper_list
+        List of datakeeper to extract results
+    simulation: Simulation
+        Simulation to run
+    index: int
+        Index of the simulation
+    stop_if_error: bool
+        Raises an error if the simulation fails
+    ref_simu_index: tuple
+        Index of the reference simulation
+    post_keeper_postproc_list : list
+        list of postprocessing to run after the datakeeper
+
+    Returns
+    -------
+    result: Output
+        Output of the simulation
+    keeper_list: list
+        Value of each datakeeper (same order as datakeeper_list)
+    """
     if stop_if_error:
         is_error = False
         result = simulation.run()
@@ -47,52 +94,45 @@ def run_single_simu(
         except Exception as err:
             print(err)
             is_error = True
+            result = None
 
     # The simulation is the reference one
-    if index == ref_simu_index:
+    if index == ref_simu_index and not is_error:
         # Create new Output from XOutput content
         Output = import_class("pyleecan.Classes", "Output")
         result = Output(init_dict=Output.as_dict(result))
         # Output value are already in XOutput
 
-    # Extract results
-    if is_keep_all_output:
-        xoutput.output_list.append(result)
-
     # Datakeepers
+    keeper_list = list()
     if is_error:  # Execute error_keeper
         for datakeeper in datakeeper_list:
-            # readability
-            dk_result = xoutput.xoutput_dict[datakeeper.symbol].result
             if datakeeper.error_keeper is None:
-                dk_result[index] = None
+                keeper_list.append(None)
             else:
-                dk_result[index] = datakeeper.error_keeper(simulation)
+                keeper_list.append(datakeeper.error_keeper(simulation))
     else:  # Execute Normal DataKeeper
         msg = "Results: "
         for datakeeper in datakeeper_list:
-            # readability
-            dk_result = xoutput.xoutput_dict[datakeeper.symbol].result
-            # Run and store Datakeeper
-            dk_result[index] = datakeeper.keeper(result)
+            # Run Datakeeper
+            value = datakeeper.keeper(result)
+            keeper_list.append(value)
             # Format log
-            if isinstance(dk_result[index], ndarray):
+            if isinstance(value, ndarray):
                 msg += (
                     datakeeper.symbol
                     + "=array(min="
-                    + format(np_min(dk_result[index]), ".8g")
+                    + format(np_min(value), ".8g")
                     + ",max="
-                    + format(np_max(dk_result[index]), ".8g")
+                    + format(np_max(value), ".8g")
                     + ")"
                 )
-            elif isinstance(dk_result[index], Data) or isinstance(
-                dk_result[index], VectorField
-            ):
-                msg += datakeeper.symbol + "=" + type(dk_result[index]).__name__
-            elif dk_result[index] is None:
+            elif isinstance(value, Data) or isinstance(value, VectorField):
+                msg += datakeeper.symbol + "=" + type(value).__name__
+            elif value is None:
                 msg += datakeeper.symbol + "= None"
             else:
-                msg += datakeeper.symbol + "=" + format(dk_result[index], ".8g")
+                msg += datakeeper.symbol + "=" + format(value, ".8g")
             msg += ", "
         msg = msg[:-2]
         simulation.get_logger().info(msg)
@@ -101,3 +141,34 @@ def run_single_simu(
         if post_keeper_postproc_list is not None:
             for postproc in post_keeper_postproc_list:
                 postproc.run(result)
+
+    return result, keeper_list
+
+
+def store_single_simu(
+    xoutput, datakeeper_list, index, result, keeper_list, is_keep_all_output
+):
+    """
+    Store the results of a simulation in the XOutput
+
+    Parameters:
+    -----------
+    xoutput: XOutput
+        Contains results
+    datakeeper_list
+        List of datakeeper to extract results
+    index: int
+        Index of the simulation
+    result: Output
+        Output of the simulation (None if the simulation failed)
+    keeper_list: list
+        Value of each datakeeper (same order as datakeeper_list)
+    is_keep_all_output: bool
+        store simulation output
+    """
+    # Extract results
+    if is_keep_all_output:
+        xoutput.output_list.append(result)
+
+    for datakeeper, value in zip(datakeeper_list, keeper_list):
+        xoutput.xoutput_dict[datakeeper.symbol].result[index] = value
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from numpy import abs as np_abs, asarray, power
+
+
+def comp_AGSF_transfer_coeff(Rag, Rsbo, wavenumber, rnoise=None):
+    """Compute the coefficients of the Air-Gap Surface Force transfer from the
+    radius Rag to the radius (or radii) Rsbo, Eq. (46) of:
+        PILE, Raphaël, LE BESNERAIS, Jean, PARENT, Guillaume, et al. Analytical
+        study of air-gap surface force–application to electrical machines. Open
+        Physics, 2020, vol. 18, no 1, p. 658-673.
+
+    Parameters
+    ----------
+    Rag : float
+        Radius of the air-gap surface force to transfer [m]
+    Rsbo : float or ndarray
+        Radius (or radii) to transfer the air-gap surface force to [m]
+    wavenumber : ndarray
+        Wavenumbers of the air-gap surface force (Nr)
+    rnoise : int
+        Maximum wavenumber to transfer (the higher wavenumbers are kept
+        unchanged to avoid amplifying the numerical noise)
+
+    Returns
+    -------
+    Sn : ndarray
+        Transfer coefficients, shape (Nr) or (NR, Nr) for NR radii
+    Cn : ndarray
+        Transfer coefficients, shape (Nr) or (NR, Nr) for NR radii
+    """
+    wavenumber = asarray(wavenumber)
+    # (NR, 1) ratios broadcast with the (Nr) wavenumbers
+    Ratio = Rag / asarray(Rsbo, dtype=float)[..., None]
+
+    # Transfer coefficients Eq. (46)
+    Sn = (Ratio ** 2) * (power(Ratio, wavenumber) + power(Ratio, -wavenumber)) / 2
+    Cn = (Ratio ** 2) * (power(Ratio, wavenumber) - power(Ratio, -wavenumber)) / 2
+
+    # Noise filtering (useful with magnetic FEA)
+    if rnoise is not None:
+        Inoise = np_abs(wavenumber) > rnoise
+        Sn[..., Inoise] = 1
+        Cn[..., Inoise] = 0
+
+    return Sn, Cn
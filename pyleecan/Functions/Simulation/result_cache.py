@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+from hashlib import sha256
+from os import listdir, makedirs, remove, replace, stat, utime
+from os.path import isfile, join
+
+import numpy as np
+
+from ... import __version__
+from ..object_cache import get_cache
+from ..Load.load_pkl import load_pkl
+from ..Save.save_pkl import save_pkl
+
+# Order of the modules: the result of a module depends on the previous ones
+MODULE_LIST = ["elec", "mag", "force"]
+VERSION_FILE = "version.txt"
+
+
+def get_result_key(module, out_name):
+    """Return the key of the result of a module in the result cache of the
+    simulation: hash of the machine, the input, the module parameters and the
+    keys of the previous modules of the simulation
+
+    The functions given as python objects (and not as str) are not part of the
+    key (as in as_dict)
+
+    Parameters
+    ----------
+    module : Electrical, Magnetics or Force
+        Module of a simulation in an Output
+    out_name : str
+        Name of the module output in Output ("elec", "mag" or "force")
+
+    Returns
+    -------
+    key : str
+        Key of the result (None if the cache is disabled)
+    """
+    simu = module.parent
+    if simu.result_cache_dir is None:
+        return None
+    output = simu.parent
+
+    hasher = sha256(__version__.encode())
+    _update_hash(hasher, simu.machine.as_dict(type_handle_ndarray=2))
+    _update_hash(hasher, simu.input.as_dict(type_handle_ndarray=2))
+    module_dict = module.as_dict(type_handle_ndarray=2)
+    module_dict.pop("logger_name", None)
+    _update_hash(hasher, module_dict)
+
+    # Keys of the previous modules computed during the same simulation
+    # (the modules can update their parameters when running)
+    key_dict = get_cache(output, "result_key", (), dict)
+    for name in MODULE_LIST[: MODULE_LIST.index(out_name)]:
+        if getattr(simu, name) is not None:
+            _update_hash(hasher, key_dict.get(name))
+    key = hasher.hexdigest()
+    key_dict[out_name] = key
+    return key
+
+
+def load_result(module, out_name, key):
+    """Replace the module output with the result of the cache
+
+    Parameters
+    ----------
+    module : Electrical, Magnetics or Force
+        Module of a simulation in an Output
+    out_name : str
+        Name of the module output in Output
+    key : str
+        Key of the result (None if the cache is disabled)
+
+    Returns
+    -------
+    is_loaded : bool
+        True if the result was in the cache
+    """
+    if key is None:
+        return False
+    file_path = join(get_cache_dir(module.parent), key + ".pkl")
+    if not isfile(file_path):
+        return False
+
+    setattr(module.parent.parent, out_name, load_pkl(file_path))
+    utime(file_path)  # Least recently used results are removed first
+    module.get_logger().info("Results loaded from the result cache")
+    return True
+
+
+def save_result(module, out_name, key):
+    """Store the module output in the cache (and remove the least recently
+    used results if the cache is larger than the simulation result_cache_size)
+
+    Parameters
+    ----------
+    module : Electrical, Magnetics or Force
+        Module of a simulation in an Output
+    out_name : str
+        Name of the module output in Output
+    key : str
+        Key of the result (None if the cache is disabled)
+    """
+    if key is None:
+        return
+    simu = module.parent
+    cache_dir = get_cache_dir(simu)
+    file_path = join(cache_dir, key + ".pkl")
+
+    out = getattr(simu.parent, out_name)
+    parent = out.parent
+    out.parent = None  # Only the module output is saved
+    try:
+        # Several processes can share the cache (multi-simulation)
+        tmp_path = file_path + "." + str(id(out)) + ".tmp"
+        save_pkl(out, tmp_path)
+        replace(tmp_path, file_path)
+    finally:
+        out.parent = parent
+
+    # Size based eviction
+    file_list = list()
+    for file_name in listdir(cache_dir):
+        if file_name.endswith(".pkl"):
+            file_stat = stat(join(cache_dir, file_name))
+            file_list.append((file_stat.st_mtime, file_stat.st_size, file_name))
+    size = sum(file_size for _, file_size, _ in file_list)
+    for _, file_size, file_name in sorted(file_list):
+        if size <= simu.result_cache_size * 2 ** 20:
+            break
+        if file_name != key + ".pkl":
+            remove(join(cache_dir, file_name))
+            size -= file_size
+
+
+def get_cache_dir(simu):
+    """Return the result cache folder of the simulation (created if needed and
+    cleared if it has been created by another version of pyleecan)
+
+    Parameters
+    ----------
+    simu : Simulation
+        Simulation with a result_cache_dir
+
+    Returns
+    -------
+    cache_dir : str
+        Path of the result cache folder
+    """
+    cache_dir = simu.result_cache_dir
+    version_path = join(cache_dir, VERSION_FILE)
+    if isfile(version_path):
+        with open(version_path, "r") as version_file:
+            if version_file.read() == __version__:
+                return cache_dir
+    clear_result_cache(cache_dir)
+    with open(version_path, "w") as version_file:
+        version_file.write(__version__)
+    return cache_dir
+
+
+def clear_result_cache(cache_dir):
+    """Remove all the results of a result cache folder
+
+    Parameters
+    ----------
+    cache_dir : str
+        Path of the result cache folder
+    """
+    makedirs(cache_dir, exist_ok=True)
+    for file_name in listdir(cache_dir):
+        if file_name.endswith(".pkl"):
+            remove(join(cache_dir, file_name))
+
+
+def _update_hash(hasher, value):
+    """Add a value (from as_dict) to the hash"""
+    if isinstance(value, dict):
+        hasher.update(b"{")
+        for key in sorted(value.keys(), key=str):
+            hasher.update(repr(key).encode())
+            _update_hash(hasher, value[key])
+        hasher.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"[")
+        for item in value:
+            _update_hash(hasher, item)
+        hasher.update(b"]")
+    elif isinstance(value, np.ndarray):
+        hasher.update(("array" + value.dtype.str + repr(value.shape)).encode())
+        if value.dtype.hasobject:
+            _update_hash(hasher, value.tolist())
+        else:
+            hasher.update(np.ascontiguousarray(value).tobytes())
+    elif hasattr(value, "as_dict"):  # SciDataTool objects
+        _update_hash(hasher, value.as_dict())
+    else:
+        hasher.update(repr(value).encode())
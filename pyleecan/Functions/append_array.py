@@ -0,0 +1,57 @@
+import numpy as np
+
+from .object_cache import get_cache, set_cache
+
+
+def append_array(obj, name, array, new_array):
+    """Return the concatenation of array and new_array along the first axis.
+    The result is a view on a buffer cached on obj with some free space at the
+    end: successive calls only copy the new rows until the buffer is full
+    (the buffer size is doubled), so building an array row by row is linear.
+
+    Parameters
+    ----------
+    obj : object
+        Object that owns the array (the buffer is cached on it)
+    name : str
+        Name of the array property
+    array : ndarray
+        Current value of the property (None or empty if no data)
+    new_array : ndarray
+        Rows to append
+
+    Returns
+    -------
+    result : ndarray
+        New value of the property (array and new_array rows)
+    """
+
+    # The buffer can only be used if array is the last returned value
+    buffer = None
+    if array is None or array.size == 0:
+        nb_row = 0
+    else:
+        buffer = get_cache(obj, "buffer_" + name, (array,))
+        array = array.reshape((-1,) + new_array.shape[1:])
+        nb_row = array.shape[0]
+    nb_new = new_array.shape[0]
+
+    if (
+        buffer is None
+        or buffer.shape[0] < nb_row + nb_new
+        or buffer.dtype != np.result_type(buffer, new_array)
+    ):
+        if nb_row == 0:
+            dtype = new_array.dtype
+        else:
+            dtype = np.result_type(array, new_array)
+        buffer = np.empty(
+            (max(2 * (nb_row + nb_new), 16),) + new_array.shape[1:], dtype=dtype
+        )
+        if nb_row > 0:
+            buffer[:nb_row] = array
+
+    buffer[nb_row : nb_row + nb_new] = new_array
+    result = buffer[: nb_row + nb_new]
+    set_cache(obj, "buffer_" + name, (result,), buffer)
+    return result
@@ -1,3 +1,128 @@
-def copy(self):
-    """Return a copy of the class"""
-    return type(self)(init_dict=self.as_dict())
+from copy import deepcopy
+from inspect import Parameter, signature
+from weakref import WeakKeyDictionary
+
+from numpy import ndarray
+
+# Arguments accepted by the as_dict functions (key: function,
+# value: (accepts type_handle_ndarray, accepts **kwargs))
+_AS_DICT_ARGS = WeakKeyDictionary()
+
+
+def copy(self, share_ndarray=False):
+    """Return a copy of the class (the ndarrays are copied with ndarray.copy()
+    without conversion to list, the values of the valid object are not checked
+    again)
+
+    Parameters
+    ----------
+    self : FrozenClass
+        A pyleecan object
+    share_ndarray : bool
+        True to share the ndarrays of self with the copy instead of copying
+        them (the shared ndarrays must be considered as read-only)
+
+    Returns
+    -------
+    obj_copy : FrozenClass
+        Copy of the object
+    """
+    if share_ndarray:
+        obj_dict = child_as_dict(self, type_handle_ndarray=2)
+    else:
+        obj_dict = child_as_dict(self, type_handle_ndarray=1)
+    return type(self).from_dict_trusted(obj_dict)
+
+
+def copy_data(data, type_handle_ndarray=1, parent=None):
+    """Return a copy of a SciDataTool object with native ndarray copies (its own
+    as_dict/copy methods convert the ndarrays to list). As with as_dict, the
+    objects referenced several times are copied several times.
+
+    Parameters
+    ----------
+    data : Data
+        A SciDataTool object
+    type_handle_ndarray : int
+        1 to copy the ndarrays, 2 to share them
+    parent : object
+        Parent of the copy
+
+    Returns
+    -------
+    data_copy : Data
+        Copy of the object
+    """
+    if isinstance(data, ndarray):
+        return _handle_ndarray(data, type_handle_ndarray)
+    elif isinstance(data, (list, tuple)):
+        return type(data)(
+            copy_data(value, type_handle_ndarray, parent) for value in data
+        )
+    elif isinstance(data, dict):
+        return {
+            key: copy_data(value, type_handle_ndarray, parent)
+            for key, value in data.items()
+        }
+    elif isinstance(data, (str, int, float, complex, bool)) or data is None:
+        return data
+    elif type(data).__module__.startswith("SciDataTool"):
+        data_copy = object.__new__(type(data))
+        for key, value in data.__dict__.items():
+            if key == "parent":
+                data_copy.__dict__[key] = parent
+            else:
+                data_copy.__dict__[key] = copy_data(
+                    value, type_handle_ndarray, data_copy
+                )
+        return data_copy
+    else:
+        return deepcopy(data)
+
+
+def child_as_dict(obj, type_handle_ndarray=0, **kwargs):
+    """Call the as_dict method of a property object. The arguments are only
+    given if they are not the default ones and if the method accepts them (an
+    as_dict overridden with the former signature as_dict(self) is called
+    without argument).
+
+    Parameters
+    ----------
+    obj : FrozenClass
+        A pyleecan (or SciDataTool) object
+    type_handle_ndarray : int
+        How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+
+    Returns
+    -------
+    obj_dict : dict
+        Result of obj.as_dict
+    """
+    if type_handle_ndarray == 0 and not kwargs:
+        return obj.as_dict()
+    as_dict = type(obj).as_dict
+    if as_dict not in _AS_DICT_ARGS:
+        param_dict = signature(as_dict).parameters
+        _AS_DICT_ARGS[as_dict] = (
+            "type_handle_ndarray" in param_dict,
+            any(param.kind == Parameter.VAR_KEYWORD for param in param_dict.values()),
+        )
+    is_type_handle, is_kwargs = _AS_DICT_ARGS[as_dict]
+    if is_kwargs:
+        return obj.as_dict(type_handle_ndarray=type_handle_ndarray, **kwargs)
+    elif is_type_handle:
+        return obj.as_dict(type_handle_ndarray=type_handle_ndarray)
+    else:
+        return obj.as_dict()
+
+
+def _handle_ndarray(value, type_handle_ndarray):
+    """Convert an ndarray for as_dict (0: tolist, 1: copy, 2: nothing)"""
+    if type_handle_ndarray == 0:
+        return value.tolist()
+    elif type_handle_ndarray == 1:
+        return value.copy()
+    elif type_handle_ndarray == 2:
+        return value
+    else:
+        raise Exception("Unknown type_handle_ndarray: " + str(type_handle_ndarray))
@@ -7,7 +7,8 @@ from .Load.load_json import load_json
 from .Load.load_hdf5 import load_hdf5
 from .Load.load_pkl import load_pkl
 from .Load.import_class import import_class
-from ..Classes._check import InitUnKnowClassError
+from .Load.matlib_index import INDEX_FILE_NAME, MatLibIndex
+from ..Classes._check import InitUnKnowClassError, skip_check_var
 
 
 def init_data(obj, file_path):
@@ -70,10 +71,10 @@ def init_data(obj, file_path):
         return obj
 
 
-def load_init_dict(file_path):
-    """load the init_dict from a h5 or json file"""
+def load_init_dict(file_path, is_lazy=False):
+    """load the init_dict from a h5 or json file (is_lazy: cf load_hdf5)"""
     if file_path.endswith("hdf5") or file_path.endswith("h5"):
-        return load_hdf5(file_path)
+        return load_hdf5(file_path, is_lazy)
     elif file_path.endswith("json") or isdir(file_path):
         return load_json(file_path)
     else:
@@ -82,17 +83,21 @@ def load_init_dict(file_path):
         )
 
 
-def load(file_path):
+def load(file_path, is_lazy=False, is_trusted=False):
     """Load a pyleecan object from a json file
 
     Parameters
     ----------
     file_path: str
         path to the file to load
+    is_lazy: bool
+        True to read the large arrays of a h5 file on their first access
+    is_trusted: bool
+        True to skip the check of the property values (file saved by pyleecan)
     """
     if file_path.endswith(".pkl"):
         return load_pkl(file_path)
-    file_path, init_dict = load_init_dict(file_path)
+    file_path, init_dict = load_init_dict(file_path, is_lazy)
 
     # Check that loaded data are of type dict
     if not isinstance(init_dict, dict):
@@ -108,9 +113,32 @@ def load(file_path):
     # Retrocompatibility
     convert_init_dict(init_dict)
 
+    if is_trusted:
+        with skip_check_var():
+            return init_data(init_dict, file_path)
     return init_data(init_dict, file_path)
 
 
+def from_dict_trusted(cls, init_dict):
+    """Create an object from a dict of trusted data (e.g. from as_dict or from
+    a file saved by pyleecan) without checking the values of the properties
+
+    Parameters
+    ----------
+    cls : type
+        pyleecan class of the object
+    init_dict : dict
+        dict with the property names as keys
+
+    Returns
+    -------
+    obj : FrozenClass
+        the created object
+    """
+    with skip_check_var():
+        return cls(init_dict=init_dict)
+
+
 def _load(file_path, cls_type=None):
     """Load a list of pyleecan objects from a json file
 
@@ -168,6 +196,8 @@ def load_matlib(mat_path):
     for (dirpath, _, filenames) in walk(mat_path):
         for file_name in filenames:
             # For all json file in the folder and subfolder
+            if file_name == INDEX_FILE_NAME:
+                continue
             if file_name.endswith(".json") or file_name.endswith(".h5"):
                 file_path = join(dirpath, file_name)
                 try:
@@ -183,6 +213,33 @@ def load_matlib(mat_path):
     return matlib
 
 
+def load_matlib_index(mat_path, index_path=None):
+    """Load the index of the Material json and h5 files of a folder and
+    subfolder (the index file is updated with the new and modified files, the
+    materials are loaded on demand)
+
+    Parameters
+    ----------
+    mat_path: str
+        path to the material library folder
+    index_path: str
+        path to the index file (default: INDEX_FILE_NAME in mat_path)
+
+    Returns
+    -------
+    matlib_index: MatLibIndex
+        Index of the material library
+    """
+
+    # Check that the dir exist
+    if not isdir(mat_path):
+        raise LoadMissingFolderError(
+            "The following given path doesn't lead to a directory: " + mat_path
+        )
+
+    return MatLibIndex(mat_path, index_path=index_path)
+
+
 class LoadMissingFolderError(Exception):
     """ """
 
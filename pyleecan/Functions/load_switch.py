@@ -6,6 +6,7 @@ WARNING! All changes made in this file will be lost!
 from ..Classes.import_all import *
 
 load_switch = {
+    "AGSFTransfer": AGSFTransfer,
     "Arc": Arc,
     "Arc1": Arc1,
     "Arc2": Arc2,
@@ -35,6 +36,7 @@ load_switch = {
     "FPGNTri": FPGNTri,
     "FluxLink": FluxLink,
     "FluxLinkFEMM": FluxLinkFEMM,
+    "FluxMapDQ": FluxMapDQ,
     "Force": Force,
     "ForceMT": ForceMT,
     "Frame": Frame,
@@ -93,7 +95,9 @@ load_switch = {
     "MachineUD": MachineUD,
     "MachineWRSM": MachineWRSM,
     "MagElmer": MagElmer,
+    "MagFE": MagFE,
     "MagFEMM": MagFEMM,
+    "MagPMMF": MagPMMF,
     "Magnet": Magnet,
     "Magnetics": Magnetics,
     "MatEconomical": MatEconomical,
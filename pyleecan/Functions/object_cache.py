@@ -0,0 +1,101 @@
+from weakref import finalize
+
+# Cached data of the objects, key: id of the object
+# value: dict (key: name of the cached data, value: (signature, data))
+_CACHE_DICT = dict()
+
+
+def get_cache(obj, name, sign, build=None):
+    """Return the data cached on obj under name, (re)build it if the
+    signature of the data it depends on has changed.
+    The cache is not a property of the object: it is neither saved, copied nor
+    compared and it is freed with the object.
+
+    Parameters
+    ----------
+    obj : object
+        Object to attach the cached data to
+    name : str
+        Name of the cached data
+    sign : tuple
+        Signature of the data the cache depends on. Arrays and objects are
+        compared by identity (the mesh methods replace the arrays when
+        modifying them), the other values (int, float, str...) by value.
+        It must not reference obj (e.g. a property object whose parent is obj):
+        the cache would keep obj alive
+    build : function
+        build() returns the data to cache (None to only get the data if the
+        cache is up to date)
+
+    Returns
+    -------
+    data : object
+        Cached data (None if the cache is not up to date and build is None)
+    """
+    obj_cache = _CACHE_DICT.get(id(obj))
+    if (
+        obj_cache is not None
+        and name in obj_cache
+        and _is_same_sign(obj_cache[name][0], sign)
+    ):
+        return obj_cache[name][1]
+
+    if build is None:
+        return None
+    data = build()
+    set_cache(obj, name, sign, data)
+    return data
+
+
+def set_cache(obj, name, sign, data):
+    """Cache data on obj under name (to update the cached data when the
+    object is modified by a method that knows how to update it)
+
+    Parameters
+    ----------
+    obj : object
+        Object to attach the cached data to
+    name : str
+        Name of the cached data
+    sign : tuple
+        Signature of the data the cache depends on (cf get_cache)
+    data : object
+        Data to cache
+    """
+    obj_cache = _CACHE_DICT.get(id(obj))
+    if obj_cache is None:
+        obj_cache = dict()
+        _CACHE_DICT[id(obj)] = obj_cache
+        finalize(obj, _CACHE_DICT.pop, id(obj), None)
+    obj_cache[name] = (sign, data)
+
+
+def clear_cache(obj, name=None):
+    """Remove the data cached on obj
+
+    Parameters
+    ----------
+    obj : object
+        Object with cached data
+    name : str
+        Name of the cached data to remove (None to remove all)
+    """
+    obj_cache = _CACHE_DICT.get(id(obj))
+    if obj_cache is not None:
+        if name is None:
+            obj_cache.clear()
+        else:
+            obj_cache.pop(name, None)
+
+
+def _is_same_sign(sign_1, sign_2):
+    """Compare two cache signatures (identity for arrays and objects)"""
+    if isinstance(sign_1, tuple) and isinstance(sign_2, tuple):
+        return len(sign_1) == len(sign_2) and all(
+            _is_same_sign(s1, s2) for s1, s2 in zip(sign_1, sign_2)
+        )
+    if sign_1 is sign_2:
+        return True
+    if isinstance(sign_1, (int, float, str, bytes)):
+        return type(sign_1) is type(sign_2) and sign_1 == sign_2
+    return False
@@ -1,6 +1,37 @@
 from ...Generator import PYTHON_TYPE, TAB, TAB2, TAB3, TAB4, TAB5, TAB6, TAB7
 from ...Generator.read_fct import is_list_pyleecan_type, is_dict_pyleecan_type
 
+# Arguments of the as_dict call of the mother class
+AS_DICT_ARGS = "type_handle_ndarray=type_handle_ndarray, **kwargs"
+# Arguments of child_as_dict (as_dict of the property objects)
+CHILD_ARGS = "type_handle_ndarray, **kwargs"
+
+
+def is_child_as_dict(prop_type):
+    """Check if a property is converted with child_as_dict (pyleecan object,
+    list or dict of pyleecan objects)
+
+    Parameters
+    ----------
+    prop_type : str
+        Type of the property
+
+    Returns
+    -------
+    is_child : bool
+        True if the as_dict of the property objects is called
+    """
+    return (
+        is_list_pyleecan_type(prop_type)
+        or is_dict_pyleecan_type(prop_type)
+        or (
+            prop_type not in PYTHON_TYPE
+            and prop_type not in ["ndarray", "[ndarray]", "{ndarray}", "function"]
+            and "." not in prop_type
+            and "SciDataTool" not in prop_type
+        )
+    )
+
 
 def generate_as_dict(gen_dict, class_dict):
     """Generate the code for the as_dict method of the class
@@ -78,12 +109,13 @@ def generate_as_dict(gen_dict, class_dict):
             )
         elif prop["type"] == "ndarray":
             # Add => "class_name ["var_name"] = self.var_name.tolist()" to
-            # var_str
+            # var_str (or the copy / the ndarray according to type_handle_ndarray)
             var_str += TAB2 + "if self." + prop["name"] + " is None:\n"
             var_str += TAB3 + class_name + '_dict["' + prop["name"] + '"] = None\n'
             var_str += TAB2 + "else:\n"
+            var_str += TAB3 + "if type_handle_ndarray == 0:\n"
             var_str += (
-                TAB3
+                TAB4
                 + class_name
                 + '_dict["'
                 + prop["name"]
@@ -91,6 +123,35 @@ def generate_as_dict(gen_dict, class_dict):
                 + prop["name"]
                 + ".tolist()\n"
             )
+            var_str += TAB3 + "elif type_handle_ndarray == 1:\n"
+            var_str += (
+                TAB4
+                + class_name
+                + '_dict["'
+                + prop["name"]
+                + '"] = self.'
+                + prop["name"]
+                + ".copy()\n"
+            )
+            var_str += TAB3 + "elif type_handle_ndarray == 2:\n"
+            var_str += (
+                TAB4
+                + class_name
+                + '_dict["'
+                + prop["name"]
+                + '"] = self.'
+                + prop["name"]
+                + "\n"
+            )
+            var_str += TAB3 + "else:\n"
+            var_str += (
+                TAB4
+                + "raise Exception(\n"
+                + TAB5
+                + '"Unknown type_handle_ndarray: " + str(type_handle_ndarray)\n'
+                + TAB4
+                + ")\n"
+            )
         elif prop["type"] == "[ndarray]":
             var_str += TAB2 + "if self." + prop["name"] + " is None:\n"
             var_str += TAB3 + class_name + '_dict["' + prop["name"] + '"] = None\n'
@@ -102,7 +163,7 @@ def generate_as_dict(gen_dict, class_dict):
                 + class_name
                 + '_dict["'
                 + prop["name"]
-                + '"].append(obj.tolist())\n'
+                + '"].append(_handle_ndarray(obj, type_handle_ndarray))\n'
             )
         elif prop["type"] == "{ndarray}":
             # Add => "class_name ["var_name"] = self.var_name.tolist()" to
@@ -117,7 +178,7 @@ def generate_as_dict(gen_dict, class_dict):
                 + class_name
                 + '_dict["'
                 + prop["name"]
-                + '"][key] = obj.tolist()\n'
+                + '"][key] = _handle_ndarray(obj, type_handle_ndarray)\n'
             )
         elif is_list_pyleecan_type(prop["type"]):
             var_str += TAB2 + "if self." + prop["name"] + " is None:\n"
@@ -127,7 +188,8 @@ def generate_as_dict(gen_dict, class_dict):
             var_str += TAB3 + "for obj in self." + prop["name"] + ":\n"
             var_str += TAB4 + "if obj is not None:"
             var_str += (
-                TAB5 + f'{class_name}_dict["{prop["name"]}"].append(obj.as_dict())\n'
+                TAB5
+                + f'{class_name}_dict["{prop["name"]}"].append(child_as_dict(obj, {CHILD_ARGS}))\n'
             )
             var_str += TAB4 + "else:"
             var_str += TAB5 + f'{class_name}_dict["{prop["name"]}"].append(None)\n'
@@ -140,7 +202,8 @@ def generate_as_dict(gen_dict, class_dict):
             var_str += TAB3 + "for key, obj in self." + prop["name"] + ".items():\n"
             var_str += TAB4 + "if obj is not None:"
             var_str += (
-                TAB5 + f'{class_name}_dict["{prop["name"]}"][key] = obj.as_dict()\n'
+                TAB5
+                + f'{class_name}_dict["{prop["name"]}"][key] = child_as_dict(obj, {CHILD_ARGS})\n'
             )
             var_str += TAB4 + "else:"
             var_str += TAB5 + f'{class_name}_dict["{prop["name"]}"][key] = None\n'
@@ -183,6 +246,31 @@ def generate_as_dict(gen_dict, class_dict):
                 + prop["name"]
                 + ").decode('ISO-8859-2')}\n"
             )
+        elif "SciDataTool" in prop["type"]:
+            # SciDataTool objects: ndarrays copied without list conversion if
+            # type_handle_ndarray is not 0
+            var_str += TAB2 + "if self." + prop["name"] + " is None:\n"
+            var_str += TAB3 + class_name + '_dict["' + prop["name"] + '"] = None\n'
+            var_str += TAB2 + "elif type_handle_ndarray == 0:\n"
+            var_str += (
+                TAB3
+                + class_name
+                + '_dict["'
+                + prop["name"]
+                + '"] = self.'
+                + prop["name"]
+                + ".as_dict()\n"
+            )
+            var_str += TAB2 + "else:\n"
+            var_str += (
+                TAB3
+                + class_name
+                + '_dict["'
+                + prop["name"]
+                + '"] = copy_data(self.'
+                + prop["name"]
+                + ", type_handle_ndarray)\n"
+            )
         else:
             # Add => "class_name ["var_name"] = self.var_name.as_dict()" to
             # var_str
@@ -194,16 +282,28 @@ def generate_as_dict(gen_dict, class_dict):
                 + class_name
                 + '_dict["'
                 + prop["name"]
-                + '"] = self.'
+                + '"] = child_as_dict(self.'
                 + prop["name"]
-                + ".as_dict()\n"
+                + ", "
+                + CHILD_ARGS
+                + ")\n"
             )
 
     # Code generation
-    dict_str += TAB + "def as_dict(self):\n"
+    dict_str += TAB + "def as_dict(self, type_handle_ndarray=0, **kwargs):\n"
     dict_str += (
         TAB2 + '"""Convert this object in a json seriable dict (can '
-        "be use in __init__)\n" + TAB2 + '"""\n\n'
+        "be use in __init__).\n"
+        + TAB2
+        + "type_handle_ndarray: int\n"
+        + TAB3
+        + "How to handle ndarray (0: tolist, 1: copy, 2: nothing)\n"
+        + TAB2
+        + "Optional keyword input parameter is for internal use only\n"
+        + TAB2
+        + "and may prevent json serializability.\n"
+        + TAB2
+        + '"""\n\n'
     )
     if class_dict["mother"] != "":
         # Get the properties of the mother class (if needed)
@@ -211,7 +311,13 @@ def generate_as_dict(gen_dict, class_dict):
             TAB2 + "# Get the properties inherited from " + class_dict["mother"] + "\n"
         )
         dict_str += (
-            TAB2 + class_name + "_dict = super(" + class_name + ", self).as_dict()\n"
+            TAB2
+            + class_name
+            + "_dict = super("
+            + class_name
+            + ", self).as_dict("
+            + AS_DICT_ARGS
+            + ")\n"
         )
     else:
         dict_str += TAB2 + class_name + "_dict = dict()\n"
@@ -11,7 +11,10 @@ from ...Generator.read_fct import (
 from ...Generator.ClassGenerator.import_method_generator import import_method
 from ...Generator.ClassGenerator.init_method_generator import generate_init
 from ...Generator.ClassGenerator.str_method_generator import generate_str
-from ...Generator.ClassGenerator.as_dict_method_generator import generate_as_dict
+from ...Generator.ClassGenerator.as_dict_method_generator import (
+    generate_as_dict,
+    is_child_as_dict,
+)
 from ...Generator.ClassGenerator.properties_generator import generate_properties
 from ...Generator.ClassGenerator.init_void_method_generator import generate_init_void
 from ...Generator.ClassGenerator.eq_method_generator import generate_eq
@@ -93,9 +96,25 @@ def generate_class(gen_dict, class_name, path_to_gen):
 
     # Save function
     class_file.write("from ..Functions.save import save\n")
-    class_file.write("from ..Functions.copy import copy\n")
-    class_file.write("from ..Functions.load import load_init_dict\n")
+    # Helpers of the as_dict method to copy the ndarrays
+    copy_import = "copy"
+    prop_type_list = [prop["type"] for prop in class_dict["properties"]]
+    if "[ndarray]" in prop_type_list or "{ndarray}" in prop_type_list:
+        copy_import += ", _handle_ndarray"
+    if any(
+        "SciDataTool" in prop_type
+        and not is_list_pyleecan_type(prop_type)
+        and not is_dict_pyleecan_type(prop_type)
+        for prop_type in prop_type_list
+    ):
+        copy_import += ", copy_data"
+    if any(is_child_as_dict(prop_type) for prop_type in prop_type_list):
+        copy_import += ", child_as_dict"
+    class_file.write("from ..Functions.copy import " + copy_import + "\n")
+    class_file.write("from ..Functions.load import load_init_dict, from_dict_trusted\n")
     class_file.write("from ..Functions.Load.import_class import import_class\n")
+    if "ndarray" in prop_type_list:
+        class_file.write("from ..Functions.Load.lazy_array import LazyArray\n")
 
     # Import of the mother_class (FrozenClass by default)
     # All the classes file are in the Classes folder (regardless of their main package)
@@ -261,6 +280,8 @@ def generate_class(gen_dict, class_name, path_to_gen):
         class_file.write(TAB + "save = save\n")
     if "copy" not in class_dict["methods"]:
         class_file.write(TAB + "copy = copy\n")
+    # Initialisation without checking the values (trusted data)
+    class_file.write(TAB + "from_dict_trusted = classmethod(from_dict_trusted)\n")
 
     if IS_LOGGER:
         class_file.write(TAB + "# get_logger method is available in all object\n")
@@ -111,7 +111,7 @@ def generate_init(gen_dict, class_dict):
     init_by_dict = ""
     for prop in all_properties:
         # To overwrite the parameter from init_dict
-        init_by_dict += TAB3 + 'if "' + prop["name"] + '" in list(init_dict.keys()):\n'
+        init_by_dict += TAB3 + 'if "' + prop["name"] + '" in init_dict:\n'
         init_by_dict += TAB4 + prop["name"] + ' = init_dict["' + prop["name"] + '"]\n'
 
     ################
@@ -47,6 +47,21 @@ def generate_properties(gen_dict, class_dict):
                 prop_str += TAB2 + "return self._" + prop["name"] + "\n\n"
             elif prop["type"] == "function":
                 prop_str += TAB2 + "return self._" + prop["name"] + "_func\n\n"
+            elif prop["type"] == "ndarray":
+                # Lazy loading (cf load_hdf5): the array is read on first access
+                # and set with the setter (to check it)
+                prop_str += (
+                    TAB2 + "if isinstance(self._" + prop["name"] + ", LazyArray):\n"
+                )
+                prop_str += (
+                    TAB3
+                    + "self._set_"
+                    + prop["name"]
+                    + "(self._"
+                    + prop["name"]
+                    + ".load())\n"
+                )
+                prop_str += TAB2 + "return self._" + prop["name"] + "\n\n"
             else:
                 prop_str += TAB2 + "return self._" + prop["name"] + "\n\n"
 
@@ -263,6 +278,11 @@ def generate_prop_setter(gen_dict, class_dict, prop):
                 check_type = prop["type"][0] + check_type
         else:
             check_type = prop["type"]
+        if prop["type"] == "ndarray":
+            # The lazy arrays are checked when they are loaded (the getter
+            # calls the setter with the loaded array)
+            set_str += TAB2 + "if not isinstance(value, LazyArray):\n"
+            set_str += TAB
         set_str += (
             TAB2 + 'check_var("' + prop["name"] + '", value, "' + check_type + '"'
         )
@@ -24,17 +24,5 @@ def add_cell(self, pt_indice, new_ind):
     if len(np.unique(pt_indice)) != self.nb_pt_per_cell:
         return False
 
-    if self.is_exist(pt_indice):
-        return False
-
-    # Create the new element
-    if self.nb_cell == 0:
-        self.connectivity = pt_indice
-        self.indice = np.array([new_ind])
-    else:
-        self.connectivity = np.vstack([self.connectivity, pt_indice])
-        self.indice = np.concatenate([self.indice, np.array([new_ind])])
-
-    self.nb_cell = self.nb_cell + 1
-
-    return True
+    # Hash table of add_cells (amortized growth of the arrays)
+    return bool(self.add_cells(np.array(pt_indice), new_ind)[0] == new_ind)
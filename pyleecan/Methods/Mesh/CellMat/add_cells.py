@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from ....Functions.append_array import append_array
+from ....Functions.object_cache import get_cache, set_cache
+
+
+def add_cells(self, connectivity, new_ind):
+    """Add several cells at once. The cells are identified by their sorted
+    point indices (hash table cached on the CellMat), the cells that already
+    exist and the cells with the same point several times are not added.
+
+    Parameters
+    ----------
+    self : CellMat
+        an CellMat object
+    connectivity : ndarray
+        point indices of the cells to add (nb_cell, nb_pt_per_cell)
+    new_ind : int
+        indice of the first created cell (the next ones are incremented)
+
+    Returns
+    -------
+    indice : ndarray
+        indice of each cell (new cell or existing one), -1 for the cells
+        that can't be created (nb_cell,)
+    """
+
+    connectivity = np.asarray(connectivity, dtype=int).reshape(
+        (-1, self.nb_pt_per_cell)
+    )
+    nb_new = connectivity.shape[0]
+    indice = -np.ones(nb_new, dtype=int)
+    if nb_new == 0:
+        return indice
+
+    connect = self.connectivity
+    if connect is None or connect.size == 0 or self.nb_cell == 0:
+        connect = None
+    cell_dict = get_cell_dict(self, connect)
+
+    key = np.sort(connectivity, axis=1)
+    is_valid = np.all(np.diff(key, axis=1) != 0, axis=1)
+    I_new = list()
+    for ii in np.nonzero(is_valid)[0]:
+        k = key[ii].tobytes()
+        ind = cell_dict.get(k)
+        if ind is None:
+            ind = new_ind + len(I_new)
+            cell_dict[k] = ind
+            I_new.append(ii)
+        indice[ii] = ind
+
+    if len(I_new) > 0:
+        self.connectivity = append_array(
+            self, "connectivity", connect, connectivity[I_new]
+        )
+        self.indice = append_array(
+            self, "indice", self.indice, np.arange(new_ind, new_ind + len(I_new))
+        )
+        self.nb_cell = self.connectivity.shape[0]
+    set_cache(self, "cell_dict", (self.connectivity,), cell_dict)
+
+    return indice
+
+
+def get_cell_dict(self, connect):
+    """Return the hash table of the cells (key: sorted point indices,
+    value: cell indice)
+
+    Parameters
+    ----------
+    self : CellMat
+        an CellMat object
+    connect : ndarray
+        connectivity of the cells (None if no cell)
+
+    Returns
+    -------
+    cell_dict : dict
+        cell indice for each sorted point indices
+    """
+
+    def build():
+        if connect is None:
+            return dict()
+        key = np.sort(connect.reshape((-1, self.nb_pt_per_cell)), axis=1)
+        key = key.astype(int)
+        return {k.tobytes(): ind for k, ind in zip(key, self.indice.tolist())}
+
+    return get_cache(self, "cell_dict", (connect,), build)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ....Functions.object_cache import get_cache
+
+
+def get_adjacency(self, adj_type="point2cell"):
+    """Return an adjacency matrix of the cells in CSR format (rows and
+    columns are point indices or cell positions in the connectivity).
+    The matrix is built at the first call and cached until the
+    connectivity is modified.
+
+    Parameters
+    ----------
+    self : CellMat
+        an CellMat object
+    adj_type : str
+        "point2cell": cells containing each point (nb_point, nb_cell)
+        "cell2cell": neighbour cells (with at least one common point) of
+        each cell (nb_cell, nb_cell)
+
+    Returns
+    -------
+    adjacency : csr_matrix
+        Adjacency matrix: the cells (or neighbours) of the row ii are
+        adjacency.indices[adjacency.indptr[ii] : adjacency.indptr[ii + 1]]
+    """
+
+    if adj_type not in ["point2cell", "cell2cell"]:
+        raise ValueError(
+            "Unknown adjacency type: " + str(adj_type) + " (point2cell or cell2cell)"
+        )
+
+    connect = self.connectivity
+
+    def build_point2cell():
+        if connect is None or connect.size == 0:
+            return csr_matrix((0, 0), dtype=np.int8)
+        connect_2d = connect.reshape((-1, self.nb_pt_per_cell))
+        nb_cell = connect_2d.shape[0]
+        point = connect_2d.ravel()
+        cell = np.repeat(np.arange(nb_cell), self.nb_pt_per_cell)
+        # Stable sort: the cells of each point are sorted by position
+        order = np.argsort(point, kind="stable")
+        indptr = np.zeros(point.max() + 2, dtype=int)
+        np.cumsum(np.bincount(point), out=indptr[1:])
+        return csr_matrix(
+            (np.ones(point.size, dtype=np.int8), cell[order], indptr),
+            shape=(indptr.size - 1, nb_cell),
+        )
+
+    def build_cell2cell():
+        point2cell = self.get_adjacency("point2cell").astype(int)
+        cell2cell = (point2cell.T @ point2cell).tocsr()
+        cell2cell.setdiag(0)
+        cell2cell.eliminate_zeros()
+        cell2cell.sort_indices()
+        return cell2cell
+
+    if adj_type == "point2cell":
+        build = build_point2cell
+    else:
+        build = build_cell2cell
+    return get_cache(self, adj_type, (connect,), build)
@@ -20,17 +20,12 @@ def get_point2cell(self, pt_indice):
 
     """
 
-    pt_to_cell = np.array([], dtype=int)
-    connect = self.connectivity
-    ind = self.indice
-
-    if (
-        connect is not None and len(connect.shape) > 1
-    ):  # If there is more than 1 element
-        Ielem = np.where(connect == pt_indice)[0]
-        pt_to_cell = ind[Ielem]
-    else:
-        if sum(connect == pt_indice) > 0:
-            pt_to_cell = ind
-
-    return pt_to_cell
+    point2cell = self.get_adjacency("point2cell")
+
+    if pt_indice is None or not 0 <= pt_indice < point2cell.shape[0]:
+        return np.array([], dtype=int)
+
+    Ielem = point2cell.indices[
+        point2cell.indptr[pt_indice] : point2cell.indptr[pt_indice + 1]
+    ]
+    return self.indice[Ielem]
@@ -20,16 +20,18 @@ def is_exist(self, connectivity):
             True if the element already exist
     """
 
-    # Check the existence of the element
-    e = np.array([], dtype=int)
-    for nd_tag in connectivity:
-        e = np.concatenate((e, self.get_point2cell(nd_tag)))
+    if len(connectivity) != self.nb_pt_per_cell or self.nb_cell == 0:
+        return False
 
-    unique, unique_counts = np.unique(e, return_counts=True)
-    for ie in range(len(unique)):
-        if unique_counts[ie] == self.nb_pt_per_cell and unique_counts[ie] == len(
-            connectivity
-        ):
-            # If this condition is valid, the element already exist
-            return True
-    return False
+    # The cell exists if one of the cells of the first point contains all the points
+    point2cell = self.get_adjacency("point2cell")
+    connect = self.connectivity.reshape((-1, self.nb_pt_per_cell))
+    pt_indice = connectivity[0]
+    if not 0 <= pt_indice < point2cell.shape[0]:
+        return False
+    Ielem = point2cell.indices[
+        point2cell.indptr[pt_indice] : point2cell.indptr[pt_indice + 1]
+    ]
+    return bool(
+        np.any(np.all(np.sort(connect[Ielem], axis=1) == np.sort(connectivity), axis=1))
+    )
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+def add_cells(self, connectivity, cell_type):
+    """Add several cells defined by their point indices at once
+    (cf CellMat.add_cells)
+
+    Parameters
+    ----------
+    self : MeshMat
+        an Mesh object
+    connectivity : ndarray
+        point indices of the cells to add (nb_cell, nb_pt_per_cell)
+    cell_type : str
+        type of the cells
+
+    Returns
+    -------
+    indice : ndarray
+        Tag of each cell (created or existing one), -1 for the cells that
+        can't be created (nb_cell,)
+    """
+
+    # The new cells are numbered after the cells of all the types
+    new_ind = 0
+    for key in self.cell:
+        if self.cell[key].indice is not None and self.cell[key].indice.size > 0:
+            new_ind = max(new_ind, int(np.max(self.cell[key].indice)) + 1)
+
+    return self.cell[cell_type].add_cells(connectivity, new_ind)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def find_cell_batch(self, points, key=None, normal_t=None):
+    """Return the cells containing the target points and the coordinates of
+    the points in the reference cell. The candidate cells are given by the
+    spatial index of the mesh (cf get_search_tree) and checked all at once.
+
+    Parameters
+    ----------
+    self : MeshMat
+        an MeshMat object
+    points : ndarray
+        coordinates of the target points (nb_pt, nb_dim)
+    key : str
+        cell type (None to use the first cell type of the mesh)
+    normal_t : ndarray
+        (optional) cell normal vector
+
+    Returns
+    -------
+    cell_ind : ndarray
+        indice of the cell containing each point, -1 if the point is outside
+        the mesh (nb_pt,)
+    point_ref : ndarray
+        coordinates of the points in the reference cell, nan if the point is
+        outside the mesh (nb_pt, 2)
+    """
+
+    if key is None:
+        key = list(self.cell.keys())[0]
+    cells = self.cell[key]
+    ref_cell = cells.interpolation.ref_cell
+    point_coord = self.point.coordinate
+    # Connectivity as rows of point_coord (point indices in the connectivity)
+    connect = self.point.get_row(cells.connectivity)
+    connect = connect.reshape((-1, cells.nb_pt_per_cell))
+    nb_cell = connect.shape[0]
+
+    points = np.atleast_2d(points)
+    nb_pt = points.shape[0]
+    cell_row = -np.ones(nb_pt, dtype=int)
+    point_ref = np.full((nb_pt, 2), np.nan)
+    if nb_cell == 0 or nb_pt == 0:
+        return cell_row, point_ref
+
+    search_tree = self.get_search_tree(key)
+    tree = search_tree["tree"]
+    nb_dim = search_tree["nb_dim"]
+    # A cell can only contain the points close to its center
+    dist_max = 2 * search_tree["radius"]
+
+    # The closest cells are checked first, then the search is extended to
+    # more cells for the points that are not found yet
+    pt_ind = np.arange(nb_pt)
+    k = min(8, nb_cell)
+    k_done = 0
+    while pt_ind.size > 0:
+        ind = tree.query(points[pt_ind, :nb_dim], k=k, distance_upper_bound=dist_max)[1]
+        ind = ind.reshape((pt_ind.size, k))
+
+        # Check all the new candidates at once (invalid index = no more cell)
+        is_valid = ind[:, k_done:] < nb_cell
+        cand_pt, cand_col = np.nonzero(is_valid)
+        cand_cell = ind[cand_pt, k_done + cand_col]
+        if cand_pt.size > 0:
+            is_inside, cand_ref = ref_cell.is_inside_batch(
+                point_coord[connect[cand_cell]], points[pt_ind[cand_pt]], normal_t
+            )
+            # Closest cell first (candidates sorted by distance for each point)
+            found, first = np.unique(cand_pt[is_inside], return_index=True)
+            cell_row[pt_ind[found]] = cand_cell[is_inside][first]
+            point_ref[pt_ind[found]] = cand_ref[is_inside][first]
+
+        # Points with all the candidates in range checked but not found
+        is_todo = (cell_row[pt_ind] == -1) & (ind[:, -1] < nb_cell)
+        if k == nb_cell:
+            break
+        pt_ind = pt_ind[is_todo]
+        k_done = k
+        k = min(4 * k, nb_cell)
+
+    cell_ind = -np.ones(nb_pt, dtype=int)
+    is_found = cell_row != -1
+    if cells.indice is not None and cells.indice.size == nb_cell:
+        cell_ind[is_found] = cells.indice[cell_row[is_found]]
+    else:
+        cell_ind[is_found] = cell_row[is_found]
+
+    return cell_ind, point_ref
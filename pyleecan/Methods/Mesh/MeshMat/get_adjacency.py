@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+
+def get_adjacency(self, key, adj_type="point2cell"):
+    """Return an adjacency matrix of the cells of a type in CSR format
+    (cached until the connectivity is modified, cf CellMat.get_adjacency)
+
+    Parameters
+    ----------
+    self : MeshMat
+        an MeshMat object
+    key : str
+        cell type
+    adj_type : str
+        "point2cell": cells containing each point (nb_point, nb_cell)
+        "cell2cell": neighbour cells (with at least one common point) of
+        each cell (nb_cell, nb_cell)
+
+    Returns
+    -------
+    adjacency : csr_matrix
+        Adjacency matrix (columns are the cell positions in the connectivity)
+    """
+
+    return self.cell[key].get_adjacency(adj_type)
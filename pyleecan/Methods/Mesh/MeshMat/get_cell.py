@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-import collections
+from collections.abc import Iterable
 import numpy as np
 
 
@@ -19,7 +19,7 @@ def get_cell(self, indices=None):
         Dict of connectivities
 
     """
-    if not isinstance(indices, collections.Iterable):
+    if not isinstance(indices, Iterable):
         indices = (indices,)
 
     cells = dict()
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from numpy import abs, newaxis, array
+from numpy import argsort, array, concatenate, isin, searchsorted, zeros
 
 
 def get_cell_area(self, indices=None):
@@ -20,20 +20,32 @@ def get_cell_area(self, indices=None):
     logger = self.get_logger()
     area = []
 
-    vertices_dict = self.get_vertice(indices=indices)
+    for key, cells in self.cell.items():
+        # Rows of the selected cells (in the order of indices)
+        if indices is None:
+            row = slice(None)
+        elif cells.indice is not None and cells.indice.size == cells.nb_cell:
+            ind = array(indices).ravel()
+            ind = ind[isin(ind, cells.indice)]
+            sorter = argsort(cells.indice)
+            row = sorter[searchsorted(cells.indice, ind, sorter=sorter)]
+        else:
+            ind = array(indices).ravel()
+            row = ind[(ind >= 0) & (ind < cells.nb_cell)]
+        if cells.nb_cell == 0:
+            continue
+        try:
+            # Cached areas of the cells with a surface reference cell
+            if not hasattr(cells.interpolation.ref_cell, "get_cell_area"):
+                raise AttributeError()
+            A = self.get_cell_geometry(key)["area"][row]
+        except:
+            logger.warning(
+                f'MeshMat: Reference Cell for "{key}" not found. '
+                + "Respective area set to zero."
+            )
+            A = zeros(cells.connectivity.reshape((cells.nb_cell, -1))[row].shape[0])
 
-    for key, vertices in vertices_dict.items():
-        if len(vertices) != 0:
-            try:
-                A = self.cell[key].interpolation.ref_cell.get_cell_area(vertices)
-                A = A.tolist()
-            except:
-                logger.warning(
-                    f'MeshMat: Reference Cell for "{key}" not found. '
-                    + "Respective area set to zero."
-                )
-                A = [0 for i in range(vertices.shape[0])]
+        area.append(A)
 
-            area.extend(A)
-
-    return array(area)
+    return concatenate(area) if len(area) > 0 else array([])
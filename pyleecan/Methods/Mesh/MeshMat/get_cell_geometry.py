@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from ....Functions.object_cache import get_cache
+
+# Integration rules used when the cells have no GaussPoint object (exact for
+# the linear cells): points in the reference cell and weights
+DEFAULT_GAUSS = {
+    "RefTriangle3": (np.array([[1 / 3, 1 / 3]]), np.array([1 / 2])),
+    "RefSegmentP1": (np.array([[0.0, 0.0]]), np.array([2.0])),
+}
+
+
+def get_cell_geometry(self, key=None):
+    """Return the geometric factors of all the cells of a type (computed at
+    once for all the cells and Gauss points). They are cached and computed
+    again only when the points or the connectivity are modified.
+
+    Parameters
+    ----------
+    self : MeshMat
+        an MeshMat object
+    key : str
+        cell type (None to use the first cell type of the mesh)
+
+    Returns
+    -------
+    geometry : dict
+        gauss_point: Gauss points in the reference cell (nb_gauss, 2),
+        jacob: jacobian matrices (nb_cell, nb_gauss, 2, 2),
+        det_jacob: jacobian determinants (nb_cell, nb_gauss),
+        inv_jacob: inverse (pseudo-inverse for the segments) of the jacobian
+        matrices (nb_cell, nb_gauss, 2, 2),
+        weight: integration weights (Gauss weights times the jacobian
+        determinants) (nb_cell, nb_gauss),
+        area: area (length for the segments) of the cells (nb_cell,),
+        shape: shape functions at the Gauss points (nb_gauss, nb_pt_per_cell),
+        grad_shape: gradient of the shape functions at the Gauss points in the
+        real cells (nb_cell, nb_gauss, 2, nb_pt_per_cell)
+    """
+
+    if key is None:
+        key = list(self.cell.keys())[0]
+    cells = self.cell[key]
+    point_coord = self.point.coordinate
+    connect = cells.connectivity
+
+    def build():
+        interp = cells.interpolation
+        ref_cell = interp.ref_cell
+        gauss_pts, gauss_w = None, None
+        if interp.gauss_point is not None:
+            try:
+                gauss_pts, gauss_w, _ = interp.gauss_point.get_gauss_points()
+            except ImportError:  # Optional quadrature package
+                pass
+        if gauss_pts is None:
+            gauss_pts, gauss_w = DEFAULT_GAUSS[type(ref_cell).__name__]
+        gauss_pts = np.atleast_2d(gauss_pts)[:, 0:2]
+        gauss_w = np.asarray(gauss_w, dtype=float)
+        nb_gauss = gauss_pts.shape[0]
+
+        vertice = point_coord[connect.reshape((-1, cells.nb_pt_per_cell))]
+        jacob, det_jacob = ref_cell.jacobian_batch(vertice, gauss_pts)
+        try:
+            inv_jacob = np.linalg.inv(jacob)
+        except np.linalg.LinAlgError:  # Segments (singular matrices)
+            inv_jacob = np.linalg.pinv(jacob)
+        weight = np.abs(det_jacob) * gauss_w[None, :]
+
+        shape, _ = ref_cell.shape_function(
+            gauss_pts if nb_gauss > 1 else gauss_pts[0], nb_gauss
+        )
+        grad_ref = np.array([ref_cell.grad_shape_function(pt) for pt in gauss_pts])
+        return {
+            "gauss_point": gauss_pts,
+            "jacob": jacob,
+            "det_jacob": det_jacob,
+            "inv_jacob": inv_jacob,
+            "weight": weight,
+            "area": weight.sum(axis=1),
+            "shape": shape.reshape((nb_gauss, -1)),
+            "grad_shape": np.einsum("cgba,gan->cgbn", inv_jacob, grad_ref),
+        }
+
+    return get_cache(self, "cell_geometry_" + key, (point_coord, connect), build)
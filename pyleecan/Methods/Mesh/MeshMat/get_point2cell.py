@@ -23,13 +23,8 @@ def get_point2cell(self, pt_indice):
     pt_to_cell = np.array([], dtype=int)
 
     for key in self.cell:
-        connect = self.cell[key].connectivity
-        indice_elem = self.cell[key].indice
-        if len(connect[key].shape) > 1:  # If there is more than 1 element
-            Ielem = np.where(connect[key] == pt_indice)[0]
-            pt_to_cell = np.concatenate((pt_to_cell, indice_elem[key][Ielem]))
-        else:
-            if sum(connect[key] == pt_indice) > 0:
-                pt_to_cell = np.concatenate((pt_to_cell, indice_elem[key]))
+        pt_to_cell = np.concatenate(
+            (pt_to_cell, self.cell[key].get_point2cell(pt_indice))
+        )
 
     return pt_to_cell
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from ....Functions.object_cache import get_cache
+
+
+def get_search_tree(self, key):
+    """Return the spatial index of the cells of a type: KD-tree of the
+    cell centers to locate points in the mesh.
+    The index is cached and rebuilt only when the points or the
+    connectivity are modified.
+
+    Parameters
+    ----------
+    self : MeshMat
+        an MeshMat object
+    key : str
+        cell type
+
+    Returns
+    -------
+    search_tree : dict
+        tree: cKDTree of the cell centers,
+        radius: largest distance between a cell center and its vertices,
+        nb_dim: number of coordinates used for the search
+    """
+
+    point_coord = self.point.coordinate
+    connect = self.cell[key].connectivity
+
+    def build():
+        nb_dim = min(self.dimension, point_coord.shape[1])
+        connect_row = self.point.get_row(connect)
+        vertice = point_coord[connect_row.reshape((-1, connect.shape[-1])), :nb_dim]
+        center = np.mean(vertice, axis=1)
+        radius = np.max(np.linalg.norm(vertice - center[:, None, :], axis=2))
+        return {"tree": cKDTree(center), "radius": radius, "nb_dim": nb_dim}
+
+    sign = (point_coord, self.point.indice, connect)
+    return get_cache(self, "search_tree_" + key, sign, build)
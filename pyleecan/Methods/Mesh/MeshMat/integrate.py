@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def integrate(self, field, group=None, key=None, is_point=False):
+    """Integrate a field over the cells of a type (all the steps at once with
+    the cached geometric factors of get_cell_geometry)
+
+    Parameters
+    ----------
+    self : MeshMat
+        an MeshMat object
+    field : ndarray
+        values on the cells (..., nb_cell) or on the cells of the group (constant
+        on each cell), or on the points (..., nb_pt) if is_point
+    group : ndarray
+        indices of the cells to integrate on (e.g. a group of a MeshSolution),
+        None for all the cells
+    key : str
+        cell type (None to use the first cell type of the mesh)
+    is_point : bool
+        True if the field is defined on the points (interpolated with the shape
+        functions of the cells)
+
+    Returns
+    -------
+    integral : ndarray
+        integral of the field (...)
+    """
+
+    if key is None:
+        key = list(self.cell.keys())[0]
+    cells = self.cell[key]
+    geometry = self.get_cell_geometry(key)
+
+    # Rows of the cells of the group
+    if group is None:
+        row = slice(None)
+    elif cells.indice is not None and cells.indice.size == cells.nb_cell:
+        sorter = np.argsort(cells.indice)
+        row = sorter[np.searchsorted(cells.indice, group, sorter=sorter)]
+    else:
+        row = np.asarray(group)
+
+    field = np.asarray(field)
+    if is_point:
+        # Integral of each shape function on each cell
+        shape_int = geometry["weight"][row].dot(geometry["shape"])
+        connect = cells.connectivity.reshape((-1, cells.nb_pt_per_cell))[row]
+        return np.einsum("...cn,cn->...", field[..., connect], shape_int)
+    if group is not None and field.shape[-1] == cells.nb_cell:
+        field = field[..., row]
+    return np.einsum("...c,c->...", field, geometry["area"][row])
@@ -7,7 +7,6 @@ from ....Classes.ScalarProductL2 import ScalarProductL2
 from ....Classes.RefSegmentP1 import RefSegmentP1
 
 from ....definitions import PACKAGE_NAME
-from collections import Counter
 import numpy as np
 from itertools import combinations
 
@@ -26,10 +25,14 @@ def interface(self, other_mesh):
     -------
     """
 
-    # Dynamic import
-    new_mesh = self.copy()
-    # new_mesh.point = PointMat()
-    new_mesh.cell = dict()
+    # Same points (arrays not copied)
+    new_mesh = type(self)(label=self.label, dimension=self.dimension)
+    new_mesh.point = PointMat(
+        coordinate=self.point.coordinate,
+        nb_pt=self.point.nb_pt,
+        indice=self.point.indice,
+        delta=self.point.delta,
+    )
 
     for key in self.cell:
 
@@ -43,64 +46,25 @@ def interface(self, other_mesh):
             interp.scalar_product = ScalarProductL2()
             new_mesh.cell["line"].interpolation = interp
 
-            connect = self.cell[key].get_connectivity()
-            connect2 = other_mesh.cell[key].get_connectivity()
-
-            points_tags = np.unique(connect)
-            other_points_tags = np.unique(connect2)
-
-            # Find the points on the interface (they are in both in and out)
-            interface_points_tags = np.intersect1d(points_tags, other_points_tags)
-            nb_interf_points = len(interface_points_tags)
-
-            comb = combinations(range(self.cell[key].nb_pt_per_cell), 2)
-
-            for duo in list(comb):
-                col1i = np.mod(duo[0], 3)
-                col2i = np.mod(duo[1], 3)
-                col1 = connect[:, col1i]
-                col2 = connect[:, col2i]
-
-                col1_bin = np.zeros(len(col1))
-                col2_bin = np.zeros(len(col1))
-
-                for pt in interface_points_tags:
-                    Icol1i = np.where(col1 == pt)[0]
-                    Icol2i = np.where(col2 == pt)[0]
-                    col1_bin[Icol1i] = 1
-                    col2_bin[Icol2i] = 1
-
-                # Position in vector where 2 nodes of the same element are on the interface (potential line element)
-                I_target = np.where(col1_bin + col2_bin == 2)[0]
-
-                comb2 = combinations(range(other_mesh.cell[key].nb_pt_per_cell), 2)
-                for duo2 in list(comb2):
-                    col1j = np.mod(duo2[0], 3)
-                    col2j = np.mod(duo2[1], 3)
-                    col12 = connect2[:, col1j]
-                    col22 = connect2[:, col2j]
-
-                    col12_bin = np.zeros(len(col12))
-                    col22_bin = np.zeros(len(col12))
-
-                    for pt in interface_points_tags:
-                        Icol1i = np.where(col12 == pt)[0]
-                        Icol2i = np.where(col22 == pt)[0]
-                        col12_bin[Icol1i] = 1
-                        col22_bin[Icol2i] = 1
-
-                    # Same but in the second mesh
-                    I_target2 = np.where(col12_bin + col22_bin == 2)[0]
-
-                    for itag in I_target2:
-                        e_tag1 = col12[itag]
-                        e_tag2 = col22[itag]
-                        Iline = np.where(
-                            ((col1[I_target] == e_tag1) & (col2[I_target] == e_tag2))
-                            | ((col2[I_target] == e_tag1) & (col1[I_target] == e_tag2))
-                        )[0]
-                        if Iline.size != 0:
-                            new_mesh.add_cell([e_tag1, e_tag2], "line")
+            # Edges of the cells of both meshes (the point indices are shared)
+            edge = get_edge(self.cell[key])
+            edge2 = get_edge(other_mesh.cell[key])
+            if edge.size == 0 or edge2.size == 0:
+                continue
+
+            # An edge is on the interface if it is in both meshes
+            nb_pt = max(edge.max(), edge2.max()) + 1
+            edge_key = np.sort(edge, axis=1) @ np.array([nb_pt, 1])
+            edge2_key = np.sort(edge2, axis=1) @ np.array([nb_pt, 1])
+            is_interf = np.isin(edge2_key, edge_key)
+
+            # Line cells in the order of the edges of the second mesh
+            I_line = np.sort(np.unique(edge2_key[is_interf], return_index=True)[1])
+            line = edge2[is_interf][I_line]
+            if line.shape[0] > 0:
+                new_mesh.cell["line"].connectivity = line
+                new_mesh.cell["line"].nb_cell = line.shape[0]
+                new_mesh.cell["line"].indice = np.arange(line.shape[0])
 
     return new_mesh
     # TODO : Extend the code to higher dimension (3 points triangles for tetrahedra interfaces ...)
@@ -125,3 +89,25 @@ def interface(self, other_mesh):
     # x = points_parent[interface_points_id, 0]
     # y = points_parent[interface_points_id, 1]
     # ax.scatter(x, y, marker='x')
+
+
+def get_edge(cells):
+    """Return the edges of the cells (nb_cell * nb_edge_per_cell, 2)
+    sorted by pair of points of the cells then by cell
+
+    Parameters
+    ----------
+    cells : CellMat
+        a CellMat object
+
+    Returns
+    -------
+    edge : ndarray
+        Points of each edge
+    """
+    if cells.connectivity is None or cells.connectivity.size == 0:
+        return np.zeros((0, 2), dtype=int)
+    connect = cells.connectivity.reshape((-1, cells.nb_pt_per_cell))
+    return np.vstack(
+        [connect[:, list(duo)] for duo in combinations(range(cells.nb_pt_per_cell), 2)]
+    )
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import numpy as np
-import copy
 
 from pyleecan.Classes.CellMat import CellMat
 from pyleecan.Classes.PointMat import PointMat
@@ -20,32 +19,33 @@ def renum(self):
     """
 
     coord_init = self.point.coordinate
-    connect_dict, nb_cell, indices = self.get_cell()
-
-    node_indice = list()
-    for key in connect_dict:
-        node_indice.extend(np.unique(connect_dict[key]))
-
-    node_indice = np.unique(node_indice)
 
+    # New indice of the points = position in the sorted used point indices
+    connect_list = [
+        self.cell[key].connectivity.astype(int).ravel() for key in self.cell
+    ]
+    node_indice, connect_new = np.unique(
+        np.concatenate([np.array([], dtype=int)] + connect_list), return_inverse=True
+    )
+    connect_new = connect_new.ravel()
     nb_node_new = len(node_indice)
-    node_indice_new = np.linspace(0, nb_node_new - 1, nb_node_new, dtype=int)
-    connect_dict_new = copy.deepcopy(connect_dict)
-    for inode in range(nb_node_new):
-        for key in connect_dict:
-            connect_dict_new[key][
-                connect_dict[key] == node_indice[inode]
-            ] = node_indice_new[inode]
 
     self.point = PointMat(
-        coordinate=coord_init[node_indice, :], nb_pt=nb_node_new, indice=node_indice_new
+        coordinate=coord_init[self.point.get_row(node_indice), :],
+        nb_pt=nb_node_new,
+        indice=np.arange(nb_node_new),
     )
 
-    for key in connect_dict:
+    ind_start = 0
+    for key, connect in zip(list(self.cell), connect_list):
+        cells = self.cell[key]
         self.cell[key] = CellMat(
-            connectivity=connect_dict_new[key],
-            nb_cell=len(connect_dict_new[key]),
-            nb_pt_per_cell=self.cell[key].nb_pt_per_cell,
-            indice=self.cell[key].indice,
-            interpolation=self.cell[key].interpolation,
+            connectivity=connect_new[ind_start : ind_start + connect.size].reshape(
+                cells.connectivity.shape
+            ),
+            nb_cell=cells.nb_cell,
+            nb_pt_per_cell=cells.nb_pt_per_cell,
+            indice=cells.indice,
+            interpolation=cells.interpolation,
         )
+        ind_start += connect.size
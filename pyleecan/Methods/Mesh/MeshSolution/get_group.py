@@ -1,18 +1,22 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
-import copy
 
 from pyleecan.Classes.CellMat import CellMat
 from pyleecan.Classes.MeshMat import MeshMat
 from pyleecan.Classes.PointMat import PointMat
 from pyleecan.Classes.SolutionMat import SolutionMat
 from pyleecan.definitions import PACKAGE_NAME
+from ....Functions.object_cache import get_cache
 
 
 def get_group(self, group_names):
     """Return all attributes of a MeshSolution object with only the cells, points
     and corresponding solutions of the group. Solutions are converted as SolutionMat.
+    The group mesh and solutions are cached (per group names) until the mesh, the
+    solutions or the groups of self are modified: each call returns a new
+    MeshSolution with copies of the cached mesh and solutions sharing their
+    ndarrays (the ndarrays must not be modified in place).
 
      Parameters
      ----------
@@ -28,8 +32,68 @@ def get_group(self, group_names):
 
     """
 
-    is_same_mesh = self.is_same_mesh
-    dimension = self.dimension
+    # Cache key: tuple of the group names (the label differs for a str)
+    if isinstance(group_names, list):
+        key = tuple(group_names)
+    else:
+        key = group_names
+        if isinstance(group_names, str) and group_names not in self.group:
+            raise KeyError(
+                group_names
+                + " group doesn't exist (available groups: "
+                + str(list(self.group.keys()))
+                + ")"
+            )
+
+    label, mesh, sol_list = get_cache(
+        self,
+        "group_" + repr(key),
+        _get_group_sign(self),
+        lambda: _build_group(self, group_names),
+    )
+
+    # The cached objects are not shared (their parent would be set to the
+    # returned MeshSolution and keep it alive in the cache): copies sharing
+    # the cached ndarrays
+    return type(self)(
+        label=label,
+        mesh=[mesh.copy(share_ndarray=True)],
+        is_same_mesh=self.is_same_mesh,
+        solution=[sol.copy(share_ndarray=True) for sol in sol_list],
+        group=dict(self.group),
+        dimension=self.dimension,
+    )
+
+
+def _get_group_sign(self):
+    """Signature of the data the group extraction depends on (cf get_cache).
+    Only arrays, fields and labels: the mesh and solution objects have self as
+    parent, the cache entry would keep self alive.
+    """
+    mesh = self.get_mesh()
+    mesh_sign = (mesh.point.coordinate, mesh.point.indice) + tuple(
+        (key, cells.connectivity, cells.indice) for key, cells in mesh.cell.items()
+    )
+    sol_sign = tuple(
+        (sol.label, sol.type_cell, sol.field, getattr(sol, "indice", None))
+        for sol in self.solution
+    )
+    group_sign = tuple(self.group.items())
+    return (mesh_sign, sol_sign, group_sign)
+
+
+def _build_group(self, group_names):
+    """Extract the mesh and the solutions of the group(s)
+
+    Returns
+    -------
+    label: str
+        label of the group MeshSolution
+    mesh: MeshMat
+        mesh of the group
+    sol_list: list
+        solutions of the group
+    """
 
     group_indices = list()
     label = ""
@@ -50,13 +114,6 @@ def get_group(self, group_names):
                 group_indices.extend(self.group[grp])
                 label = label + grp + "_"
     elif isinstance(group_names, str):
-        if group_names not in self.group:
-            raise KeyError(
-                group_names
-                + " group doesn't exist (available groups: "
-                + str(list(self.group.keys()))
-                + ")"
-            )
         group_indices.extend(self.group[group_names])
         label = label + group_names
 
@@ -67,22 +124,41 @@ def get_group(self, group_names):
     point_init = mesh_init.get_point()
     mesh_list = list()
     for sep in sep_list:
-        connect_dict, nb_cell, indice_dict = mesh_init.get_cell(sep)
-
+        sep = np.array(sep, dtype=int)
         node_indice = list()
+        indice_dict = dict()
         mesh_new = MeshMat()
-        for key in connect_dict:
-            node_indice.extend(np.unique(connect_dict[key]))
+        for key in mesh_init.cell:
+            # Position of the group cells in the connectivity (group order)
+            cells = mesh_init.cell[key]
+            connect = cells.connectivity.reshape((-1, cells.nb_pt_per_cell))
+            Ipos = np.zeros(sep.size, dtype=int)
+            is_in = np.zeros(sep.size, dtype=bool)
+            if cells.nb_cell > 0:
+                sorter = np.argsort(cells.indice)
+                Ipos = np.searchsorted(cells.indice, sep, sorter=sorter)
+                Ipos = sorter[np.mod(Ipos, sorter.size)]
+                is_in = cells.indice[Ipos] == sep
+            indice_dict[key] = sep[is_in].tolist()
+            connect_grp = connect[Ipos[is_in]]
+
+            node_indice.extend(np.unique(connect_grp))
             mesh_new.cell[key] = CellMat(
-                connectivity=connect_dict[key],
-                nb_cell=len(connect_dict[key]),
+                connectivity=connect_grp,
+                nb_cell=len(connect_grp),
                 nb_pt_per_cell=mesh_init.cell[key].nb_pt_per_cell,
                 indice=indice_dict[key],
                 interpolation=mesh_init.cell[key].interpolation,
             )
         node_indice = np.unique(node_indice)
 
-        mesh_new.point = PointMat(init_dict=mesh_init.point.as_dict())
+        # Same points (arrays not copied, renum selects the used points)
+        mesh_new.point = PointMat(
+            coordinate=mesh_init.point.coordinate,
+            nb_pt=mesh_init.point.nb_pt,
+            indice=mesh_init.point.indice,
+            delta=mesh_init.point.delta,
+        )
         mesh_new.label = label
 
         mesh_list.append(mesh_new)
@@ -112,7 +188,7 @@ def get_group(self, group_names):
         if new_sol is not None:
             sol_list.append(new_sol)
 
-    # 5) Create the corresponding MeshSolution object
+    # 5) renumber the points of the group mesh
     if is_interface:
         mesh_interface.renum()
         mesh = mesh_interface
@@ -120,11 +196,4 @@ def get_group(self, group_names):
         mesh_new.renum()
         mesh = mesh_new
 
-    meshsol_grp = self.copy()
-    meshsol_grp.label = label
-    meshsol_grp.mesh = [mesh]
-    meshsol_grp.is_same_mesh = is_same_mesh
-    meshsol_grp.solution = sol_list
-    meshsol_grp.dimension = dimension
-
-    return meshsol_grp
+    return label, mesh, sol_list
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ....Functions.object_cache import get_cache
+
+# Number of point sets whose interpolation matrix is kept
+NB_CACHED_POINTS = 8
+
+
+def interpolate(self, points, label=None, index=None):
+    """Return the values of a solution at arbitrary points on all the steps
+    (time, frequency...) of the solution.
+
+    The points are located in the mesh all at once and the interpolation
+    weights (shape functions of the cells) are stored in a sparse matrix.
+    The matrices of the last NB_CACHED_POINTS point sets are cached (compared
+    by value) until the mesh is modified: the next calls with the same points
+    only cost a matrix product.
+
+    Parameters
+    ----------
+    self : MeshSolution
+        an MeshSolution object
+    points : ndarray
+        coordinates of the points (Npoints, nb_dim)
+    label : str
+        label of the solution
+    index : int
+        index of the solution
+
+    Returns
+    -------
+    values : ndarray
+        field at the points, the "indice" axis of the solution is replaced by
+        the points, e.g. (Nt, Npoints, comp) for a vector field.
+        nan for the points outside the mesh.
+    """
+
+    solution = self.get_solution(label=label, index=index)
+    mesh = self.get_mesh(label=label, index=index)
+    axis_name, _ = solution.get_axes_list()
+    field = np.asarray(solution.get_field())
+    ii = axis_name.index("indice") if axis_name and "indice" in axis_name else 0
+
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    # Least recently used interpolation matrices of the mesh (key: points and
+    # cell type), cleared when the mesh is modified
+    mesh_sign = (mesh.point.coordinate, mesh.point.indice) + tuple(
+        (key, cells.connectivity, cells.indice) for key, cells in mesh.cell.items()
+    )
+    weight_dict = get_cache(mesh, "interpolate", mesh_sign, OrderedDict)
+    key = (solution.type_cell, points.shape, points.tobytes())
+    if key in weight_dict:
+        weight_dict.move_to_end(key)
+    else:
+        weight_dict[key] = _comp_weight(mesh, points, solution.type_cell)
+        if len(weight_dict) > NB_CACHED_POINTS:
+            weight_dict.popitem(last=False)
+    weight = weight_dict[key]
+
+    # Sparse product on all the other axes at once
+    field_ind = np.moveaxis(field, ii, 0)
+    values = weight.dot(field_ind.reshape((field_ind.shape[0], -1)))
+    values = values.reshape((points.shape[0],) + field_ind.shape[1:])
+    values[weight.getnnz(axis=1) == 0] = np.nan
+
+    return np.moveaxis(values, 0, ii)
+
+
+def _comp_weight(mesh, points, type_cell):
+    """Interpolation matrix (Npoints, Nnodes) of a nodal solution or selection
+    matrix (Npoints, Ncells) of a solution on the cells of type type_cell"""
+
+    nb_pt = points.shape[0]
+    row_list, col_list, val_list = list(), list(), list()
+    is_found = np.zeros(nb_pt, dtype=bool)
+
+    key_list = list(mesh.cell.keys()) if type_cell == "point" else [type_cell]
+    for key in key_list:
+        cells = mesh.cell[key]
+        pt_ind = np.nonzero(~is_found)[0]
+        if pt_ind.size == 0 or cells.nb_cell == 0:
+            continue
+        cell_ind, point_ref = mesh.find_cell_batch(points[pt_ind], key)
+        is_in = cell_ind != -1
+        pt_ind, cell_ind, point_ref = pt_ind[is_in], cell_ind[is_in], point_ref[is_in]
+        is_found[pt_ind] = True
+
+        # Row of the cells in the connectivity (find_cell_batch returns indices)
+        if cells.indice is not None and cells.indice.size == cells.nb_cell:
+            sorter = np.argsort(cells.indice)
+            cell_row = sorter[np.searchsorted(cells.indice, cell_ind, sorter=sorter)]
+        else:
+            cell_row = cell_ind
+
+        if type_cell == "point":
+            # Rows of the points (point indices in the connectivity)
+            connect = mesh.point.get_row(cells.connectivity)
+            connect = connect.reshape((-1, cells.nb_pt_per_cell))
+            shape_value, _ = cells.interpolation.ref_cell.shape_function(
+                point_ref, pt_ind.size
+            )
+            row_list.append(np.repeat(pt_ind, cells.nb_pt_per_cell))
+            col_list.append(connect[cell_row].ravel())
+            val_list.append(shape_value[:, 0, :].ravel())
+            nb_col = mesh.point.coordinate.shape[0]
+        else:
+            row_list.append(pt_ind)
+            col_list.append(cell_row)
+            val_list.append(np.ones(pt_ind.size))
+            nb_col = cells.nb_cell
+
+    if len(row_list) == 0:
+        nb_col = mesh.point.coordinate.shape[0] if type_cell == "point" else 0
+        return csr_matrix((nb_pt, nb_col))
+    return csr_matrix(
+        (
+            np.concatenate(val_list),
+            (np.concatenate(row_list), np.concatenate(col_list)),
+        ),
+        shape=(nb_pt, nb_col),
+    )
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 
 
-def as_dict(self):
-    """Convert this object in a json seriable dict (can be use in __init__)"""
+def as_dict(self, type_handle_ndarray=0, **kwargs):
+    """Convert this object in a json seriable dict (can be use in __init__).
+    type_handle_ndarray: int
+        How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+    """
 
     # Get the properties inherited from Mesh
-    MeshVTK_dict = super(type(self), self).as_dict()
+    MeshVTK_dict = super(type(self), self).as_dict(
+        type_handle_ndarray=type_handle_ndarray, **kwargs
+    )
     MeshVTK_dict["mesh"] = None
     MeshVTK_dict["is_pyvista_mesh"] = self.is_pyvista_mesh
     MeshVTK_dict["format"] = self.format
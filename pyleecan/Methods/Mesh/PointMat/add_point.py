@@ -4,34 +4,24 @@ import numpy as np
 
 
 def add_point(self, coord):
-    """Define a new PointMat object based on a set of elements.
+    """Add a new point (cf add_points)
 
     Parameters
     ----------
     self : PointMat
         an PointMat object
-    element : Element
-        an Element object
+    coord : ndarray
+        coordinates of the point
 
     Returns
     -------
-    node: Node
-        a Node object corresponding to Element
+    new_ind : int
+        indice of the new point, None if the point already exists
 
     """
-    if self.is_exist(coord):
+    nb_pt = self.nb_pt
+    new_ind = self.add_points(coord)[0]
+    if self.nb_pt == nb_pt:  # The point already exists
         return None
-    else:
-        if self.coordinate is not None and self.coordinate.size > 0:
-            self.coordinate = np.vstack((self.coordinate, coord))
-            new_ind = max(self.indice) + 1
-            self.indice = np.concatenate((self.indice, np.array([new_ind], dtype=int)))
-            self.nb_pt = self.nb_pt + 1
-        else:
-            self.coordinate = np.concatenate((self.coordinate, coord))
-            new_ind = 0
-            self.indice = np.array([], dtype=int)
-            self.indice = np.concatenate((self.indice, np.array([new_ind], dtype=int)))
-            self.nb_pt = self.nb_pt + 1
 
     return new_ind
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from ....Functions.append_array import append_array
+from ....Functions.object_cache import get_cache, set_cache
+
+
+def add_points(self, coord):
+    """Add several points at once. The points are identified by their
+    coordinates rounded to delta (hash table cached on the PointMat), the
+    points that already exist are not added again.
+
+    Parameters
+    ----------
+    self : PointMat
+        an PointMat object
+    coord : ndarray
+        coordinates of the points to add (nb_pt, nb_dim)
+
+    Returns
+    -------
+    indice : ndarray
+        indice of each point (new point or existing one) (nb_pt,)
+    """
+
+    coord = np.atleast_2d(np.asarray(coord, dtype=float))
+    nb_new = coord.shape[0]
+    if nb_new == 0:
+        return np.array([], dtype=int)
+
+    delta = self.delta
+    coordinate = self.coordinate
+    if coordinate is None or coordinate.size == 0:
+        coordinate = None
+    point_dict = get_point_dict(self, coordinate, coord.shape[1])
+
+    # Points of coord with the same key are added once
+    # (+ 0.0 so that -0.0 and 0.0 give the same bytes)
+    key = np.round(coord / delta) + 0.0
+    key_unique, I_first, I_inv = np.unique(
+        key, axis=0, return_index=True, return_inverse=True
+    )
+    I_first_sort = np.argsort(I_first)  # Keep the order of coord
+
+    if coordinate is None or self.indice is None or self.indice.size == 0:
+        new_ind = 0
+    else:
+        new_ind = int(np.max(self.indice)) + 1
+    indice_unique = np.zeros(key_unique.shape[0], dtype=int)
+    I_new = list()
+    for ii in I_first_sort:
+        k = key_unique[ii].tobytes()
+        ind = point_dict.get(k)
+        if ind is None:
+            ind = new_ind + len(I_new)
+            point_dict[k] = ind
+            I_new.append(ii)
+        indice_unique[ii] = ind
+
+    if len(I_new) > 0:
+        I_new = I_first[I_new]
+        self.coordinate = append_array(self, "coordinate", coordinate, coord[I_new])
+        self.indice = append_array(
+            self, "indice", self.indice, np.arange(new_ind, new_ind + I_new.size)
+        )
+        self.nb_pt = self.coordinate.shape[0]
+    set_cache(self, "point_dict", (self.coordinate, delta), point_dict)
+
+    return indice_unique[I_inv.ravel()]
+
+
+def get_point_dict(self, coordinate, nb_dim):
+    """Return the hash table of the points (key: rounded coordinates,
+    value: point indice)
+
+    Parameters
+    ----------
+    self : PointMat
+        an PointMat object
+    coordinate : ndarray
+        coordinates of the points (None if no point)
+    nb_dim : int
+        number of coordinates of the points
+
+    Returns
+    -------
+    point_dict : dict
+        point indice for each rounded coordinates
+    """
+
+    def build():
+        if coordinate is None:
+            return dict()
+        key = np.round(coordinate.reshape((-1, nb_dim)) / self.delta) + 0.0
+        return {k.tobytes(): ind for k, ind in zip(key, self.indice.tolist())}
+
+    return get_cache(self, "point_dict", (coordinate, self.delta), build)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from ....Functions.object_cache import get_cache
+
+
+def get_row(self, indice):
+    """Return the rows of points (position in coordinate) from their indices
+    (e.g. the values of a connectivity). The sorted indices are cached until
+    the indices are modified.
+
+    Parameters
+    ----------
+    self : PointMat
+        an PointMat object
+    indice : ndarray
+        indices of the points
+
+    Returns
+    -------
+    row : ndarray
+        rows of the points (same shape as indice)
+    """
+
+    indice = np.asarray(indice, dtype=int)
+    point_ind = self.indice
+    if point_ind is None or point_ind.size != self.coordinate.shape[0]:
+        return indice
+
+    def build():
+        if np.array_equal(point_ind, np.arange(point_ind.size)):
+            return None  # indice = row
+        return np.argsort(point_ind)
+
+    sorter = get_cache(self, "row_sorter", (point_ind,), build)
+    if sorter is None:
+        return indice
+    return sorter[np.searchsorted(point_ind, indice, sorter=sorter)]
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def is_inside_batch(self, vertice, point, normal_t=None):
+    """Check if each point is inside its cell (one call to is_inside per
+    point, the linear cells have a vectorized version)
+
+    Parameters
+    ----------
+    self : RefCell
+        a RefCell object
+    vertice : ndarray
+        vertices of the cells (nb_cell, nb_pt_per_cell, nb_dim)
+    point : ndarray
+        coordinates of the checked points (nb_cell, nb_dim)
+    normal_t : ndarray
+        (optional) cell normal vector
+
+    Returns
+    -------
+    is_inside: ndarray
+        true if the point is inside its cell (nb_cell,)
+    point_ref : ndarray
+        coordinates of the points in the reference cell (nb_cell, 2)
+    """
+
+    nb_cell = point.shape[0]
+    is_inside = np.zeros(nb_cell, dtype=bool)
+    point_ref = np.zeros((nb_cell, 2))
+    for ii in range(nb_cell):
+        is_inside[ii] = self.is_inside(vertice[ii], point[ii], normal_t)[0]
+        point_ref[ii] = self.get_ref_point(vertice[ii], point[ii])[0:2]
+
+    return is_inside, point_ref
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def jacobian_batch(self, vertice, point):
+    """Compute the jacobian and its determinant of several cells at several
+    points of the reference cell (one call to jacobian per cell and point, the
+    linear cells have a vectorized version)
+
+    Parameters
+    ----------
+    self : RefCell
+        a RefCell object
+    vertice : ndarray
+        vertices of the cells (nb_cell, nb_pt_per_cell, nb_dim)
+    point : ndarray
+        coordinates of the points in the reference cell (nb_pt, 2)
+
+    Returns
+    -------
+    jacob : ndarray
+        jacobian matrices (nb_cell, nb_pt, 2, 2)
+    det_jacob : ndarray
+        jacobian determinants (nb_cell, nb_pt)
+    """
+
+    nb_cell, nb_pt = vertice.shape[0], point.shape[0]
+    jacob = np.zeros((nb_cell, nb_pt, 2, 2))
+    det_jacob = np.zeros((nb_cell, nb_pt))
+    for ii in range(nb_cell):
+        for jj in range(nb_pt):
+            jacob[ii, jj], det_jacob[ii, jj] = self.jacobian(point[jj], vertice[ii])
+
+    return jacob, det_jacob
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from ....Classes.RefCell import RefCell
+
+
+def is_inside_batch(self, vertice, point, normal_t=None):
+    """Check if each point is inside its cell (vectorized is_inside)
+
+    Parameters
+    ----------
+    self : RefSegmentP1
+        a RefSegmentP1 object
+    vertice : ndarray
+        vertices of the cells (nb_cell, 2, nb_dim)
+    point : ndarray
+        coordinates of the checked points (nb_cell, nb_dim)
+    normal_t : ndarray
+        (optional) normal of another cell. Additional facultative criterion.
+
+    Returns
+    -------
+    is_inside: ndarray
+        true if the point is inside its cell (nb_cell,)
+    point_ref : ndarray
+        coordinates of the points in the reference cell (nb_cell, 2)
+    """
+
+    if normal_t is not None:  # Normal check only available cell by cell
+        return RefCell.is_inside_batch(self, vertice, point, normal_t)
+
+    # Same as get_ref_point: rotation in the segment frame
+    pt1 = point[:, 0:2] - vertice[:, 0, 0:2]
+    pt2 = vertice[:, 1, 0:2] - vertice[:, 0, 0:2]
+    rho2 = np.sqrt(pt2[:, 0] ** 2 + pt2[:, 1] ** 2)
+    s = 2 * (pt1[:, 0] * pt2[:, 0] + pt1[:, 1] * pt2[:, 1]) / rho2 ** 2 - 1
+    t = 2 * (pt1[:, 1] * pt2[:, 0] - pt1[:, 0] * pt2[:, 1]) / rho2 ** 2
+
+    eps = self.epsilon
+    is_inside = (np.abs(s) < 1 + eps) & (np.abs(t) < eps * ((1 - s ** 2) + 1))
+
+    return is_inside, np.column_stack((s, t))
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def jacobian_batch(self, vertice, point):
+    """Compute the jacobian and its determinant (half length) of several
+    segments (constant on each cell) at several points of the reference cell
+
+    Parameters
+    ----------
+    self : RefSegmentP1
+        a RefSegmentP1 object
+    vertice : ndarray
+        vertices of the cells (nb_cell, 2, nb_dim)
+    point : ndarray
+        coordinates of the points in the reference cell (nb_pt, 2)
+
+    Returns
+    -------
+    jacob : ndarray
+        jacobian matrices (nb_cell, nb_pt, 2, 2)
+    det_jacob : ndarray
+        jacobian determinants (nb_cell, nb_pt)
+    """
+
+    jacob = np.zeros((vertice.shape[0], 2, 2))
+    jacob[:, 0, :] = (vertice[:, 1, 0:2] - vertice[:, 0, 0:2]) / 2
+    det_jacob = np.sqrt(jacob[:, 0, 0] ** 2 + jacob[:, 0, 1] ** 2)
+
+    nb_pt = point.shape[0]
+    return (
+        np.repeat(jacob[:, None], nb_pt, axis=1),
+        np.repeat(det_jacob[:, None], nb_pt, axis=1),
+    )
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from ....Classes.RefCell import RefCell
+
+
+def is_inside_batch(self, vertice, point, normal_t=None):
+    """Check if each point is inside its cell (vectorized is_inside)
+
+    Parameters
+    ----------
+    self : RefTriangle3
+        an RefTriangle3 object
+    vertice : ndarray
+        vertices of the cells (nb_cell, 3, nb_dim)
+    point : ndarray
+        coordinates of the checked points (nb_cell, nb_dim)
+    normal_t : ndarray
+        (optional) cell normal vector
+
+    Returns
+    -------
+    is_inside: ndarray
+        true if the point is inside its cell (nb_cell,)
+    point_ref : ndarray
+        coordinates of the points in the reference cell (nb_cell, 2)
+    """
+
+    if normal_t is not None:  # Normal check only available cell by cell
+        return RefCell.is_inside_batch(self, vertice, point, normal_t)
+
+    # point = vertice[0] + s * (vertice[1] - vertice[0]) + t * (vertice[2] - vertice[0])
+    u = vertice[:, 1, 0:2] - vertice[:, 0, 0:2]
+    v = vertice[:, 2, 0:2] - vertice[:, 0, 0:2]
+    w = point[:, 0:2] - vertice[:, 0, 0:2]
+    det_jacob = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+    s = (w[:, 0] * v[:, 1] - w[:, 1] * v[:, 0]) / det_jacob
+    t = (u[:, 0] * w[:, 1] - u[:, 1] * w[:, 0]) / det_jacob
+
+    eps = self.epsilon
+    is_inside = (s > -eps) & (t > -eps) & (1 - s - t > -eps)
+
+    return is_inside, np.column_stack((s, t))
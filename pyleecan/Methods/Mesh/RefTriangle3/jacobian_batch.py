@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+
+def jacobian_batch(self, vertice, point):
+    """Compute the jacobian and its determinant of several linear triangles
+    (constant on each cell) at several points of the reference cell
+
+    Parameters
+    ----------
+    self : RefTriangle3
+        a RefTriangle3 object
+    vertice : ndarray
+        vertices of the cells (nb_cell, 3, nb_dim)
+    point : ndarray
+        coordinates of the points in the reference cell (nb_pt, 2)
+
+    Returns
+    -------
+    jacob : ndarray
+        jacobian matrices (nb_cell, nb_pt, 2, 2)
+    det_jacob : ndarray
+        jacobian determinants (nb_cell, nb_pt)
+    """
+
+    jacob = np.zeros((vertice.shape[0], 2, 2))
+    jacob[:, 0, :] = vertice[:, 1, 0:2] - vertice[:, 0, 0:2]
+    jacob[:, 1, :] = vertice[:, 2, 0:2] - vertice[:, 0, 0:2]
+    det_jacob = jacob[:, 0, 0] * jacob[:, 1, 1] - jacob[:, 0, 1] * jacob[:, 1, 0]
+
+    nb_pt = point.shape[0]
+    return (
+        np.repeat(jacob[:, None], nb_pt, axis=1),
+        np.repeat(det_jacob[:, None], nb_pt, axis=1),
+    )
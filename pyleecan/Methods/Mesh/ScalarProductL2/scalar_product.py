@@ -31,9 +31,8 @@ def scalar_product(self, funca, funcb, detJ, weights, nb_gauss_points):
         a L2 scalar product
     """
 
-    func_a_w_dJ = np.zeros(funca.shape)
-    for i in range(nb_gauss_points):
-        func_a_w_dJ[i, :] = funca[i, :] * weights[i] * detJ[i]
+    w_dJ = np.asarray(weights[:nb_gauss_points]) * np.asarray(detJ[:nb_gauss_points])
+    func_a_w_dJ = funca * w_dJ.reshape((-1,) + (1,) * (funca.ndim - 1))
 
     l2_scal_mat = np.squeeze(np.tensordot(func_a_w_dJ, funcb, axes=([0], [0])))
 
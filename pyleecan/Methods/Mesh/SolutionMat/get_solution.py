@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from numpy import take, where, array
+from numpy import take, array, arange, argsort, searchsorted, mod, zeros
 
 
 def get_solution(self, indice=None):
@@ -28,25 +28,36 @@ def get_solution(self, indice=None):
 
     # create indices of solution if None
     if s_indice is None:
-        s_indice = [i for i in range(field_sol.shape[Iindice])]
+        s_indice = arange(field_sol.shape[Iindice])
+    s_indice = array(s_indice)
 
     # check input indices
-    if not indice:
+    if indice is None or len(indice) == 0:
         indice = s_indice
 
-    if set(indice) - set(s_indice):
+    # get array index of the input indices (sorted search)
+    indice = array(indice)
+    if s_indice.size > 0:
+        sorter = argsort(s_indice)
+        array_indice = searchsorted(s_indice, indice, sorter=sorter)
+        array_indice = sorter[mod(array_indice, s_indice.size)]
+        is_in = s_indice[array_indice] == indice
+    else:
+        array_indice = zeros(indice.size, dtype=int)
+        is_in = zeros(indice.size, dtype=bool)
+
+    if not is_in.all():
         logger.warning(
             "At least one input indice is not part of the solution. "
             + "Respective indice will be skipped."
         )
 
     # skip indice that are not part of the solution
-    new_indice = [ii for ii in indice if ii in s_indice]
-
-    # get array index of new_indice
-    array_indice = [where(array(s_indice) == ii)[0][0] for ii in new_indice]
+    array_indice = array_indice[is_in]
+    new_indice = s_indice[array_indice]
 
-    # setup requested solution
+    # setup requested solution (the axes of self are not modified)
+    axis_size = list(axis_size)
     axis_size[Iindice] = len(new_indice)
     new_field_sol = take(field_sol, array_indice, axis=Iindice)
 
@@ -54,7 +65,7 @@ def get_solution(self, indice=None):
         label=self.label,
         type_cell=self.type_cell,
         field=new_field_sol,
-        indice=indice,
+        indice=new_indice,
         axis_name=axis_name,
         axis_size=axis_size,
         dimension=self.dimension,
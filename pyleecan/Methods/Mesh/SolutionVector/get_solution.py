@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from numpy import take
+from numpy import take, isin, array
 from SciDataTool import Data1D
 
 
@@ -32,15 +32,16 @@ def get_solution(self, indice=None):
             ax_idx = axes_names.index("indice")
 
             org_indice = axes[ax_idx].get_values()
+            is_in = isin(indice, org_indice)
 
-            if set(indice) - set(org_indice):
+            if not is_in.all():
                 logger.warning(
                     "At least one input indice is not part of the solution. "
                     + "Respective indice will be skipped."
                 )
 
             # skip indice that are not part of the solution
-            new_indice = [ii for ii in indice if ii in org_indice]
+            new_indice = array(indice)[is_in].tolist()
 
             # create requested axes list to get field values (see SciDataTool ref.)
             args = [name for name in axes_names]
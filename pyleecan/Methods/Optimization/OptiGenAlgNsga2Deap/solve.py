@@ -1,17 +1,22 @@
 # -*- coding: utf-8 -*-
 
-from deap.tools import selNSGA2
 from copy import deepcopy
 from datetime import datetime
+from os.path import isfile
 import numpy as np
 
 from ....Classes.Output import Output
 from ....Classes.XOutput import XOutput
 from ....Classes.DataKeeper import DataKeeper
 from ....Classes.ParamExplorerSet import ParamExplorerSet
-from ....Functions.Optimization.evaluate import evaluate
+from ....Functions.Optimization.evaluate_pop import evaluate_serial, evaluate_pool
+from ....Functions.Optimization.fitness_cache import (
+    FitnessCache,
+    get_problem_signature,
+)
 from ....Functions.Optimization.update import update
 from ....Functions.Optimization.check_cstr import check_cstr
+from ....Functions.Optimization.selNSGA2 import selNSGA2
 from ....Functions.Optimization.tournamentDCD import tournamentDCD
 
 
@@ -66,6 +71,30 @@ def solve(self):
         # Create the toolbox
         self.create_toolbox()
 
+        # Cache of the evaluations (crossover and mutation can create the same
+        # design several times)
+        if self.cache_size == 0:
+            cache = None
+        else:
+            cache = FitnessCache(
+                capacity=self.cache_size,
+                decimals=self.cache_decimals,
+                file_path=self.cache_path,
+                signature=get_problem_signature(self.problem),
+            )
+            if cache.load():
+                logger.info(
+                    "{} evaluations loaded from the fitness cache {}".format(
+                        len(cache), self.cache_path
+                    )
+                )
+            elif self.cache_path is not None and isfile(self.cache_path):
+                logger.warning(
+                    "The fitness cache {} belongs to another problem, it will be overwritten".format(
+                        self.cache_path
+                    )
+                )
+
         # Add the reference output to multi_output
         if isinstance(self.problem.simu.parent, Output):
             xoutput = XOutput(init_dict=self.problem.simu.parent.as_dict())
@@ -99,12 +128,8 @@ def solve(self):
         pop = self.toolbox.population(self.size_pop)
 
         # Evaluate the population
-        nb_error = 0
-        for i in range(0, self.size_pop):
-            time = datetime.now().strftime("%H:%M:%S")
-            print_gen_simu(time, 0, i, self.size_pop, nb_error, pop)
-            nb_error += evaluate(self, pop[i])
-            print_obj(self.problem.obj_func, pop[i])
+        nb_error = evaluate_pop(self, 0, pop, cache)
+        time = datetime.now().strftime("%H:%M:%S")
 
         # Check the constraints violation
         nb_infeasible = 0
@@ -183,12 +208,8 @@ def solve(self):
 
             shape += len(to_eval)
 
-            nb_error = 0
-            for i in range(len(to_eval)):
-                time = datetime.now().strftime("%H:%M:%S")
-                print_gen_simu(time, ngen, i, self.size_pop, nb_error, to_eval)
-                nb_error += evaluate(self, to_eval[i])
-                print_obj(self.problem.obj_func, to_eval[i])
+            nb_error = evaluate_pop(self, ngen, to_eval, cache)
+            time = datetime.now().strftime("%H:%M:%S")
 
             # Check the constraints violation
             nb_infeasible = 0
@@ -286,6 +307,102 @@ def solve(self):
         raise err
 
 
+def evaluate_pop(self, ngen, indiv_list, cache=None):
+    """Evaluate the individuals of a generation with the evaluator of the solver
+    (the individuals and the DataKeepers are updated in the individual order)
+
+    Parameters
+    ----------
+    self : OptiGenAlgNsga2Deap
+        Solver to perform NSGA-II
+    ngen : int
+        Generation number
+    indiv_list : list
+        Individuals to evaluate
+    cache : FitnessCache
+        Results of the previous evaluations (None to evaluate every individual)
+
+    Returns
+    -------
+    nb_error : int
+        Number of failed evaluations
+    """
+    if self.evaluator is not None:
+        evaluator = self.evaluator
+    elif self.nb_proc == 1:
+        evaluator = evaluate_serial
+    else:
+        evaluator = evaluate_pool
+
+    datakeeper_list = self.problem.datakeeper_list
+    if cache is None:
+        eval_list = indiv_list
+    else:
+        # The output is needed by the constraints and to be kept
+        is_output = self.is_keep_all_output or len(self.problem.constraint) > 0
+        # Evaluate only the first individual of each design not in the cache
+        key_list = [cache.get_key(indiv) for indiv in indiv_list]
+        entry_dict = dict()  # key: design key, value: cache entry
+        eval_dict = dict()  # key: design key, value: individual to evaluate
+        for key, indiv in zip(key_list, indiv_list):
+            if key not in entry_dict and key not in eval_dict:
+                entry = cache.get(key, is_output)
+                if entry is None:
+                    eval_dict[key] = indiv
+                else:
+                    entry_dict[key] = entry
+        eval_list = list(eval_dict.values())
+        nb_result = [len(datakeeper.result) for datakeeper in datakeeper_list]
+
+    nb_error = 0
+    for i, evaluation_failure in evaluator(self, eval_list):
+        nb_error += evaluation_failure
+        time = datetime.now().strftime("%H:%M:%S")
+        print_gen_simu(time, ngen, i, len(eval_list), nb_error, eval_list)
+        print_obj(self.problem.obj_func, eval_list[i])
+
+    if cache is not None:
+        # Store the new evaluations in the cache
+        keeper_array = list()
+        for datakeeper, nb in zip(datakeeper_list, nb_result):
+            keeper_array.append(datakeeper.result[nb:])
+            del datakeeper.result[nb:]
+        for i, (key, indiv) in enumerate(eval_dict.items()):
+            entry_dict[key] = (
+                tuple(indiv.fitness.values),
+                indiv.is_simu_valid,
+                [keeper_result[i] for keeper_result in keeper_array],
+                indiv.output if is_output else None,
+            )
+            cache.put(key, entry_dict[key])
+
+        # Update the other individuals and the DataKeepers in the individual order
+        nb_error = 0
+        for key, indiv in zip(key_list, indiv_list):
+            fitness, is_simu_valid, keeper_list, output = entry_dict[key]
+            if eval_dict.get(key) is not indiv:
+                indiv.fitness.values = fitness
+                indiv.is_simu_valid = is_simu_valid
+                if output is not None:
+                    indiv.output = output
+            for datakeeper, keeper_value in zip(datakeeper_list, keeper_list):
+                datakeeper.result.append(keeper_value)
+            nb_error += not is_simu_valid
+
+        nb_hit = len(indiv_list) - len(eval_list)
+        cache.nb_hit += nb_hit
+        cache.nb_miss += len(eval_list)
+        print(
+            "{}  gen {:>5}: {:>4} cache hits, {:>4} cache misses.".format(
+                datetime.now().strftime("%H:%M:%S"), ngen, nb_hit, len(eval_list)
+            )
+        )
+        if cache.file_path is not None:
+            cache.save()
+
+    return nb_error
+
+
 def print_gen_simu(time, gen_id, simu_id, size_pop, nb_error, to_eval):
     print(
         "\r{}  gen {:>5}: simu {}/{} ({:>5.2f}%), {:>4} errors.".format(
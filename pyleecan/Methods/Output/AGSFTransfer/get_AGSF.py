@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from SciDataTool import Data1D, DataFreq, VectorField
+
+
+def get_AGSF(self, index=None):
+    """Return the transferred AGSF as a VectorField
+
+    Parameters
+    ----------
+    self : AGSFTransfer
+        an AGSFTransfer object
+    index : int
+        Index of the radius in Rsbo (None for all the radii, with a "radius" axis)
+
+    Returns
+    -------
+    AGSF : VectorField
+        Transferred air-gap surface force
+    """
+    Prad_TR, Ptan_TR = self.get_spectrum(index)
+
+    axes_list = [
+        Data1D(name="freqs", values=self.freqs),
+        Data1D(name="wavenumber", values=self.wavenumber),
+    ]
+    if index is None:
+        axes_list.insert(0, Data1D(name="radius", unit="m", values=self.Rsbo))
+
+    AGSF = VectorField(
+        name="Air gap Surface Force",
+        symbol="AGSF",
+    )
+    AGSF.components["radial"] = DataFreq(
+        name="Radial AGSF",
+        unit="N/m²",
+        symbol="AGSF_r",
+        axes=axes_list,
+        values=Prad_TR,
+    )
+    AGSF.components["tangential"] = DataFreq(
+        name="Tangential AGSF",
+        unit="N/m²",
+        symbol="AGSF_t",
+        axes=axes_list,
+        values=Ptan_TR,
+    )
+    return AGSF
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from numpy import newaxis
+
+
+def get_spectrum(self, index=None):
+    """Return the transferred spectra (computed from the transfer coefficients
+    and the base spectrum if the result is factorized)
+
+    Parameters
+    ----------
+    self : AGSFTransfer
+        an AGSFTransfer object
+    index : int or slice
+        Index of the radius (or radii) in Rsbo (None for all the radii)
+
+    Returns
+    -------
+    Prad_TR : ndarray
+        Transferred radial spectrum (Nf, Nr), or (NR, Nf, Nr) for several radii
+    Ptan_TR : ndarray
+        Transferred tangential spectrum (Nf, Nr), or (NR, Nf, Nr) for several radii
+    """
+    if index is None:
+        index = slice(None)
+
+    if self.Prad_TR is not None and self.Ptan_TR is not None:
+        return self.Prad_TR[index], self.Ptan_TR[index]
+
+    # Transfer law Eq. (45): the coefficients broadcast along the frequencies
+    Sn = self.Sn[index][..., newaxis, :]
+    jCn = 1j * self.Cn[index][..., newaxis, :]
+    Prad_TR = Sn * self.Prad + jCn * self.Ptan
+    Ptan_TR = Sn * self.Ptan - jCn * self.Prad
+    return Prad_TR, Ptan_TR
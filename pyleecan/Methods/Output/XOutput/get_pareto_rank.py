@@ -0,0 +1,45 @@
+import numpy as np
+from ....Classes.OptiObjective import OptiObjective
+from ....Functions.Optimization.non_dominated_sort import (
+    non_dominated_sort,
+    crowding_distance,
+)
+
+
+def get_pareto_rank(self):
+    """Sort the valid individuals in non dominated fronts and compute their
+    crowding distance in their front
+
+    Parameters
+    ----------
+    self: XOutput
+
+    Returns
+    -------
+    rank: ndarray
+        front index of each individual (0 for the pareto front, -1 for the non
+        valid individuals)
+    crowding_dist: ndarray
+        crowding distance of each individual (nan for the non valid
+        individuals)
+    """
+
+    # Gather fitness results
+    data = [
+        val.result
+        for _, val in self.xoutput_dict.items()
+        if isinstance(val, OptiObjective)
+    ]
+    fitness = np.array(data, dtype=float).T
+
+    # Keep only valid values
+    is_valid = np.array(self["is_valid"].result, dtype=bool)
+    indx = np.flatnonzero(is_valid)
+
+    rank = -np.ones(is_valid.size, dtype=int)
+    crowding_dist = np.full(is_valid.size, np.nan)
+    if indx.size > 0:
+        rank[indx] = non_dominated_sort(fitness[indx])
+        crowding_dist[indx] = crowding_distance(fitness[indx], rank[indx])
+
+    return rank, crowding_dist
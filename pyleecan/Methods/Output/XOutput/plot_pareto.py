@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from ....Classes.OptiObjective import OptiObjective
+from ....Functions.Optimization.non_dominated_sort import non_dominated_sort
 from ....Methods.Output.XOutput import _get_symbol_data_
 
 
@@ -52,18 +53,9 @@ def plot_pareto(
     y_values, y_label = _get_symbol_data_(self, y_symbol, indx)
 
     # Get pareto front
-    pareto = fitness
-
-    # Get dominated values
-    idx_non_dom = list(range(len(pareto)))
-    N = len(pareto)
-    for i in range(N):
-        for j in idx_non_dom:
-            if all(pareto[j] <= pareto[i]) and any(pareto[j] < pareto[i]):
-                idx_non_dom.remove(i)
-                break
-
-    pareto = pareto[idx_non_dom]
+    idx_non_dom = np.flatnonzero(non_dominated_sort(fitness) == 0)
+
+    pareto = fitness[idx_non_dom]
     design_var_values = design_var[idx_non_dom]
 
     # Write annotations
@@ -4,6 +4,11 @@
 def comp_parameters(self, output):
     """Compute the parameters dict for the equivalent electrical circuit:
     resistance, inductance and back electromotive force
+
+    If the machine has a flux linkage map (computed on the first call if
+    needed), the flux linkages are interpolated on the map instead of being
+    computed by the inductance model for each operating point
+
     Parameters
     ----------
     self : EEC_PMSM
@@ -15,11 +20,18 @@ def comp_parameters(self, output):
 
     PAR = self.parameters
 
+    flux_map = getattr(output.simu.machine, "flux_map", None)
+    if flux_map is not None and (flux_map.Phid is None or flux_map.Phiq is None):
+        flux_map.comp_flux_map(output)
+
     # Parameters to compute only once
     if "R20" not in PAR:
         PAR["R20"] = output.simu.machine.stator.comp_resistance_wind()
     if "phi" not in PAR:
-        PAR["phi"] = self.fluxlink.comp_fluxlinkage(output)
+        if self.fluxlink is None and flux_map is not None:
+            PAR["phi"] = flux_map.interpolate(0, 0)[0]
+        else:
+            PAR["phi"] = self.fluxlink.comp_fluxlinkage(output)
 
     # Parameters which may vary for each simulation
     is_comp_ind = False
@@ -39,7 +51,10 @@ def comp_parameters(self, output):
 
     # compute inductance if necessary
     if is_comp_ind:
-        (phid, phiq) = self.indmag.comp_inductance(output)
+        if flux_map is not None:
+            (phid, phiq) = flux_map.interpolate(PAR["Id"], PAR["Iq"])
+        else:
+            (phid, phiq) = self.indmag.comp_inductance(output)
         if PAR["Id"] != 0:
             PAR["Ld"] = (phid - PAR["phi"]) / PAR["Id"]
         else:
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 
 from ....Methods.Simulation.Input import InputError
+from ....Functions.Simulation.result_cache import (
+    get_result_key,
+    load_result,
+    save_result,
+)
 
 
 def run(self):
@@ -18,6 +23,11 @@ def run(self):
 
     output = self.parent.parent
 
+    # Load the results if the same problem has already been solved
+    key = get_result_key(self, "elec")
+    if load_result(self, "elec", key):
+        return
+
     if self.eec is not None:
 
         # # Generate drive
@@ -37,3 +47,5 @@ def run(self):
 
         # Compute torque
         self.comp_torque(output)
+
+    save_result(self, "elec", key)
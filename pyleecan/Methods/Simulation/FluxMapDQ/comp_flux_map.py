@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
+from os import getpid
+from os.path import join
+
+from cloudpickle import dumps, loads
+from numpy import array, meshgrid
+
+from ....Methods.Simulation.Input import InputError
+
+# Output shared by all the operating points of a worker process
+_worker_dict = dict()
+
+
+def comp_flux_map(self, output):
+    """Compute the d-axis and q-axis flux linkage on the (Id, Iq) grid with the
+    inductance model of the EEC (one computation per grid point, on nb_proc
+    processes)
+
+    Parameters
+    ----------
+    self : FluxMapDQ
+        a FluxMapDQ object
+    output : Output
+        an Output object (with an EEC_PMSM electrical model)
+    """
+    eec = output.simu.elec.eec if output.simu.elec is not None else None
+    if eec is None or getattr(eec, "indmag", None) is None:
+        raise InputError(
+            "ERROR: The flux linkage map requires an electrical equivalent circuit with an inductance model"
+        )
+    if self.Id is None or self.Iq is None or self.Id.size < 2 or self.Iq.size < 2:
+        raise InputError(
+            "ERROR: The flux linkage map requires at least 2 values of Id and Iq"
+        )
+
+    Id_grid, Iq_grid = meshgrid(self.Id, self.Iq, indexing="ij")
+    Id_list = Id_grid.ravel().tolist()
+    Iq_list = Iq_grid.ravel().tolist()
+
+    nb_proc = self.nb_proc if self.nb_proc != 0 else cpu_count()
+    self.get_logger().info(
+        "Computing the flux linkage map on "
+        + str(len(Id_list))
+        + " operating points ("
+        + str(nb_proc)
+        + " process(es))"
+    )
+    if nb_proc == 1:
+        phi_list = [_comp_point(output, Id, Iq) for Id, Iq in zip(Id_list, Iq_list)]
+    else:
+        # The output is sent once to each worker
+        param = dumps((output, output.get_path_result()))
+        with ProcessPoolExecutor(
+            max_workers=min(nb_proc, len(Id_list)),
+            initializer=_init_worker,
+            initargs=(param,),
+        ) as executor:
+            phi_list = list(executor.map(_comp_point_worker, Id_list, Iq_list))
+
+    phi_list = array(phi_list, dtype=float)
+    self.Phid = phi_list[:, 0].reshape(Id_grid.shape)
+    self.Phiq = phi_list[:, 1].reshape(Id_grid.shape)
+
+
+def _comp_point(output, Id, Iq):
+    """Compute the dq flux linkage of one operating point"""
+    elec = output.elec
+    Id_ref, Iq_ref = elec.Id_ref, elec.Iq_ref
+    elec.Id_ref, elec.Iq_ref = Id, Iq
+    try:
+        (phid, phiq) = output.simu.elec.eec.indmag.comp_inductance(output)
+    finally:
+        elec.Id_ref, elec.Iq_ref = Id_ref, Iq_ref
+    return (phid, phiq)
+
+
+def _init_worker(param):
+    """Load the output of the worker (with its own result folder to avoid
+    sharing the model files between the processes)"""
+    output, path_result = loads(param)
+    output.path_result = join(path_result, "FluxMap_" + str(getpid()))
+    _worker_dict["output"] = output
+
+
+def _comp_point_worker(Id, Iq):
+    """Compute the dq flux linkage of one operating point in the worker"""
+    return _comp_point(_worker_dict["output"], Id, Iq)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+from bisect import bisect_right
+
+from numpy import asarray, clip, isscalar, searchsorted, stack
+
+from ....Functions.object_cache import get_cache
+from ....Methods.Simulation.Input import InputError
+
+
+def interpolate(self, Id, Iq):
+    """Interpolate the d-axis and q-axis flux linkage of an operating point
+    (bilinear interpolation on the grid, linear extrapolation outside)
+
+    The interpolation data are cached until Id, Iq, Phid or Phiq are replaced
+
+    Parameters
+    ----------
+    self : FluxMapDQ
+        a FluxMapDQ object
+    Id : float or ndarray
+        d-axis current [A]
+    Iq : float or ndarray
+        q-axis current [A]
+
+    Returns
+    -------
+    Phid : float or ndarray
+        d-axis flux linkage [Wb]
+    Phiq : float or ndarray
+        q-axis flux linkage [Wb]
+    """
+
+    def build():
+        if self.Phid is None or self.Phiq is None:
+            raise InputError(
+                "ERROR: The flux linkage map must be computed before interpolating it"
+            )
+        Id_grid = asarray(self.Id, dtype=float)
+        Iq_grid = asarray(self.Iq, dtype=float)
+        phi = stack((self.Phid, self.Phiq), axis=-1).astype(float)
+        if phi.shape != (Id_grid.size, Iq_grid.size, 2) or min(phi.shape[:2]) < 2:
+            raise InputError(
+                "ERROR: The flux linkage map must be (Nd, Nq) arrays with Nd, Nq >= 2"
+            )
+        Id_list, Iq_list = Id_grid.tolist(), Iq_grid.tolist()
+        phi_list = [self.Phid.tolist(), self.Phiq.tolist()]
+        return Id_list, Iq_list, phi_list, Id_grid, Iq_grid, phi
+
+    Id_list, Iq_list, phi_list, Id_grid, Iq_grid, phi = get_cache(
+        self, "interp", (self.Id, self.Iq, self.Phid, self.Phiq), build
+    )
+
+    if isscalar(Id) and isscalar(Iq):
+        # Pure python for a single operating point (faster than numpy)
+        ii = min(max(bisect_right(Id_list, Id) - 1, 0), len(Id_list) - 2)
+        jj = min(max(bisect_right(Iq_list, Iq) - 1, 0), len(Iq_list) - 2)
+        td = (Id - Id_list[ii]) / (Id_list[ii + 1] - Id_list[ii])
+        tq = (Iq - Iq_list[jj]) / (Iq_list[jj + 1] - Iq_list[jj])
+        result = list()
+        for phi in phi_list:
+            p0 = phi[ii][jj] + td * (phi[ii + 1][jj] - phi[ii][jj])
+            p1 = phi[ii][jj + 1] + td * (phi[ii + 1][jj + 1] - phi[ii][jj + 1])
+            result.append(p0 + tq * (p1 - p0))
+        return result[0], result[1]
+
+    Id = asarray(Id, dtype=float)
+    Iq = asarray(Iq, dtype=float)
+    ii = clip(searchsorted(Id_grid, Id, side="right") - 1, 0, Id_grid.size - 2)
+    jj = clip(searchsorted(Iq_grid, Iq, side="right") - 1, 0, Iq_grid.size - 2)
+    td = ((Id - Id_grid[ii]) / (Id_grid[ii + 1] - Id_grid[ii]))[..., None]
+    tq = ((Iq - Iq_grid[jj]) / (Iq_grid[jj + 1] - Iq_grid[jj]))[..., None]
+    p0 = phi[ii, jj] + td * (phi[ii + 1, jj] - phi[ii, jj])
+    p1 = phi[ii, jj + 1] + td * (phi[ii + 1, jj + 1] - phi[ii, jj + 1])
+    result = p0 + tq * (p1 - p0)
+    return result[..., 0], result[..., 1]
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 from SciDataTool import DataFreq, VectorField, Data1D
-from numpy import power, where, repeat, newaxis, multiply
+
+from ....Functions.Simulation.comp_AGSF_transfer_coeff import (
+    comp_AGSF_transfer_coeff,
+)
 
 
 def comp_AGSF_transfer(self, output, rnoise=None):
@@ -19,6 +22,8 @@ def comp_AGSF_transfer(self, output, rnoise=None):
         a Force object
     output : Output
         an Output object
+    rnoise : int
+        Maximum wavenumber to transfer (to avoid numerical noise amplification)
 
     """
 
@@ -38,26 +43,13 @@ def comp_AGSF_transfer(self, output, rnoise=None):
     Ptan_wr = result_freq["tangential"]
     wavenumber = result_freq["wavenumber"]
     freqs = result_freq["freqs"]
-    Nf = len(freqs)
-
-    Ratio = Rag / Rsbo
 
     # Transfer coefficients Eq. (46)
-    Sn = (Ratio ** 2) * (power(Ratio, wavenumber) + power(Ratio, -wavenumber)) / 2
-    Cn = (Ratio ** 2) * (power(Ratio, wavenumber) - power(Ratio, -wavenumber)) / 2
-
-    # Noise filtering (useful with magnetic FEA)
-    if rnoise is not None:
-        Inoise = where(abs(wavenumber) > rnoise)[0]
-        Sn[Inoise] = 1
-        Cn[Inoise] = 0
-
-    XSn = repeat(Sn[..., newaxis], Nf, axis=1).transpose()
-    XCn = repeat(Cn[..., newaxis], Nf, axis=1).transpose()
+    Sn, Cn = comp_AGSF_transfer_coeff(Rag, Rsbo, wavenumber, rnoise)
 
-    # Transfer law Eq. (45)
-    Prad_wr_TR = multiply(XSn, Prad_wr) + 1j * multiply(XCn, Ptan_wr)
-    Ptan_wr_TR = multiply(XSn, Ptan_wr) - 1j * multiply(XCn, Prad_wr)
+    # Transfer law Eq. (45) (the coefficients broadcast along the frequencies)
+    Prad_wr_TR = Sn * Prad_wr + 1j * Cn * Ptan_wr
+    Ptan_wr_TR = Sn * Ptan_wr - 1j * Cn * Prad_wr
 
     # Save results as Data objects
     Datafreqs = Data1D(name="freqs", values=freqs)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+from numpy import asarray, atleast_1d
+
+from ....Classes.AGSFTransfer import AGSFTransfer
+from ....Functions.Simulation.comp_AGSF_transfer_coeff import (
+    comp_AGSF_transfer_coeff,
+)
+
+
+def comp_AGSF_transfer_batch(self, output, Rsbo, rnoise=None, is_factorized=False):
+    """Compute the Air-Gap Surface Force transfer from the air-gap radius to
+    several radii at once (cf comp_AGSF_transfer)
+
+    The base spectrum is computed once and the transfer coefficients of every
+    radius broadcast along the frequencies. The factorized result only stores
+    the coefficients and the base spectrum (the transferred spectra are
+    computed on demand by AGSFTransfer.get_spectrum).
+
+    Parameters
+    ----------
+    self: Force
+        a Force object
+    output : Output
+        an Output object
+    Rsbo : ndarray
+        Radii to transfer the AGSF to (NR) [m]
+    rnoise : int
+        Maximum wavenumber to transfer (to avoid numerical noise amplification)
+    is_factorized : bool
+        True to store the transfer coefficients instead of the transferred spectra
+
+    Returns
+    -------
+    AGSF_transfer : AGSFTransfer
+        AGSF transferred to the radii Rsbo
+    """
+
+    Rsbo = atleast_1d(asarray(Rsbo, dtype=float))
+
+    result_freq = output.force.AGSF.get_rphiz_along("freqs", "wavenumber")
+    wavenumber = result_freq["wavenumber"]
+
+    # Transfer coefficients Eq. (46) for every radius: (NR, Nr)
+    Sn, Cn = comp_AGSF_transfer_coeff(output.force.Rag, Rsbo, wavenumber, rnoise)
+
+    AGSF_transfer = AGSFTransfer(
+        Rag=output.force.Rag,
+        Rsbo=Rsbo,
+        freqs=result_freq["freqs"],
+        wavenumber=wavenumber,
+        Prad=result_freq["radial"],
+        Ptan=result_freq["tangential"],
+        Sn=Sn,
+        Cn=Cn,
+    )
+    if not is_factorized:
+        (
+            AGSF_transfer.Prad_TR,
+            AGSF_transfer.Ptan_TR,
+        ) = AGSF_transfer.get_spectrum()
+
+    return AGSF_transfer
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 
 from ....Methods.Simulation.Input import InputError
+from ....Functions.Simulation.result_cache import (
+    get_result_key,
+    load_result,
+    save_result,
+)
 
 
 def run(self):
@@ -16,6 +21,11 @@ def run(self):
 
     output = self.parent.parent
 
+    # Load the results if the same problem has already been solved
+    key = get_result_key(self, "force")
+    if load_result(self, "force", key):
+        return
+
     # Compute and store time and angle axes from previous output
     # and returns additional axes in axes_dict
     axes_dict = self.comp_axes(output)
@@ -26,6 +36,17 @@ def run(self):
     # Store force quantities contained in out_dict in OutForce, as Data object if necessary
     output.force.store(out_dict, axes_dict)
 
+    # Compute the air-gap surface force transfer to several radii if required
+    if self.Rsbo_transfer is not None and self.Rsbo_transfer.size > 0:
+        output.force.AGSF_transfer = self.comp_AGSF_transfer_batch(
+            output,
+            self.Rsbo_transfer,
+            self.max_wavenumber_transfer,
+            self.is_transfer_factorized,
+        )
+
     # Compute the air-gap surface force transfer if required
     if self.is_agsf_transfer:
         self.comp_AGSF_transfer(output, self.max_wavenumber_transfer)
+
+    save_result(self, "force", key)
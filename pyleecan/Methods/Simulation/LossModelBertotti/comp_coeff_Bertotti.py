@@ -4,6 +4,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy import optimize
 
+from ....Functions.object_cache import get_cache
+
 
 # TODO define one loss calculation function to use everywhere in class
 def _comp_loss(self, C, Cx, f, B):
@@ -30,6 +32,9 @@ def comp_coeff_Bertotti(self, mat):
     """
     Compute the missing (i.e. None-valued) Bertotti loss coefficients from the
     Material object data by data fitting.
+    The fitted coefficients are cached on the material (until its loss data or
+    the enforced coefficients change) so that the models of several parts with
+    the same material only fit them once.
 
     Parameters
     ----------
@@ -62,20 +67,25 @@ def comp_coeff_Bertotti(self, mat):
     if n_est == 0:
         return True
 
-    data = mat.mag.LossData.get_data()
-    f = data[:, 1]
-    B = data[:, 0]
-    Loss = data[:, 2]
-
-    # fit the data
-    # TODO Which normalization to use? 1/f or should it be user defined?
-    # TODO use constrained parameter estimation
-    _comp_err = lambda Cx: (_comp_loss(self, C, Cx, f, B) - Loss) / (f)
-    C0 = np.ones([n_est])  # initial values for the parameters
-    result = optimize.least_squares(_comp_err, C0[:], method="lm")
-
-    C1 = result.x
-    success = result.success
+    data = np.asarray(mat.mag.LossData.get_data(), dtype=float)
+
+    def fit():
+        f = data[:, 1]
+        B = data[:, 0]
+        Loss = data[:, 2]
+
+        # fit the data
+        # TODO Which normalization to use? 1/f or should it be user defined?
+        # TODO use constrained parameter estimation
+        _comp_err = lambda Cx: (_comp_loss(self, C, Cx, f, B) - Loss) / (f)
+        C0 = np.ones([n_est])  # initial values for the parameters
+        result = optimize.least_squares(_comp_err, C0[:], method="lm")
+        return result.x, result.success
+
+    # Loss data compared by value (the mag and LossData objects have mat as
+    # parent: the cache would keep mat alive)
+    sign = (data.tobytes(), data.shape, tuple(C), self.F_REF, self.B_REF)
+    C1, success = get_cache(mat, "coeff_Bertotti", sign, fit)
 
     if success is None:
         logger.warning(f"'{self.name}' LossModel: Parameter fitting failed.")
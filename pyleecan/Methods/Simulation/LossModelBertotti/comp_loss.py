@@ -1,44 +1,23 @@
 # -*- coding: utf-8 -*-
-from numpy import array, nan, tile, newaxis, ones
-from SciDataTool import DataTime, DataFreq, Data1D
-from logging import getLogger
+from numpy import array, moveaxis, tile, newaxis, ones
+from SciDataTool import DataTime, Data1D
 
 from ....Classes.SolutionData import SolutionData
 
 
-def _comp_loss_sum(self, LossDensComps, area, k_freq):
-    # get the axes
-    axes_list = [axis.name for axis in LossDensComps.axes]
-    freqs_idx = axes_list.index("freqs")
-    comps_idx = axes_list.index("Components")
-
-    # compute the sum over all frequencies and elements of the loss components
-    comp_names = ["Hysteresis", "Eddy", "Excess"]
+def _comp_loss_sum(self, comps_data, freqs_idx, mesh, k_freq):
+    """Sum the loss density components (last axis of comps_data) over all
+    frequencies and elements for each speed"""
+    # compute the sum over all frequencies and integral over the elements of
+    # the loss components
     alphas = [1, self.alpha_ed, self.alpha_ex]  # hyst. is propotional to freq.
+    loss_comps = mesh.integrate(moveaxis(comps_data.sum(axis=freqs_idx), 0, -1))
 
-    loss_dict = {}
-    for comp_name in comp_names:
-        axis_data = {"Components": comp_name}
-        idx = LossDensComps.axes[comps_idx].values.tolist().index(comp_name)
-        axes_list_ = [axis for axis in axes_list]
-        axes_list_[comps_idx] += f"[{idx}]"
-
-        data_dict = LossDensComps.get_along(*axes_list_, axis_data=axis_data)
-        data_freq_sum = data_dict["LossDensComps"].sum(axis=freqs_idx)
-        loss_dict[comp_name] = (area * data_freq_sum).sum()
-
-    # compute the losses of the different speeds
-    for comp_name, alpha in zip(comp_names, alphas):
-        k = array(k_freq) ** alpha
-        loss_dict[comp_name] = loss_dict[comp_name] * k
-
-    # compute the sum of the components
+    # compute the losses of the different speeds and the sum of the components
     loss_sum = None
-    for comp_name in comp_names:
-        if loss_sum is None:
-            loss_sum = loss_dict[comp_name]
-        else:
-            loss_sum = loss_dict[comp_name] + loss_sum
+    for loss_comp, alpha in zip(loss_comps, alphas):
+        loss = loss_comp * array(k_freq) ** alpha
+        loss_sum = loss if loss_sum is None else loss + loss_sum
 
     return loss_sum
 
@@ -69,6 +48,10 @@ def comp_loss(self, output, part_label):
 
     # setup meshsolution and solution list
     meshsolution = output.mag.meshsolution.get_group(group_name)
+    # cells of the group (in the group mesh order)
+    sol_grp = meshsolution.get_solution(label="B")
+    comp = list(sol_grp.field.components.values())[0]
+    indice = comp.axes[[axis.name for axis in comp.axes].index("indice")].get_values()
 
     # compute needed model parameter from material data
     success = self.comp_coeff_Bertotti(mat_type)
@@ -76,16 +59,17 @@ def comp_loss(self, output, part_label):
         logger.warning("LossModelBertotti: Unable to estimate model coefficents.")
 
     if success:
-        # compute loss density
-        LossDens, LossDensComps = self.comp_loss_density(meshsolution)
+        # compute loss density (the flux density spectrum of the whole mesh is
+        # computed once for all the groups and models)
+        LossDens, LossDensComps = self.comp_loss_density(
+            output.mag.meshsolution, indice
+        )
 
         # compute sum over frequencies
         axes_list = [axis.name for axis in LossDens.axes]
         freqs_idx = axes_list.index("freqs")
 
-        loss_dens_freq_sum = LossDens.get_along(*axes_list)["LossDens"].sum(
-            axis=freqs_idx
-        )
+        loss_dens_freq_sum = LossDens.values.sum(axis=freqs_idx)
 
         time = Data1D(name="time", unit="", values=array([0, 1]))
         # time = Data1D(name="time", unit="", values=array([0]), ) # TODO squeeze issue
@@ -109,14 +93,15 @@ def comp_loss(self, output, part_label):
             sym = 1
 
         # compute the sum of the losses
-        area = meshsolution.get_mesh().get_cell_area()
         N0_list = self.N0 if self.N0 else [N0]
         k_freq = [n / N0 for n in N0_list]
 
         Time = output.elec.Time
         Speed = Data1D(name="speed", unit="rpm", symbol="N0", values=N0_list)
 
-        loss_sum = _comp_loss_sum(self, LossDensComps, area, k_freq)[newaxis, :]
+        loss_sum = _comp_loss_sum(
+            self, LossDensComps.values, freqs_idx, meshsolution.get_mesh(), k_freq
+        )[newaxis, :]
         loss_sum = (
             loss_sum * ones((Time.get_length(), 1))[:, newaxis]
         )  # TODO use periodicity
@@ -1,24 +1,35 @@
 # -*- coding: utf-8 -*-
 from SciDataTool import DataFreq, Data1D
-from numpy import newaxis, abs, sqrt, stack
+from numpy import abs, stack
 
+from ....Functions.MeshSolution.get_magnitude_spectrum import get_magnitude_spectrum
 
-def comp_loss_density(self, meshsolution):
+
+def comp_loss_density(self, meshsolution, indice=None):
     """
     Compute the losses density (per kg) according to the following model equation:
         Loss = C0*f*B^C1 + C2*(f*B)^C3 + C4*(f*B)^C4
 
+    The spectrum of the flux density of all the cells of the meshsolution is
+    computed once (and cached), so that the losses of several groups can be
+    computed from the same meshsolution by selecting their cells.
+
     Parameters
     ----------
     self : LossModelBertotti
         a LossModelBertotti object
-    field : DataND
-        a DataND object that contains the flux density values
+    meshsolution : MeshSolution
+        a MeshSolution object that contains the flux density "B" solution
+    indice : list
+        indices of the cells to compute the losses of (None for all the cells)
 
     Returns
     -------
     loss_density: DataND
         a DataND object of the normalized losses
+    loss_density_comps: DataND
+        a DataND object of the normalized losses components
+        (hysteresis, eddy current and excess)
     """
     # get the parameters
     Coeff = list(
@@ -33,38 +44,29 @@ def comp_loss_density(self, meshsolution):
     # TODO Calculate principle axes and transform for exponentials other than 2
     # TODO maybe use rad. and tan. comp. as intermediate solution
 
-    # loop over field components
-    HY, ED, EX = None, None, None
-    for component in sol.field.components.values():
-        axes_names = ["freqs" if x.name == "time" else x.name for x in component.axes]
-
-        # TODO add filter function to limit max. order of harmonics
-        mag_dict = component.get_magnitude_along(*axes_names)
-        symbol = component.symbol
-
-        # TODO better data check (axis size, ...)
-        freqs = mag_dict["freqs"]
-        # freqs[freqs<0] = 0 # to only regard positive freqs
-        k = 1  # 1 / sqrt(2)
-        f_norm = abs(freqs[:, newaxis] / F_REF)
-        B_norm = k * mag_dict[symbol] / B_REF
-        # factor 1 / sqrt(2) to account for SciDataTool FFT of double sided spectrum
-        # TODO is this factor also true for powers other than 2 ?
-
-        HY_ = Coeff[0] * f_norm * B_norm ** Coeff[1]
-        ED_ = Coeff[2] * (f_norm * B_norm) ** Coeff[3]
-        EX_ = Coeff[4] * (f_norm * B_norm) ** Coeff[5]
-
-        HY = HY_ if HY is None else HY + HY_
-        ED = ED_ if ED is None else ED + ED_
-        EX = EX_ if EX is None else EX + EX_
+    # Magnitude spectrum of all the field components (last axis)
+    # TODO add filter function to limit max. order of harmonics
+    freqs, B_mag, axes = get_magnitude_spectrum(sol, indice)
+
+    # TODO better data check (axis size, ...)
+    # freqs[freqs<0] = 0 # to only regard positive freqs
+    k = 1  # 1 / sqrt(2)
+    # factor 1 / sqrt(2) to account for SciDataTool FFT of double sided spectrum
+    # TODO is this factor also true for powers other than 2 ?
+    freqs_shape = [1] * B_mag.ndim
+    freqs_shape[[axis.name for axis in axes].index("freqs")] = freqs.size
+    f_norm = abs(freqs.reshape(freqs_shape) / F_REF)
+    B_norm = k * B_mag / B_REF
+
+    # Sum of the losses of the components
+    fB_norm = f_norm * B_norm
+    HY = (Coeff[0] * f_norm * B_norm ** Coeff[1]).sum(axis=-1)
+    ED = (Coeff[2] * fB_norm ** Coeff[3]).sum(axis=-1)
+    EX = (Coeff[4] * fB_norm ** Coeff[5]).sum(axis=-1)
 
     loss = HY + ED + EX
 
     # setup loss density data
-    Freq = Data1D(name="freqs", unit="", values=freqs)
-    axes = [Freq if x.name == "time" else x for x in component.axes]
-
     loss_density = DataFreq(
         name="Loss Density", unit="W/kg", symbol="LossDens", axes=axes, values=loss
     )
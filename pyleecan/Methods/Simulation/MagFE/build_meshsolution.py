@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+from numpy import arange
+from SciDataTool import DataTime, Data1D, VectorField
+
+from ....Classes.CellMat import CellMat
+from ....Classes.MeshMat import MeshMat
+from ....Classes.MeshSolution import MeshSolution
+from ....Classes.PointMat import PointMat
+from ....Classes.RefTriangle3 import RefTriangle3
+from ....Classes.SolutionData import SolutionData
+from ....Classes.SolutionVector import SolutionVector
+
+
+def build_meshsolution(self, model, Time, B, H, mu):
+    """Build the MeshSolution objets from the finite element model outputs.
+    The mesh of each lamination is at rest (in its own frame): the moving band
+    is not included.
+
+    Parameters
+    ----------
+    self : MagFE
+        a MagFE object
+    model : MagFEModel
+        Meshed finite element model of the machine
+    Time : Data
+        Time axis
+    B: ndarray
+        3D Magnetic flux density for all time steps and each element (Nt, Nelem, 3) [T]
+    H : ndarray
+        3D Magnetic field for all time steps and each element (Nt, Nelem, 3) [A/m]
+    mu : ndarray
+        Magnetic relative permeability for all time steps and each element (Nt, Nelem) []
+
+    Returns
+    -------
+    meshsol: MeshSolution
+        a MeshSolution object with the finite element outputs at every time step
+    """
+    Nelem = model.cell.shape[0]
+    Npoint = model.point.shape[0]
+    mesh = MeshMat(label="MagFE")
+    mesh.cell["triangle"] = CellMat(
+        connectivity=model.cell,
+        nb_cell=Nelem,
+        nb_pt_per_cell=3,
+        indice=arange(Nelem),
+    )
+    mesh.cell["triangle"].interpolation.ref_cell = RefTriangle3(epsilon=1e-9)
+    mesh.point = PointMat(coordinate=model.point, nb_pt=Npoint, indice=arange(Npoint))
+
+    Indices_Cell = Data1D(name="indice", values=arange(Nelem), is_components=True)
+
+    # Store the results for B
+    components = {}
+    for ii, comp in enumerate(["x", "y"]):
+        components["comp_" + comp] = DataTime(
+            name="Magnetic Flux Density B" + comp,
+            unit="T",
+            symbol="B" + comp,
+            axes=[Time, Indices_Cell],
+            values=B[:, :, ii],
+            is_real=True,
+        )
+    solB = VectorField(name="Magnetic Flux Density", symbol="B", components=components)
+
+    # Store the results for H
+    componentsH = {}
+    for ii, comp in enumerate(["x", "y"]):
+        componentsH["comp_" + comp] = DataTime(
+            name="Magnetic Field H" + comp,
+            unit="A/m",
+            symbol="H" + comp,
+            axes=[Time, Indices_Cell],
+            values=H[:, :, ii],
+            is_real=True,
+        )
+    solH = VectorField(name="Magnetic Field", symbol="H", components=componentsH)
+
+    solmu = DataTime(
+        name="Magnetic Permeability",
+        unit="H/m",
+        symbol=r"\mu",
+        axes=[Time, Indices_Cell],
+        values=mu,
+        is_real=True,
+    )
+
+    sollist = [
+        SolutionVector(field=solB, type_cell="triangle", label="B"),
+        SolutionVector(field=solH, type_cell="triangle", label="H"),
+        SolutionData(field=solmu, type_cell="triangle", label=r"\mu"),
+    ]
+
+    meshsol = MeshSolution(
+        label="MagFE_magnetostatic",
+        mesh=[mesh],
+        solution=sollist,
+        is_same_mesh=True,
+        dimension=2,
+    )
+    meshsol.group = model.get_group()
+
+    return meshsol
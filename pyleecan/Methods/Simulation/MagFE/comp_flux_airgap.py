@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+from os.path import join
+
+from numpy import zeros
+
+from ....Classes.Lamination import Lamination
+from ....Functions.MagFE.mag_fe_model import MagFEModel
+
+
+def comp_flux_airgap(self, output, axes_dict):
+    """Build and solve the native finite element model to calculate and store
+    magnetic quantities
+
+    Parameters
+    ----------
+    self : MagFE
+        a MagFE object
+    output : Output
+        an Output object
+    axes_dict: {Data}
+        Dict of axes used for magnetic calculation
+
+    Returns
+    -------
+    out_dict: dict
+        Dict containing the following quantities:
+            Br : ndarray
+                Airgap radial flux density (Nt,Na) [T]
+            Bt : ndarray
+                Airgap tangential flux density (Nt,Na) [T]
+            Tem : ndarray
+                Electromagnetic torque over time (Nt,) [Nm]
+            Phi_wind_stator : ndarray
+                Stator winding flux (qs,Nt) [Wb]
+            Phi_wind : dict
+                Dict of winding fluxlinkage with respect to Machine.get_lam_list_label (qs,Nt) [Wb]
+            meshsolution: MeshSolution
+                MeshSolution object containing magnetic quantities B, H, mu for each time step
+    """
+
+    # Get time and angular axes
+    Angle = axes_dict["Angle"]
+    Time = axes_dict["Time"]
+
+    # Set the angular symmetry factor according to the machine and check if it is anti-periodic
+    sym, is_antiper_a = Angle.get_periodicity()
+
+    # Import angular vector from Data object
+    angle = Angle.get_values(
+        is_oneperiod=self.is_periodicity_a,
+        is_antiperiod=is_antiper_a and self.is_periodicity_a,
+    )
+    Na = angle.size
+
+    # Check if the time axis is anti-periodic
+    _, is_antiper_t = Time.get_periodicity()
+
+    # Number of time steps
+    time = Time.get_values(
+        is_oneperiod=self.is_periodicity_t,
+        is_antiperiod=is_antiper_t and self.is_periodicity_t,
+    )
+    Nt = time.size
+
+    # Get rotor angular position
+    angle_rotor = output.get_angle_rotor()[0:Nt]
+
+    # Interpolate current on magnetic model time axis
+    # Get stator current from elec out
+    if self.is_mmfs:
+        Is = output.elec.comp_I_mag(time, is_stator=True)
+    else:
+        Is = None
+    # Get rotor current from elec out
+    if self.is_mmfr:
+        Ir = output.elec.comp_I_mag(time, is_stator=False)
+    else:
+        Ir = None
+
+    # Modifiy the machine to match the conditions
+    machine = output.simu.machine
+    if self.is_remove_slotS or self.is_remove_slotR or self.is_remove_vent:
+        machine = type(machine)(init_dict=machine.as_dict())
+        if self.is_remove_slotR:  # Remove all slots on the rotor
+            machine.rotor = Lamination(init_dict=machine.rotor.as_dict())
+        if self.is_remove_slotS:  # Remove all slots on the stator
+            machine.stator = Lamination(init_dict=machine.stator.as_dict())
+        if self.is_remove_vent:  # Remove all ventilations
+            machine.rotor.axial_vent = list()
+            machine.stator.axial_vent = list()
+
+    # Mesh the machine and compute the element kernels (once for all time steps)
+    self.get_logger().debug("Meshing the machine for the finite element model...")
+    model = MagFEModel(
+        machine,
+        sym=sym,
+        is_antiper=is_antiper_a,
+        Kmesh_fineness=self.Kmesh_fineness,
+        is_mmfs=self.is_mmfs,
+        is_mmfr=self.is_mmfr,
+        type_BH_stator=self.type_BH_stator,
+        type_BH_rotor=self.type_BH_rotor,
+    )
+
+    # Init flux arrays in out_dict
+    out_dict = dict()
+    out_dict["Br"] = zeros((Nt, Na))
+    out_dict["Bt"] = zeros((Nt, Na))
+    # Init torque array in out_dict
+    out_dict["Tem"] = zeros((Nt))
+    # Init lamination winding flux list of arrays in out_dict
+    out_dict["Phi_wind"] = {}
+    for label, lam in zip(machine.get_lam_list_label(), machine.get_lam_list()):
+        if hasattr(lam, "winding") and lam.winding is not None:
+            qs = lam.winding.qs  # Winding phase number
+            out_dict["Phi_wind"][label] = zeros((Nt, qs))
+
+    # Solve for all time step and store all the results in out_dict
+    B_elem, H_elem, mu_elem = self.solve_FE(
+        model,
+        output,
+        out_dict,
+        machine=machine,
+        Nt=Nt,
+        angle=angle,
+        Is=Is,
+        Ir=Ir,
+        angle_rotor=angle_rotor,
+    )
+
+    # Store the mesh results in meshsolution
+    if self.is_get_mesh:
+        # Build MeshSolution object and store it in out_dict
+        out_dict["meshsolution"] = self.build_meshsolution(
+            model, Time, B_elem, H_elem, mu_elem
+        )
+        # Save meshsolution as .h5 on disk if requested
+        if self.is_save_FEA:
+            save_path = output.get_path_result()
+            save_path_fea = join(save_path, "MeshSolutionFE.h5")
+            out_dict["meshsolution"].save(save_path_fea)
+
+    # Store stator winding flux
+    if "Stator_0" in out_dict["Phi_wind"].keys():
+        out_dict["Phi_wind_stator"] = out_dict["Phi_wind"]["Stator_0"]
+    # delete 'Phi_wind' if empty
+    if not out_dict["Phi_wind"]:
+        out_dict.pop("Phi_wind")
+
+    return out_dict
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+from numpy import pi, roll, zeros
+
+from ....Functions.MagFE.comp_reluctivity import MU0
+
+
+def solve_FE(self, model, output, out_dict, machine, Nt, angle, Is, Ir, angle_rotor):
+    """
+    Solve the finite element model to calculate airgap flux density, torque
+    instantaneous/average/ripple values, flux induced in the windings and flux
+    density, field and permeability maps
+
+    Parameters
+    ----------
+    self: MagFE
+        A MagFE object
+    model: MagFEModel
+        Meshed finite element model of the machine
+    output: Output
+        An Output object
+    out_dict: dict
+        Dict containing the following quantities to update for each time step:
+            Br : ndarray
+                Airgap radial flux density (Nt,Na) [T]
+            Bt : ndarray
+                Airgap tangential flux density (Nt,Na) [T]
+            Tem : ndarray
+                Electromagnetic torque over time (Nt,) [Nm]
+            Phi_wind : dict
+                Dict of winding fluxlinkage with respect to Machine.get_lam_list_label (Nt,qs) [Wb]
+    machine: Machine
+        Machine of the model (with the removed slots or ventilations if any)
+    Nt: int
+        Number of time steps for calculation
+    angle: ndarray
+        Angle vector for calculation
+    Is : ndarray
+        Stator current matrix (qs,Nt) [A]
+    Ir : ndarray
+        Rotor current matrix (qs,Nt) [A]
+    angle_rotor: ndarray
+        Rotor angular position vector (Nt,)
+
+    Returns
+    -------
+    B: ndarray
+        3D Magnetic flux density for all time steps and each element (Nt, Nelem, 3) [T]
+    H : ndarray
+        3D Magnetic field for all time steps and each element (Nt, Nelem, 3) [A/m]
+    mu : ndarray
+        Magnetic relative permeability for all time steps and each element (Nt, Nelem) []
+    """
+    Na = angle.size
+    Nb = model.Nb
+    Rag = self.Rag_enforced
+    if Rag is None:
+        Rag = machine.comp_Rgap_mec()
+    is_internal_rotor = machine.rotor.is_internal
+
+    # Account for initial angular shift of stator and rotor
+    angle_shift = self.angle_rotor_shift - self.angle_stator_shift
+    # Rotation of the inner lamination in the frame of the outer one
+    if is_internal_rotor:
+        alpha = angle_rotor + angle_shift
+    else:
+        alpha = -(angle_rotor + angle_shift)
+
+    # Current of each wound lamination
+    I_dict = dict()
+    for label, lam in zip(model.label_list, model.lam_list):
+        if label in model.F_I:
+            I_dict[label] = Is if lam.is_stator else Ir
+
+    # Init the mesh solution
+    if self.is_get_mesh:
+        Nelem = model.cell.shape[0]
+        B_elem = zeros((Nt, Nelem, 3))
+        H_elem = zeros((Nt, Nelem, 3))
+        mu_elem = zeros((Nt, Nelem))
+    else:
+        B_elem, H_elem, mu_elem = None, None, None
+
+    # Compute the data for each time step
+    A1, A2, shift = zeros((Nt, Nb)), zeros((Nt, Nb)), zeros(Nt)
+    a = None
+    for ii in range(Nt):
+        if Nt > 1:
+            self.get_logger().info(
+                "Solving time step " + str(ii + 1) + " / " + str(Nt) + " with MagFE"
+            )
+        else:
+            self.get_logger().info("Computing Airgap Flux with MagFE")
+        # Update the sources
+        f = model.f_mag.copy()
+        for label, I in I_dict.items():
+            if I is not None:
+                f += model.F_I[label].dot(I[:, ii])
+
+        # Solve (starting from the previous time step solution)
+        a, nb_iter = model.solve(
+            alpha[ii], f, a0=a, tol=self.tol_newton, nb_iter_max=self.nb_iter_max
+        )
+        if not model.is_linear:
+            self.get_logger().debug(
+                "Newton iterations for time step " + str(ii + 1) + ": " + str(nb_iter)
+            )
+        A1[ii], A2[ii], shift[ii] = model.get_ring_value(a, alpha[ii])
+
+        # Winding flux
+        for label in out_dict["Phi_wind"].keys():
+            lam = machine.get_lam_by_label(label)
+            out_dict["Phi_wind"][label][ii, :] = (
+                model.sym
+                * lam.comp_length()
+                * model.F_I[label].T.dot(a)
+                / lam.winding.Npcpp
+            )
+
+        # Flux density, field and permeability of each element
+        if self.is_get_mesh:
+            B = model.comp_B(a)
+            nu, _ = model.comp_reluctivity(a)
+            B_elem[ii, :, 0:2] = B
+            H_elem[ii, :, 0:2] = nu[:, None] * B - model.Hc
+            mu_elem[ii, :] = 1 / (MU0 * nu)
+
+    # Torque on the inner lamination (Maxwell stress tensor in the moving band)
+    Tem = model.comp_torque(A1, A2, shift)
+    out_dict["Tem"] = Tem if is_internal_rotor else -Tem
+
+    # Airgap flux density in the frame of the stator
+    if machine.stator.is_internal:
+        angle_out = angle[None, :] + alpha[:, None]
+    else:
+        angle_out = angle
+    out_dict["Br"], out_dict["Bt"] = model.comp_airgap_flux(
+        A1, A2, shift, angle_out, Rag
+    )
+
+    # Shift to take into account stator position
+    if self.angle_stator_shift != 0:
+        roll_id = int(self.angle_stator_shift * Na / (2 * pi))
+        out_dict["Br"] = roll(out_dict["Br"], roll_id, axis=1)
+        out_dict["Bt"] = roll(out_dict["Bt"], roll_id, axis=1)
+
+    return B_elem, H_elem, mu_elem
@@ -1,13 +1,11 @@
-from os.path import basename, splitext
+import os
 
-from numpy import zeros, pi, roll, cos, sin
+from numpy import zeros, pi, roll
 
 # from scipy.interpolate import interp1d
 
 from ....Classes._FEMMHandler import _FEMMHandler
-from ....Functions.FEMM.update_FEMM_simulation import update_FEMM_simulation
-from ....Functions.FEMM.comp_FEMM_torque import comp_FEMM_torque
-from ....Functions.FEMM.comp_FEMM_Phi_wind import comp_FEMM_Phi_wind
+from ....Functions.FEMM.comp_FEMM_airgap_flux import write_FEMM_airgap_lua
 
 
 def solve_FEMM(
@@ -117,95 +115,42 @@ def solve_FEMM(
     Rag = self.Rag_enforced
     if Rag is None:
         Rag = machine.comp_Rgap_mec()
-
-    L1 = machine.stator.comp_length()
     save_path = self.get_path_save(output)
-    is_internal_rotor = machine.rotor.is_internal
-    if "Phi_wind" in out_dict:
-        qs = {}
-        Npcpp = {}
-        for key in out_dict["Phi_wind"].keys():
-            lam = machine.get_lam_by_label(key)
-            qs[key] = lam.winding.qs  # Winding phase number
-            Npcpp[key] = lam.winding.Npcpp  # parallel paths
-
-    # Account for initial angular shift of stator and rotor and apply it to the sliding band
-    angle_shift = self.angle_rotor_shift - self.angle_stator_shift
+
+    # LUA script to get the airgap flux density with a single call per time step
+    if self.is_batch_airgap:
+        path_lua = write_FEMM_airgap_lua(
+            save_path,
+            angle,
+            Rag,
+            is_sliding_band=self.is_sliding_band,
+            id_worker=start_t,
+        )
+    else:
+        path_lua = None
 
     # Compute the data for each time step
     for ii in range(start_t, end_t):
-        if Nt > 1:
-            self.get_logger().info(
-                "Solving time step " + str(ii + 1) + " / " + str(Nt) + " in FEMM"
-            )
-        else:
-            self.get_logger().info("Computing Airgap Flux in FEMM")
-        # Update rotor position and currents
-        update_FEMM_simulation(
-            femm=femm,
-            circuits=FEMM_dict["circuits"],
-            is_sliding_band=self.is_sliding_band,
-            is_internal_rotor=is_internal_rotor,
-            angle_rotor=angle_rotor + angle_shift,
+        tmpmeshFEMM, tmpB, tmpH, tmpmu, tmpgroups = self.solve_FEMM_step(
+            femm,
+            output,
+            out_dict,
+            FEMM_dict,
+            sym=sym,
+            Nt=Nt,
+            angle=angle,
             Is=Is,
             Ir=Ir,
+            angle_rotor=angle_rotor,
             ii=ii,
+            Rag=Rag,
+            path_lua=path_lua,
+            is_get_mesh=ii == start_t,
+            id_worker=start_t,
         )
-        # try "previous solution" for speed up of FEMM calculation
-        if self.is_sliding_band:
-            try:
-                base = basename(self.get_path_save_fem(output))
-                ans_file = splitext(base)[0] + ".ans"
-                femm.mi_setprevious(ans_file, 0)
-            except:
-                pass
-
-        # Run the computation
-        femm.mi_analyze()
-
-        # Load results
-        femm.mi_loadsolution()
-
-        # Get the flux result
-        if self.is_sliding_band:
-            for jj in range(Na):
-                out_dict["Br"][ii, jj], out_dict["Bt"][ii, jj] = femm.mo_getgapb(
-                    "bc_ag2", angle[jj] * 180 / pi
-                )
-        else:
-            for jj in range(Na):
-                B = femm.mo_getb(Rag * cos(angle[jj]), Rag * sin(angle[jj]))
-                out_dict["Br"][ii, jj] = B[0] * cos(angle[jj]) + B[1] * sin(angle[jj])
-                out_dict["Bt"][ii, jj] = -B[0] * sin(angle[jj]) + B[1] * cos(angle[jj])
-
-        # Compute the torque
-        out_dict["Tem"][ii] = comp_FEMM_torque(femm, FEMM_dict, sym=sym)
-
-        if "Phi_wind" in out_dict:
-            # Phi_wind computation
-            # TODO fix inconsistency for multi lam machines here
-            for key in out_dict["Phi_wind"].keys():
-                out_dict["Phi_wind"][key][ii, :] = comp_FEMM_Phi_wind(
-                    femm,
-                    qs[key],
-                    Npcpp[key],
-                    is_stator=machine.get_lam_by_label(key).is_stator,
-                    Lfemm=FEMM_dict["Lfemm"],
-                    L1=L1,
-                    sym=sym,
-                )
 
         # Load mesh data & solution
-        if (self.is_sliding_band or Nt == 1) and (self.is_get_mesh or self.is_save_FEA):
-            # Get mesh data and magnetic quantities from .ans file
-            tmpmeshFEMM, tmpB, tmpH, tmpmu, tmpgroups = self.get_meshsolution(
-                femm,
-                save_path,
-                j_t0=ii,
-                id_worker=start_t,
-                is_get_mesh=ii == start_t,
-            )
-
+        if tmpB is not None:
             # Initialize mesh and magnetic quantities for first time step
             if ii == start_t:
                 meshFEMM = [tmpmeshFEMM]
@@ -223,6 +168,10 @@ def solve_FEMM(
             H_elem[ii0, :, 0:2] = tmpH
             mu_elem[ii0, :] = tmpmu
 
+    # Delete the LUA script
+    if path_lua is not None:
+        os.remove(path_lua)
+
     # Shift to take into account stator position
     if self.angle_stator_shift != 0:
         roll_id = int(self.angle_stator_shift * Na / (2 * pi))
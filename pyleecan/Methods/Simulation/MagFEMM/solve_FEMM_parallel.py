@@ -1,12 +1,16 @@
 from multiprocessing import cpu_count
-from multiprocessing.dummy import Pool
 from os import remove
 
-from shutil import copyfile
-
-from numpy import concatenate
+from numpy import zeros, pi, roll
 
 from ....Classes._FEMMHandler import _FEMMHandler
+from ....Functions.FEMM.comp_FEMM_airgap_flux import write_FEMM_airgap_lua
+from ....Functions.FEMM.run_FEMM_workers import (
+    get_FEMM_workers,
+    load_FEMM_worker,
+    run_FEMM_workers,
+    close_FEMM_workers,
+)
 
 
 def solve_FEMM_parallel(
@@ -23,7 +27,9 @@ def solve_FEMM_parallel(
     angle_rotor,
 ):
     """
-    Same as solve_FEMM including parallelization on several workers
+    Same as solve_FEMM including parallelization on several workers.
+    The time steps are handed out one by one to the first available worker
+    and the workers are kept open between simulations if is_close_femm is False.
 
     Parameters
     ----------
@@ -74,42 +80,41 @@ def solve_FEMM_parallel(
 
     # The following function must be in solve_FEMM_parallel to access
     # to its variable without passing them in arguments
-    def solve_FEMM_single(femm_handler, filename, start_t, end_t):
+    def solve_FEMM_single(worker, ii):
         """
-        Call FEMM to compute airgap flux density from start_t to end_t timesteps
+        Call FEMM to compute airgap flux density at time step ii
 
         This function is called in threads, the shared memory enable to modify global variable
-        defined in solve_FEMM_parallel such as Br and Bt
+        defined in solve_FEMM_parallel such as Br and Bt (each time step on its own row)
 
         Parameters
         ----------
 
-        femm_handler : _FEMMHandler
-            FEMM handler
-        filename : str
-            .fem file path
-        start_t : int
-            first timestep to compute
-        end_t: int
-            last timestep to compute
+        worker : dict
+            FEMM worker (FEMM handler and .fem file path)
+        ii : int
+            timestep to compute
 
         Returns
         -------
+        mesh: MeshMat
+            Object containing magnetic mesh (first time step only)
         B: ndarray
-            3D Magnetic flux density for time steps of the current FEMM instance and each element (Nt0, Nelem, 3) [T]
+            Magnetic flux density for the time step and each element (Nelem, 2) [T]
         H : ndarray
-            3D Magnetic field for time steps of the current FEMM instance and each element (Nt0, Nelem, 3) [A/m]
+            Magnetic field for the time step and each element (Nelem, 2) [A/m]
         mu : ndarray
-            Magnetic relative permeability for time steps of the current FEMM instance and each element (Nt0, Nelem) []
-        mesh: MeshMat
-            Object containing magnetic mesh at first time step of the current FEMM instance
+            Magnetic relative permeability for the time step and each element (Nelem,) []
         groups: dict
             Dict whose values are group label and values are array of indices of related elements
 
         """
+        # Open FEMM and the worker file if needed
+        load_FEMM_worker(worker)
+        id_worker, path_lua = lua_dict[id(worker)]
 
-        B_elem, H_elem, mu_elem, meshFEMM, groups = self.solve_FEMM(
-            femm_handler,
+        return self.solve_FEMM_step(
+            worker["femm"],
             output,
             out_dict,
             FEMM_dict,
@@ -119,20 +124,23 @@ def solve_FEMM_parallel(
             Is=Is,
             Ir=Ir,
             angle_rotor=angle_rotor,
-            is_close_femm=True,
-            filename=filename,
-            start_t=start_t,
-            end_t=end_t,
+            ii=ii,
+            Rag=Rag,
+            path_lua=path_lua,
+            is_get_mesh=ii == 0,
+            id_worker=id_worker,
         )
 
-        return B_elem, H_elem, mu_elem, meshFEMM, groups
-
     # Init mesh solution as None since array allocation can only be done once
     # number of elements is known, i.e. after first time step resolution
     B_elem, H_elem, mu_elem, meshFEMM, groups = None, None, None, None, None
 
     # Loading parameters for readibility
     fem_file = self.get_path_save_fem(output)
+    save_path = self.get_path_save(output)
+    Rag = self.Rag_enforced
+    if Rag is None:
+        Rag = output.simu.machine.comp_Rgap_mec()
     nb_worker = self.nb_worker
     logger = self.get_logger()
 
@@ -149,64 +157,80 @@ def solve_FEMM_parallel(
         )
         nb_worker = Nt
 
-    # Copy femm file and create lists to split the tasks
-    nb_task_worker = []  # nb of task for each worker
-    nb_task_to_split = Nt  # number of task remaining to split
-    for w in range(nb_worker, 0, -1):
-        # Copy the file
-        copyfile(fem_file, fem_file[:-4] + "_" + str(w) + ".fem")
-        # Compute the number of task for this worker
-        nb_task_worker.append(nb_task_to_split // w + ((nb_task_to_split % w) > 0))
-        # Remove the number of task of this worker from the number of remaining tasks
-        nb_task_to_split -= nb_task_worker[-1]
-
-    # Define the argument lists:
-    #   - femm_handler
-    #   - femm_file
-    #   - start_time : index of the first time step to compute
-    #   - end_time : index of the last time step to compute
-    femm_handler = [_FEMMHandler() for i in range(nb_worker)]
-    femm_files = [
-        fem_file[:-4] + "_" + str(i) + ".fem" for i in range(1, nb_worker + 1)
-    ]
-    start_time_list = [sum(nb_task_worker[:i]) for i in range(nb_worker)]
-    end_time_list = [sum(nb_task_worker[: i + 1]) for i in range(nb_worker)]
-
-    # Gathering the different arguments for each instance
-    args = [
-        [i, j, k, l]
-        for i, j, k, l in zip(femm_handler, femm_files, start_time_list, end_time_list)
-    ]
+    # Get the workers (FEMM handler + copy of the femm file), reused if possible
+    worker_list = get_FEMM_workers(fem_file, nb_worker, _FEMMHandler)
+    femm_handler = [worker["femm"] for worker in worker_list]
 
     # append femm_handler to handler_list
     output.mag.internal.handler_list.extend(femm_handler)
 
-    # Creating threads pool
-    pool = Pool(nb_worker)
-
-    # Computing FEMM in parallel
-    results = pool.starmap(solve_FEMM_single, args)
+    # LUA script of each worker to get the airgap flux density (written once)
+    lua_dict = dict()
+    for w, worker in enumerate(worker_list):
+        if self.is_batch_airgap:
+            path_lua = write_FEMM_airgap_lua(
+                save_path,
+                angle,
+                Rag,
+                is_sliding_band=self.is_sliding_band,
+                id_worker=w,
+            )
+        else:
+            path_lua = None
+        lua_dict[id(worker)] = (w, path_lua)
+
+    # Computing FEMM in parallel (dynamic scheduling of the time steps)
+    try:
+        results, stat_list = run_FEMM_workers(
+            worker_list, list(range(Nt)), solve_FEMM_single
+        )
+    except BaseException:
+        close_FEMM_workers(fem_file)
+        raise
+    finally:
+        for handler in femm_handler:
+            output.mag.internal.handler_list.remove(handler)
+        for _, path_lua in lua_dict.values():
+            if path_lua is not None:
+                remove(path_lua)
+
+    # Shift to take into account stator position (once all the time steps are solved)
+    if self.angle_stator_shift != 0:
+        roll_id = int(self.angle_stator_shift * angle.size / (2 * pi))
+        out_dict["Br"] = roll(out_dict["Br"], roll_id, axis=1)
+        out_dict["Bt"] = roll(out_dict["Bt"], roll_id, axis=1)
+    out_dict["Rag"] = Rag
+
+    # Report the workers utilisation
+    output.mag.internal.worker_stat = stat_list
+    for w, stat in enumerate(stat_list):
+        logger.debug(
+            "FEMM worker "
+            + str(w + 1)
+            + ": "
+            + str(stat["nb_task"])
+            + " time steps in "
+            + format(stat["time"], ".3g")
+            + " s (usage "
+            + format(100 * stat["usage"], ".3g")
+            + "%)"
+        )
 
     # Building mesh solution
-    if self.is_get_mesh:
-        B_elem = concatenate([res[0] for res in results], axis=0)
-        H_elem = concatenate([res[1] for res in results], axis=0)
-        mu_elem = concatenate([res[2] for res in results], axis=0)
-        meshFEMM = results[0][3]
-        groups = results[0][4]
-
-    # Remove temporary .fem and .ans files
-    for w in range(nb_worker, 0, -1):
-        try:
-            remove(fem_file[:-4] + "_" + str(w) + ".fem")
-        except:
-            filename = fem_file[:-4] + "_" + str(w) + ".fem"
-            self.get_logger().warning("Could not remove file: " + filename)
-
-        try:
-            remove(fem_file[:-4] + "_" + str(w) + ".ans")
-        except:
-            filename = fem_file[:-4] + "_" + str(w) + ".ans"
-            self.get_logger().warning("Could not remove file: " + filename)
+    if self.is_get_mesh and results[0][1] is not None:
+        Nelem = results[0][1].shape[0]
+        B_elem = zeros([Nt, Nelem, 3])
+        H_elem = zeros([Nt, Nelem, 3])
+        mu_elem = zeros([Nt, Nelem])
+        for ii in range(Nt):
+            B_elem[ii, :, 0:2] = results[ii][1]
+            H_elem[ii, :, 0:2] = results[ii][2]
+            mu_elem[ii, :] = results[ii][3]
+        meshFEMM = [results[0][0]]
+        groups = [results[0][4]]
+
+    # Close FEMM and remove temporary .fem and .ans files
+    if self.is_close_femm:
+        close_FEMM_workers(fem_file)
 
     return B_elem, H_elem, mu_elem, meshFEMM, groups
@@ -0,0 +1,159 @@
+from os.path import basename, splitext
+
+from ....Functions.FEMM.update_FEMM_simulation import update_FEMM_simulation
+from ....Functions.FEMM.comp_FEMM_torque import comp_FEMM_torque
+from ....Functions.FEMM.comp_FEMM_Phi_wind import comp_FEMM_Phi_wind
+from ....Functions.FEMM.comp_FEMM_airgap_flux import comp_FEMM_airgap_flux
+
+
+def solve_FEMM_step(
+    self,
+    femm,
+    output,
+    out_dict,
+    FEMM_dict,
+    sym,
+    Nt,
+    angle,
+    Is,
+    Ir,
+    angle_rotor,
+    ii,
+    Rag,
+    path_lua=None,
+    is_get_mesh=False,
+    id_worker=0,
+):
+    """
+    Solve the FEMM model (already open) at the time step ii and store the
+    airgap flux density, the torque and the winding flux in out_dict
+    (without the post-processing of solve_FEMM: stator shift, closing FEMM...)
+
+    Parameters
+    ----------
+    self: MagFEMM
+        A MagFEMM object
+    femm: _FEMMHandler
+        Object to handle FEMM
+    output: Output
+        An Output object
+    out_dict: dict
+        Dict containing the quantities to update for the time step ii (cf solve_FEMM)
+    FEMM_dict : dict
+        Dict containing FEMM model parameters
+    sym: int
+        Spatial symmetry factor
+    Nt: int
+        Number of time steps for calculation
+    angle: ndarray
+        Angle vector for calculation
+    Is : ndarray
+        Stator current matrix (qs,Nt) [A]
+    Ir : ndarray
+        Stator current matrix (qs,Nt) [A]
+    angle_rotor: ndarray
+        Rotor angular position vector (Nt,)
+    ii: int
+        Index of the time step to solve
+    Rag: float
+        Radius to compute the airgap flux density [m]
+    path_lua: str
+        Path to the LUA script of write_FEMM_airgap_lua (None to call FEMM for each angle)
+    is_get_mesh: bool
+        True to build the mesh (and groups) from the FEMM solution
+    id_worker: int
+        Worker index (name of the temporary files)
+
+    Returns
+    -------
+    mesh: MeshMat
+        Object containing magnetic mesh (None if not is_get_mesh)
+    B: ndarray
+        Magnetic flux density for each element (Nelem, 2) [T] (None if the mesh solution is not requested)
+    H : ndarray
+        Magnetic field for each element (Nelem, 2) [A/m] (None if the mesh solution is not requested)
+    mu : ndarray
+        Magnetic relative permeability for each element (Nelem,) [] (None if the mesh solution is not requested)
+    groups: dict
+        Dict whose values are group label and values are array of indices of related elements
+    """
+
+    # Loading parameters for readibility
+    machine = output.simu.machine
+    L1 = machine.stator.comp_length()
+    is_internal_rotor = machine.rotor.is_internal
+
+    # Account for initial angular shift of stator and rotor and apply it to the sliding band
+    angle_shift = self.angle_rotor_shift - self.angle_stator_shift
+
+    if Nt > 1:
+        self.get_logger().info(
+            "Solving time step " + str(ii + 1) + " / " + str(Nt) + " in FEMM"
+        )
+    else:
+        self.get_logger().info("Computing Airgap Flux in FEMM")
+    # Update rotor position and currents
+    update_FEMM_simulation(
+        femm=femm,
+        circuits=FEMM_dict["circuits"],
+        is_sliding_band=self.is_sliding_band,
+        is_internal_rotor=is_internal_rotor,
+        angle_rotor=angle_rotor + angle_shift,
+        Is=Is,
+        Ir=Ir,
+        ii=ii,
+    )
+    # try "previous solution" for speed up of FEMM calculation
+    if self.is_sliding_band:
+        try:
+            base = basename(self.get_path_save_fem(output))
+            ans_file = splitext(base)[0] + ".ans"
+            femm.mi_setprevious(ans_file, 0)
+        except:
+            pass
+
+    # Run the computation
+    femm.mi_analyze()
+
+    # Load results
+    femm.mi_loadsolution()
+
+    # Get the flux result
+    out_dict["Br"][ii, :], out_dict["Bt"][ii, :] = comp_FEMM_airgap_flux(
+        femm,
+        angle,
+        Rag,
+        is_sliding_band=self.is_sliding_band,
+        path_lua=path_lua,
+    )
+
+    # Compute the torque
+    out_dict["Tem"][ii] = comp_FEMM_torque(femm, FEMM_dict, sym=sym)
+
+    if "Phi_wind" in out_dict:
+        # Phi_wind computation
+        # TODO fix inconsistency for multi lam machines here
+        for key in out_dict["Phi_wind"].keys():
+            lam = machine.get_lam_by_label(key)
+            out_dict["Phi_wind"][key][ii, :] = comp_FEMM_Phi_wind(
+                femm,
+                lam.winding.qs,
+                lam.winding.Npcpp,
+                is_stator=lam.is_stator,
+                Lfemm=FEMM_dict["Lfemm"],
+                L1=L1,
+                sym=sym,
+            )
+
+    # Load mesh data & solution
+    if (self.is_sliding_band or Nt == 1) and (self.is_get_mesh or self.is_save_FEA):
+        # Get mesh data and magnetic quantities from .ans file
+        return self.get_meshsolution(
+            femm,
+            self.get_path_save(output),
+            j_t0=ii,
+            id_worker=id_worker,
+            is_get_mesh=is_get_mesh,
+        )
+    else:
+        return None, None, None, None, None
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+from numpy import array, pi, roll, zeros
+
+from ....Functions.MagFE.comp_reluctivity import MU0
+
+# Maximum number of fixed point iterations for the teeth saturation
+NB_ITER_SAT = 50
+
+
+def comp_flux_airgap(self, output, axes_dict):
+    """Calculate the airgap flux density, the torque and the winding flux with
+    the permeance x magnetomotive force model, vectorized on all the time steps
+
+    The radial flux density is the total magnetomotive force (windings and
+    magnets) divided by the effective airgap length (airgap, magnets, slot
+    openings and saturation of the teeth). The tangential flux density is the
+    one of the current sheet equivalent to the stator winding. The torque is
+    the derivative of the airgap magnetic coenergy with respect to the rotor
+    position (magnet, reluctance and cogging torques) with the permeability of
+    the teeth frozen at the actual position.
+
+    Parameters
+    ----------
+    self : MagPMMF
+        a MagPMMF object
+    output : Output
+        an Output object
+    axes_dict: {Data}
+        Dict of axes used for magnetic calculation
+
+    Returns
+    -------
+    out_dict: dict
+        Dict containing the following quantities:
+            Br : ndarray
+                Airgap radial flux density (Nt,Na) [T]
+            Bt : ndarray
+                Airgap tangential flux density (Nt,Na) [T]
+            Tem : ndarray
+                Electromagnetic torque over time (Nt,) [Nm]
+            Phi_wind_stator : ndarray
+                Stator winding flux (Nt,qs) [Wb]
+            Phi_wind : dict
+                Dict of winding fluxlinkage with respect to Machine.get_lam_list_label (Nt,qs) [Wb]
+    """
+
+    # Get time and angular axes
+    Angle = axes_dict["Angle"]
+    Time = axes_dict["Time"]
+
+    # Set the angular symmetry factor according to the machine and check if it is anti-periodic
+    _, is_antiper_a = Angle.get_periodicity()
+
+    # Angular vector of the outputs and of the full period (for the integrals)
+    angle = Angle.get_values(
+        is_oneperiod=self.is_periodicity_a,
+        is_antiperiod=is_antiper_a and self.is_periodicity_a,
+    )
+    Na = angle.size
+    angle_per = Angle.get_values(is_oneperiod=self.is_periodicity_a)
+    Na_per = angle_per.size
+    d_angle = angle_per[1] - angle_per[0]
+
+    # Check if the time axis is anti-periodic
+    _, is_antiper_t = Time.get_periodicity()
+
+    # Number of time steps
+    time = Time.get_values(
+        is_oneperiod=self.is_periodicity_t,
+        is_antiperiod=is_antiper_t and self.is_periodicity_t,
+    )
+    Nt = time.size
+
+    # Get rotor angular position
+    angle_rotor = output.get_angle_rotor()[0:Nt]
+
+    machine = output.simu.machine
+    Rag = self.Rag_enforced
+    if Rag is None:
+        Rag = machine.comp_Rgap_mec()
+    L = (machine.stator.comp_length() + machine.rotor.comp_length()) / 2
+    g = abs(machine.stator.comp_radius_mec() - machine.rotor.comp_radius_mec())
+
+    # Magnetomotive force and effective airgap length on the (Nt, Na) grid
+    # for the rotor positions angle_rotor-delta, angle_rotor, angle_rotor+delta
+    # (torque by virtual work)
+    delta = d_angle / 2
+    mmf = zeros((3, Nt, Na_per))
+    mmf_stator = zeros((Nt, Na_per))
+    g_eff = zeros((3, Nt, Na_per)) + g
+    wf_dict = dict()
+    out_dict = {"Phi_wind": dict()}
+    for label, lam in zip(machine.get_lam_list_label(), machine.get_lam_list()):
+        # Angles in the frame of the lamination
+        if lam.is_stator:
+            angle_lam = angle_per[None, None, :] - self.angle_stator_shift
+            is_mmf = self.is_mmfs
+        else:
+            angle_lam = (
+                angle_per[None, None, :]
+                - angle_rotor[None, :, None]
+                - self.angle_rotor_shift
+                - array([-delta, 0, delta])[:, None, None]
+            )
+            is_mmf = self.is_mmfr
+
+        g_eff += self.comp_slot_gap(lam, angle_lam)
+        mmf_lam, g_mag = self.comp_magnet_mmf(lam, angle_lam, d_angle)
+        g_eff += g_mag
+        if is_mmf:
+            mmf += mmf_lam
+
+        if hasattr(lam, "winding") and lam.winding is not None:
+            # Winding functions (qs, 1 or 3, 1 or Nt, Na)
+            qs = lam.winding.qs
+            wf = lam.comp_wind_function(angle=angle_lam.ravel() % (2 * pi))
+            wf = wf.reshape((qs,) + angle_lam.shape)
+            # At the actual rotor position (for the winding flux)
+            wf_dict[label] = wf[:, 0] if lam.is_stator else wf[:, 1]
+            if is_mmf:
+                I = output.elec.comp_I_mag(time, is_stator=lam.is_stator)
+                mmf_wind = (I[:, None, :, None] * wf).sum(axis=0)
+                mmf += mmf_wind
+                if lam.is_stator:
+                    mmf_stator += mmf_wind[0]
+
+    # Teeth saturation: fixed point on their equivalent airgap length at the
+    # actual rotor position, frozen for the torque computation
+    g_iron = zeros((Nt, Na_per))
+    for ii in range(NB_ITER_SAT):
+        B = _comp_flux(mmf[1], g_eff[1] + g_iron)
+        g_new = self.comp_iron_gap(
+            machine.stator, B, self.type_BH_stator
+        ) + self.comp_iron_gap(machine.rotor, B, self.type_BH_rotor)
+        if abs(g_new - g_iron).max() <= 1e-3 * g:
+            break
+        g_iron = (g_iron + g_new) / 2
+    g_eff = g_eff + g_iron[None, :, :]
+    B = _comp_flux(mmf, g_eff)
+    Br = B[1]
+    # Current sheet of the stator winding
+    Bt = (
+        MU0
+        / Rag
+        * (roll(mmf_stator, -1, axis=1) - roll(mmf_stator, 1, axis=1))
+        / (2 * d_angle)
+    )
+
+    # Torque: derivative of the airgap magnetic coenergy (at constant currents)
+    coenergy = pi * L * Rag / MU0 * (B ** 2 * g_eff).mean(axis=2)
+    out_dict["Tem"] = (coenergy[2] - coenergy[0]) / (2 * delta)
+
+    # Winding flux
+    for label, wf in wf_dict.items():
+        Npcpp = machine.get_lam_by_label(label).winding.Npcpp
+        out_dict["Phi_wind"][label] = (
+            2 * pi * L * Rag * (Br[None] * wf).sum(axis=2).T / (Na_per * Npcpp)
+        )
+
+    out_dict["Br"] = Br[:, :Na]
+    out_dict["Bt"] = Bt[:, :Na]
+
+    # Store stator winding flux
+    if "Stator_0" in out_dict["Phi_wind"].keys():
+        out_dict["Phi_wind_stator"] = out_dict["Phi_wind"]["Stator_0"]
+    # delete 'Phi_wind' if empty
+    if not out_dict["Phi_wind"]:
+        out_dict.pop("Phi_wind")
+
+    return out_dict
+
+
+def _comp_flux(mmf, g_eff):
+    """Radial flux density with the magnetic potential of the rotor given by
+    the flux conservation"""
+    U = (mmf / g_eff).mean(axis=-1) / (1 / g_eff).mean(axis=-1)
+    return MU0 * (mmf - U[..., None]) / g_eff
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from numpy import abs as np_abs, pi, zeros
+
+from ....Functions.MagFE.comp_reluctivity import (
+    MU0,
+    comp_reluctivity,
+    get_reluctivity_table,
+)
+
+
+def comp_iron_gap(self, lam, B, type_BH):
+    """Compute the equivalent airgap length of the teeth of a lamination: the
+    magnetic potential drop in the teeth (flux density of the airgap
+    concentrated in the teeth, at mid-height of the slots) is added to the one
+    of the airgap
+
+    Parameters
+    ----------
+    self : MagPMMF
+        a MagPMMF object
+    lam : Lamination
+        Lamination with slots (no teeth saturation for the other laminations)
+    B : ndarray
+        Airgap radial flux density [T]
+    type_BH : int
+        0 to use the B(H) curve, 1 to use mur_lin, 2 for an infinite
+        permeability
+
+    Returns
+    -------
+    g_iron : ndarray
+        Equivalent airgap length (same shape as B) [m]
+    """
+    slot = getattr(lam, "slot", None)
+    if type_BH == 2 or slot is None or hasattr(lam, "magnet"):
+        return zeros(B.shape)
+
+    # Ratio between the flux density in the teeth and in the airgap
+    Zs = slot.Zs
+    H_slot = slot.comp_height()
+    Rbo = lam.get_Rbo()
+    R_mid = Rbo - H_slot / 2 if lam.is_internal else Rbo + H_slot / 2
+    W_tooth = 2 * pi * R_mid / Zs - slot.comp_surface() / H_slot
+    k_tooth = 2 * pi * Rbo / (Zs * W_tooth)
+
+    mat = lam.mat_type.mag
+    if type_BH == 1 or mat.BH_curve is None:
+        nu = 1 / (MU0 * mat.mur_lin)
+    else:
+        table = get_reluctivity_table(mat.get_BH())
+        nu, _ = comp_reluctivity(table, (k_tooth * np_abs(B)) ** 2)
+    return MU0 * nu * k_tooth * H_slot
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+from re import findall
+
+from numpy import (
+    angle as np_angle,
+    array,
+    clip,
+    exp,
+    maximum,
+    minimum,
+    pi,
+    sqrt,
+    zeros,
+)
+
+
+def comp_magnet_mmf(self, lam, angle, d_angle=0):
+    """Compute the magnetomotive force of the magnets of a lamination and the
+    additional airgap length of the magnets and of the magnet slots
+
+    Each pole (magnets and holes of the same "_S" index) is an equivalent
+    magnetic circuit: the magnetomotive force Hc*h of its magnets (thickness h,
+    total width W) is applied on the angular span of the pole (arc A on the
+    airgap side) with the equivalent magnet airgap h/mur*A/W.
+
+    Parameters
+    ----------
+    self : MagPMMF
+        a MagPMMF object
+    lam : Lamination
+        Lamination with magnets (LamSlotMag or LamHole)
+    angle : ndarray
+        Angles in the frame of the lamination [rad]
+    d_angle : float
+        Angular step: the quantities are averaged on [angle-d_angle/2,
+        angle+d_angle/2] (continuous function of the rotor position) [rad]
+
+    Returns
+    -------
+    mmf : ndarray
+        Magnetomotive force (outward) (same shape as angle) [A]
+    g_mag : ndarray
+        Additional airgap length (same shape as angle) [m]
+    """
+    mmf, g_mag = zeros(angle.shape), zeros(angle.shape)
+    if not (hasattr(lam, "magnet") or hasattr(lam, "hole")):
+        return mmf, g_mag
+
+    # Magnets slots: the iron is at the bore radius of the lamination
+    R_mec = lam.comp_radius_mec()
+    g_out = abs(R_mec - lam.get_Rbo())
+    g_mag[:] = g_out
+
+    # Surfaces of each pole (on one period of the lamination)
+    per_a = lam.comp_periodicity()[0]
+    pole_dict = dict()
+    for surf in lam.build_geometry(sym=per_a):
+        if "Magnet" in surf.label or "Hole" in surf.label:
+            pole_id = findall(r"_S\d+$", surf.label)
+            if len(pole_id) > 0:
+                pole_dict.setdefault(pole_id[0], list()).append(surf)
+
+    for surf_list in pole_dict.values():
+        # Angular span of the pole
+        ref = np_angle(surf_list[0].point_ref)
+        span = list()
+        for surf in surf_list:
+            for line in surf.get_lines():
+                span.extend(np_angle(array(line.discretize(10)) * exp(-1j * ref)))
+        start, width = ref + min(span), max(span) - min(span)
+        # Equivalent magnet of the pole
+        Hch, W, h_mur = 0, 0, 0
+        for surf in surf_list:
+            if "Magnet" not in surf.label:
+                continue
+            mat = _get_magnet(lam, surf.label).mat_type.mag
+            sign = 1 if "_N_" in surf.label else -1
+            S = surf.comp_surface()
+            P = sum([line.comp_length() for line in surf.get_lines()])
+            # Thickness and width of the rectangle of same surface and perimeter
+            h = (P / 2 - sqrt(max(P ** 2 / 4 - 4 * S, 0))) / 2
+            if h > 0:
+                Hch += sign * mat.Hc * h * (S / h)
+                h_mur += h / mat.mur_lin * (S / h)
+                W += S / h
+        if W == 0:
+            continue
+        A = width * R_mec
+        for k in range(per_a):
+            # Part of [angle-d_angle/2, angle+d_angle/2] in the pole
+            x = (angle - start - k * 2 * pi / per_a + pi) % (2 * pi) - pi
+            if d_angle > 0:
+                overlap = minimum(x + d_angle / 2, width) - maximum(x - d_angle / 2, 0)
+                ratio = clip(overlap / d_angle, 0, 1)
+            else:
+                ratio = (x >= 0) & (x < width)
+            mmf = mmf + ratio * Hch / W
+            g_mag = g_mag + ratio * (h_mur / W * A / W - g_out)
+    return mmf, g_mag
+
+
+def _get_magnet(lam, label):
+    """Magnet object of a magnet surface"""
+    if "HoleMagnet" in label:
+        idx_str = findall(r"_T\d+_", label)[0][2:-1]
+        return lam.hole[0].get_magnet_dict()["magnet_" + idx_str]
+    return lam.magnet
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from numpy import abs as np_abs, pi, where, zeros
+
+
+def comp_slot_gap(self, lam, angle):
+    """Compute the additional airgap length of the slot openings of a lamination:
+    the flux lines in a slot opening are modelled by a straight line (airgap)
+    and a quarter circle ending on the slot side
+
+    Parameters
+    ----------
+    self : MagPMMF
+        a MagPMMF object
+    lam : Lamination
+        Lamination with slots (the magnet slots are modelled by comp_magnet_mmf)
+    angle : ndarray
+        Angles in the frame of the lamination [rad]
+
+    Returns
+    -------
+    g_slot : ndarray
+        Additional airgap length (same shape as angle) [m]
+    """
+    slot = getattr(lam, "slot", None)
+    if not self.is_slotting or slot is None or hasattr(lam, "magnet"):
+        return zeros(angle.shape)
+
+    Zs = slot.Zs
+    opening = slot.comp_angle_opening()
+    # Angle from the closest slot center (by convention a tooth is centered on
+    # the X axis)
+    delta = np_abs((angle % (2 * pi / Zs)) - pi / Zs)
+    # Distance to the closest side of the slot opening
+    dist = (opening / 2 - delta) * lam.get_Rbo()
+    return where(dist > 0, pi / 2 * dist, 0)
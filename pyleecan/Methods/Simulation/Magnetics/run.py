@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 from ....Methods.Simulation.Input import InputError
+from ....Functions.Simulation.result_cache import (
+    get_result_key,
+    load_result,
+    save_result,
+)
 
 
 def run(self):
@@ -16,6 +21,11 @@ def run(self):
     self.get_logger().info("Starting Magnetic module")
     output = self.parent.parent
 
+    # Load the results if the same problem has already been solved
+    key = get_result_key(self, "mag")
+    if load_result(self, "mag", key):
+        return
+
     # Compute and store time and angle axes from elec output
     # and returns additional axes in axes_dict
     axes_dict = self.comp_axes(output)
@@ -25,3 +35,5 @@ def run(self):
 
     # Store magnetic quantities contained in out_dict in OutMag, as Data object if necessary
     output.mag.store(out_dict, axes_dict)
+
+    save_result(self, "mag", key)
@@ -1,12 +1,18 @@
 from ....Classes._frozen import FrozenClass
+from ....Functions.copy import _handle_ndarray, child_as_dict
 from numpy import ndarray
 
 
-def as_dict(self):
-    """Convert this object in a json seriable dict (can be use in __init__)"""
+def as_dict(self, type_handle_ndarray=0, **kwargs):
+    """Convert this object in a json seriable dict (can be use in __init__).
+    type_handle_ndarray: int
+        How to handle ndarray (0: tolist, 1: copy, 2: nothing)
+    """
 
     # Get the properties inherited from ParamExplorer
-    ParamExplorerSet_dict = super(type(self), self).as_dict()
+    ParamExplorerSet_dict = super(type(self), self).as_dict(
+        type_handle_ndarray=type_handle_ndarray, **kwargs
+    )
     ParamExplorerSet_dict["value"] = (
         self.value.copy() if self.value is not None else None
     )
@@ -16,9 +22,13 @@ def as_dict(self):
         ParamExplorerSet_dict["value"] = list()
         for obj in self.value:
             if isinstance(obj, FrozenClass):
-                ParamExplorerSet_dict["value"].append(obj.as_dict())
+                ParamExplorerSet_dict["value"].append(
+                    child_as_dict(obj, type_handle_ndarray, **kwargs)
+                )
             elif isinstance(obj, ndarray):
-                ParamExplorerSet_dict["value"].append(obj.tolist())
+                ParamExplorerSet_dict["value"].append(
+                    _handle_ndarray(obj, type_handle_ndarray)
+                )
             else:
                 ParamExplorerSet_dict["value"].append(obj)
     # The class name is added to the dict for deserialisation purpose
@@ -1,7 +1,9 @@
 import numpy as np
 import itertools
 from ....Functions.Simulation.VarSimu.run_single_simu import run_single_simu
+from ....Functions.Simulation.VarSimu.run_pool_simu import run_pool_simu
 from ....Functions.Load.import_class import import_class
+from ....Functions.FEMM.run_FEMM_workers import close_FEMM_workers
 
 
 def run(self):
@@ -58,12 +60,7 @@ def run(self):
 
         # Set back the var_simu
         simulation.var_simu = self
-        print(
-            "\r["
-            + "=" * (50 * (1) // (nb_simu))
-            + " " * (50 - ((50) // (nb_simu)))
-            + "] {:3d}%".format(((100 * 1) // (nb_simu)))
-        )
+        print_progress(1, nb_simu)
 
     # Reuse some intermediate results from reference simulation (if requested)
     for simu in simulation_list:
@@ -77,43 +74,112 @@ def run(self):
 
     # Execute the other simulations
     nb_simu = self.nb_simu
-    InputCurrent = import_class("pyleecan.Classes", "InputCurrent")
-    for idx, [i, simulation] in zip(index_list, enumerate(simulation_list)):
-        simulation.index = idx  # For plot and save results
-        msg = "Running simulation " + str(idx + 1) + "/" + str(self.nb_simu) + " with "
-        for param_exp in simu_dict["paramexplorer_list"]:
-            if isinstance(param_exp.get_value()[idx], InputCurrent):
-                msg += "Id=" + format(param_exp.get_value()[idx].Id_ref, ".8g")
-                msg += ", Iq=" + format(param_exp.get_value()[idx].Iq_ref, ".8g") + ", "
-            else:
-                msg += param_exp.symbol
-                msg += "="
-                msg += format(param_exp.get_value()[idx], ".8g")
-                msg += ", "
-        msg = msg[:-2]
-        logger.info(msg)
-        # Run the simulation handling errors
-        run_single_simu(
+    if self.nb_proc != 1 and len(simulation_list) > 1:
+        logger.info(
+            "Running "
+            + str(len(simulation_list))
+            + " simulations on a pool of "
+            + (str(self.nb_proc) if self.nb_proc else "all the")
+            + " processes"
+        )
+        for idx, simulation in zip(index_list, simulation_list):
+            simulation.index = idx  # For plot and save results
+            logger.info(
+                get_simu_msg(idx, self.nb_simu, simu_dict["paramexplorer_list"])
+            )
+        # Results are stored in the index order as soon as available
+        simu_iter = run_pool_simu(
             xoutput,
             self.datakeeper_list,
-            simulation,
-            idx,
+            simulation_list,
+            index_list,
             self.stop_if_error,
             self.ref_simu_index,
             self.is_keep_all_output,
+            nb_proc=self.nb_proc,
+            chunk_size=self.chunk_size,
             post_keeper_postproc_list=self.post_keeper_postproc_list,
         )
-
-        # Display simulation progress
-        print(
-            "\r["
-            + "=" * (50 * (i + 1 + ref_simu_in_multsim) // (nb_simu))
-            + " " * (50 - ((50 * (i + 1 + ref_simu_in_multsim)) // (nb_simu)))
-            + "] {:3d}%".format(((100 * (i + 1 + ref_simu_in_multsim)) // (nb_simu)))
-        )
+        for i, idx in enumerate(simu_iter):
+            logger.info(
+                "Simulation " + str(idx + 1) + "/" + str(self.nb_simu) + " done"
+            )
+            print_progress(i + 1 + ref_simu_in_multsim, nb_simu)
+    else:
+        for idx, [i, simulation] in zip(index_list, enumerate(simulation_list)):
+            simulation.index = idx  # For plot and save results
+            logger.info(
+                get_simu_msg(idx, self.nb_simu, simu_dict["paramexplorer_list"])
+            )
+            # Run the simulation handling errors
+            run_single_simu(
+                xoutput,
+                self.datakeeper_list,
+                simulation,
+                idx,
+                self.stop_if_error,
+                self.ref_simu_index,
+                self.is_keep_all_output,
+                post_keeper_postproc_list=self.post_keeper_postproc_list,
+            )
+
+            # Display simulation progress
+            print_progress(i + 1 + ref_simu_in_multsim, nb_simu)
+
+    # Close the FEMM workers kept open between the simulations
+    close_FEMM_workers()
 
     # Running postprocessings
     if self.postproc_list:
         logger.info("Running var_simu postprocessings...")
         for postproc in self.postproc_list:
             postproc.run(xoutput)
+
+
+def get_simu_msg(idx, nb_simu, paramexplorer_list):
+    """Message logged when a simulation is run
+
+    Parameters
+    ----------
+    idx : int
+        Index of the simulation
+    nb_simu : int
+        Total number of simulations
+    paramexplorer_list : list
+        List of the ParamExplorer of the VarSimu
+
+    Returns
+    -------
+    msg : str
+        "Running simulation idx/nb_simu with " + values of the parameters
+    """
+    InputCurrent = import_class("pyleecan.Classes", "InputCurrent")
+    msg = "Running simulation " + str(idx + 1) + "/" + str(nb_simu) + " with "
+    for param_exp in paramexplorer_list:
+        if isinstance(param_exp.get_value()[idx], InputCurrent):
+            msg += "Id=" + format(param_exp.get_value()[idx].Id_ref, ".8g")
+            msg += ", Iq=" + format(param_exp.get_value()[idx].Iq_ref, ".8g") + ", "
+        else:
+            msg += param_exp.symbol
+            msg += "="
+            msg += format(param_exp.get_value()[idx], ".8g")
+            msg += ", "
+    return msg[:-2]
+
+
+def print_progress(nb_done, nb_simu):
+    """Display the multi-simulation progress bar
+
+    Parameters
+    ----------
+    nb_done : int
+        Number of simulations already computed
+    nb_simu : int
+        Total number of simulations
+    """
+    print(
+        "\r["
+        + "=" * (50 * nb_done // nb_simu)
+        + " " * (50 - ((50 * nb_done) // nb_simu))
+        + "] {:3d}%".format((100 * nb_done) // nb_simu)
+    )
@@ -24,3 +24,7 @@ def set_reused_data(self, simu, output):
         )
         simu.mag.import_file = output.mag.internal.FEMM_dict["path_save"]
         simu.mag.FEMM_dict_enforced = output.mag.internal.FEMM_dict
+        if simu.mag.nb_worker > 1:
+            # Keep the FEMM workers open between the simulations
+            # (closed at the end of VarSimu.run)
+            simu.mag.is_close_femm = False